@@ -19,6 +19,29 @@ DISK_DUMP_FILE_NAME = "designsphysics-{}.log".format(VERSION)
 MKFLUID_LIMIT = 10
 MKFLUID_OFFSET = 1
 GITHUB_MASTER_CONSTANTS_URL = "https://raw.githubusercontent.com/DualSPHysics/DesignSPHysics/master/mod/constants.py"
+VERSION_CHECK_TIMEOUT = 3  # Seconds
+VERSION_CHECK_CACHE_TTL = 24 * 60 * 60  # Seconds
+VERSION_CHECK_FAILED_CACHE_TTL = 60 * 60  # Seconds
+VERSION_CHECK_CACHE_FILE_NAME = "designsphysics-version-check.json"
+BATHYMETRY_CACHE_DIR_NAME = "designsphysics-bathymetry-cache"
+BATHYMETRY_CACHE_MAX_ENTRIES = 20
+GEO_PREVIEW_MAX_FACES = 500000  # Triangles of the light preview shown for huge imported geometries
+GENCASE_HISTORY_FILE_NAME = "gencase_history.jsonl"  # Stored in the case folder, as the output folder is removed on each run
+GENCASE_HISTORY_MAX_ENTRIES = 500
+# Approximate resources per particle, used to estimate them before running GenCase.
+SOLVER_BYTES_PER_PARTICLE = 250  # Solver memory (RAM or GPU memory)
+PART_BYTES_PER_PARTICLE = 44  # Part_XXXX.bi4 files: id (4), double position (24), velocity (12) and density (4)
+OUTPARTS_SAMPLES_PER_OBJECT = 20000  # Sampled positions per object to estimate the particles kept by the output filters
+MEASURETOOL_PREVIEW_MAX_POINTS = 200000  # Points drawn at most when previewing MeasureTool point sets
+OUTPARTS_PREVIEW_MAX_POINTS = 200000  # Kept particles drawn at most when previewing the output parts filters
+MOTION_PREVIEW_TIME_STEPS = 501  # Instants evaluated when previewing the motion of the case
+MOTION_PREVIEW_POINTS_PER_OBJECT = 2000  # Surface points followed per moving object to check its motion
+MOTION_PREVIEW_FRAME_INTERVAL = 40  # Milliseconds between frames when playing a motion preview
+DATA_FILE_PREVIEW_ROWS = 2000  # Rows kept at least when scanning motion and velocity data files to preview them
+WATCHDOG_CHECK_INTERVAL = 30  # Seconds between simulation watchdog checks
+WATCHDOG_LOG_TAIL_LINES = 40
+WATCHDOG_REPORT_FILE_NAME = "watchdog_report.txt"
+WATCHDOG_MAX_AUTO_RESUMES = 3  # Automatic resumes of a simulation before giving up
 
 # FreeCAD Related Constants
 SINGLETON_DOCUMENT_NAME = "DSPH_Case"
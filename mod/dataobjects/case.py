@@ -16,6 +16,8 @@ from mod.dataobjects.variable_res.bufferbox import BufferBox
 from mod.dataobjects.variable_res.variable_res_config import VariableResConfig
 from mod.tools.dialog_tools import warning_dialog
 from mod.tools.freecad_tools import get_fc_object
+from mod.tools.helper_index_tools import create_helper_index
+from mod.tools.spatial_index_tools import AABBIndex
 
 from mod.tools.stdout_tools import debug, log
 
@@ -78,10 +80,30 @@ class Case():
         self.damping_zones: dict = dict()  # {freecad_object_name: Damping}
         self.acceleration_input: AccelerationInput = AccelerationInput()
         self.relaxation_zone: RelaxationZone = None
+        #HELPER OBJECTS BOUNDS
+        self._helper_index: AABBIndex = create_helper_index()  # Not saved nor exported, built from FreeCAD on load
 
 
 
 
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop("_helper_index", None)
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._helper_index = create_helper_index()
+
+    @property
+    def helper_index(self) -> AABBIndex:
+        """ Index of the bounding boxes of the helper objects of the case. See helper_index_tools. """
+        return self._helper_index
+
+    @helper_index.setter
+    def helper_index(self, helper_index: AABBIndex):
+        self._helper_index = helper_index
+
     @staticmethod
     def the() -> "Case":
         """ Static access method. """
@@ -30,6 +30,14 @@ class ApplicationSettings():
         self.notify_on_outdated_version_enabled: bool = True
         self.force_moordynplus_support_enabled: bool = False
         self.basic_visualization:bool = True
+        #Simulation watchdog
+        self.watchdog_enabled: bool = True
+        self.watchdog_stall_minutes: float = 30.0
+        self.watchdog_min_throughput_ratio: float = 0.1
+        self.watchdog_auto_resume: bool = False
+        #CPU run profiles for the solver, as dicts (see run_profile_tools)
+        self.run_profiles: list = list()
+        self.run_profile_name: str = ""
         #Variables for custom script generation
         self.execs_path = ""
         self.custom_script_text = ""
@@ -73,6 +81,18 @@ class ApplicationSettings():
                 self.custom_script_text = disk_data["custom_script_text"]
             if "basic_visualization" in disk_data.keys():
                 self.basic_visualization = disk_data["basic_visualization"]
+            if "watchdog_enabled" in disk_data.keys():
+                self.watchdog_enabled = disk_data["watchdog_enabled"]
+            if "watchdog_stall_minutes" in disk_data.keys():
+                self.watchdog_stall_minutes = disk_data["watchdog_stall_minutes"]
+            if "watchdog_min_throughput_ratio" in disk_data.keys():
+                self.watchdog_min_throughput_ratio = disk_data["watchdog_min_throughput_ratio"]
+            if "watchdog_auto_resume" in disk_data.keys():
+                self.watchdog_auto_resume = disk_data["watchdog_auto_resume"]
+            if "run_profiles" in disk_data.keys():
+                self.run_profiles = disk_data["run_profiles"]
+            if "run_profile_name" in disk_data.keys():
+                self.run_profile_name = disk_data["run_profile_name"]
 
     def persist(self) -> None:
         """ Persists the current settings to disk for next instantiations to load. """
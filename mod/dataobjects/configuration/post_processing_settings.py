@@ -1,5 +1,6 @@
 from mod.dataobjects.flow_tool_xml_box import FlowToolXmlBox
 from mod.enums import FlowUnits
+from mod.functions import migrate_state
 
 
 class PostProcessingSettings():
@@ -7,5 +8,18 @@ class PostProcessingSettings():
     def __init__(self):
         self.measuretool_points: list = []
         self.measuretool_grid: list = []
+        self.measuretool_point_sets: list = []  # Point set parts, as dicts (see point_set_tools)
         self.flowtool_units: FlowUnits = FlowUnits.LITERSSECOND
-        self.flowtool_xml_boxes: list[FlowToolXmlBox] = list()  # [FlowToolBox]
\ No newline at end of file
+        self.flowtool_xml_boxes: list[FlowToolXmlBox] = list()  # [FlowToolBox]
+
+    def __setstate__(self, state: dict):
+        # Attribute renaming map (old -> new)
+        rename_map = dict()
+
+        # Handle missing attributes (backward compatibility)
+        default_attrs = {
+            'measuretool_point_sets': list()
+        }
+
+        # Restore the state
+        self.__dict__.update(migrate_state(rename_map, default_attrs, state))
\ No newline at end of file
@@ -0,0 +1,33 @@
+from mod.dataobjects.gauges.gauge_base import Gauge
+
+
+class GaugeArray(Gauge):
+    """ A set of velocity, swl or maxz gauges sharing their settings, placed along a line,
+    on a grid or on the points of a CSV file. Each point is exported as a gauge of its own. """
+
+    def __init__(self, save_vtk_part: bool = False, compute_dt: float = 0, compute_time_start: float = 0,
+                 compute_time_end: float = 0, output: bool = False, output_dt: float = 0, output_time_start: float = 0,
+                 output_time_end: float = 0, name: str = "", gauge_type: str = "velocity"):
+        super().__init__(save_vtk_part, compute_dt, compute_time_start, compute_time_end, output, output_dt,
+                         output_time_start, output_time_end, name)
+        self.gauge_type: str = gauge_type  # velocity, swl or maxz
+        self.layout: str = "line"  # line, grid or csv
+        self.line_start = [0.0, 0.0, 0.0]
+        self.line_end = [1.0, 0.0, 0.0]
+        self.line_count: int = 10
+        self.grid_origin = [0.0, 0.0, 0.0]
+        self.grid_spacing = [0.1, 0.1, 0.1]
+        self.grid_counts = [10, 1, 1]
+        self.csv_path: str = ""
+        self.csv_offset = [0.0, 0.0, 0.0]  # Added to the points of the CSV file, changed when the array is moved
+        self.points: list = list()  # Base point of each gauge
+        # SWL gauges: end point of each gauge relative to its base point
+        self.swl_offset = [0.0, 0.0, 1.0]
+        self.point_dp: float = 0
+        self.point_dp_coef_dp: bool = False
+        self.mass_limit: float = 0.5
+        self.mass_limit_coef: bool = True
+        # MaxZ gauges
+        self.height: float = 1.0
+        self.dist_limit: float = 0
+        self.type = "array"
@@ -27,4 +27,5 @@ class InletOutletZone:
         self.density_info: InletOutletDensityInfo = InletOutletDensityInfo()
         self.elevation_info: InletOutletElevationInfo = InletOutletElevationInfo()
         self.fc_object_name:str=""
+        self.helper_geometry_key: str = None  # Parameters the FreeCAD helper was last drawn with
 
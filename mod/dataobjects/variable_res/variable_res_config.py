@@ -29,46 +29,59 @@ class VariableResConfig:
         self.update_ids()
 
     def remove_with_children(self,id:int):
-        to_remove = [id]
-        while to_remove :
-            rem = to_remove.pop()
-            rem_obj = self.get_bufferbox_by_id(rem)
-            sons = self.get_children(rem)
-            self.remove_bufferbox(rem_obj.id)
-            #self.bufferbox_list.remove(rem_obj)
-            #if sons
-            for son in sons:
-                to_remove.append(son.id)
-        #self.update_ids()
+        removed = self.get_descendance(id)
+        removed.append(self.get_bufferbox_by_id(id))
+        for bf in removed:
+            delete_object(bf.fc_object_name)
+        removed_ids = {bf.id for bf in removed}
+        self.bufferbox_list = [bf for bf in self.bufferbox_list if bf.id not in removed_ids]
+        self.update_ids()
 
-    def get_children(self, id: int):
-        sons_list = []
+    def get_children_index(self) -> dict:
+        """ Returns the children of each buffer box, by parent id, in list order. Top level boxes are under None. """
+        children_index = {}
         for bf in self.bufferbox_list:
-            if bf.parent is not None:
-                if bf.parent.id == id:
-                    sons_list.append(bf)
-        return sons_list
+            children_index.setdefault(bf.parent.id if bf.parent is not None else None, []).append(bf)
+        return children_index
 
-    def get_descendance(self,id: int):
-        sons_list=[self.get_bufferbox_by_id(id)]
-        return_list=[]
-        while sons_list:
-            son=sons_list.pop(0)
-            new_sons=self.get_children(son.id)
-            sons_list= sons_list + new_sons
-            return_list = return_list + new_sons
-        return return_list
+    def get_children(self, id: int):
+        return [bf for bf in self.bufferbox_list if bf.parent is not None and bf.parent.id == id]
 
+    def get_descendance(self,id: int):
+        children_index = self.get_children_index()
+        descendance = []
+        visited = {id}
+        pending = list(reversed(children_index.get(id, [])))
+        while pending:
+            son = pending.pop()
+            if son.id in visited:
+                continue
+            visited.add(son.id)
+            descendance.append(son)
+            pending += reversed(children_index.get(son.id, []))
+        return descendance
 
+    def get_tree_order(self) -> list:
+        """ Returns (buffer box, depth) tuples in depth-first order, each box followed by its children.
+        Boxes whose parent chain is a loop are left out. The boxes are not changed. """
+        children_index = self.get_children_index()
+        ordered = []
+        pending = [(bf, 0) for bf in reversed(children_index.get(None, []))]
+        while pending:
+            bf, depth = pending.pop()
+            ordered.append((bf, depth))
+            pending += [(son, depth + 1) for son in reversed(children_index.get(bf.id, []))]
+        return ordered
 
     def get_bufferbox_by_id(self,id:int):
+        if 0 <= id < len(self.bufferbox_list) and self.bufferbox_list[id].id == id:
+            return self.bufferbox_list[id]
         for bf in self.bufferbox_list:
             if id ==bf.id:
                 return bf
         return None
 
     def update_ids(self):
-        for bf in self.bufferbox_list:
-            bf.id=self.bufferbox_list.index(bf)
+        for index, bf in enumerate(self.bufferbox_list):
+            bf.id=index
         self.n_boxes = len(self.bufferbox_list)
-
@@ -53,6 +53,12 @@ class SDPositionPropertyType:
     DEFAULT_PERCENTAGE = 3
 
 
+class ValidationSeverity:
+    """ Severity of the issues found validating a case before running it. """
+    ERROR = "error"
+    WARNING = "warning"
+
+
 class ObjectType:
     """ Simulation domain property type. """
     BOUND = "bound"
@@ -86,6 +92,7 @@ class FreeCADObjectType:
     CIRCLE = "Part::Circle"
     PLANE = "Part::Plane"
     SPREADSHEET = 'Spreadsheet::Sheet'
+    PART_FEATURE = "Part::Feature"
 
 
 class FreeCADDisplayMode:
@@ -335,6 +342,16 @@ class FilterOperations:
     operation={"add":ADD,"del":DEL,"confirm":CONFIRM}
 
 
+class HelperKind:
+    """ Kinds of helper objects kept in the helper index of a case, by the name used in messages. """
+    INOUT_ZONE = "Inlet/outlet zone"
+    GAUGE = "Gauge"
+    OUTPUT_FILTER = "Output filter"
+    FLOWTOOL_BOX = "FlowTool box"
+    DAMPING_ZONE = "Damping zone"
+    VRES_BOX = "Variable resolution box"
+
+
 class HelpText:
     """ Help strings for different zones of the application GUIs. """
     POINTREFX = __("Reference point to create particles in X direction.")
@@ -4,7 +4,9 @@
 
 import re
 import locale
+import os
 import sys
+from contextlib import contextmanager
 from os import path
 
 def make_float(num):
@@ -100,3 +102,20 @@ def is_key(obj,key):
     if obj and key in obj:
         return True
     return False
+
+
+@contextmanager
+def atomic_open(file_path: str, mode: str = "w", **kwargs):
+    """ Opens a temporary file next to file_path that replaces it only once it was completely written.
+    If anything fails while writing, the previous file is kept untouched. """
+    temporary_path = "{}.tmp".format(file_path)
+    try:
+        with open(temporary_path, mode, **kwargs) as temporary_file:
+            yield temporary_file
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+        os.replace(temporary_path, file_path)
+    except BaseException:
+        if path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
@@ -7,29 +7,33 @@ It allows an user to create DualSPHysics compatible cases, automating a bunch of
 
 More info in http://design.sphysics.org/
 """
-from urllib.error import URLError
-from urllib.request import urlopen
+from time import perf_counter
 
-import FreeCADGui
+IMPORT_START_TIME = perf_counter()
+
+import FreeCADGui  # pylint: disable=wrong-import-position
 
 from PySide2 import QtCore, QtWidgets
 
-from mod.constants import APP_NAME, VERSION, REVISION, DEFAULT_WORKBENCH, GITHUB_MASTER_CONSTANTS_URL, \
-    DAMPING_GROUP_NAME, SIMULATION_DOMAIN_NAME
+from mod.constants import APP_NAME, VERSION, REVISION, DEFAULT_WORKBENCH, DAMPING_GROUP_NAME, SIMULATION_DOMAIN_NAME
 
 from mod.dataobjects.case import Case
 from mod.dataobjects.configuration.application_settings import ApplicationSettings
 
-from mod.tools.dialog_tools import info_dialog, warning_dialog
+from mod.tools.dialog_tools import warning_dialog
 from mod.tools.freecad_tools import check_compatibility, document_count, prompt_close_all_documents, get_fc_main_window, \
     get_fc_object
 from mod.tools.freecad_tools import delete_existing_docks
 from mod.tools.main_loop_tools import  MainLoopManager, MainLoopEmiter, UnitWatcher
 from mod.tools.stdout_tools import print_license, log, debug
+from mod.tools.timing_tools import StageTimer
 from mod.tools.translation_tools import __
+from mod.tools.version_check_tools import check_version_in_background
 from mod.widgets.designsphysics_dock import DesignSPHysicsDock
 from mod.widgets.properties_dock_widget import PropertiesDockWidget
 
+IMPORT_ELAPSED_TIME = perf_counter() - IMPORT_START_TIME
+
 __author__ = "Iván Martínez Estévez, Andrés Vieira"
 __copyright__ = "Copyright 2016-2023, DualSHPysics Team"
 __credits__ = ["Iván Martínez Estévez", "Andrés Vieira", "Irene Fernandez Mariño", "Lorena Docasar", "Alejandro Jacobo Cabrera Crespo",
@@ -88,20 +92,16 @@ def on_unit_change():
 
 def boot():
     """ Boots the application. """
+    startup_timer = StageTimer("{} startup".format(APP_NAME))
+    startup_timer.add_stage("Module imports", IMPORT_ELAPSED_TIME)
     print_license()
     check_compatibility()
+    startup_timer.mark("License and compatibility check")
 
-    try:
-        master_branch_version = str(urlopen(GITHUB_MASTER_CONSTANTS_URL).read()).split("VERSION = \"")[-1].split("\"")[
-            0]
-        if VERSION < master_branch_version and ApplicationSettings.the().notify_on_outdated_version_enabled:
-            info_dialog(
-                __("Your version of DesignSPHyiscs is outdated. Please go to the Addon Manager and update it. New versions include bug fixes, new features and new DualSPHysics executables, among other things."),
-                __("The version you're using is {} while the version that you can update to is {}").format(VERSION,
-                                                                                                           master_branch_version)
-            )
-    except URLError:
-        log("No network connection or Git repo is down. Skipping version check.")
+    # The version check is done in background and notifies asynchronously so the startup is never blocked.
+    if ApplicationSettings.the().notify_on_outdated_version_enabled:
+        check_version_in_background()
+    startup_timer.mark("Version check launch")
 
     if document_count() > 0:
         success = prompt_close_all_documents()
@@ -111,9 +111,12 @@ def boot():
 
     # Tries to delete docks created by a previous execution of DesignSPHysics
     delete_existing_docks()
+    startup_timer.mark("Document and dock cleanup")
 
     designsphysics_dock = DesignSPHysicsDock(get_fc_main_window())
+    startup_timer.mark("Main dock creation")
     properties_widget = PropertiesDockWidget(parent=get_fc_main_window())
+    startup_timer.mark("Properties dock creation")
 
     get_fc_main_window().addDockWidget(QtCore.Qt.RightDockWidgetArea, designsphysics_dock)
     get_fc_main_window().addDockWidget(QtCore.Qt.LeftDockWidgetArea, properties_widget)
@@ -129,6 +132,8 @@ def boot():
 
     log("Subscribing selection change monitor handler to freecad object tree item changed.")
 
+    startup_timer.mark("Dock placement and tree subscription")
+
     properties_widget.need_refresh.connect(
         lambda p=properties_widget, d=designsphysics_dock: on_tree_item_selection_change(p, d))
     designsphysics_dock.need_refresh.connect(
@@ -146,11 +151,14 @@ def boot():
     
     emitter.start()
     # watcher.start()
+    startup_timer.mark("Main loop launch")
 
     FreeCADGui.activateWorkbench(DEFAULT_WORKBENCH)
     if "DsphWorkbench" in FreeCADGui.listWorkbenches().keys():
         FreeCADGui.activateWorkbench("DsphWorkbench")
     elif "DsphWorkbench" in FreeCADGui.listWorkbenches().keys():
         FreeCADGui.activateWorkbench("Part")
+    startup_timer.mark("Workbench activation")
+    log(startup_timer.report())
     log(__("Initialization finished for {} v{}.{}").format(APP_NAME, VERSION, REVISION))
     Case.manager = manager
\ No newline at end of file
@@ -1,5 +1,6 @@
 {common}
 dualsph=$bindir"/DualSPHysics5.4_linux64"
 export LD_LIBRARY_PATH=$LD_LIBRARY_PATH:$bindir
+{run_profile}
 args="{args}"
-$dualsph $args
+{launcher}$dualsph $args
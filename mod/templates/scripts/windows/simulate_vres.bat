@@ -1,5 +1,6 @@
 {common}
 set dualsph=%bindir%\VResolution\DualSPHysicsVRes_win64.exe
 rem export LD_LIBRARY_PATH=$LD_LIBRARY_PATH:$bindir
+{run_profile}
 set args={args}
-%dualsph% %args%
+{launcher}%dualsph% %args%
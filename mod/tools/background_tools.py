@@ -0,0 +1,72 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Tools to run long operations in worker threads while the interface keeps responding. """
+
+from contextlib import contextmanager
+
+from PySide2 import QtCore
+
+# Number of operations running that need the periodic checks of the main loop to be stopped.
+_main_loop_pauses: int = 0
+
+
+class BackgroundTask(QtCore.QThread):
+    """ Runs a function in a worker thread, keeping its result or the exception it raised. """
+
+    progress = QtCore.Signal(str)
+
+    def __init__(self, function, *args, **kwargs):
+        super().__init__()
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.result = None
+        self.exception: BaseException = None
+
+    def run(self):
+        try:
+            self.result = self.function(*self.args, **self.kwargs)
+        except BaseException as ex:  # pylint: disable=broad-except
+            self.exception = ex
+
+
+def run_in_background(function, *args, progress_slot=None, **kwargs):
+    """ Runs a function in a worker thread while the Qt event loop keeps processing events, so the interface
+    is repainted and the progress can be shown. Blocks until the function finishes and returns its result,
+    raising again any exception it raised.
+    The function must not access FreeCAD objects, and the data it receives should not be changed meanwhile:
+    pass it copies or run it inside main_loop_paused(). If progress_slot is given, the function receives a
+    report_progress keyword argument that can be called from the worker thread with a message for it. """
+    task = BackgroundTask(function, *args, **kwargs)
+    if progress_slot is not None:
+        task.kwargs["report_progress"] = task.progress.emit
+        task.progress.connect(progress_slot)
+    loop = QtCore.QEventLoop()
+    task.finished.connect(loop.quit)
+    task.start()
+    if not task.isFinished():
+        loop.exec_()
+    task.wait()
+    if task.exception is not None:
+        raise task.exception
+    return task.result
+
+
+
+@contextmanager
+def main_loop_paused():
+    """ Stops the periodic checks of the main loop while the block runs. Those checks can change the case and the
+    document, and the events are still processed while run_in_background waits, so they have to be stopped while
+    worker threads use data of the case. """
+    global _main_loop_pauses  # pylint: disable=global-statement
+    _main_loop_pauses += 1
+    try:
+        yield
+    finally:
+        _main_loop_pauses -= 1
+
+
+def is_main_loop_paused() -> bool:
+    """ Returns whether the periodic checks of the main loop are stopped. """
+    return _main_loop_pauses > 0
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Tools to run BathymetryTool asynchronously, caching its results.
+
+Generated grids are stored in a content addressed cache inside the FreeCAD
+user directory, keyed by the hash of the input file, the full argument
+vector and the BathymetryTool executable, so importing the same survey
+with the same options again doesn't run the tool. Each run still gets its
+own output file, linked or copied from the cache, as the cache is pruned. """
+
+import hashlib
+import os
+import shutil
+from os import path
+from tempfile import gettempdir
+from uuid import uuid4
+
+import FreeCAD
+
+from PySide2 import QtCore
+
+from mod.constants import BATHYMETRY_CACHE_DIR_NAME, BATHYMETRY_CACHE_MAX_ENTRIES
+from mod.tools.background_tools import BackgroundTask
+from mod.tools.stdout_tools import debug, log
+
+# File digests by (path, size, modification time), so big surveys are only hashed once per session.
+_file_digests: dict = dict()
+
+
+def hash_file(file_path: str, block_size: int = 1024 * 1024) -> str:
+    """ Returns the SHA-256 hex digest of the contents of a file. """
+    file_stat = os.stat(file_path)
+    digest_key = (path.abspath(file_path), file_stat.st_size, file_stat.st_mtime_ns)
+    if digest_key not in _file_digests:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as hashed_file:
+            for block in iter(lambda: hashed_file.read(block_size), b""):
+                digest.update(block)
+        _file_digests[digest_key] = digest.hexdigest()
+    return _file_digests[digest_key]
+
+
+def get_bathymetry_cache_key(executable: str, input_file: str, executable_parameters: list) -> str:
+    """ Returns the cache key of a BathymetryTool run. The input and output paths are not part of the
+    parameters, so the same data imported from another location or with another name hits the cache. """
+    digest = hashlib.sha256()
+    digest.update(hash_file(input_file).encode())
+    for parameter in executable_parameters:
+        digest.update(b"\0" + str(parameter).encode())
+    # A different executable may generate a different grid.
+    if path.isfile(executable):
+        executable_stat = os.stat(executable)
+        digest.update("\0{}\0{}\0{}".format(path.abspath(executable), executable_stat.st_size,
+                                            executable_stat.st_mtime_ns).encode())
+    return digest.hexdigest()
+
+
+def get_bathymetry_cache_dir() -> str:
+    """ Returns the directory of the bathymetry cache, creating it if needed. """
+    cache_dir = "{datadir}/{name}".format(datadir=FreeCAD.getUserAppDataDir(), name=BATHYMETRY_CACHE_DIR_NAME)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def link_or_copy_file(source: str, destination: str) -> None:
+    """ Makes destination a hard link to source, or a copy if they are in different file systems.
+    The file is written with a temporary name first, so an interrupted copy never leaves a partial file. """
+    partial_file = "{}.{}.partial".format(destination, uuid4().hex)
+    try:
+        os.link(source, partial_file)
+    except OSError:
+        shutil.copyfile(source, partial_file)
+    os.replace(partial_file, destination)
+
+
+def get_cached_bathymetry(cache_key: str, cache_dir: str) -> str:
+    """ Returns the cached grid for a key, or None if it's not cached. """
+    cached_file = "{}/bathymetry_{}.stl".format(cache_dir, cache_key[:32])
+    if not path.isfile(cached_file):
+        return None
+    # Marked as recently used, so it's the last one to be pruned.
+    os.utime(cached_file)
+    return cached_file
+
+
+def restore_cached_bathymetry(executable: str, input_file: str, executable_parameters: list, cache_dir: str,
+                              output_file: str) -> tuple:
+    """ Returns the cache key of a BathymetryTool run and whether its grid was cached, in which case it is
+    copied to output_file. Does not access FreeCAD, so it can run in a worker thread. """
+    cache_key = get_bathymetry_cache_key(executable, input_file, executable_parameters)
+    cached_file = get_cached_bathymetry(cache_key, cache_dir)
+    if cached_file is None:
+        return cache_key, False
+    link_or_copy_file(cached_file, output_file)
+    return cache_key, True
+
+
+def store_cached_bathymetry(cache_key: str, generated_file: str, cache_dir: str) -> None:
+    """ Adds a generated grid to the cache. The generated file is kept where it is, as the imported geometry
+    refers to it and the cache entries can be pruned.
+    The least recently used grids are removed to keep at most BATHYMETRY_CACHE_MAX_ENTRIES. """
+    link_or_copy_file(generated_file, "{}/bathymetry_{}.stl".format(cache_dir, cache_key[:32]))
+
+    cached_files = sorted((path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith(".stl")),
+                          key=path.getmtime, reverse=True)
+    for old_file in cached_files[BATHYMETRY_CACHE_MAX_ENTRIES:]:
+        try:
+            os.remove(old_file)
+        except OSError:
+            pass
+
+
+class BathymetryToolRun(QtCore.QObject):
+    """ A BathymetryTool execution that doesn't block the interface.
+    Each run writes to its own output file in output_dir (the temporary directory by default), so several runs
+    can overlap. The input file is hashed in a worker thread and, if the same grid was generated before, the
+    cached grid is copied to the output file without running the tool. The output file is never pruned from the
+    cache, so it can be referenced by the imported geometry.
+    Emits progress with each line written by the tool, and finished with the path of the generated STL,
+    failed with the tool output or cancelled if cancel() was called. """
+
+    progress = QtCore.Signal(str)
+    finished = QtCore.Signal(str)
+    failed = QtCore.Signal(str)
+    cancelled = QtCore.Signal()
+
+    def __init__(self, executable: str, input_file: str, executable_parameters: list, output_dir: str = None, parent=None):
+        super().__init__(parent=parent)
+        self.executable: str = executable
+        self.input_file: str = input_file
+        self.executable_parameters: list = executable_parameters
+        self.output_file: str = "{}/bathymetry_{}.stl".format(output_dir or gettempdir(), uuid4().hex)
+        self.cache_dir: str = None
+        self.cache_key: str = None
+        self.output: str = ""
+        self.is_cancelled: bool = False
+        self.hash_task: BackgroundTask = None
+        self.process: QtCore.QProcess = None
+
+    def get_full_parameters(self) -> list:
+        """ Returns the full argument vector of the tool for this run. """
+        return ["-loadpos", self.input_file] + self.executable_parameters + ["-savegrid:stl:m", self.output_file]
+
+    def start(self):
+        """ Starts the run. The cache is checked in a worker thread. """
+        self.progress.emit("Checking cached results...")
+        self.cache_dir = get_bathymetry_cache_dir()
+        self.hash_task = BackgroundTask(restore_cached_bathymetry, self.executable, self.input_file,
+                                        self.executable_parameters, self.cache_dir, self.output_file)
+        self.hash_task.finished.connect(self.on_cache_checked)
+        self.hash_task.start()
+
+    def cancel(self):
+        """ Stops the run. The tool is stopped if it's running, and it won't be started if the cache is
+        still being checked. """
+        self.is_cancelled = True
+        if self.process is not None and self.process.state() != QtCore.QProcess.NotRunning:
+            self.process.kill()
+
+    def remove_output_file(self):
+        """ Removes the output file of a cancelled run, if it was written. """
+        try:
+            os.remove(self.output_file)
+        except OSError:
+            pass
+
+    def on_cache_checked(self):
+        """ Returns the cached grid if available, or runs the tool otherwise. """
+        if self.is_cancelled:
+            self.remove_output_file()
+            self.cancelled.emit()
+            return
+        if self.hash_task.exception is not None:
+            debug("Bathymetry cache disabled for this run: {}".format(self.hash_task.exception))
+        else:
+            self.cache_key, cached = self.hash_task.result
+            if cached:
+                log("Using cached bathymetry for {}".format(self.output_file))
+                self.progress.emit("Using cached result")
+                self.finished.emit(self.output_file)
+                return
+
+        self.process = QtCore.QProcess(self)
+        self.process.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+        self.process.readyReadStandardOutput.connect(self.on_stdout_ready)
+        self.process.finished.connect(self.on_process_finished)
+        log("Executing: {} {}".format(self.executable, " ".join(self.get_full_parameters())))
+        self.process.start(self.executable, self.get_full_parameters())
+
+    def on_stdout_ready(self):
+        """ Keeps the output of the tool and reports its last line as progress. """
+        current_output = str(self.process.readAllStandardOutput().data(), encoding="utf-8", errors="replace")
+        self.output += current_output
+        lines = [line.strip() for line in current_output.splitlines() if line.strip()]
+        if lines:
+            self.progress.emit(lines[-1])
+
+    def on_process_finished(self, exit_code, exit_status=None):
+        """ Stores the generated grid in the cache and notifies the result. """
+        if self.is_cancelled:
+            self.remove_output_file()
+            self.cancelled.emit()
+            return
+        if exit_code or exit_status == QtCore.QProcess.CrashExit or not path.isfile(self.output_file):
+            self.failed.emit(self.output)
+            return
+        if self.cache_key is not None:
+            try:
+                store_cached_bathymetry(self.cache_key, self.output_file, self.cache_dir)
+            except OSError as ex:
+                debug("Unable to cache bathymetry {}: {}".format(self.output_file, ex))
+        self.finished.emit(self.output_file)
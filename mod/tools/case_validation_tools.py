@@ -0,0 +1,486 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Static validation of a case before running GenCase or the solver.
+
+Checks the case data and the bounding boxes of its FreeCAD objects for
+errors that would make GenCase or DualSPHysics fail: cases without fluid,
+mk conflicts, referenced files that don't exist, inlet/outlet zones or
+gauges outside the domain, helper objects that don't reach the domain and
+variable resolution boxes that are not nested. Only bounding boxes are
+used, and those of the helper objects are queried from the helper index of
+the case, so it's fast enough to run on every save even for big cases.
+Time series files are scanned too, but only before running GenCase or the
+solver. """
+
+from glob import glob
+from os import path
+from time import perf_counter
+
+from PySide2 import QtWidgets
+
+from mod.appmode import AppMode
+from mod.constants import MKFLUID_LIMIT
+from mod.dataobjects.relaxation_zone.relaxation_zone_file import RelaxationZoneFile
+from mod.enums import HelperKind, InletOutletElevationType, InletOutletVelocitySpecType, InletOutletZoneGeneratorType, \
+    InletOutletZSurfMode, MLPistonType, MotionType, ObjectType, SDPositionPropertyType, ValidationSeverity
+from mod.tools.background_tools import run_in_background
+from mod.tools.data_file_tools import DataFileSpec, scan_data_file
+from mod.tools.dialog_tools import StageProgressDialog, ok_cancel_dialog
+from mod.tools.gauge_array_tools import get_member_end_points
+from mod.tools.helper_index_tools import get_helper_objects, query_helpers_box
+from mod.tools.outparts_tools import get_object_bounds
+from mod.tools.point_set_tools import points_inside_box
+from mod.tools.stdout_tools import debug, error, warning
+from mod.tools.translation_tools import __
+
+# Relative tolerance when comparing positions with the domain limits
+DOMAIN_TOLERANCE = 1e-6
+# Errors listed in the confirmation dialog. The rest are shown in its details.
+MAX_LISTED_ERRORS = 5
+# Helper objects checked against the domain. Inlet/outlet zones, gauges and variable resolution boxes have their own checks.
+DOMAIN_HELPER_KINDS = (HelperKind.OUTPUT_FILTER, HelperKind.FLOWTOOL_BOX, HelperKind.DAMPING_ZONE)
+
+
+class ValidationIssue():
+    """ An issue found validating a case, with a hint on how to fix it. """
+
+    def __init__(self, severity: str, message: str, hint: str = ""):
+        self.severity: str = severity
+        self.message: str = message
+        self.hint: str = hint
+
+    @property
+    def is_error(self) -> bool:
+        """ Returns whether the issue makes the execution fail. """
+        return self.severity == ValidationSeverity.ERROR
+
+    def __str__(self):
+        text = "[{}] {}".format(self.severity.upper(), self.message)
+        return "{} {}".format(text, self.hint) if self.hint else text
+
+
+def resolve_domain_limit(position_property, particle_limit: float, is_max: bool) -> float:
+    """ Returns a simulation domain limit from its configuration and the particle limit on the same side. """
+    sign = 1 if is_max else -1
+    if position_property.type == SDPositionPropertyType.VALUE:
+        return position_property.value
+    if position_property.type == SDPositionPropertyType.DEFAULT_VALUE:
+        return particle_limit + sign * position_property.value
+    if position_property.type == SDPositionPropertyType.DEFAULT_PERCENTAGE:
+        return particle_limit + sign * position_property.value * particle_limit / 100
+    return particle_limit
+
+
+def get_domain_limits(domain, particle_min: list, particle_max: list) -> tuple:
+    """ Returns the (min, max) corners of the simulation domain for the given particle limits. """
+    domain_min = [resolve_domain_limit(getattr(domain, "posmin_" + axis), particle_min[index], False)
+                  for index, axis in enumerate("xyz")]
+    domain_max = [resolve_domain_limit(getattr(domain, "posmax_" + axis), particle_max[index], True)
+                  for index, axis in enumerate("xyz")]
+    return domain_min, domain_max
+
+
+def get_particle_limits(case, mode3d: bool) -> tuple:
+    """ Returns the (min, max) corners of the union of the bounding boxes of the simulation objects,
+    an approximation of the particle limits GenCase computes. Returns None if there are no objects. """
+    limits = None
+    for obj in case.objects:
+        if obj.type == ObjectType.SPECIAL:
+            continue
+        try:
+            minimum, maximum = get_object_bounds(obj, mode3d)
+        except (AttributeError, StopIteration):
+            continue
+        if limits is None:
+            limits = (list(minimum), list(maximum))
+        else:
+            limits = ([min(a, b) for a, b in zip(limits[0], minimum)], [max(a, b) for a, b in zip(limits[1], maximum)])
+    return limits
+
+
+def is_inside(point: list, box_min: list, box_max: list, mode3d: bool) -> bool:
+    """ Returns whether a point is inside a box. The Y axis is ignored in 2D cases. """
+    for axis in (0, 1, 2) if mode3d else (0, 2):
+        tolerance = DOMAIN_TOLERANCE * max(abs(box_min[axis]), abs(box_max[axis]), 1.0)
+        if point[axis] < box_min[axis] - tolerance or point[axis] > box_max[axis] + tolerance:
+            return False
+    return True
+
+
+def get_zone_bounds(zone) -> tuple:
+    """ Returns the (min, max) corners of the generator of an inlet/outlet zone, or None for mk based zones. """
+    zone_info = zone.zone_info
+    if zone_info.zone_generator_type == InletOutletZoneGeneratorType.BOX:
+        point = zone_info.zone_box_generator.point
+        other_point = [p + s for p, s in zip(point, zone_info.zone_box_generator.size)]
+    elif zone_info.zone_generator_type == InletOutletZoneGeneratorType.LINE:
+        point = zone_info.zone_line_generator.point
+        other_point = zone_info.zone_line_generator.point2
+    elif zone_info.zone_generator_type == InletOutletZoneGeneratorType.CIRCLE:
+        radius = zone_info.zone_circle_generator.radius
+        point = [p - radius for p in zone_info.zone_circle_generator.point]
+        other_point = [p + radius for p in zone_info.zone_circle_generator.point]
+    else:
+        return None
+    return [min(a, b) for a, b in zip(point, other_point)], [max(a, b) for a, b in zip(point, other_point)]
+
+
+def get_zone_direction(zone) -> list:
+    """ Returns the inflow direction of an inlet/outlet zone as a 3D vector. """
+    if zone.zone_info.zone_generator_type <= InletOutletZoneGeneratorType.MK_2D:
+        direction_2d = zone.zone_info.zone_direction_2d.direction
+        return [direction_2d[0], 0.0, direction_2d[1]]
+    return list(zone.zone_info.zone_direction_3d.direction)
+
+
+def check_particles(case) -> list:
+    """ Checks that the case has particles and that the constant b can be computed. """
+    issues = list()
+    if not any(obj.type != ObjectType.SPECIAL for obj in case.objects):
+        issues.append(ValidationIssue(ValidationSeverity.ERROR, "The case does not have any simulation object.",
+                                      "Add some geometry to the simulation."))
+    elif not case.get_all_fluid_objects() and not case.inlet_outlet.zones \
+            and case.constants.hswl_auto and case.constants.speedsystem_auto:
+        issues.append(ValidationIssue(ValidationSeverity.ERROR, "The case does not have any fluid, so constant 'b' would be zero.",
+                                      "Add fluid to the simulation or set HSWL or SpeedSystem in the Constants section."))
+    return issues
+
+
+def check_mk_conflicts(case) -> list:
+    """ Checks that each mk has a single kind of motion and that the mk referenced by other elements exist. """
+    issues = list()
+    fluid_mks = {obj.obj_mk for obj in case.get_all_fluid_objects()}
+    bound_mks = {obj.obj_mk for obj in case.get_all_bound_objects()}
+    for real_mk, mk_properties in case.mkbasedproperties.items():
+        if mk_properties.float_property and mk_properties.has_movements():
+            issues.append(ValidationIssue(ValidationSeverity.ERROR,
+                                          "MKBound {} is floating and has a motion assigned.".format(real_mk - MKFLUID_LIMIT),
+                                          "Remove the motion or the floating configuration of that mk."))
+    for zone in case.inlet_outlet.zones:
+        if zone.zone_info.zone_generator_type in (InletOutletZoneGeneratorType.MK_2D, InletOutletZoneGeneratorType.MK_3D) \
+                and zone.zone_info.zone_mk_generator.mkfluid not in fluid_mks:
+            issues.append(ValidationIssue(ValidationSeverity.ERROR,
+                                          "An inlet/outlet zone uses MKFluid {}, which does not exist.".format(zone.zone_info.zone_mk_generator.mkfluid),
+                                          "Select the mk of a fluid object in the inlet/outlet zone."))
+    for gauge in case.gauges.gauges_dict.values():
+        if gauge.type == "force" and str(gauge.target).strip().lstrip("-").isdigit() and int(gauge.target) not in bound_mks:
+            issues.append(ValidationIssue(ValidationSeverity.WARNING,
+                                          "Force gauge {} targets MKBound {}, which does not exist.".format(gauge.name, gauge.target)))
+    return issues
+
+
+def locate_case_file(case, file_path: str) -> str:
+    """ Returns the path of a file referenced by the case, as an absolute path or relative to the case folders,
+    or None if it does not exist. """
+    if not file_path:
+        return None
+    candidates = [file_path]
+    if case.path and not path.isabs(file_path):
+        candidates += [path.join(case.path, file_path), path.join(case.get_out_folder_path(), file_path)]
+    return next((candidate for candidate in candidates if path.isfile(candidate)), None)
+
+
+def find_case_file(case, file_path: str) -> bool:
+    """ Returns whether a file referenced by the case exists, as an absolute path or relative to the case folders. """
+    return locate_case_file(case, file_path) is not None
+
+
+def get_referenced_files(case) -> list:
+    """ Returns the files referenced by the case as (description, file path) tuples. """
+    referenced_files = list()
+    for obj in case.get_all_complex_objects():
+        if obj.is_loaded_geometry:
+            loaded_file = obj.filename if find_case_file(case, obj.filename) else obj.origin_filename
+            referenced_files.append(("Geometry of {}".format(obj.name), loaded_file))
+    for real_mk, mk_properties in case.mkbasedproperties.items():
+        for movement in mk_properties.movements:
+            generator = getattr(movement, "generator", None)
+            if generator is not None and hasattr(generator, "filename"):
+                referenced_files.append(("Motion file of mk {}".format(real_mk), generator.filename))
+    for acceleration in case.acceleration_input.acclist:
+        referenced_files.append(("Acceleration input file", acceleration.datafile))
+    for index, zone in enumerate(case.inlet_outlet.zones):
+        if zone.velocity_info.velocity_specification_type in (InletOutletVelocitySpecType.FILE_UNIFORM,
+                                                              InletOutletVelocitySpecType.FILE_LINEAR,
+                                                              InletOutletVelocitySpecType.FILE_PARABOLIC):
+            referenced_files.append(("Velocity file of inlet/outlet zone {}".format(index), zone.velocity_info.file_path))
+        if zone.elevation_info.elevation_enabled and zone.elevation_info.elevation_type == InletOutletElevationType.VARIABLE \
+                and zone.elevation_info.zsurf_mode == InletOutletZSurfMode.FILE:
+            referenced_files.append(("Surface file of inlet/outlet zone {}".format(index), zone.elevation_info.zsurffile))
+    return referenced_files
+
+
+def check_referenced_files(case) -> list:
+    """ Checks that the files referenced by the case exist. """
+    return [ValidationIssue(ValidationSeverity.ERROR, "{} not found: '{}'.".format(description, file_path),
+                            "Select the file again.")
+            for description, file_path in get_referenced_files(case) if not find_case_file(case, file_path)]
+
+
+def get_motion_file_spec(real_mk: int, generator, timemax: float) -> DataFileSpec:
+    """ Returns how the file of a motion generator is read. """
+    description = "Motion file of mk {}".format(real_mk - MKFLUID_LIMIT)
+    time_span = (0.0, generator.duration or timemax)
+    if generator.type == MotionType.FILE_ROTATIONAL_GENERATOR:
+        return DataFileSpec(description, generator.filename, [0, 1], ["time", "angle"], time_span=time_span)
+    if generator.type == MotionType.FILE_GENERATOR:
+        return DataFileSpec(description, generator.filename, [generator.fieldtime, generator.fieldx, generator.fieldy, generator.fieldz],
+                            ["time", "x", "y", "z"], generator.fields, time_span)
+    columns, names = [generator.fieldtime], ["time"]
+    if generator.type == MotionType.FILE_PATH_GENERATOR:
+        columns, names = columns + [generator.fieldx, generator.fieldy, generator.fieldz], names + ["x", "y", "z"]
+    return DataFileSpec(description, generator.filename, columns + [generator.fieldang1, generator.fieldang2, generator.fieldang3],
+                        names + ["angle 1", "angle 2", "angle 3"], generator.fields, time_span)
+
+
+def get_data_files(case) -> list:
+    """ Returns the time series files referenced by the case as DataFileSpec, with the columns read from them. """
+    timemax = case.execution_parameters.timemax
+    data_files = list()
+    for real_mk, mk_properties in case.mkbasedproperties.items():
+        for movement in mk_properties.movements:
+            generator = getattr(movement, "generator", None)
+            if generator is not None and generator.type in (MotionType.FILE_GENERATOR, MotionType.FILE_ROTATIONAL_GENERATOR,
+                                                            MotionType.FILE_ROTATE_ADV_GENERATOR, MotionType.FILE_PATH_GENERATOR):
+                data_files.append(get_motion_file_spec(real_mk, generator, timemax))
+        piston = mk_properties.mlayerpiston
+        piston_data = list()
+        if piston is not None and piston.type == MLPistonType.MLPISTON1D:
+            piston_data = [piston]
+        elif piston is not None and piston.type == MLPistonType.MLPISTON2D:
+            piston_data = piston.veldata
+        for data in piston_data:
+            data_files.append(DataFileSpec("Piston velocity file of mk {}".format(real_mk - MKFLUID_LIMIT), data.filevelx,
+                                           [0, 1], ["time", "velocity"], time_span=(data.timedataini, data.timedataini + timemax)))
+    for acceleration in case.acceleration_input.acclist:
+        time_end = acceleration.time_end if acceleration.time_end > acceleration.time_start else timemax
+        data_files.append(DataFileSpec("Acceleration input file", acceleration.datafile, [0, 1, 2, 3],
+                                       ["time", "acceleration x", "acceleration y", "acceleration z"],
+                                       time_span=(acceleration.time_start, time_end)))
+    relaxation_zone = case.relaxation_zone
+    if isinstance(relaxation_zone, RelaxationZoneFile) and relaxation_zone.filesvel:
+        time_span = (relaxation_zone.start, relaxation_zone.start + relaxation_zone.duration if relaxation_zone.duration else timemax)
+        for file_path in sorted(glob("{}*".format(locate_case_file(case, relaxation_zone.filesvel) or relaxation_zone.filesvel))):
+            data_files.append(DataFileSpec("Relaxation zone velocity file", file_path, [0, 1], ["time", "velocity"],
+                                           time_span=time_span))
+    velocity_file_columns = {InletOutletVelocitySpecType.FILE_UNIFORM: ["time", "velocity"],
+                             InletOutletVelocitySpecType.FILE_LINEAR: ["time", "velocity 1", "velocity 2", "z 1", "z 2"],
+                             InletOutletVelocitySpecType.FILE_PARABOLIC: ["time", "velocity 1", "velocity 2", "velocity 3",
+                                                                          "z 1", "z 2", "z 3"]}
+    for index, zone in enumerate(case.inlet_outlet.zones):
+        names = velocity_file_columns.get(zone.velocity_info.velocity_specification_type)
+        if names:
+            data_files.append(DataFileSpec("Velocity file of inlet/outlet zone {}".format(index), zone.velocity_info.file_path,
+                                           list(range(len(names))), names, len(names), (0.0, timemax)))
+        if zone.elevation_info.elevation_enabled and zone.elevation_info.elevation_type == InletOutletElevationType.VARIABLE \
+                and zone.elevation_info.zsurf_mode == InletOutletZSurfMode.FILE:
+            data_files.append(DataFileSpec("Surface file of inlet/outlet zone {}".format(index), zone.elevation_info.zsurffile,
+                                           [0, 1], ["time", "z"], time_span=(0.0, timemax)))
+    return data_files
+
+
+def check_data_files(case, progress_dialog: StageProgressDialog = None) -> list:
+    """ Scans the time series files referenced by the case in a worker thread and checks their columns, that
+    time increases and that they cover the time where they are used. Files that don't exist are skipped. """
+    issues = list()
+    for data_file in get_data_files(case):
+        file_path = locate_case_file(case, data_file.file_path)
+        if file_path is None:
+            continue
+        if progress_dialog is not None:
+            progress_dialog.start_stage(data_file.description)
+        try:
+            scan = run_in_background(scan_data_file, file_path, data_file.columns, data_file.field_count,
+                                     progress_slot=progress_dialog.update_info if progress_dialog is not None else None)
+        except OSError as ex:
+            issues.append(ValidationIssue(ValidationSeverity.ERROR, "{} can't be read: {}".format(data_file.description, ex)))
+            continue
+        for severity, message in scan.get_problems(data_file.time_span):
+            hint = "Check the file and the columns set for it." if severity == ValidationSeverity.ERROR \
+                else "Extend the data or change the time where it's used."
+            issues.append(ValidationIssue(severity, "{} '{}': {}".format(data_file.description, data_file.file_path, message), hint))
+    return issues
+
+
+def check_inlet_zones(case, domain_min: list, domain_max: list, mode3d: bool) -> list:
+    """ Checks that inlet/outlet zones, including the buffer of layers behind them, are inside the domain. """
+    issues = list()
+    for index, zone in enumerate(case.inlet_outlet.zones):
+        zone_bounds = get_zone_bounds(zone)
+        if zone_bounds is None:
+            continue
+        buffer_length = zone.layers * case.dp
+        direction = get_zone_direction(zone)
+        corners = list()
+        for corner in zone_bounds:
+            corners.append(corner)
+            corners.append([c - d * buffer_length for c, d in zip(corner, direction)])
+        if not all(is_inside(corner, domain_min, domain_max, mode3d) for corner in corners):
+            issues.append(ValidationIssue(ValidationSeverity.ERROR,
+                                          "Inlet/outlet zone {} or its {} layers are outside the domain.".format(index, zone.layers),
+                                          "Move the zone inside the domain or enlarge the domain in 'Execution parameters'."))
+    return issues
+
+
+def get_gauge_points(gauge) -> list:
+    """ Returns the points that define the region measured by a gauge. """
+    if gauge.type == "array":
+        end_points = get_member_end_points(gauge)
+        return [list(point) for point in gauge.points] + (end_points.tolist() if end_points is not None else list())
+    if not hasattr(gauge, "point0"):
+        return list()
+    points = [list(gauge.point0)]
+    if hasattr(gauge, "point1"):
+        points.append(list(gauge.point1))
+    if gauge.type == "maxz":
+        points.append([gauge.point0[0], gauge.point0[1], gauge.point0[2] + gauge.height])
+    if gauge.type in ("mesh", "flow"):
+        far_point = list(gauge.point0)
+        for vector, length in ((gauge.vec1, gauge.size1_length), (gauge.vec2, gauge.size2_length),
+                               (getattr(gauge, "vec3", None), getattr(gauge, "size3_length", 0))):
+            if vector is not None:
+                far_point = [p + v * length for p, v in zip(far_point, vector)]
+        points.append(far_point)
+    return points
+
+
+def check_gauges(case, domain_min: list, domain_max: list, mode3d: bool) -> list:
+    """ Checks that gauges are inside the domain, testing all their points at once. """
+    gauge_names, points = list(), list()
+    for name, gauge in case.gauges.gauges_dict.items():
+        gauge_points = get_gauge_points(gauge)
+        gauge_names += [name] * len(gauge_points)
+        points += gauge_points
+    inside = points_inside_box(points, domain_min, domain_max, mode3d, DOMAIN_TOLERANCE)
+    outside_names = {name for name, is_point_inside in zip(gauge_names, inside) if not is_point_inside}
+    return [ValidationIssue(ValidationSeverity.WARNING, "Gauge {} is outside the domain.".format(name),
+                            "It won't measure any particle.")
+            for name in case.gauges.gauges_dict if name in outside_names]
+
+
+def check_helpers_in_domain(case, domain_min: list, domain_max: list, mode3d: bool) -> list:
+    """ Checks that output filters, FlowTool boxes and damping zones reach the domain. The Y axis is ignored in 2D cases. """
+    inside_keys = query_helpers_box(case, domain_min, domain_max, mode3d, DOMAIN_HELPER_KINDS)
+    issues = list()
+    for kind in DOMAIN_HELPER_KINDS:
+        helper_objects = get_helper_objects(case, kind)
+        for key in sorted(key for key in case.helper_index.keys() if key[0] == kind and key not in inside_keys):
+            issues.append(ValidationIssue(ValidationSeverity.WARNING,
+                                          "{} {} is outside the domain.".format(kind, helper_objects.get(key, key[1])),
+                                          "It won't have any effect."))
+    return issues
+
+
+def get_box_limits(bufferbox) -> tuple:
+    """ Returns the (min, max) corners of a variable resolution box. """
+    return list(bufferbox.point), [p + s for p, s in zip(bufferbox.point, bufferbox.size)]
+
+
+def get_overlapping_boxes(bufferboxes: list, mode3d: bool) -> list:
+    """ Returns the pairs of boxes that overlap, sweeping them sorted along X so only boxes that overlap
+    along X are compared. """
+    overlapping = list()
+    open_boxes = list()
+    for bufferbox in sorted(bufferboxes, key=lambda box: box.point[0]):
+        box_min, box_max = get_box_limits(bufferbox)
+        open_boxes = [other for other in open_boxes if get_box_limits(other)[1][0] > box_min[0]]
+        for other in open_boxes:
+            other_min, other_max = get_box_limits(other)
+            if all(box_min[i] < other_max[i] and other_min[i] < box_max[i] for i in range(3) if mode3d or i != 1):
+                overlapping.append((other, bufferbox))
+        open_boxes.append(bufferbox)
+    return overlapping
+
+
+def check_vres_boxes(case, domain_min: list, domain_max: list, mode3d: bool) -> list:
+    """ Checks the tree of variable resolution boxes: boxes must have a size and be nested inside their parent box
+    or the domain, boxes with the same parent must not overlap and children must be finer than their parent. """
+    issues = list()
+    if not case.vres.active:
+        return issues
+    tree_order = [bufferbox for bufferbox, _ in case.vres.get_tree_order()]
+    ordered_ids = {bufferbox.id for bufferbox in tree_order}
+    for bufferbox in [box for box in case.vres.bufferbox_list if box.id not in ordered_ids]:
+        issues.append(ValidationIssue(ValidationSeverity.ERROR,
+                                      "Variable resolution box {} is its own ancestor.".format(bufferbox.id),
+                                      "Change the parent of the box."))
+    for bufferbox in tree_order:
+        if not bufferbox.active:
+            continue
+        box_min, box_max = get_box_limits(bufferbox)
+        if any(size <= 0 for index, size in enumerate(bufferbox.size) if mode3d or index != 1) or bufferbox.dp_ratio <= 0:
+            issues.append(ValidationIssue(ValidationSeverity.ERROR,
+                                          "Variable resolution box {} has no size or an invalid dp ratio.".format(bufferbox.id)))
+            continue
+        if bufferbox.parent is not None:
+            parent_min, parent_max = get_box_limits(bufferbox.parent)
+            container = "its parent box {}".format(bufferbox.parent.id)
+        else:
+            parent_min, parent_max = domain_min, domain_max
+            container = "the domain"
+        if not (is_inside(box_min, parent_min, parent_max, mode3d) and is_inside(box_max, parent_min, parent_max, mode3d)):
+            issues.append(ValidationIssue(ValidationSeverity.ERROR,
+                                          "Variable resolution box {} is not inside {}.".format(bufferbox.id, container),
+                                          "Variable resolution boxes must be nested."))
+        if bufferbox.dp_ratio >= 1:
+            issues.append(ValidationIssue(ValidationSeverity.WARNING,
+                                          "Variable resolution box {} has a dp ratio of {:g}, so it's not finer than {}.".format(
+                                              bufferbox.id, bufferbox.dp_ratio, container),
+                                          "Use a dp ratio lower than 1 to refine the resolution."))
+    for siblings in case.vres.get_children_index().values():
+        for first, second in get_overlapping_boxes([box for box in siblings if box.active], mode3d):
+            issues.append(ValidationIssue(ValidationSeverity.ERROR,
+                                          "Variable resolution boxes {} and {} overlap.".format(first.id, second.id),
+                                          "Boxes at the same level must not overlap."))
+    return issues
+
+
+def validate_case(case) -> list:
+    """ Returns the list of ValidationIssue found in a case. """
+    mode3d = AppMode.is_3d()
+    issues = check_particles(case) + check_mk_conflicts(case) + check_referenced_files(case)
+    particle_limits = get_particle_limits(case, mode3d)
+    if particle_limits is not None:
+        domain_min, domain_max = get_domain_limits(case.domain, *particle_limits)
+        issues += check_inlet_zones(case, domain_min, domain_max, mode3d)
+        issues += check_gauges(case, domain_min, domain_max, mode3d)
+        issues += check_helpers_in_domain(case, domain_min, domain_max, mode3d)
+        issues += check_vres_boxes(case, domain_min, domain_max, mode3d)
+    return issues
+
+
+def log_validation_issues(issues: list) -> None:
+    """ Writes the issues found validating a case in the report view. """
+    for issue in issues:
+        if issue.is_error:
+            error(str(issue))
+        else:
+            warning(str(issue))
+
+
+def confirm_case_validation(case, action: str) -> bool:
+    """ Validates a case before an action (running GenCase, the solver...) and logs the issues found.
+    If there are errors, asks whether to continue anyway. Returns whether the action should continue. """
+    start_time = perf_counter()
+    issues = validate_case(case)
+    data_file_count = len(get_data_files(case))
+    if data_file_count:
+        progress_dialog = StageProgressDialog("Checking data files. Please wait.", data_file_count)
+        progress_dialog.show()
+        try:
+            issues += check_data_files(case, progress_dialog)
+        finally:
+            progress_dialog.close_dialog()
+    debug("Case validated in {:.3f} s with {} issues".format(perf_counter() - start_time, len(issues)))
+    log_validation_issues(issues)
+    errors = [issue for issue in issues if issue.is_error]
+    if not errors:
+        return True
+    listed_errors = "\n".join("- {}".format(issue.message) for issue in errors[:MAX_LISTED_ERRORS])
+    if len(errors) > MAX_LISTED_ERRORS:
+        listed_errors += "\n" + __("... and {} more.").format(len(errors) - MAX_LISTED_ERRORS)
+    answer = ok_cancel_dialog(__("Case validation"), __(
+        "The case has errors that will probably make {} fail:\n\n{}\n\nRun anyway?"
+    ).format(action, listed_errors), "\n".join(str(issue) for issue in issues))
+    return answer == QtWidgets.QMessageBox.Ok
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Streaming checks of the time series files referenced by a case.
+
+Motion files, acceleration input files, multi-layer piston velocities,
+relaxation zone velocities and inlet/outlet velocity files are only copied
+into the case, and the solver is the first one to read them. These files can
+take several GB, so they are read in chunks of lines and reduced on the fly:
+the number of values of each row, whether time increases, the time range and
+a decimated copy of the series for previews. Memory use doesn't depend on
+the size of the file. """
+
+import os
+import warnings
+from os import path
+from time import perf_counter
+
+import numpy as np
+
+from mod.constants import DATA_FILE_PREVIEW_ROWS
+from mod.enums import ValidationSeverity
+from mod.tools.stdout_tools import debug
+
+DATA_FILE_CHUNK_BYTES = 1 << 23  # Bytes of lines parsed at once
+MAX_REPORTED_LINES = 5  # Line numbers listed for each kind of problem
+TIME_TOLERANCE = 1e-6  # Seconds of margin when comparing the time range of a file with the time it's used
+NEWLINE_BYTE = ord("\n")
+SEPARATOR_BYTES = np.zeros(256, dtype=bool)  # Bytes that separate values once commas and semicolons are replaced
+SEPARATOR_BYTES[list(b" \t\r\n\v\f")] = True
+
+# Scans by (path, size, modification time, columns, number of values), so files are only read once per session.
+_file_scans: dict = dict()
+
+
+class DataFileSpec():
+    """ A time series file referenced by the case and how it's read.
+
+    Attributes:
+        description: What the file is used for
+        file_path: Path of the file, as referenced by the case
+        columns: Indexes of the columns read, time first
+        column_names: Names of the columns read
+        field_count: Number of values of each row, 0 if any number is valid as long as all rows have the same
+        time_span: (start, end) times that the data must cover, or None
+    """
+
+    def __init__(self, description: str, file_path: str, columns: list, column_names: list, field_count: int = 0,
+                 time_span: tuple = None):
+        self.description: str = description
+        self.file_path: str = file_path
+        self.columns: list = columns
+        self.column_names: list = column_names
+        self.field_count: int = field_count
+        self.time_span: tuple = time_span
+
+
+class DataFileScan():
+    """ Summary of the rows of a data file, built chunk by chunk.
+    Lines that are empty or start with # are ignored. Lines that are not numeric before the first row of
+    data are taken as headers. """
+
+    def __init__(self, file_path: str, columns: list, field_count: int = 0, preview_rows: int = DATA_FILE_PREVIEW_ROWS):
+        self.file_path: str = file_path
+        self.columns: list = list(columns)
+        self.field_count: int = field_count
+        self.preview_rows: int = preview_rows
+        self.column_count: int = 0
+        self.rows: int = 0
+        self.header_lines: int = 0
+        self.bad_lines: int = 0
+        self.first_bad_lines: list = list()
+        self.unordered_rows: int = 0
+        self.first_unordered_lines: list = list()
+        self.first_time: float = None
+        self.last_row: np.ndarray = None
+        self.value_min: np.ndarray = None
+        self.value_max: np.ndarray = None
+        self.preview: np.ndarray = np.zeros((0, len(self.columns)))
+        self.preview_stride: int = 1
+
+    @property
+    def last_time(self) -> float:
+        """ Returns the time of the last row. """
+        return None if self.last_row is None else float(self.last_row[0])
+
+    @property
+    def readable(self) -> bool:
+        """ Returns whether the rows have all the columns read. """
+        return self.column_count > max(self.columns)
+
+    def add_chunk(self, first_line: int, data: bytes) -> None:
+        """ Adds a chunk of lines that starts at the given line number. Chunks with only empty lines and rows
+        of numbers with the expected number of values are parsed at once. Otherwise, they are split line by line. """
+        if self.column_count and self.readable and b"#" not in data:
+            counts = count_line_values(data)
+            if np.all((counts == 0) | (counts == self.column_count)):
+                values = parse_values(data)
+                valid = np.flatnonzero(counts)
+                if values is not None and values.size == len(valid) * self.column_count:
+                    if len(valid):
+                        self.add_rows(first_line + valid, values.reshape(-1, self.column_count)[:, self.columns])
+                    return
+        self.add_lines(first_line, split_data_lines(data))
+
+    def add_lines(self, first_line: int, split_lines: list) -> None:
+        """ Adds a chunk of lines, split in values, that starts at the given line number. """
+        if not self.column_count:
+            for index, values in enumerate(split_lines):
+                if not values or values[0].startswith("#"):
+                    continue
+                if to_float_row(values) is None:
+                    self.header_lines += 1
+                    continue
+                self.column_count = self.field_count or len(values)
+                first_line, split_lines = first_line + index, split_lines[index:]
+                break
+            else:
+                return
+
+        counts = np.fromiter((len(values) for values in split_lines), dtype=np.int64, count=len(split_lines))
+        ignored = np.fromiter((not values or values[0].startswith("#") for values in split_lines), dtype=bool,
+                              count=len(split_lines))
+        valid = np.flatnonzero((counts == self.column_count) & ~ignored)
+        bad = (counts != self.column_count) & ~ignored
+        rows = [split_lines[index] for index in valid]
+        try:
+            values = np.array(rows, dtype=float).reshape(-1, self.column_count)
+        except ValueError:
+            parsed = [to_float_row(row) for row in rows]
+            numeric = np.array([row is not None for row in parsed], dtype=bool)
+            bad[valid[~numeric]] = True
+            valid = valid[numeric]
+            values = np.array([row for row in parsed if row is not None], dtype=float).reshape(-1, self.column_count)
+        # Both kinds of bad lines are added together so the reported lines keep the order of the file
+        self.add_bad_lines(first_line + np.flatnonzero(bad))
+        if self.readable and len(values):
+            self.add_rows(first_line + valid, values[:, self.columns])
+
+    def add_bad_lines(self, line_numbers: np.ndarray) -> None:
+        """ Counts lines that are not numeric or don't have the expected number of values. """
+        self.bad_lines += len(line_numbers)
+        self.first_bad_lines += line_numbers[:MAX_REPORTED_LINES - len(self.first_bad_lines)].tolist()
+
+    def add_rows(self, line_numbers: np.ndarray, data: np.ndarray) -> None:
+        """ Adds rows of data, with the columns read, to the time checks, the value ranges and the preview. """
+        times = data[:, 0]
+        previous_time = times[0] if self.last_row is None else self.last_row[0]
+        unordered = np.flatnonzero(np.diff(times, prepend=previous_time) <= 0)
+        if self.last_row is None:
+            unordered = unordered[1:]
+            self.first_time = float(times[0])
+            self.value_min, self.value_max = data.min(axis=0), data.max(axis=0)
+        else:
+            self.value_min, self.value_max = np.minimum(self.value_min, data.min(axis=0)), np.maximum(self.value_max, data.max(axis=0))
+        self.unordered_rows += len(unordered)
+        self.first_unordered_lines += line_numbers[unordered][:MAX_REPORTED_LINES - len(self.first_unordered_lines)].tolist()
+
+        # Keeps the rows that are multiple of the stride, doubling it when the preview gets too big.
+        row_indexes = np.arange(self.rows, self.rows + len(data))
+        self.preview = np.concatenate((self.preview, data[row_indexes % self.preview_stride == 0]))
+        while len(self.preview) > 2 * self.preview_rows:
+            self.preview = self.preview[::2]
+            self.preview_stride *= 2
+        self.rows += len(data)
+        self.last_row = data[-1]
+
+    def get_preview(self) -> np.ndarray:
+        """ Returns the decimated rows, with the columns read, always including the last one. """
+        if self.last_row is None or (self.rows - 1) % self.preview_stride == 0:
+            return self.preview
+        return np.concatenate((self.preview, self.last_row[np.newaxis]))
+
+    def get_problems(self, time_span: tuple = None) -> list:
+        """ Returns the problems found as (severity, message) tuples. time_span is the (start, end) time where the
+        data is used, to warn if the file doesn't cover it. """
+        problems = list()
+        if self.field_count and self.field_count <= max(self.columns):
+            problems.append((ValidationSeverity.ERROR, "Column {} is read but the rows have {} values.".format(
+                max(self.columns), self.field_count)))
+        elif self.column_count and not self.readable:
+            problems.append((ValidationSeverity.ERROR, "Rows have {} values but column {} is read.".format(
+                self.column_count, max(self.columns))))
+        elif not self.rows:
+            problems.append((ValidationSeverity.ERROR, "No data rows found."))
+        if self.bad_lines:
+            problems.append((ValidationSeverity.ERROR, "{} lines are not numeric or don't have {} values (line {}).".format(
+                self.bad_lines, self.column_count, ", ".join(str(line) for line in self.first_bad_lines))))
+        if self.unordered_rows:
+            problems.append((ValidationSeverity.ERROR, "Time does not increase in {} rows (line {}).".format(
+                self.unordered_rows, ", ".join(str(line) for line in self.first_unordered_lines))))
+        if time_span is not None and self.rows:
+            start, end = time_span
+            if self.first_time > start + TIME_TOLERANCE:
+                problems.append((ValidationSeverity.WARNING, "Data starts at t={:g} s but it's used from t={:g} s.".format(
+                    self.first_time, start)))
+            if self.last_time < end - TIME_TOLERANCE:
+                problems.append((ValidationSeverity.WARNING, "Data ends at t={:g} s but it's used until t={:g} s.".format(
+                    self.last_time, end)))
+        return problems
+
+
+def to_float_row(values: list) -> list:
+    """ Returns the values of a row as floats, or None if any of them is not a number. """
+    try:
+        return [float(value) for value in values]
+    except ValueError:
+        return None
+
+
+def read_data_chunks(file_path: str, report_progress=None):
+    """ Yields the lines of a data file in chunks of about DATA_FILE_CHUNK_BYTES, as (number of the first line, bytes),
+    with commas and semicolons replaced by spaces. Chunks always end at the end of a line.
+    report_progress, if given, is called with a message with the percentage of the file read. """
+    total_bytes = max(path.getsize(file_path), 1)
+    first_line = 1
+    with open(file_path, "rb") as data_file:
+        while True:
+            lines = data_file.readlines(DATA_FILE_CHUNK_BYTES)
+            if not lines:
+                return
+            yield first_line, b"".join(lines).replace(b",", b" ").replace(b";", b" ")
+            first_line += len(lines)
+            if report_progress is not None:
+                report_progress("{} ({:.0f}%)".format(path.basename(file_path), 100 * data_file.tell() / total_bytes))
+
+
+def split_data_lines(data: bytes) -> list:
+    """ Returns the lines of a chunk of a data file split in values. """
+    lines = data.decode("utf-8", errors="replace").split("\n")
+    if lines and not lines[-1]:
+        lines.pop()
+    return [line.split() for line in lines]
+
+
+def count_line_values(data: bytes) -> np.ndarray:
+    """ Returns the number of values of each line of a chunk of a data file, counting the starts of the
+    words of the chunk with NumPy instead of splitting each line. """
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    if not len(buffer):
+        return np.zeros(0, dtype=np.int64)
+    is_separator = SEPARATOR_BYTES[buffer]
+    value_starts = np.flatnonzero(~is_separator[1:] & is_separator[:-1]) + 1
+    if not is_separator[0]:
+        value_starts = np.concatenate(([0], value_starts))
+    line_ends = np.flatnonzero(buffer == NEWLINE_BYTE)
+    line_count = len(line_ends) + (buffer[-1] != NEWLINE_BYTE)
+    return np.bincount(np.searchsorted(line_ends, value_starts), minlength=line_count)
+
+
+def parse_values(data: bytes) -> np.ndarray:
+    """ Returns all the values of a chunk of a data file as a flat array, or None if any of them is not a number. """
+    with warnings.catch_warnings():
+        # Older NumPy versions warn and return the values read so far instead of raising
+        warnings.simplefilter("ignore", DeprecationWarning)
+        try:
+            return np.fromstring(data, dtype=float, sep=" ")
+        except ValueError:
+            return None
+
+
+def scan_data_file(file_path: str, columns: list, field_count: int = 0, report_progress=None) -> DataFileScan:
+    """ Scans a data file reading the given columns, time first. Scans are reused until the file changes.
+    Raises OSError if the file can't be read. """
+    file_stat = os.stat(file_path)
+    scan_key = (path.abspath(file_path), file_stat.st_size, file_stat.st_mtime_ns, tuple(columns), field_count)
+    if scan_key not in _file_scans:
+        start_time = perf_counter()
+        scan = DataFileScan(file_path, columns, field_count)
+        for first_line, data in read_data_chunks(file_path, report_progress):
+            scan.add_chunk(first_line, data)
+        debug("Scanned {} rows of {} in {:.3f} s".format(scan.rows, file_path, perf_counter() - start_time))
+        _file_scans[scan_key] = scan
+    return _file_scans[scan_key]
+
+
+def load_data_columns(file_path: str, columns: list) -> np.ndarray:
+    """ Returns the given columns of a data file as a (rows, len(columns)) array. Lines that are not numeric or
+    don't have the columns, like headers, are skipped. Raises ValueError if the file has no data rows. """
+    last_column = max(columns)
+    chunks = list()
+    for _, data in read_data_chunks(file_path):
+        rows = list()
+        for values in split_data_lines(data):
+            if len(values) <= last_column:
+                continue
+            try:
+                rows.append([float(values[column]) for column in columns])
+            except ValueError:
+                continue
+        if rows:
+            chunks.append(np.array(rows))
+    if not chunks:
+        raise ValueError("No data found in {}".format(file_path))
+    return np.concatenate(chunks)
@@ -5,7 +5,7 @@
 Contains general use standard dialogs. """
 from PySide2.QtWidgets import QDialog
 
-from PySide2 import QtWidgets
+from PySide2 import QtCore, QtWidgets
 
 from mod.tools.translation_tools import __
 
@@ -27,11 +27,13 @@ def info_dialog(info_text, detailed_text=None):
     InformationDialog(__("Information"), info_text, detailed_text)
 
 
-def ok_cancel_dialog(title, text):
+def ok_cancel_dialog(title, text, detailed_text=None):
     """Spawns an okay/cancel dialog with the title and text passed"""
     open_confirm_dialog = QtWidgets.QMessageBox()
     open_confirm_dialog.setWindowTitle(title)
     open_confirm_dialog.setText(text)
+    if detailed_text:
+        open_confirm_dialog.setDetailedText(detailed_text)
     open_confirm_dialog.setStandardButtons(QtWidgets.QMessageBox.Ok |
                                            QtWidgets.QMessageBox.Cancel)
     open_confirm_dialog.setDefaultButton(QtWidgets.QMessageBox.Ok)
@@ -70,3 +72,60 @@ class WaitDialog(QDialog):
         self.wait_label2.setText(text)
         self.update()
 
+
+class StageProgressDialog(QDialog):
+    """ Dialog showing the progress of a sequence of stages. It can't be closed by the user and
+    blocks the rest of the interface while shown, but keeps being repainted.
+    If cancellable, a cancel button is shown and the cancelled flag should be checked between stages,
+    or cancel_requested connected to stop the operation right away. """
+
+    cancel_requested = QtCore.Signal()
+
+    def __init__(self, text: str, stage_count: int, cancellable: bool = False):
+        super().__init__()
+        self.setWindowModality(QtCore.Qt.ApplicationModal)
+        self.setMinimumWidth(400)
+        self.stage_layout = QtWidgets.QVBoxLayout()
+        self.stage_title_label = QtWidgets.QLabel(__(text))
+        self.stage_label = QtWidgets.QLabel()
+        self.stage_detail_label = QtWidgets.QLabel()
+        self.stage_progress = QtWidgets.QProgressBar()
+        self.stage_progress.setRange(0, stage_count)
+        self.stage_progress.setValue(0)
+        self.completed_stages: int = 0
+        self.cancelled: bool = False
+        self.stage_layout.addWidget(self.stage_title_label)
+        self.stage_layout.addWidget(self.stage_label)
+        self.stage_layout.addWidget(self.stage_progress)
+        self.stage_layout.addWidget(self.stage_detail_label)
+        if cancellable:
+            self.cancel_button = QtWidgets.QPushButton(__("Cancel"))
+            self.cancel_button.clicked.connect(self.on_cancel)
+            self.stage_layout.addWidget(self.cancel_button)
+        self.setLayout(self.stage_layout)
+
+    def closeEvent(self, evnt):
+        evnt.ignore()
+
+    def close_dialog(self):
+        self.accept()
+
+    def on_cancel(self):
+        """ Flags the operation as cancelled. It is stopped by its owner as soon as possible. """
+        self.cancelled = True
+        self.cancel_button.setEnabled(False)
+        self.stage_detail_label.setText(__("Cancelling..."))
+        self.cancel_requested.emit()
+
+    def start_stage(self, text: str):
+        """ Shows the next stage as the current one. Stages completed before are counted in the progress bar. """
+        self.stage_progress.setValue(min(self.completed_stages, self.stage_progress.maximum()))
+        self.completed_stages += 1
+        self.stage_label.setText(__(text))
+        self.stage_detail_label.setText("")
+        QtWidgets.QApplication.processEvents()
+
+    def update_info(self, text: str):
+        """ Shows details about what is being done in the current stage. """
+        self.stage_detail_label.setText(text)
+        QtWidgets.QApplication.processEvents()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Prediction of the disk space needed by the output of a simulation.
+
+The volume is computed from the particle estimate, the number of output
+parts (timemax / timeout) and the fraction of particles kept by the output
+parts filters. Fixed boundary particles are only stored in the first part,
+and every ignore_nparts parts the filters are not applied. The filters are
+evaluated on the particles written by GenCase if it was executed, or on
+particles sampled in the objects otherwise. """
+
+import math
+import shutil
+from os import path
+
+from mod.appmode import AppMode
+from mod.constants import PART_BYTES_PER_PARTICLE
+from mod.tools.outparts_tools import OutpartsPreview, get_outparts_mask, load_gencase_particles, sample_case_particles
+from mod.tools.particle_estimation_tools import ParticleEstimate, estimate_case_particles
+
+
+class DiskOutputPlan():
+    """ Predicted output volume of a simulation and the free space available for it. """
+
+    def __init__(self):
+        self.particles: int = 0
+        self.stored_particles: float = 0.0  # Particles stored in each part, without filters
+        self.kept_fraction: float = 1.0  # Fraction of the stored particles kept by the output filters
+        self.unfiltered_fraction: float = 0.0  # Fraction of the parts where the filters are ignored
+        self.timemax: float = 0.0
+        self.timeout: float = 0.0
+        self.free_space: int = -1  # -1 if unknown
+        self.skipped_objects: list = list()
+
+    @property
+    def part_count(self) -> int:
+        """ Number of output parts, including the initial one. """
+        if self.timeout <= 0:
+            return 1
+        return int(math.floor(self.timemax / self.timeout + 1e-9)) + 1
+
+    @property
+    def first_part_size(self) -> int:
+        """ Size of the initial part, which stores every particle. """
+        return int(self.particles * PART_BYTES_PER_PARTICLE)
+
+    @property
+    def part_size(self) -> int:
+        """ Mean size of the rest of the parts, with the output filters applied. """
+        effective_fraction = self.unfiltered_fraction + (1.0 - self.unfiltered_fraction) * self.kept_fraction
+        return int(self.stored_particles * effective_fraction * PART_BYTES_PER_PARTICLE)
+
+    @property
+    def unfiltered_part_size(self) -> int:
+        """ Size of each part if no output filters were applied. """
+        return int(self.stored_particles * PART_BYTES_PER_PARTICLE)
+
+    @property
+    def total_size(self) -> int:
+        """ Total predicted output volume, in bytes. """
+        return self.first_part_size + (self.part_count - 1) * self.part_size
+
+    @property
+    def unfiltered_total_size(self) -> int:
+        """ Total output volume without the output filters, in bytes. """
+        return self.first_part_size + (self.part_count - 1) * self.unfiltered_part_size
+
+    @property
+    def filter_savings(self) -> int:
+        """ Bytes saved by the output filters. """
+        return self.unfiltered_total_size - self.total_size
+
+    def exceeds_free_space(self) -> bool:
+        """ Returns whether the predicted output doesn't fit in the free space of the output folder. """
+        return self.free_space >= 0 and self.total_size > self.free_space
+
+    def suggest_timeout(self, budget: int) -> float:
+        """ Returns the minimum output interval (s) that keeps the output within a budget in bytes,
+        with the current filters. Returns -1 if not even the initial part fits. """
+        if budget <= self.first_part_size:
+            return -1
+        if self.part_size <= 0:
+            return self.timeout
+        max_parts = (budget - self.first_part_size) // self.part_size
+        if max_parts <= 0:
+            return -1
+        return max(self.timemax / max_parts, self.timeout)
+
+    def suggest_kept_fraction(self, budget: int) -> float:
+        """ Returns the maximum fraction of particles the output filters should keep for the output to
+        fit a budget in bytes at the current output interval. Returns -1 if it can't fit with filters alone. """
+        filtered_parts = (self.part_count - 1) * (1.0 - self.unfiltered_fraction)
+        if filtered_parts <= 0 or self.stored_particles <= 0:
+            return 1.0 if self.total_size <= budget else -1
+        unfiltered_parts = (self.part_count - 1) * self.unfiltered_fraction
+        available = budget - self.first_part_size - unfiltered_parts * self.unfiltered_part_size
+        fraction = available / (filtered_parts * self.unfiltered_part_size)
+        if fraction <= 0:
+            return -1
+        return min(fraction, 1.0)
+
+
+def get_free_space(folder: str) -> int:
+    """ Returns the free space in bytes of the file system of a folder, or of its nearest existing parent
+    if it's not created yet. Returns -1 if unknown. """
+    folder = path.abspath(folder)
+    while not path.isdir(folder):
+        parent = path.dirname(folder)
+        if parent == folder:
+            return -1
+        folder = parent
+    try:
+        return shutil.disk_usage(folder).free
+    except OSError:
+        return -1
+
+
+def plan_disk_output(case, estimate: ParticleEstimate = None, timemax: float = None, timeout: float = None) -> DiskOutputPlan:
+    """ Returns the predicted output volume of a case with its output filters and execution parameters.
+    The simulation time and output interval can be given to plan values not saved in the case yet.
+    If GenCase was already executed, the estimate is scaled to the real particle count. """
+    estimate = estimate or estimate_case_particles(case)
+    plan = DiskOutputPlan()
+    plan.timemax = case.execution_parameters.timemax if timemax is None else timemax
+    plan.timeout = case.execution_parameters.timeout if timeout is None else timeout
+    plan.skipped_objects = estimate.skipped_objects
+
+    scale = 1.0
+    if case.info.particle_number and estimate.total:
+        scale = case.info.particle_number / estimate.total
+    plan.particles = int(round(estimate.total * scale))
+    plan.stored_particles = (estimate.fluid + estimate.moving_bound) * scale
+
+    outparts = case.outparts
+    if outparts.active and outparts.ignore_nparts > 0:
+        plan.unfiltered_fraction = 1.0 / outparts.ignore_nparts
+    if outparts.active:
+        try:
+            particles = load_gencase_particles(case)
+        except (OSError, ValueError):
+            particles = sample_case_particles(case, estimate.object_particles, AppMode.is_3d())
+        plan.kept_fraction = OutpartsPreview(particles, get_outparts_mask(outparts, particles)).kept_fraction
+
+    plan.free_space = get_free_space(case.get_out_folder_path()) if case.path else -1
+    return plan
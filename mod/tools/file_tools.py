@@ -15,13 +15,17 @@ import shutil
 import re
 import pickle
 import sys
+import multiprocessing
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait as futures_wait
 from sys import platform
 from traceback import print_exc
 from glob import glob
 from os import path, chdir, makedirs
 from pickle import UnpicklingError  # Import the specific error
 
+from PySide2 import QtWidgets
+
 import FreeCAD
 import FreeCADGui
 import Mesh
@@ -33,15 +37,20 @@ from mod.dataobjects.inletoutlet.inlet_outlet_elevation_info import InletOutletE
 from mod.dataobjects.inletoutlet.inlet_outlet_velocity_info import InletOutletVelocityInfo
 from mod.dataobjects.motion.path_file_gen import PathFileGen
 from mod.dataobjects.motion.rotate_adv_file_gen import RotateAdvFileGen
-from mod.functions import get_designsphysics_path, get_mod_path
+from mod.functions import get_designsphysics_path, get_mod_path, atomic_open
+from mod.tools.background_tools import main_loop_paused, run_in_background
 from mod.tools.freecad_tools import manage_inlet_outlet_zones,manage_vres_bufferboxes, manage_gauges, manage_partfilters
-from mod.tools.stdout_tools import error, debug, log
+from mod.tools.stdout_tools import error, debug, log, warning
 from mod.tools.translation_tools import __
 from mod.xml.xml_exporter import XMLExporter
-from mod.tools.dialog_tools import error_dialog, warning_dialog, WaitDialog
+from mod.tools.dialog_tools import error_dialog, warning_dialog, StageProgressDialog
 from mod.tools.executable_tools import refocus_cwd
-from mod.tools.freecad_tools import document_count, prompt_close_all_documents, get_fc_object
-from mod.enums import ObjectType, ObjectFillMode, InletOutletVelocityType, InletOutletZSurfMode
+from mod.tools.freecad_tools import document_count, prompt_close_all_documents, get_fc_object, \
+    seed_inout_zone_geometry_keys
+from mod.tools.helper_index_tools import build_helper_index, update_helper_kind
+from mod.tools.mesh_tools import load_mesh_for_import, build_lod_mesh_arrays
+from mod.tools.point_set_tools import generate_point_set, save_point_set, write_measuretool_points
+from mod.enums import HelperKind, ObjectType, ObjectFillMode, InletOutletVelocityType, InletOutletZSurfMode
 from mod.tools.pickle_tool import CustomUnpickler
 
 from mod.constants import VERSION, PICKLE_PROTOCOL
@@ -94,6 +103,9 @@ def load_case(load_path: str) -> "Case":
                 warning_dialog(__("The case data you are loading comes from a previous version ({}) of this software. They may be missing features or errors. Please check your setup carefully.").format(loaded_data.version))
             elif loaded_data.version > VERSION:
                 warning_dialog(__("You are loading a case data from a future version ({}) of this software. You should upgrade DesignSPHysics as they may be errors using this file.").format(loaded_data.version))
+            # The helpers of the inlet/outlet zones were saved drawn with the loaded parameters
+            seed_inout_zone_geometry_keys(loaded_data.inlet_outlet.zones)
+            build_helper_index(loaded_data)
             return loaded_data
        
         except EOFError:
@@ -122,212 +134,187 @@ def load_case(load_path: str) -> "Case":
 
 
    
-def save_case(save_name: str, case: "Case") -> None:
-    """ Saves a case to disk in the given path. """
-    manage_inlet_outlet_zones(case.inlet_outlet.zones)
-    manage_vres_bufferboxes(case.vres.bufferbox_list)
-    manage_gauges(case.gauges.gauges_dict)
-    manage_partfilters(case.outparts.filts)
-    wait_dialog=WaitDialog("Case is saving. Please wait.")
-    wait_dialog.show()
-    project_name = save_name.split("/")[-1]
-
-    case.path = save_name
-    case.name = project_name
-
-    if not path.exists(save_name):
-        makedirs(save_name)
-
-    if not path.exists("{}/{}_out".format(save_name, project_name)):
-        makedirs("{}/{}_out".format(save_name, project_name))
-
-    # Export complex objects to STL, copy imported object files to the case
-    log("Saving geometries")
-    wait_dialog.update_info("Saving geometries")
-    for obj in case.get_all_complex_objects():
-        if obj.is_loaded_geometry:
-            filename=obj.filename.split("/")[-1] #TEST WINDOWS
-            dest_name=f"{save_name}/{filename}"
-            if not os.path.isfile(dest_name):
-                orig_name = obj.origin_filename
-                chdir(save_name)
-                try:
-                    #if os.sep=='\\':
-                    #    orig_name=orig_name.replace('/','\\')
-                    shutil.copy2(orig_name, dest_name)
-                    obj.filename=filename
-                except shutil.Error:
-                    error(f"shutil.Error: {shutil.Error.strerror}")
-                except IOError:
-                    error("Unable to copy {} into {}".format(orig_name, dest_name))
-        else:
-            filename = f"{save_name}/{obj.name}.stl"
-            object=get_fc_object(obj.name)
-            pos=object.Placement.Base
-            rotation=object.Placement.Rotation
-            object.Placement.Base=[0,0,0]
-            object.Placement.Rotation.Angle=0
-            object.Placement.Rotation.Axis=FreeCAD.Vector(0,0,0)
-            Mesh.export([object],filename)
-            object.Placement.Base=pos
-            object.Placement.Rotation=rotation
-            obj.filename= f"{obj.name}.stl"
-        obj.full_filename=filename
-
-    # FIXME: Too many branches
-    log("Saving other files")
-    wait_dialog.update_info("Saving other files")
-    save_extra_files(case,save_name)
-
-    # Dumps all the case data to an XML file.
-    wait_dialog.update_info("Saving XML file")
-    log("Saving XML file")
-    XMLExporter().save_to_disk(save_name, case)
-    wait_dialog.update_info("Saving FreeCAD data file")
-    log("Saving FreeCAD data file")
-    case.version = VERSION
-    # Save data array on disk. It is saved as a binary file with Pickle.
-    try:
-        with open(save_name + "/casedata.dsphdata", "wb") as picklefile:
-            pickle.dump(case, picklefile, PICKLE_PROTOCOL)
-    except Exception:
-        print_exc()
-        error_dialog(__("There was a problem saving the DSPH information file (casedata.dsphdata)."))
-    log("End saving")
-    wait_dialog.close_dialog()
-    refocus_cwd()
-
-def save_extra_files(case: "Case",save_name:str):
-    # Copy files from movements and change its paths to be inside the project.
-    project_name = save_name.split("/")[-1]
-    for _, mkproperties in case.mkbasedproperties.items():
-        for movement in mkproperties.movements:
-            if isinstance(movement, SpecialMovement):
-                if isinstance(movement.generator, (FileGen, RotationFileGen,RotateAdvFileGen,PathFileGen)):
-                    filename = movement.generator.filename
-                    log("Copying movement generator {} to {}".format(filename, save_name))
-
-                    # Change directory to de case one, so if file path is already relative it copies it to the
-                    # out folder
-                    chdir(save_name)
-
-                    try:
-                        # Copy to project root
-                        shutil.copy2(filename, save_name)
-                    except shutil.Error:
-                        # Probably already copied the file.
-                        pass
-                    except IOError:
-                        error("Unable to copy {} into {}".format(filename, save_name))
-
-                    try:
-                        # Copy to project out folder
-                        shutil.copy2(filename, save_name + "/" + project_name + "_out")
-
-                        movement.generator.filename = "{}".format(filename.split("/")[-1])
-                    except shutil.Error:
-                        # Probably already copied the file.
-                        pass
-                    except IOError:
-                        error("Unable to copy {} into {}".format(filename, save_name + "/" + project_name + "_out"))
-
-    # Copy files from Acceleration input and change paths to be inside the project folder.
-    for aid in case.acceleration_input.acclist:
-        filename = aid.datafile
-        log("Copying acceleration_input file '{}' to {}".format(filename, save_name + "/" + project_name + "_out"))
-
-        # Change directory to de case one, so if file path is already relative it copies it to the
-        # out folder
+def copy_loaded_geometries(copy_jobs: list, save_name: str, report_progress=None) -> list:
+    """ Copies the files of imported geometries into the case folder.
+    Each job is an (origin file, destination file) tuple. Returns whether each file was copied.
+    Does not access the case nor FreeCAD, so it can run in a worker thread. """
+    copied: list = list()
+    for index, (orig_name, dest_name) in enumerate(copy_jobs):
+        if report_progress:
+            report_progress("{} ({}/{})".format(path.basename(dest_name), index + 1, len(copy_jobs)))
         chdir(save_name)
-
         try:
-            # Copy to project root
-            shutil.copy2(filename, save_name)
+            #if os.sep=='\\':
+            #    orig_name=orig_name.replace('/','\\')
+            shutil.copy2(orig_name, dest_name)
+            copied.append(True)
         except shutil.Error:
-            # Probably already copied the file.
-            pass
+            error(f"shutil.Error: {shutil.Error.strerror}")
+            copied.append(False)
         except IOError:
-            error("Unable to copy {} into {}".format(filename, save_name))
-
-        try:
-            # Copy to project out folder
-            shutil.copy2(filename, save_name + "/" + project_name + "_out")
+            error("Unable to copy {} into {}".format(orig_name, dest_name))
+            copied.append(False)
+    return copied
 
-            aid.datafile = filename.split("/")[-1]
 
-        except shutil.Error:
-            # Probably already copied the file.
-            pass
-        except IOError:
-            error("Unable to copy {} into {}".format(filename, save_name))
+def write_case_data(save_name: str, case_data: bytes) -> None:
+    """ Writes the case data, already serialized with Pickle, on disk.
+    The file is replaced atomically, so a failure while saving can't corrupt the previous one. """
+    with atomic_open(save_name + "/casedata.dsphdata", "wb") as picklefile:
+        picklefile.write(case_data)
 
-    # Copy files from pistons and change paths to be inside the project folder.
-    for _, mkproperties in case.mkbasedproperties.items():
-        if isinstance(mkproperties.mlayerpiston, MLPiston1D):
-            filename = mkproperties.mlayerpiston.filevelx
-            log("Copying {} to {}".format(filename, save_name + "/" + project_name + "_out"))
-            # Change directory to de case one, so if file path is already relative it copies it to the
-            # out folder
-            chdir(save_name)
 
-            try:
-                # Copy to project root
-                shutil.copy2(filename, save_name)
-            except shutil.Error:
-                # Probably already copied the file.
-                pass
-            except IOError:
-                error("Unable to copy {} into {}".format(filename, save_name))
+def save_case(save_name: str, case: "Case") -> None:
+    """ Saves a case to disk in the given path.
+    Stages that need FreeCAD run in the main thread, while file copies, XML writing and the case data
+    writing run in a worker thread so the interface keeps responding and showing the progress.
+    The checks of the main loop, which can change the case, are stopped during the whole save, and the workers
+    only receive file names and data already serialized. The case is updated in the main thread with their results. """
+    with main_loop_paused():
+        progress_dialog = StageProgressDialog("Case is saving. Please wait.", 7)
+        progress_dialog.show()
 
+        try:
+            log("Updating helper objects")
+            progress_dialog.start_stage("Updating helper objects")
+            manage_inlet_outlet_zones(case.inlet_outlet.zones)
+            manage_vres_bufferboxes(case.vres.bufferbox_list)
+            manage_gauges(case.gauges.gauges_dict)
+            manage_partfilters(case.outparts.filts)
+            for kind in (HelperKind.INOUT_ZONE, HelperKind.VRES_BOX, HelperKind.GAUGE, HelperKind.OUTPUT_FILTER):
+                update_helper_kind(case, kind)
+            project_name = save_name.split("/")[-1]
+
+            case.path = save_name
+            case.name = project_name
+
+            if not path.exists(save_name):
+                makedirs(save_name)
+
+            if not path.exists("{}/{}_out".format(save_name, project_name)):
+                makedirs("{}/{}_out".format(save_name, project_name))
+
+            # Export complex objects to STL, copy imported object files to the case
+            log("Saving geometries")
+            progress_dialog.start_stage("Saving geometries")
+            copy_jobs: list = list()
+            copied_objects: list = list()
+            complex_objects = case.get_all_complex_objects()
+            for index, obj in enumerate(complex_objects):
+                if obj.is_loaded_geometry:
+                    filename=obj.filename.split("/")[-1] #TEST WINDOWS
+                    dest_name=f"{save_name}/{filename}"
+                    if not os.path.isfile(dest_name):
+                        copy_jobs.append((obj.origin_filename, dest_name))
+                        copied_objects.append(obj)
+                else:
+                    progress_dialog.update_info("{} ({}/{})".format(obj.name, index + 1, len(complex_objects)))
+                    filename = f"{save_name}/{obj.name}.stl"
+                    object=get_fc_object(obj.name)
+                    pos=object.Placement.Base
+                    rotation=object.Placement.Rotation
+                    object.Placement.Base=[0,0,0]
+                    object.Placement.Rotation.Angle=0
+                    object.Placement.Rotation.Axis=FreeCAD.Vector(0,0,0)
+                    Mesh.export([object],filename)
+                    object.Placement.Base=pos
+                    object.Placement.Rotation=rotation
+                    obj.filename= f"{obj.name}.stl"
+                obj.full_filename=filename
+
+            log("Copying geometry files")
+            progress_dialog.start_stage("Copying geometry files")
+            copied = run_in_background(copy_loaded_geometries, copy_jobs, save_name, progress_slot=progress_dialog.update_info)
+            for obj, (_, dest_name), was_copied in zip(copied_objects, copy_jobs, copied):
+                if was_copied:
+                    obj.filename = path.basename(dest_name)
+
+            log("Saving other files")
+            progress_dialog.start_stage("Saving other files")
+            save_extra_files(case, save_name, in_background=True)
+
+            # Case data is adapted in the main thread, as the renderers need FreeCAD objects.
+            log("Generating XML data")
+            progress_dialog.start_stage("Generating XML data")
+            xml_exporter = XMLExporter()
+            xml_data = xml_exporter.get_adapted_case_data(case)
+            material_xml = xml_exporter.generate_material(case)
+
+            # Dumps all the case data to an XML file.
+            log("Saving XML file")
+            progress_dialog.start_stage("Saving XML file")
+            run_in_background(xml_exporter.write_files_to_disk, save_name, project_name, xml_data, material_xml)
+            del xml_data
+
+            log("Saving FreeCAD data file")
+            progress_dialog.start_stage("Saving FreeCAD data file")
+            case.version = VERSION
             try:
-                # Copy to project out folder
-                shutil.copy2(filename, save_name + "/" + project_name + "_out")
+                # Serialized in the main thread, so the worker only writes a snapshot of the case.
+                case_data = pickle.dumps(case, PICKLE_PROTOCOL)
+                run_in_background(write_case_data, save_name, case_data)
+            except Exception:
+                print_exc()
+                error_dialog(__("There was a problem saving the DSPH information file (casedata.dsphdata)."))
+            log("End saving")
+        finally:
+            progress_dialog.close_dialog()
+            refocus_cwd()
+
+
+def get_extra_file_references(case: "Case") -> list:
+    """ Returns the references of the case to files that have to be copied into the case folder, as
+    (data object, attribute with the file name, whether it names a series of files, file name once copied) tuples. """
+    references: list = list()
+    # Files of movements
+    for _, mkproperties in case.mkbasedproperties.items():
+        for movement in mkproperties.movements:
+            if isinstance(movement, SpecialMovement):
+                if isinstance(movement.generator, (FileGen, RotationFileGen,RotateAdvFileGen,PathFileGen)):
+                    references.append((movement.generator, "filename", False, movement.generator.filename.split("/")[-1]))
 
-                mkproperties.mlayerpiston.filevelx = filename.split("/")[-1]
-            except shutil.Error:
-                # Probably already copied the file.
-                pass
-            except IOError:
-                error("Unable to copy {} into {}".format(filename, save_name))
+    # Files of acceleration inputs
+    for aid in case.acceleration_input.acclist:
+        references.append((aid, "datafile", False, aid.datafile.split("/")[-1]))
 
+    # Files of pistons
+    for _, mkproperties in case.mkbasedproperties.items():
+        if isinstance(mkproperties.mlayerpiston, MLPiston1D):
+            references.append((mkproperties.mlayerpiston, "filevelx", False, mkproperties.mlayerpiston.filevelx.split("/")[-1]))
         if isinstance(mkproperties.mlayerpiston, MLPiston2D):
-            veldata = mkproperties.mlayerpiston.veldata
-            for v in veldata:
-                filename = v.filevelx
-                log("Copying {} to {}".format(filename, save_name + "/" + project_name + "_out"))
-                # Change directory to de case one, so if file path is already relative it copies it to the
-                # out folder
-                chdir(save_name)
+            for v in mkproperties.mlayerpiston.veldata:
+                references.append((v, "filevelx", False, v.filevelx.split("/")[-1]))
 
-                try:
-                    # Copy to project root
-                    shutil.copy2(filename, save_name)
-                except shutil.Error:
-                    # Probably already copied the file.
-                    pass
-                except IOError:
-                    error("Unable to copy {} into {}".format(filename, save_name))
+    # The abc_x*_y*.csv file series needed by RelaxationZones
+    if isinstance(case.relaxation_zone, RelaxationZoneFile) and case.relaxation_zone.filesvel:
+        references.append((case.relaxation_zone, "filesvel", True, case.relaxation_zone.filesvel.split("/")[-1]))
 
-                try:
-                    # Copy to project out folder
-                    shutil.copy2(filename, save_name + "/" + project_name + "_out")
+    # Mesh data files of inlet/outlet zones
+    for zone in case.inlet_outlet.zones:
+        veloc: InletOutletVelocityInfo = zone.velocity_info
+        if veloc.velocity_type == InletOutletVelocityType.INTERPOLATED:
+            references.append((veloc.velocity_mesh_data, "filepath", False, os.path.basename(veloc.velocity_mesh_data.filepath)))
+        zsurf: InletOutletElevationInfo = zone.elevation_info
+        if zsurf.zsurf_mode == InletOutletZSurfMode.MESHDATA:
+            references.append((zsurf.meshdata, "file", False, os.path.basename(zsurf.meshdata.file)))
+    return references
 
-                    v.filevelx = filename.split("/")[-1]
-                except shutil.Error:
-                    # Probably already copied the file.
-                    pass
-                except IOError:
-                    error("Unable to copy {} into {}".format(filename, save_name))
 
-    # Copies files needed for RelaxationZones into the project folder and changes data paths to relative ones.
-    if isinstance(case.relaxation_zone, RelaxationZoneFile) and case.relaxation_zone.filesvel:
-        # Need to copy the abc_x*_y*.csv file series to the out folder
-        filename = case.relaxation_zone.filesvel
+def copy_extra_files(file_names: list, save_name: str) -> list:
+    """ Copies files used by the case into the case folder and its out folder. Each file name comes with whether
+    it names a series of files. Relative paths are taken from the case folder.
+    Returns whether each file was copied to the out folder. Does not access the case nor FreeCAD, so it can run
+    in a worker thread. """
+    project_name = save_name.split("/")[-1]
+    out_folder = save_name + "/" + project_name + "_out"
+    copied: list = list()
+    for filename, is_series in file_names:
         # Change directory to de case one, so if file path is already relative it copies it to the
         # out folder
         chdir(save_name)
-        for f in glob("{}*".format(filename)):
-            log("Copying {} to {}".format(filename, save_name + "/" + project_name + "_out"))
+        was_copied = False
+        for f in (glob("{}*".format(filename)) if is_series else [filename]):
+            log("Copying {} to {}".format(f, out_folder))
             try:
                 # Copy to project root
                 shutil.copy2(f, save_name)
@@ -335,69 +322,35 @@ def save_extra_files(case: "Case",save_name:str):
                 # Probably already copied the file.
                 pass
             except IOError:
-                error("Unable to copy {} into {}".format(filename, save_name))
-            try:
-                # Copy to project out folder
-                shutil.copy2(f, save_name + "/" + project_name + "_out")
-                case.relaxation_zone.filesvel = filename.split("/")[-1]
-            except shutil.Error:
-                # Probably already copied the file.
-                pass
-            except IOError:
-                error("Unable to copy {} into {}".format(filename, save_name))
-    for zone in case.inlet_outlet.zones:
-        veloc: InletOutletVelocityInfo = zone.velocity_info
-        if veloc.velocity_type == InletOutletVelocityType.INTERPOLATED:
-            filename = veloc.velocity_mesh_data.filepath
-            log("Copying {} to {}".format(filename, save_name + "/" + project_name + "_out"))
-            # Change directory to de case one, so if file path is already relative it copies it to the
-            # out folder
-            chdir(save_name)
-            try:
-                # Copy to project root
-                shutil.copy2(filename, save_name)
-            except shutil.Error:
-                # Probably already copied the file.
-                pass
-            except IOError:
-                error("Unable to copy {} into {}".format(filename, save_name))
+                error("Unable to copy {} into {}".format(f, save_name))
 
             try:
                 # Copy to project out folder
-                shutil.copy2(filename, save_name + "/" + project_name + "_out")
-
-                veloc.velocity_mesh_data.filepath = os.path.basename(veloc.velocity_mesh_data.filepath)
+                shutil.copy2(f, out_folder)
+                was_copied = True
             except shutil.Error:
                 # Probably already copied the file.
                 pass
             except IOError:
-                error("Unable to copy {} into {}".format(filename, save_name))
-        zsurf: InletOutletElevationInfo = zone.elevation_info
-        if zsurf.zsurf_mode == InletOutletZSurfMode.MESHDATA:
-            filename = zsurf.meshdata.file
-            log("Copying {} to {}".format(filename, save_name + "/" + project_name + "_out"))
-            # Change directory to de case one, so if file path is already relative it copies it to the
-            # out folder
-            chdir(save_name)
-            try:
-                # Copy to project root
-                shutil.copy2(filename, save_name)
-            except shutil.Error:
-                # Probably already copied the file.
-                pass
-            except IOError:
-                error("Unable to copy {} into {}".format(filename, save_name))
-
-            try:
-                # Copy to project out folder
-                shutil.copy2(filename, save_name + "/" + project_name + "_out")
-
-                zsurf.meshdata.file = os.path.basename(zsurf.meshdata.file)
-            except shutil.Error:
-                # Probably already copied the file.
-                pass
-            except IOError:
-                error("Unable to copy {} into {}".format(filename, save_name))
+                error("Unable to copy {} into {}".format(f, out_folder))
+        copied.append(was_copied)
+    return copied
+
+
+def save_extra_files(case: "Case", save_name: str, in_background: bool = False) -> None:
+    """ Copies the files used by the case (movements, acceleration inputs, pistons, relaxation zones and
+    inlet/outlet mesh data) into the case folder and changes their paths to be inside it.
+    If in_background is set, the files are copied in a worker thread, while the case is always changed in
+    the calling thread. """
+    references = get_extra_file_references(case)
+    file_names = [(getattr(owner, attribute), is_series) for owner, attribute, is_series, _ in references]
+    if in_background:
+        copied = run_in_background(copy_extra_files, file_names, save_name)
+    else:
+        copied = copy_extra_files(file_names, save_name)
+    for (owner, attribute, _, copied_name), was_copied in zip(references, copied):
+        if was_copied:
+            setattr(owner, attribute, copied_name)
 
 
 def get_default_config_file():
@@ -421,27 +374,11 @@ def get_saved_config_file() -> str:
 
 
 
-def import_geo(filename=None, scale_x=1, scale_y=1, scale_z=1, name=None, autofill=False, case=None,adm =False,
-               adm_reverse=False,has_adm_maxdepth=False,adm_maxdepth=3.0,has_adm_mindepth=False,adm_mindepth=0.1,
-               desired_mkbound=-1,draw_as_points:bool=False,decimate:bool=False,reduction:float=0.9):
-    """ Opens a GEO file, preprocesses it and saves it
-    int temp files to load with FreeCAD. """
-    if case is None:
-        raise RuntimeError("Case parameter must be populated")
-
+def read_geo_with_freecad(filename: str, scale_x: float, scale_y: float, scale_z: float) -> "Mesh.Mesh":
+    """ Reads a GEO file with the FreeCAD readers and scales it from meters to millimeters. """
     file_type = ".{}".format(filename.split(".")[-1]).lower()
-
-    if scale_x <= 0:
-        scale_x = 1
-    if scale_y <= 0:
-        scale_y = 1
-    if scale_z <= 0:
-        scale_z = 1
-
     scale_matrix = FreeCAD.Matrix()
     #scale_matrix.scale(scale_x * 1000, scale_y * 1000, scale_z * 1000)
-    internal_name = "external_{}".format(name).replace("-", "_")
-
     if file_type == ".vtk" or file_type == ".vtu" or file_type == ".vtp":
         scale_matrix.scale(scale_x * 1000, scale_y * 1000, scale_z * 1000)
         loaded_fem_mesh = Fem.read(filename)
@@ -452,18 +389,22 @@ def import_geo(filename=None, scale_x=1, scale_y=1, scale_z=1, name=None, autofi
         loaded_mesh = Mesh.read(filename)
 
     loaded_mesh.transform(scale_matrix)
-    Mesh.show(loaded_mesh, internal_name)
+    return loaded_mesh
 
 
-    SimObj=SimulationObject(internal_name, -1, ObjectType.BOUND, ObjectFillMode.SOLID)
-    if not FreeCAD.ActiveDocument.getObject(SimObj.name):  #If there is no object with the same name in FreeCAD
-        case.remove_tmp_object(SimObj.name)                 #Remove the tmpp object (why?))
-        warning_dialog("Error loading object")
-        return
+def mesh_from_arrays(vertices, faces) -> "Mesh.Mesh":
+    """ Builds a FreeCAD mesh from the vertex and face arrays returned by mesh_tools. """
+    loaded_mesh = Mesh.Mesh()
+    loaded_mesh.addFacets((vertices.tolist(), faces.tolist()))
+    return loaded_mesh
 
 
-    FreeCADGui.SendMsgToActiveView("ViewFit")
-   
+def add_loaded_geometry_tmp_object(case: "Case", internal_name: str, name: str, filename: str, scale_x=1, scale_y=1,
+                                   scale_z=1, autofill=False, adm=False, adm_reverse=False, has_adm_maxdepth=False,
+                                   adm_maxdepth=3.0, has_adm_mindepth=False, adm_mindepth=0.1, desired_mkbound=-1,
+                                   draw_as_points: bool = False) -> None:
+    """ Adds an imported geometry already shown in FreeCAD to the temporal object list of the case. """
+    file_type = ".{}".format(filename.split(".")[-1]).lower()
     # Add the geometry to the temporal object list. The mk must be defined when adding to the DSPH simulation (By default: mk=-1) 
     case.add_tmp_object(SimulationObject(internal_name, desired_mkbound, ObjectType.BOUND, ObjectFillMode.SOLID))
     tmp_object:SimulationObject=case.get_tmp_object(internal_name)
@@ -479,11 +420,62 @@ def import_geo(filename=None, scale_x=1, scale_y=1, scale_z=1, name=None, autofi
     tmp_object.file_type=file_type[1:4]
     tmp_object.is_loaded_geometry=True
     tmp_object.origin_filename=filename
+    fc_object = get_fc_object(internal_name)
+    fc_object.Label = name
+    if draw_as_points :
+        FreeCADGui.ActiveDocument.getObject(internal_name).DisplayMode = u"Points"
+
+
+def import_geo(filename=None, scale_x=1, scale_y=1, scale_z=1, name=None, autofill=False, case=None,adm =False,
+               adm_reverse=False,has_adm_maxdepth=False,adm_maxdepth=3.0,has_adm_mindepth=False,adm_mindepth=0.1,
+               desired_mkbound=-1,draw_as_points:bool=False,decimate:bool=False,reduction:float=0.9,
+               preview_max_faces:int=0):
+    """ Opens a GEO file, preprocesses it and saves it
+    int temp files to load with FreeCAD.
+    If preview_max_faces is given, huge meshes are shown as a light preview with about that many triangles.
+    GenCase always uses the full resolution file. """
+    if case is None:
+        raise RuntimeError("Case parameter must be populated")
+
+    if scale_x <= 0:
+        scale_x = 1
+    if scale_y <= 0:
+        scale_y = 1
+    if scale_z <= 0:
+        scale_z = 1
+
+    internal_name = "external_{}".format(name).replace("-", "_")
+    loaded_mesh = None
+    if preview_max_faces:
+        try:
+            vertices, faces, triangle_count = run_in_background(build_lod_mesh_arrays, filename,
+                                                                (scale_x, scale_y, scale_z), preview_max_faces)
+            loaded_mesh = mesh_from_arrays(vertices, faces)
+            decimate = False
+            if triangle_count > len(faces):
+                log("Showing {} as a preview with {} of its {} triangles. GenCase uses the full resolution file.".format(
+                    name, len(faces), triangle_count))
+        except (ValueError, OSError) as ex:
+            debug("Preview of {} can't be built, loading it with FreeCAD: {}".format(filename, ex))
+    if loaded_mesh is None:
+        loaded_mesh = read_geo_with_freecad(filename, scale_x, scale_y, scale_z)
+    Mesh.show(loaded_mesh, internal_name)
+
+
+    SimObj=SimulationObject(internal_name, -1, ObjectType.BOUND, ObjectFillMode.SOLID)
+    if not FreeCAD.ActiveDocument.getObject(SimObj.name):  #If there is no object with the same name in FreeCAD
+        case.remove_tmp_object(SimObj.name)                 #Remove the tmpp object (why?))
+        warning_dialog("Error loading object")
+        return
+
+
+    FreeCADGui.SendMsgToActiveView("ViewFit")
+
+    add_loaded_geometry_tmp_object(case, internal_name, name, filename, scale_x, scale_y, scale_z, autofill, adm,
+                                   adm_reverse, has_adm_maxdepth, adm_maxdepth, has_adm_mindepth, adm_mindepth,
+                                   desired_mkbound, draw_as_points)
     fc_object=get_fc_object(internal_name)
     if fc_object:
-        fc_object.Label = name
-        if draw_as_points :
-                FreeCADGui.ActiveDocument.getObject(internal_name).DisplayMode = u"Points"
         if decimate :
                 newmesh=fc_object.Mesh.copy()
                 newmesh.decimate(0.2,reduction)
@@ -493,14 +485,135 @@ def import_geo(filename=None, scale_x=1, scale_y=1, scale_z=1, name=None, autofi
         warning_dialog("There has been some error while loading object")
 
 
+def get_mesh_worker_python() -> str:
+    """ Returns a Python interpreter able to run mesh loading worker processes, or None if it can't be found.
+    Inside FreeCAD sys.executable is usually the FreeCAD binary, so the bundled interpreter next to it is used. """
+    executable_dir = path.dirname(sys.executable)
+    if path.basename(sys.executable).lower().startswith("python"):
+        return sys.executable
+    for candidate in ("python.exe", "python3", "python"):
+        if path.isfile(path.join(executable_dir, candidate)):
+            return path.join(executable_dir, candidate)
+    return None
+
+
+def create_mesh_loading_executor(job_count: int):
+    """ Returns an executor to load meshes in parallel: a pool of worker processes if a Python interpreter
+    is available for them, or a pool of threads otherwise (NumPy releases the GIL in most of the work). """
+    worker_count = max(1, min(job_count, os.cpu_count() or 1))
+    worker_python = get_mesh_worker_python()
+    if worker_python is not None:
+        try:
+            mp_context = multiprocessing.get_context("spawn")
+            mp_context.set_executable(worker_python)
+            return ProcessPoolExecutor(max_workers=worker_count, mp_context=mp_context)
+        except (OSError, ValueError):
+            print_exc()
+    debug("Loading meshes using threads")
+    return ThreadPoolExecutor(max_workers=worker_count)
+
+
+def import_geo_batch(surfaces: list, case: "Case", scale_x=1, scale_y=1, scale_z=1, autofill=False, adm=False,
+                     adm_reverse=False, has_adm_maxdepth=False, adm_maxdepth=3.0, has_adm_mindepth=False,
+                     adm_mindepth=0.1, draw_as_points: bool = False, decimate: bool = False, reduction: float = 0.9,
+                     preview_max_faces: int = 0) -> list:
+    """ Imports several GEO files at once, as the surfaces of a VTM file.
+    Each surface is a (filename, name, desired_mkbound) tuple. Files are read and decimated in parallel worker
+    processes, then the FreeCAD objects are created in a single transaction with a single recompute.
+    If preview_max_faces is given, huge surfaces are shown as light previews (see import_geo).
+    Files that can't be read in the workers are read with the FreeCAD readers instead.
+    Returns the internal names of the imported objects, or an empty list if cancelled. """
+    if scale_x <= 0:
+        scale_x = 1
+    if scale_y <= 0:
+        scale_y = 1
+    if scale_z <= 0:
+        scale_z = 1
+
+    jobs: list = list()
+    for filename, name, desired_mkbound in surfaces:
+        internal_name = "external_{}".format(name).replace("-", "_")
+        if get_fc_object(internal_name) or internal_name in [job[0] for job in jobs]:
+            warning("There is already an object named {}. Skipping surface {}".format(internal_name, filename))
+            continue
+        jobs.append((internal_name, filename, name, desired_mkbound))
+    if not jobs:
+        return []
+
+    progress_dialog = StageProgressDialog("Geometry is being imported. Please wait.", len(jobs) + 1, cancellable=True)
+    progress_dialog.show()
+    progress_dialog.start_stage("Loading surfaces")
+    loaded_meshes: dict = dict()
+    executor = create_mesh_loading_executor(len(jobs))
+    futures = {executor.submit(load_mesh_for_import, filename, (scale_x, scale_y, scale_z), reduction if decimate else 0.0,
+                               preview_max_faces): internal_name for internal_name, filename, _, _ in jobs}
+    pending = set(futures)
+    try:
+        while pending and not progress_dialog.cancelled:
+            done, pending = futures_wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    loaded_meshes[futures[future]] = future.result()
+                except Exception as ex:  # pylint: disable=broad-except
+                    debug("Surface {} will be read with FreeCAD: {}".format(futures[future], ex))
+                    loaded_meshes[futures[future]] = None
+            if done:
+                progress_dialog.start_stage("Loading surfaces ({}/{})".format(len(loaded_meshes), len(jobs)))
+            QtWidgets.QApplication.processEvents()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+    if progress_dialog.cancelled:
+        progress_dialog.close_dialog()
+        log("Geometry import cancelled")
+        return []
+
+    progress_dialog.start_stage("Creating FreeCAD objects")
+    imported: list = list()
+    FreeCAD.ActiveDocument.openTransaction("Import geometries")
+    try:
+        for index, (internal_name, filename, name, desired_mkbound) in enumerate(jobs):
+            progress_dialog.update_info("{} ({}/{})".format(name, index + 1, len(jobs)))
+            if progress_dialog.cancelled:
+                FreeCAD.ActiveDocument.abortTransaction()
+                for imported_name in imported:
+                    case.remove_tmp_object(imported_name)
+                log("Geometry import cancelled")
+                return []
+            try:
+                if loaded_meshes[internal_name] is None:
+                    loaded_mesh = read_geo_with_freecad(filename, scale_x, scale_y, scale_z)
+                    if decimate:
+                        loaded_mesh.decimate(0.2, reduction)
+                else:
+                    loaded_mesh = mesh_from_arrays(*loaded_meshes.pop(internal_name))
+            except Exception as ex:  # pylint: disable=broad-except
+                error("There was an error loading surface {}: {}".format(name, ex))
+                continue
+            fc_object = FreeCAD.ActiveDocument.addObject("Mesh::Feature", internal_name)
+            fc_object.Mesh = loaded_mesh
+            add_loaded_geometry_tmp_object(case, internal_name, name, filename, scale_x, scale_y, scale_z, autofill,
+                                           adm, adm_reverse, has_adm_maxdepth, adm_maxdepth, has_adm_mindepth,
+                                           adm_mindepth, desired_mkbound, draw_as_points)
+            imported.append(internal_name)
+        FreeCAD.ActiveDocument.commitTransaction()
+    finally:
+        progress_dialog.close_dialog()
+
+    FreeCAD.ActiveDocument.recompute()
+    FreeCADGui.SendMsgToActiveView("ViewFit")
+    if len(imported) < len(jobs):
+        warning_dialog(__("Some surfaces could not be imported. Check the log for details."))
+    return imported
+
+
 
 def save_measuretool_point_list(case_path: str, filename:str,points: list) -> None:
     """ Creates a file with measuretool points information. """
     if points:
-        with open(f"{case_path}{os.sep}{filename}", "w", encoding="utf-8") as f:
-            f.write("POINTS\n")
-            for curr_point in points:
-                f.write("{}  {}  {}\n".format(*curr_point))
+        write_measuretool_points(f"{case_path}{os.sep}{filename}", points)
     else:
         raise RuntimeError("Attempting to save measuretool info with no points setup.")
 
@@ -513,6 +626,13 @@ def save_measuretool_point_grid(case_path: str, filename:str,grid: list) -> None
     else:
         raise RuntimeError("Attempting to save measuretool info with no grid setup.")
 
+def save_measuretool_point_set(case_path: str, filename: str, parts: list) -> None:
+    """ Generates the points of a MeasureTool point set and writes them with their binary copy. """
+    if parts:
+        save_point_set(f"{case_path}{os.sep}{filename}", generate_point_set(parts))
+    else:
+        raise RuntimeError("Attempting to save measuretool info with no point set setup.")
+
 def load_default_materials() -> list:
     """ Loads and returns a list with the default materials on the project root. """
     with open("{}/default-materials.json".format(get_designsphysics_path()), encoding="utf-8") as default_config:
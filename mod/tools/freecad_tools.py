@@ -10,10 +10,12 @@ import FreeCAD
 import FreeCADGui
 import Draft
 import Part
+import Points
 
 from PySide2 import QtWidgets
 
 from mod.dataobjects.gauges.flow_gauge import FlowGauge
+from mod.dataobjects.gauges.gauge_array import GaugeArray
 from mod.dataobjects.gauges.gauge_base import Gauge
 from mod.dataobjects.gauges.mesh_gauge import MeshGauge
 from mod.dataobjects.inletoutlet.inlet_outlet_zone_box_generator import InletOutletZoneBoxGenerator
@@ -27,6 +29,7 @@ from mod.dataobjects.outparts_filter.filters import FilterPos, FilterSphere, Fil
     FilterMK, TypeFilter, FilterGroup
 from mod.dataobjects.variable_res.bufferbox import BufferBox
 
+from mod.tools.gauge_array_tools import get_member_end_points, shift_gauge_array
 from mod.tools.translation_tools import __
 from mod.tools.stdout_tools import log, error, debug
 from mod.tools.dialog_tools import ok_cancel_dialog, error_dialog, warning_dialog
@@ -315,7 +318,8 @@ def create_inout_zone_line(line_info: InletOutletZoneLineGenerator, direction: I
 
 
 def update_inout_zone_line(fc_object_name: str, line_info: InletOutletZoneLineGenerator,
-                           direction: InletOutletZone2DDirection, rotation: InletOutletZone2DRotation) -> str:
+                           direction: InletOutletZone2DDirection, rotation: InletOutletZone2DRotation,
+                           recompute: bool = True) -> str:
     zone_line_group = get_fc_object(fc_object_name)
     zone_line = zone_line_group.OutList[0]
     if line_info.manual_setting : # FreeCAD manual position and rotation
@@ -348,7 +352,8 @@ def update_inout_zone_line(fc_object_name: str, line_info: InletOutletZoneLineGe
             rot_point = position_vect
         zone_line.Placement = FreeCAD.Placement(position_vect, fc_rotation, rot_point)
         zone_line.setPropertyStatus("Placement", ["ReadOnly"])
-        FreeCAD.ActiveDocument.recompute()
+        if recompute:
+            FreeCAD.ActiveDocument.recompute()
     return zone_line_group.Name
 
 
@@ -386,7 +391,8 @@ def create_inout_zone_box(box_info: InletOutletZoneBoxGenerator, direction: Inle
 
 
 def update_inout_zone_box(fc_obj_name: str, box_info: InletOutletZoneBoxGenerator,
-                          direction: InletOutletZone3DDirection, rotation: InletOutletZone3DRotation):
+                          direction: InletOutletZone3DDirection, rotation: InletOutletZone3DRotation,
+                          recompute: bool = True):
     zone_box_group = get_fc_object(fc_obj_name)
     zone_box = zone_box_group.OutList[0]
     if box_info.manual_setting : # FreeCAD manual position and rotation
@@ -408,7 +414,8 @@ def update_inout_zone_box(fc_obj_name: str, box_info: InletOutletZoneBoxGenerato
     direction_vector = FreeCAD.Vector(direction.direction)
     zone_line = zone_box_group.OutList[1]
     update_line(zone_line.Name, point1=[0, 0, 0], point2=direction_vector)
-    FreeCAD.ActiveDocument.recompute()
+    if recompute:
+        FreeCAD.ActiveDocument.recompute()
     return zone_box_group.Name
 
 
@@ -467,7 +474,8 @@ def create_inout_zone_circle(circle_info: InletOutletZoneCircleGenerator, direct
 
 
 def update_inout_zone_circle(fc_object_name: str, circle_info: InletOutletZoneCircleGenerator,
-                             direction: InletOutletZone3DDirection, rotation: InletOutletZone3DRotation) -> str:
+                             direction: InletOutletZone3DDirection, rotation: InletOutletZone3DRotation,
+                             recompute: bool = True) -> str:
     zone_circle_group = get_fc_object(fc_object_name)
     zone_circle = zone_circle_group.OutList[0]
     zone_line = zone_circle_group.OutList[1]
@@ -508,7 +516,8 @@ def update_inout_zone_circle(fc_object_name: str, circle_info: InletOutletZoneCi
             #rotation.adv_rotation_from_freecad_placement(user_placement)
         zone_circle.setPropertyStatus("Placement", ["ReadOnly"])
         zone_line.recompute() #?
-
+    if recompute:
+        FreeCAD.ActiveDocument.recompute()
     return zone_circle_group.Name
 
 def create_inout_zone_3d_mk_object(obj_name:str) -> str:
@@ -565,7 +574,7 @@ def change_mk_inout_zone_3d(fc_object_name,new_mk_object_name) -> str:
 
 
 def update_inout_zone_3d_mk_object(fc_object_name,mk_info: InletOutletZoneMKGenerator, direction: InletOutletZone3DDirection,
-                             rotation: InletOutletZone3DRotation,original_object_name:str) -> str:
+                             rotation: InletOutletZone3DRotation,original_object_name:str, recompute: bool = True) -> str:
     zone_mk_group =get_fc_object(fc_object_name)
     original_object=get_fc_object(original_object_name)
     clone_obj=zone_mk_group.OutList[0]
@@ -607,12 +616,13 @@ def update_inout_zone_3d_mk_object(fc_object_name,mk_info: InletOutletZoneMKGene
         rotation_point = rotation_center - pos_vector
         clone_obj.AttachmentOffset = FreeCAD.Placement(zero_vector, fc_rotation, rotation_point)
         zone_line.AttachmentOffset = FreeCAD.Placement(zero_vector, fc_rotation, rotation_point)
-    FreeCAD.ActiveDocument.recompute()
+    if recompute:
+        FreeCAD.ActiveDocument.recompute()
     return zone_mk_group.Name
 
 
 def update_inout_zone_2d_mk_object(fc_object_name,mk_info: InletOutletZoneMKGenerator, direction: InletOutletZone2DDirection,
-                             rotation: InletOutletZone2DRotation,original_object_name) -> str:
+                             rotation: InletOutletZone2DRotation,original_object_name, recompute: bool = True) -> str:
     zone_mk_group =get_fc_object(fc_object_name)
     original_object=get_fc_object(original_object_name)
     clone_obj=zone_mk_group.OutList[0]
@@ -646,10 +656,88 @@ def update_inout_zone_2d_mk_object(fc_object_name,mk_info: InletOutletZoneMKGene
         fc_rotation = FreeCAD.Base.Rotation(axis, rotation.rotation_angle)
         clone_obj.AttachmentOffset = FreeCAD.Placement(FreeCAD.Vector(0,0,0), fc_rotation, rot_point)
         zone_line.AttachmentOffset = FreeCAD.Placement(FreeCAD.Vector(0, 0, 0), fc_rotation, rot_point)
-    FreeCAD.ActiveDocument.recompute()
+    if recompute:
+        FreeCAD.ActiveDocument.recompute()
     return zone_mk_group.Name
 
 
+def get_inout_zone_original_object(fc_object_name: str) -> str:
+    """ Returns the name of the fluid object an mk based inlet/outlet zone helper is attached to, or None. """
+    support = getattr(get_fc_object(fc_object_name).OutList[0], "AttachmentSupport", None)
+    return support[0][0].Name if support else None
+
+
+def get_inout_zone_geometry_key(zone, original_object_name: str = None) -> str:
+    """ Returns a description of the parameters that define the helper geometry of an inlet/outlet zone,
+    including the position of the fluid object of mk based zones. """
+    info = zone.zone_info
+    parameters = [info.zone_generator_type]
+    for attribute in ("zone_direction_2d", "zone_rotation_2d", "zone_direction_3d", "zone_rotation_3d",
+                      "zone_line_generator", "zone_box_generator", "zone_circle_generator", "zone_mk_generator"):
+        if hasattr(info, attribute):
+            parameters.append(sorted(vars(getattr(info, attribute)).items()))
+    if original_object_name:
+        parameters.append((original_object_name, tuple(get_fc_object(original_object_name).Placement.Base)))
+    return repr(parameters)
+
+
+def get_inout_zone_drawn_object(zone) -> tuple:
+    """ Returns whether the helper of an inlet/outlet zone exists in the document and the name of the fluid object
+    it is attached to, which is None for zones not based on an mk. """
+    if not zone.fc_object_name or not get_fc_object(zone.fc_object_name):
+        return False, None
+    if zone.zone_info.zone_generator_type not in (InletOutletZoneGeneratorType.MK_2D, InletOutletZoneGeneratorType.MK_3D):
+        return True, None
+    original_object_name = get_inout_zone_original_object(zone.fc_object_name)
+    return bool(original_object_name), original_object_name
+
+
+def store_inout_zone_geometry_key(zone) -> None:
+    """ Records the parameters of an inlet/outlet zone whose helper is already drawn with them, so it is not
+    redrawn until they change. """
+    drawn, original_object_name = get_inout_zone_drawn_object(zone)
+    if drawn:
+        zone.helper_geometry_key = get_inout_zone_geometry_key(zone, original_object_name)
+
+
+def seed_inout_zone_geometry_keys(zones) -> None:
+    """ Records the parameters of the helpers of the inlet/outlet zones of a loaded case, without redrawing them. """
+    for zone in zones:
+        store_inout_zone_geometry_key(zone)
+
+
+def update_inout_zone(zone, recompute: bool = True) -> bool:
+    """ Updates the helper geometry of an inlet/outlet zone, only if its parameters changed since it was last drawn.
+    The document is recomputed if recompute is set. Returns whether the helper was updated. """
+    drawn, original_object_name = get_inout_zone_drawn_object(zone)
+    if not drawn:
+        zone.helper_geometry_key = None
+        return False
+    if getattr(zone, "helper_geometry_key", None) == get_inout_zone_geometry_key(zone, original_object_name):
+        return False
+    info = zone.zone_info
+    if info.zone_generator_type == InletOutletZoneGeneratorType.LINE:
+        update_inout_zone_line(zone.fc_object_name, info.zone_line_generator, info.zone_direction_2d,
+                               info.zone_rotation_2d, recompute=False)
+    elif info.zone_generator_type == InletOutletZoneGeneratorType.MK_2D:
+        update_inout_zone_2d_mk_object(zone.fc_object_name, info.zone_mk_generator, info.zone_direction_2d,
+                                       info.zone_rotation_2d, original_object_name, recompute=False)
+    elif info.zone_generator_type == InletOutletZoneGeneratorType.BOX:
+        update_inout_zone_box(zone.fc_object_name, info.zone_box_generator, info.zone_direction_3d,
+                              info.zone_rotation_3d, recompute=False)
+    elif info.zone_generator_type == InletOutletZoneGeneratorType.CIRCLE:
+        update_inout_zone_circle(zone.fc_object_name, info.zone_circle_generator, info.zone_direction_3d,
+                                 info.zone_rotation_3d, recompute=False)
+    elif info.zone_generator_type == InletOutletZoneGeneratorType.MK_3D:
+        update_inout_zone_3d_mk_object(zone.fc_object_name, info.zone_mk_generator, info.zone_direction_3d,
+                                       info.zone_rotation_3d, original_object_name, recompute=False)
+    # Drawing some zones reads their parameters back from FreeCAD, so the key is taken after drawing them
+    zone.helper_geometry_key = get_inout_zone_geometry_key(zone, original_object_name)
+    if recompute:
+        FreeCAD.ActiveDocument.recompute()
+    return True
+
+
 def copy_object(fc_obj_name:str) -> str:
     obj = get_fc_object(fc_obj_name)
     clone=Draft.make_clone(obj)
@@ -1055,6 +1143,59 @@ def update_line(fc_object_name, point1, point2):
     FreeCAD.ActiveDocument.recompute()
 
 
+def build_gauge_array_shape(gauge_array: GaugeArray):
+    """ Returns a single compound with a vertex for each velocity gauge of an array, or an edge for each swl or maxz gauge. """
+    points = [FreeCAD.Vector(point) * DIVIDER for point in gauge_array.points]
+    end_points = get_member_end_points(gauge_array)
+    if end_points is None:
+        return Part.makeCompound([Part.Vertex(point) for point in points])
+    return Part.makeCompound([Part.LineSegment(start, FreeCAD.Vector(end) * DIVIDER).toShape()
+                              for start, end in zip(points, end_points.tolist()) if start != FreeCAD.Vector(end) * DIVIDER])
+
+
+def draw_gauge_array(gauge_array: GaugeArray, name: str, color=(0.32, 1.00, 0.00)) -> str:
+    """ Draws all the gauges of an array as a single object, so big arrays keep the document responsive. """
+    array_object = FreeCAD.ActiveDocument.addObject(FreeCADObjectType.PART_FEATURE, name)
+    array_object.Shape = build_gauge_array_shape(gauge_array)
+    array_object_GUI = FreeCADGui.ActiveDocument.getObject(array_object.Name)
+    array_object_GUI.PointSize = 4
+    array_object_GUI.PointColor = color
+    array_object_GUI.LineColor = color
+    array_object_GUI.DrawStyle = "Dotted"
+    FreeCAD.ActiveDocument.recompute()
+    return array_object.Name
+
+
+def update_gauge_array(gauge_array: GaugeArray):
+    """ Rebuilds the object of a gauge array from its points. """
+    array_object = get_fc_object(gauge_array.fc_object_name)
+    array_object.Placement = FreeCAD.Placement()
+    array_object.Shape = build_gauge_array_shape(gauge_array)
+    FreeCAD.ActiveDocument.recompute()
+
+
+def draw_point_cloud(points, name: str, color=(0.32, 1.00, 0.00)) -> str:
+    """ Draws a (N, 3) array of points in m as a single point cloud object and returns its name. """
+    point_cloud = Points.Points()
+    point_cloud.addPoints([tuple(point) for point in (points * DIVIDER).tolist()])
+    point_cloud_object = FreeCAD.ActiveDocument.addObject("Points::Feature", name)
+    point_cloud_object.Points = point_cloud
+    point_cloud_GUI = FreeCADGui.ActiveDocument.getObject(point_cloud_object.Name)
+    point_cloud_GUI.PointSize = 2
+    point_cloud_GUI.ShapeColor = color
+    FreeCAD.ActiveDocument.recompute()
+    return point_cloud_object.Name
+
+
+def get_rigid_placement(rotation, translation) -> FreeCAD.Placement:
+    """ Returns the placement of a rigid transformation given as a 3x3 rotation matrix and a translation in m. """
+    matrix = FreeCAD.Matrix(rotation[0][0], rotation[0][1], rotation[0][2], translation[0] * DIVIDER,
+                            rotation[1][0], rotation[1][1], rotation[1][2], translation[1] * DIVIDER,
+                            rotation[2][0], rotation[2][1], rotation[2][2], translation[2] * DIVIDER,
+                            0.0, 0.0, 0.0, 1.0)
+    return FreeCAD.Placement(matrix)
+
+
 def draw_infinite_plane(point, vector, name: str) -> str:
     plane = FreeCAD.ActiveDocument.addObject(FreeCADObjectType.PLANE, name)
     plane_GUI = FreeCADGui.ActiveDocument.getObject(plane.Name)
@@ -1153,6 +1294,24 @@ def get_fc_object(internal_name):
     return FreeCAD.ActiveDocument.getObject(internal_name)
 
 
+def get_fc_bounds(fc_object) -> tuple:
+    """ Returns the (min, max) corners of the bounding box of a FreeCAD object, in meters. Groups have the bounding box
+    of the objects they contain. Returns None if the object has no geometry. """
+    if fc_object is None:
+        return None
+    geometry = getattr(fc_object, "Shape", None)
+    if geometry is not None and not geometry.isNull():
+        bound_box = geometry.BoundBox
+        return ([bound_box.XMin / DIVIDER, bound_box.YMin / DIVIDER, bound_box.ZMin / DIVIDER],
+                [bound_box.XMax / DIVIDER, bound_box.YMax / DIVIDER, bound_box.ZMax / DIVIDER])
+    bounds = [get_fc_bounds(child) for child in getattr(fc_object, "OutList", [])]
+    bounds = [child_bounds for child_bounds in bounds if child_bounds is not None]
+    if not bounds:
+        return None
+    return ([min(child_bounds[0][axis] for child_bounds in bounds) for axis in range(3)],
+            [max(child_bounds[1][axis] for child_bounds in bounds) for axis in range(3)])
+
+
 def get_fc_view_object(internal_name):
     """ Returns a FreeCADGui View provider object by a name. """
     return FreeCADGui.ActiveDocument.getObject(internal_name)
@@ -1260,6 +1419,17 @@ def manage_partfilters(filters: Dict[
 
 def manage_gauges(gauges: Dict[str, Gauge]):
     for gauge in gauges.values():
+        if gauge.type == "array":
+            # Moving the array object moves all its gauges
+            fc_obj = get_fc_object(gauge.fc_object_name)
+            if fc_obj.Placement.Rotation.Angle != 0.0:
+                fc_obj.Placement.Rotation.Angle = 0.0
+                warning_dialog(__("Rotation on Gauge objects cannot be modified"))
+            if fc_obj.Placement.Base.Length > 0:
+                shift = fc_obj.Placement.Base / DIVIDER
+                shift_gauge_array(gauge, [shift.x, shift.y, shift.z])
+                update_gauge_array(gauge)
+            continue
         if gauge.type in ["velocity", "maxz", "swl"]:
             fc_obj = get_fc_object(gauge.fc_object_name)
             if list(fc_obj.Placement.Base / DIVIDER) != gauge.point0:
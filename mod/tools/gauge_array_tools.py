@@ -0,0 +1,86 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Tools to generate the points of gauge arrays.
+
+A gauge array defines hundreds or thousands of gauges with the same
+settings. Their points are generated at once with NumPy from a line, a
+grid or a CSV file, and each one is exported to GenCase as a gauge named
+after the array and its index. """
+
+import re
+
+import numpy as np
+
+GAUGE_ARRAY_TYPES = ("velocity", "swl", "maxz")
+GAUGE_ARRAY_LAYOUTS = ("line", "grid", "csv")
+
+
+def generate_line_points(start: list, end: list, count: int) -> np.ndarray:
+    """ Returns count points evenly spaced from start to end, both included. """
+    if count < 1:
+        return np.empty((0, 3))
+    return np.linspace(np.asarray(start, dtype=float), np.asarray(end, dtype=float), count)
+
+
+def generate_grid_points(origin: list, spacing: list, counts: list) -> np.ndarray:
+    """ Returns the points of a grid with counts points per axis, X varying fastest. """
+    if min(counts) < 1:
+        return np.empty((0, 3))
+    axes = [origin[axis] + spacing[axis] * np.arange(counts[axis], dtype=float) for axis in range(3)]
+    z_values, y_values, x_values = np.meshgrid(axes[2], axes[1], axes[0], indexing="ij")
+    return np.column_stack((x_values.ravel(), y_values.ravel(), z_values.ravel()))
+
+
+def load_csv_points(file_path: str) -> np.ndarray:
+    """ Returns the points in the first three columns of a CSV file, in m.
+    Columns may be separated by commas, semicolons, tabs or spaces. Lines that are not numeric, like headers, are skipped. """
+    points = list()
+    with open(file_path, "r", encoding="utf-8", errors="replace") as csv_file:
+        for line in csv_file:
+            values = [value for value in re.split(r"[,;\s]+", line.strip()) if value]
+            if len(values) < 3:
+                continue
+            try:
+                points.append([float(value) for value in values[:3]])
+            except ValueError:
+                continue
+    return np.array(points, dtype=float).reshape((-1, 3))
+
+
+def generate_array_points(gauge_array) -> np.ndarray:
+    """ Returns the base points of the gauges of an array from its layout. Raises OSError if the CSV can't be read. """
+    if gauge_array.layout == "grid":
+        return generate_grid_points(gauge_array.grid_origin, gauge_array.grid_spacing, gauge_array.grid_counts)
+    if gauge_array.layout == "csv":
+        return load_csv_points(gauge_array.csv_path) + np.asarray(gauge_array.csv_offset, dtype=float)
+    return generate_line_points(gauge_array.line_start, gauge_array.line_end, gauge_array.line_count)
+
+
+def shift_gauge_array(gauge_array, shift: list) -> None:
+    """ Moves the gauges of an array, together with the fields of its layout, so generating its points
+    again gives the moved ones. """
+    gauge_array.points = (np.asarray(gauge_array.points, dtype=float).reshape((-1, 3)) + shift).tolist()
+    if gauge_array.layout == "grid":
+        gauge_array.grid_origin = [value + delta for value, delta in zip(gauge_array.grid_origin, shift)]
+    elif gauge_array.layout == "csv":
+        gauge_array.csv_offset = [value + delta for value, delta in zip(gauge_array.csv_offset, shift)]
+    else:
+        gauge_array.line_start = [value + delta for value, delta in zip(gauge_array.line_start, shift)]
+        gauge_array.line_end = [value + delta for value, delta in zip(gauge_array.line_end, shift)]
+
+
+def get_member_name(array_name: str, index: int) -> str:
+    """ Returns the name of the gauge of an array at an index. """
+    return "{}_{:04d}".format(array_name, index)
+
+
+def get_member_end_points(gauge_array) -> np.ndarray:
+    """ Returns the second point of each gauge of an array: the end point of swl gauges and the top of maxz gauges.
+    Velocity gauges only have one point, so None is returned. """
+    points = np.asarray(gauge_array.points, dtype=float).reshape((-1, 3))
+    if gauge_array.gauge_type == "swl":
+        return points + np.asarray(gauge_array.swl_offset, dtype=float)
+    if gauge_array.gauge_type == "maxz":
+        return points + np.array([0.0, 0.0, gauge_array.height])
+    return None
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Tools to run GenCase showing its progress.
+
+The GenCase output is read while it runs and each line is matched against
+the keywords of its stages (loading the geometry, filling, computing
+normals and saving), so the time spent in each stage is known. Timings of
+every run are appended to a history file in the case folder, together with
+a hash of the case definition, to compare runs between case revisions. """
+
+import hashlib
+import json
+import re
+from datetime import datetime
+from os import path
+from time import perf_counter
+
+from PySide2 import QtCore
+
+from mod.constants import GENCASE_HISTORY_FILE_NAME, GENCASE_HISTORY_MAX_ENTRIES
+from mod.functions import atomic_open, parse_ds_int
+from mod.tools.stdout_tools import debug, log
+
+# GenCase stages in execution order, as (key, label, keywords found in the output lines of that stage)
+GENCASE_STAGES = (
+    ("loading", "Loading geometry", ("load", "reading")),
+    ("filling", "Filling", ("fill", "creating particles", "draw")),
+    ("normals", "Computing normals", ("normal",)),
+    ("saving", "Saving", ("saving", "saved", "writing"))
+)
+
+
+def format_elapsed(seconds: float) -> str:
+    """ Returns an elapsed time as h:mm:ss. """
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return "{}:{:02d}:{:02d}".format(hours, minutes, seconds)
+
+
+def match_gencase_stage(line: str, current_index: int) -> int:
+    """ Returns the index of the stage a GenCase output line belongs to. Stages only move forward,
+    so lines that mention an earlier stage keep the current one. """
+    lowered_line = line.lower()
+    for index in range(len(GENCASE_STAGES) - 1, current_index, -1):
+        if any(keyword in lowered_line for keyword in GENCASE_STAGES[index][2]):
+            return index
+    return current_index
+
+
+def parse_total_particles(output: str) -> int:
+    """ Returns the total number of particles reported by GenCase, or 0 if not found. """
+    match = re.search(r"Total particles: ([\d,.]+)", output)
+    if not match:
+        return 0
+    try:
+        return parse_ds_int(match.group(1))
+    except ValueError:
+        return 0
+
+
+class GencaseRun(QtCore.QObject):
+    """ A GenCase execution that reports its progress while it runs.
+    Emits stage_started with the label of each stage, progress with the elapsed time and the last output
+    line, and finished with the exit code and the full output once the process ends, is cancelled or
+    can't be started. """
+
+    stage_started = QtCore.Signal(str)
+    progress = QtCore.Signal(str)
+    finished = QtCore.Signal(int, str)
+
+    def __init__(self, executable: str, arguments: list, working_directory: str, parent=None):
+        super().__init__(parent=parent)
+        self.executable: str = executable
+        self.arguments: list = arguments
+        self.output_data: bytearray = bytearray()
+        self.pending_line: bytes = b""
+        self.last_line: str = ""
+        self.stage_index: int = -1
+        self.stage_start: float = 0.0
+        self.start_time: float = 0.0
+        self.end_time: float = 0.0
+        self.stage_timings: dict = dict()  # {stage key: seconds}
+        self.exit_code: int = 0
+        self.cancelled: bool = False
+        self.is_finished: bool = False
+
+        self.process = QtCore.QProcess(self)
+        self.process.setWorkingDirectory(working_directory)
+        self.process.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+        self.process.readyReadStandardOutput.connect(self.on_stdout_ready)
+        self.process.finished.connect(self.on_process_finished)
+        self.process.errorOccurred.connect(self.on_process_error)
+
+        self.elapsed_timer = QtCore.QTimer(self)
+        self.elapsed_timer.setInterval(1000)
+        self.elapsed_timer.timeout.connect(self.emit_progress)
+
+    @property
+    def output(self) -> str:
+        """ Full output of the process up to now. """
+        try:
+            return str(self.output_data, encoding="utf-8")
+        except UnicodeDecodeError:
+            return str(self.output_data, encoding="latin1")
+
+    @property
+    def total_time(self) -> float:
+        """ Seconds the process has been running. """
+        if not self.start_time:
+            return 0.0
+        return (self.end_time or perf_counter()) - self.start_time
+
+    def start(self):
+        """ Starts GenCase. """
+        self.start_time = perf_counter()
+        self.start_stage(0)
+        # Started before the process, as errorOccurred is emitted right away if it can't be started.
+        self.elapsed_timer.start()
+        self.process.start(self.executable, self.arguments)
+
+    def cancel(self):
+        """ Kills GenCase if it's running. finished is emitted once the process is stopped, or right away
+        if it's not running. """
+        if self.is_finished:
+            return
+        log("Cancelling GenCase")
+        self.cancelled = True
+        if self.process.state() != QtCore.QProcess.NotRunning:
+            self.process.kill()
+        else:
+            self.finish(-1)
+
+    def start_stage(self, index: int):
+        """ Closes the timing of the current stage and starts the stage with the given index. """
+        now = perf_counter()
+        if self.stage_index >= 0:
+            self.stage_timings[GENCASE_STAGES[self.stage_index][0]] = now - self.stage_start
+        self.stage_index = index
+        self.stage_start = now
+        if index < len(GENCASE_STAGES):
+            self.stage_started.emit(GENCASE_STAGES[index][1])
+
+    def emit_progress(self):
+        """ Reports the elapsed time in the current stage and the last output line. """
+        self.progress.emit("{} - {}".format(format_elapsed(perf_counter() - self.stage_start), self.last_line[:100]))
+
+    def on_stdout_ready(self):
+        """ Reads the new output lines, moving to the next stages when they show up. """
+        data = bytes(self.process.readAllStandardOutput().data())
+        self.output_data.extend(data)
+        lines = (self.pending_line + data).split(b"\n")
+        self.pending_line = lines.pop()
+        for raw_line in lines:
+            line = str(raw_line, encoding="utf-8", errors="replace").strip()
+            if not line:
+                continue
+            self.last_line = line
+            stage_index = match_gencase_stage(line, self.stage_index)
+            if stage_index != self.stage_index:
+                self.start_stage(stage_index)
+        self.emit_progress()
+
+    def on_process_finished(self, exit_code, exit_status=None):
+        """ Reports the result of the process. """
+        # Killed or crashed processes may report a zero exit code.
+        self.finish(exit_code or (-1 if exit_status == QtCore.QProcess.CrashExit else 0))
+
+    def on_process_error(self, process_error):
+        """ Reports a failed run if GenCase can't be started, as finished is not emitted by the process then. """
+        if process_error != QtCore.QProcess.FailedToStart:
+            return
+        self.output_data.extend("GenCase could not be started: {}\n".format(self.process.errorString()).encode("utf-8"))
+        self.finish(-1)
+
+    def finish(self, exit_code: int):
+        """ Closes the timings of the run and reports its result, only once. """
+        if self.is_finished:
+            return
+        self.is_finished = True
+        self.elapsed_timer.stop()
+        self.end_time = perf_counter()
+        self.start_stage(len(GENCASE_STAGES))
+        self.exit_code = exit_code
+        debug("GenCase stage timings: {}".format(self.stage_timings))
+        self.finished.emit(self.exit_code, self.output)
+
+
+def get_case_revision(case) -> str:
+    """ Returns a short hash of the case definition file written for GenCase, identifying the case revision. """
+    def_file = "{path}/{name}_Def.xml".format(path=case.path, name=case.name)
+    if not path.isfile(def_file):
+        return ""
+    with open(def_file, "rb") as def_stream:
+        return hashlib.sha256(def_stream.read()).hexdigest()[:16]
+
+
+def store_gencase_history(case, run: GencaseRun) -> None:
+    """ Appends the timings of a GenCase run to the history file in the case folder.
+    Only the last GENCASE_HISTORY_MAX_ENTRIES runs are kept. """
+    if run.cancelled:
+        status = "cancelled"
+    else:
+        status = "failed" if run.exit_code else "completed"
+    entry = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "case": case.name,
+        "revision": get_case_revision(case),
+        "dp": case.dp,
+        "status": status,
+        "particles": parse_total_particles(run.output),
+        "total_time": round(run.total_time, 3),
+        "stages": {key: round(seconds, 3) for key, seconds in run.stage_timings.items()}
+    }
+    history_file = "{}/{}".format(case.path, GENCASE_HISTORY_FILE_NAME)
+    lines = list()
+    try:
+        if path.isfile(history_file):
+            with open(history_file, "r", encoding="utf-8") as history_stream:
+                lines = [line for line in history_stream.read().splitlines() if line.strip()]
+        lines.append(json.dumps(entry))
+        with atomic_open(history_file, "w", encoding="utf-8") as history_stream:
+            history_stream.write("\n".join(lines[-GENCASE_HISTORY_MAX_ENTRIES:]) + "\n")
+    except OSError as ex:
+        debug("Unable to store GenCase history in {}: {}".format(history_file, ex))
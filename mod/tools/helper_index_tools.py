@@ -0,0 +1,103 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Index of the bounding boxes of the helper objects of a case.
+
+Each case keeps an AABBIndex with the bounding boxes of the FreeCAD objects
+of its inlet/outlet zones, gauges, output filters, FlowTool boxes, damping
+zones and variable resolution boxes, keyed by (HelperKind, FreeCAD object
+name). It is built when a case is loaded and then updated one helper at a
+time where helpers are created, edited or deleted, and one kind at a time
+where the positions set by hand in FreeCAD are read back. Validators and
+the interface query it instead of reading the bounds of every helper. The
+grid is laid on the X and Z axes, so the queries of 2D cases, which ignore
+the Y axis, use it too. """
+
+from mod.enums import HelperKind
+from mod.tools.freecad_tools import get_fc_bounds, get_fc_object
+from mod.tools.spatial_index_tools import AABBIndex, get_typical_cell_size
+
+HELPER_INDEX_GRID_AXES = (0, 2)  # X and Z, used by both 2D and 3D queries
+
+
+def create_helper_index(bounds: list = ()) -> AABBIndex:
+    """ Returns an empty helper index with cells sized for some (min, max) boxes. """
+    return AABBIndex(get_typical_cell_size(bounds), HELPER_INDEX_GRID_AXES)
+
+
+def get_helper_objects(case, kind: str = None) -> dict:
+    """ Returns the names of the helpers of a case, or only those of a HelperKind, by (kind, FreeCAD object name). """
+    helper_objects = dict()
+    if kind in (None, HelperKind.INOUT_ZONE):
+        for index, zone in enumerate(case.inlet_outlet.zones):
+            if zone.fc_object_name:
+                helper_objects[(HelperKind.INOUT_ZONE, zone.fc_object_name)] = str(index)
+    if kind in (None, HelperKind.GAUGE):
+        for name, gauge in case.gauges.gauges_dict.items():
+            if gauge.fc_object_name:
+                helper_objects[(HelperKind.GAUGE, gauge.fc_object_name)] = name
+    if kind in (None, HelperKind.OUTPUT_FILTER):
+        for name, outparts_filter in case.outparts.filts.items():
+            if outparts_filter.fc_object_name:
+                helper_objects[(HelperKind.OUTPUT_FILTER, outparts_filter.fc_object_name)] = name
+    if kind in (None, HelperKind.FLOWTOOL_BOX):
+        for flow_box in case.post_processing_settings.flowtool_xml_boxes:
+            if flow_box.fc_object_name:
+                helper_objects[(HelperKind.FLOWTOOL_BOX, flow_box.fc_object_name)] = flow_box.name
+    if kind in (None, HelperKind.DAMPING_ZONE):
+        for group_name in case.damping_zones:
+            helper_objects[(HelperKind.DAMPING_ZONE, group_name)] = group_name
+    if kind in (None, HelperKind.VRES_BOX):
+        for bufferbox in case.vres.bufferbox_list:
+            if bufferbox.fc_object_name:
+                helper_objects[(HelperKind.VRES_BOX, bufferbox.fc_object_name)] = str(bufferbox.id)
+    return helper_objects
+
+
+def build_helper_index(case) -> None:
+    """ Builds the helper index of a case from the bounds of all its helper objects, as done when it's loaded. """
+    helper_bounds = dict()
+    for key in get_helper_objects(case):
+        bounds = get_fc_bounds(get_fc_object(key[1]))
+        if bounds is not None:
+            helper_bounds[key] = bounds
+    case.helper_index = create_helper_index(helper_bounds.values())
+    for key, bounds in helper_bounds.items():
+        case.helper_index.insert(key, *bounds)
+
+
+def update_helper(case, kind: str, fc_object_name: str) -> None:
+    """ Updates the bounds of a helper that was created or changed. Helpers without geometry are removed. """
+    bounds = get_fc_bounds(get_fc_object(fc_object_name)) if fc_object_name else None
+    if bounds is None:
+        case.helper_index.remove((kind, fc_object_name))
+    else:
+        case.helper_index.update((kind, fc_object_name), *bounds)
+
+
+def remove_helper(case, kind: str, fc_object_name: str) -> None:
+    """ Removes a deleted helper from the index. """
+    case.helper_index.remove((kind, fc_object_name))
+
+
+def update_helper_kind(case, kind: str) -> None:
+    """ Updates the bounds of all the helpers of a kind, after reading back the positions set by hand in FreeCAD,
+    and removes those that are no longer in the case. """
+    helper_keys = get_helper_objects(case, kind).keys()
+    for key in [key for key in case.helper_index.keys() if key[0] == kind and key not in helper_keys]:
+        case.helper_index.remove(key)
+    for key in helper_keys:
+        update_helper(case, *key)
+
+
+def query_helpers_box(case, box_min: list, box_max: list, mode3d: bool, kinds: tuple = None) -> set:
+    """ Returns the (kind, FreeCAD object name) keys of the helpers, of any kind or of the given kinds, that intersect
+    a box. The Y axis is ignored in 2D cases. """
+    keys = case.helper_index.query_box(box_min, box_max, (0, 1, 2) if mode3d else (0, 2))
+    return keys if kinds is None else {key for key in keys if key[0] in kinds}
+
+
+def query_helpers_point(case, point: list, mode3d: bool, kinds: tuple = None) -> set:
+    """ Returns the (kind, FreeCAD object name) keys of the helpers, of any kind or of the given kinds, that contain
+    a point. The Y axis is ignored in 2D cases. """
+    return query_helpers_box(case, point, point, mode3d, kinds)
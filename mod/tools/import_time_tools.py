@@ -0,0 +1,107 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Import time measurement tools.
+
+Runs a Python interpreter with "-X importtime" over a DesignSPHysics module and
+reports the slowest imports against a time budget, so the workbench startup
+stays fast as new features are added. It only depends on the standard library
+so it can be executed outside FreeCAD, as long as the given interpreter can
+import FreeCAD and PySide2 (for example, the one bundled with FreeCAD):
+
+    python -m mod.tools.import_time_tools --python /path/to/freecad/bin/python mod.main
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from os import path
+
+# Budget for importing the module that boots DesignSPHysics, in milliseconds.
+IMPORT_TIME_BUDGET_MS = 1500
+IMPORT_TIME_LINE_REGEX = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+class ImportTimeEntry():
+    """ Time spent importing a module, as reported by "-X importtime". """
+
+    def __init__(self, module_name: str, self_us: int, cumulative_us: int, depth: int):
+        self.module_name: str = module_name
+        self.self_us: int = self_us
+        self.cumulative_us: int = cumulative_us
+        self.depth: int = depth
+
+
+def parse_import_time(output: str) -> list:
+    """ Parses the "-X importtime" output (written to stderr) into a list of ImportTimeEntry. """
+    entries: list = list()
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE_REGEX.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indentation, module_name = match.groups()
+        entries.append(ImportTimeEntry(module_name, int(self_us), int(cumulative_us), (len(indentation) - 1) // 2))
+    return entries
+
+
+def measure_import_time(module_name: str, python_executable: str = sys.executable) -> list:
+    """ Imports a module in a new interpreter and returns the parsed import times.
+    Raises RuntimeError if the module can't be imported. """
+    designsphysics_path = path.abspath("{}/../..".format(path.dirname(path.abspath(__file__))))
+    process = subprocess.run([python_executable, "-X", "importtime", "-c", "import {}".format(module_name)],
+                             cwd=designsphysics_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                             universal_newlines=True, check=False)
+    entries = parse_import_time(process.stderr)
+    if process.returncode != 0:
+        error_lines = [line for line in process.stderr.splitlines() if not IMPORT_TIME_LINE_REGEX.match(line)]
+        raise RuntimeError("Unable to import {}:\n{}".format(module_name, "\n".join(error_lines)))
+    return entries
+
+
+def get_total_import_time(entries: list, module_name: str) -> int:
+    """ Returns the cumulative import time of a module in microseconds, or 0 if it was not imported. """
+    for entry in entries:
+        if entry.module_name == module_name:
+            return entry.cumulative_us
+    return 0
+
+
+def import_time_report(entries: list, module_name: str, budget_ms: float = IMPORT_TIME_BUDGET_MS, top: int = 20) -> str:
+    """ Returns a text report with the total import time of a module against the budget and its slowest imports. """
+    total_ms = get_total_import_time(entries, module_name) / 1000.0
+    lines = ["Import time of {}: {:.1f} ms (budget: {:.1f} ms) -> {}".format(
+        module_name, total_ms, budget_ms, "OK" if total_ms <= budget_ms else "OVER BUDGET")]
+
+    lines.append("Slowest imports by own time:")
+    for entry in sorted(entries, key=lambda e: e.self_us, reverse=True)[:top]:
+        lines.append("    {:10.1f} ms  {:10.1f} ms cumulative  {}".format(entry.self_us / 1000.0, entry.cumulative_us / 1000.0,
+                                                                         entry.module_name))
+
+    own_modules = [entry for entry in entries if entry.module_name.startswith("mod.")]
+    lines.append("Slowest DesignSPHysics modules by cumulative time:")
+    for entry in sorted(own_modules, key=lambda e: e.cumulative_us, reverse=True)[:top]:
+        lines.append("    {:10.1f} ms  {}".format(entry.cumulative_us / 1000.0, entry.module_name))
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """ Measures the import time of a module and prints its report. Returns 1 if the budget is exceeded and 2 if the module can't be imported. """
+    parser = argparse.ArgumentParser(description="Measures DesignSPHysics import times against a budget.")
+    parser.add_argument("module", nargs="?", default="mod.main", help="Module to import (default: mod.main)")
+    parser.add_argument("--python", default=sys.executable, help="Python interpreter able to import FreeCAD")
+    parser.add_argument("--budget", type=float, default=IMPORT_TIME_BUDGET_MS, help="Budget in milliseconds")
+    parser.add_argument("--top", type=int, default=20, help="Number of imports to list")
+    args = parser.parse_args()
+
+    try:
+        entries = measure_import_time(args.module, args.python)
+    except RuntimeError as ex:
+        print(str(ex), file=sys.stderr)
+        return 2
+    print(import_time_report(entries, args.module, args.budget, args.top))
+    return 0 if get_total_import_time(entries, args.module) / 1000.0 <= args.budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,10 +10,12 @@ from mod.dataobjects.case import Case
 import FreeCAD
 
 from mod.dataobjects.configuration.application_settings import ApplicationSettings
-from mod.enums import DampingType, FreeCADDisplayMode, FreeCADObjectType
+from mod.enums import DampingType, FreeCADDisplayMode, FreeCADObjectType, HelperKind
+from mod.tools.background_tools import is_main_loop_paused
 from mod.tools.dialog_tools import warning_dialog, error_dialog
 from mod.tools.freecad_tools import get_fc_object, valid_document_environment, \
     get_fc_view_object, add_tree_structure, add_case_limits_object, draw_simulation_domain, get_case_limits
+from mod.tools.helper_index_tools import remove_helper
 
 from mod.tools.translation_tools import __
 from mod.widgets.designsphysics_dock import DesignSPHysicsDock
@@ -56,6 +58,7 @@ def manage_deleted_objects():
     # Check deleting of damping zones
     for damping_to_delete in list(filter(lambda x: not get_fc_object(x), Case.the().damping_zones)):
         Case.the().remove_damping_zone(damping_to_delete)
+        remove_helper(Case.the(), HelperKind.DAMPING_ZONE, damping_to_delete)
     #Check for deleting in helper group folders
     if GAUGES_GROUP_NAME not in names_list or VRES_BOXES_GROUP_NAME not in names_list or IO_ZONES_GROUP_NAME not in names_list or OUTFILTERS_GROUP_NAME not in names_list or VARIABLES_SHEET_NAME not in names_list or DAMPING_GROUP_NAME not in names_list:
         add_tree_structure()
@@ -99,6 +102,10 @@ def manage_deleted_objects():
             if fc_name not in names_list:
                 FreeCADGui.runCommand('Std_Undo', 0)
                 missing_objs.append("Flowtool boxes helper objects.")
+    # Drop the helpers that are still missing after the undos from the helper index
+    for kind, fc_name in Case.the().helper_index.keys():
+        if not get_fc_object(fc_name):
+            remove_helper(Case.the(), kind, fc_name)
     # Manage Case Limits
     if CASE_LIMITS_OBJ_NAME not in names_list:
         add_case_limits_object()
@@ -126,6 +133,8 @@ class MainLoopManager(QObject):
 
     @Slot()
     def deleted(self):
+        if is_main_loop_paused():
+            return None
         try:
             manage_deleted_objects()
         except Exception:
@@ -141,6 +150,8 @@ class MainLoopManager(QObject):
 
     @Slot()
     def slot_selection(self):
+        if is_main_loop_paused():
+            return
         if not FreeCADGui.Selection.getSelection():
             self.properties.configure_to_no_selection()
 
@@ -0,0 +1,626 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Mesh reading and simplification tools based on NumPy.
+
+These functions return meshes as a (vertices, faces) pair of arrays, with
+vertices as a float64 (N, 3) array and faces as an int64 (M, 3) array of
+triangle vertex indices. They do not depend on FreeCAD, so they can be
+executed in worker processes. Formats or variants that are not supported
+raise ValueError, so the caller can fall back to the FreeCAD readers.
+"""
+
+import base64
+import re
+import zlib
+import xml.etree.ElementTree as ElementTree
+from os import path
+
+import numpy as np
+
+STL_BINARY_HEADER_SIZE = 84
+STL_BINARY_FACET_DTYPE = np.dtype([("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attributes", "<u2")])
+STL_ASCII_VERTEX_REGEX = re.compile(rb"vertex\s+(\S+)\s+(\S+)\s+(\S+)")
+
+VTK_LEGACY_TYPES = {
+    "bit": None, "unsigned_char": "u1", "char": "i1", "unsigned_short": "u2", "short": "i2",
+    "unsigned_int": "u4", "int": "i4", "unsigned_long": "u8", "long": "i8", "float": "f4", "double": "f8",
+    "vtktypeint64": "i8", "vtktypeuint64": "u8"
+}
+VTK_XML_TYPES = {
+    "Int8": "i1", "UInt8": "u1", "Int16": "i2", "UInt16": "u2", "Int32": "i4", "UInt32": "u4",
+    "Int64": "i8", "UInt64": "u8", "Float32": "f4", "Float64": "f8"
+}
+VTK_TRIANGLE = 5
+VTK_TRIANGLE_STRIP = 6
+VTK_POLYGON = 7
+VTK_QUAD = 9
+VTK_SURFACE_CELL_TYPES = (VTK_TRIANGLE, VTK_POLYGON, VTK_QUAD)
+
+# Triangles processed at once when streaming memory mapped meshes.
+TRIANGLE_CHUNK_SIZE = 1000000
+
+
+def read_mesh_arrays(filename: str) -> tuple:
+    """ Reads a STL, legacy VTK, VTU or VTP surface file and returns its (vertices, faces) arrays. """
+    file_type = path.splitext(filename)[1].lower()
+    if file_type == ".stl":
+        return read_stl_arrays(filename)
+    if file_type == ".vtk":
+        return read_vtk_legacy_arrays(filename)
+    if file_type in (".vtu", ".vtp"):
+        return read_vtk_xml_arrays(filename)
+    raise ValueError("Unsupported mesh file type: {}".format(file_type))
+
+
+def read_file_array(filename: str, dtype, count: int, offset: int) -> np.ndarray:
+    """ Reads count items of the given dtype starting at offset bytes of a binary file. """
+    array = np.fromfile(filename, dtype=dtype, count=count, offset=offset)
+    if len(array) != count:
+        raise ValueError("Unexpected end of file reading {}".format(filename))
+    return array
+
+
+def read_until(stream, marker: bytes, block_size: int = 1024 * 1024) -> bytes:
+    """ Reads a binary stream in blocks until the marker is found or the end is reached. Returns the read bytes. """
+    content = b""
+    while True:
+        block = stream.read(block_size)
+        content += block
+        if not block or content.find(marker, max(0, len(content) - len(block) - len(marker))) >= 0:
+            return content
+
+
+def is_binary_stl(filename: str) -> bool:
+    """ Returns whether a STL file is binary, checking its size against the facet count in its header. """
+    file_size = path.getsize(filename)
+    if file_size < STL_BINARY_HEADER_SIZE:
+        return False
+    with open(filename, "rb") as stl_file:
+        stl_file.seek(80)
+        facet_count = int(np.frombuffer(stl_file.read(4), dtype="<u4")[0])
+    return file_size == STL_BINARY_HEADER_SIZE + facet_count * STL_BINARY_FACET_DTYPE.itemsize
+
+
+def read_stl_arrays(filename: str) -> tuple:
+    """ Reads a binary or ASCII STL file. Vertices are not shared between facets. """
+    if is_binary_stl(filename):
+        with open(filename, "rb") as stl_file:
+            stl_file.seek(80)
+            facet_count = int(np.frombuffer(stl_file.read(4), dtype="<u4")[0])
+        facets = read_file_array(filename, STL_BINARY_FACET_DTYPE, facet_count, STL_BINARY_HEADER_SIZE)
+        vertices = facets["vertices"].reshape(-1, 3).astype(np.float64)
+    else:
+        with open(filename, "rb") as stl_file:
+            vertices = np.array(STL_ASCII_VERTEX_REGEX.findall(stl_file.read()), dtype=np.float64)
+        if len(vertices) % 3:
+            raise ValueError("Malformed ASCII STL file {}".format(filename))
+    return vertices, np.arange(len(vertices), dtype=np.int64).reshape(-1, 3)
+
+
+def triangulate_cells(connectivity: np.ndarray, offsets: np.ndarray, cell_types: np.ndarray = None) -> np.ndarray:
+    """ Returns the triangles of a list of polygonal cells given with VTK connectivity and end offsets.
+    Polygons are split in triangle fans. Raises ValueError for non surface cells. """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    connectivity = np.asarray(connectivity, dtype=np.int64)
+    starts = np.concatenate(([0], offsets[:-1]))
+    sizes = offsets - starts
+    if cell_types is not None and not np.isin(cell_types, VTK_SURFACE_CELL_TYPES).all():
+        raise ValueError("Only triangle, quad and polygon cells are supported")
+    if (sizes < 3).any():
+        raise ValueError("Only triangle, quad and polygon cells are supported")
+    if (sizes == 3).all():
+        return connectivity.reshape(-1, 3)
+    triangles = []
+    for size in np.unique(sizes):
+        cell_starts = starts[sizes == size]
+        for corner in range(1, size - 1):
+            triangles.append(np.stack((connectivity[cell_starts], connectivity[cell_starts + corner],
+                                       connectivity[cell_starts + corner + 1]), axis=1))
+    return np.concatenate(triangles)
+
+
+def triangulate_strips(connectivity: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """ Returns the triangles of a list of VTK triangle strips given with connectivity and end offsets. """
+    triangles = []
+    start = 0
+    for end in np.asarray(offsets, dtype=np.int64):
+        strip = connectivity[start:end]
+        for index in range(len(strip) - 2):
+            triangle = strip[index:index + 3]
+            triangles.append(triangle if index % 2 == 0 else triangle[[1, 0, 2]])
+        start = end
+    return np.array(triangles, dtype=np.int64).reshape(-1, 3)
+
+
+def legacy_cell_list_to_offsets(cell_list: np.ndarray) -> tuple:
+    """ Converts a legacy VTK cell list ([n, id1, ..., idn, n, ...]) to connectivity and end offsets arrays. """
+    cell_list = np.asarray(cell_list, dtype=np.int64)
+    sizes = []
+    position = 0
+    # Cells of the same size are the most common case, so try to jump through them at once.
+    while position < len(cell_list):
+        size = int(cell_list[position])
+        run = cell_list[position::size + 1]
+        same_size = np.flatnonzero(run != size)
+        run_length = len(run) if len(same_size) == 0 else int(same_size[0])
+        run_length = min(run_length, (len(cell_list) - position) // (size + 1))
+        if run_length == 0:
+            raise ValueError("Malformed legacy VTK cell list")
+        sizes.append(np.full(run_length, size, dtype=np.int64))
+        position += run_length * (size + 1)
+    sizes = np.concatenate(sizes) if sizes else np.zeros(0, dtype=np.int64)
+    headers = np.concatenate(([0], np.cumsum(sizes + 1)[:-1]))
+    mask = np.ones(len(cell_list), dtype=bool)
+    mask[headers] = False
+    return cell_list[mask], np.cumsum(sizes)
+
+
+class VtkLegacyReader():
+    """ Sequential reader for the ASCII and binary legacy VTK formats. """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.file = open(filename, "rb")  # pylint: disable=consider-using-with
+        self.file.readline()
+        self.file.readline()
+        self.binary = self.file.readline().strip().upper() == b"BINARY"
+
+    def close(self):
+        """ Closes the underlying file. """
+        self.file.close()
+
+    def next_keyword_line(self) -> list:
+        """ Returns the words of the next non empty line, or an empty list at the end of the file. """
+        while True:
+            line = self.file.readline()
+            if not line:
+                return []
+            words = line.decode("latin1").split()
+            if words:
+                return words
+
+    def read_values(self, vtk_type: str, count: int) -> np.ndarray:
+        """ Reads count values of the given legacy VTK type from the current position. """
+        dtype = VTK_LEGACY_TYPES.get(vtk_type.lower())
+        if dtype is None:
+            raise ValueError("Unsupported legacy VTK data type {}".format(vtk_type))
+        if self.binary:
+            # Binary values are memory mapped, so they are only read from disk when used.
+            offset = self.file.tell()
+            if offset + count * np.dtype(dtype).itemsize > path.getsize(self.filename):
+                raise ValueError("Unexpected end of file reading {}".format(self.filename))
+            values = np.memmap(self.filename, dtype=">" + dtype, mode="r", offset=offset, shape=(count,))
+            self.file.seek(offset + count * np.dtype(dtype).itemsize)
+            return values
+        values = []
+        while len(values) < count:
+            line = self.file.readline()
+            if not line:
+                raise ValueError("Unexpected end of file reading {}".format(self.filename))
+            values.extend(line.split())
+        return np.array(values[:count], dtype=dtype)
+
+    def read_cells(self, first_size: int, second_size: int) -> tuple:
+        """ Reads a cell section and returns its connectivity and end offsets arrays.
+        Supports both the classic cell list and the OFFSETS/CONNECTIVITY layout of VTK 5.1 files. """
+        position = self.file.tell()
+        words = self.next_keyword_line()
+        if words and words[0].upper() == "OFFSETS":
+            offsets = self.read_values(words[1], first_size).astype(np.int64)
+            words = self.next_keyword_line()
+            if not words or words[0].upper() != "CONNECTIVITY":
+                raise ValueError("Malformed legacy VTK cell section in {}".format(self.filename))
+            connectivity = self.read_values(words[1], second_size).astype(np.int64)
+            return connectivity, offsets[1:]
+        self.file.seek(position)
+        return legacy_cell_list_to_offsets(self.read_values("int", second_size))
+
+
+def read_vtk_legacy_arrays(filename: str) -> tuple:
+    """ Reads a legacy VTK file with POLYDATA or UNSTRUCTURED_GRID surface datasets. """
+    reader = VtkLegacyReader(filename)
+    vertices = None
+    triangles = []
+    cells = None
+    cell_types = None
+    try:
+        while True:
+            words = reader.next_keyword_line()
+            if not words:
+                break
+            keyword = words[0].upper()
+            if keyword == "DATASET" and words[1].upper() not in ("POLYDATA", "UNSTRUCTURED_GRID"):
+                raise ValueError("Unsupported legacy VTK dataset {}".format(words[1]))
+            if keyword == "POINTS":
+                vertices = reader.read_values(words[2], int(words[1]) * 3).reshape(-1, 3).astype(np.float64)
+            elif keyword in ("POLYGONS", "TRIANGLE_STRIPS", "CELLS", "VERTICES", "LINES"):
+                connectivity, offsets = reader.read_cells(int(words[1]), int(words[2]))
+                if keyword == "POLYGONS":
+                    triangles.append(triangulate_cells(connectivity, offsets))
+                elif keyword == "TRIANGLE_STRIPS":
+                    triangles.append(triangulate_strips(connectivity, offsets))
+                elif keyword == "CELLS":
+                    cells = (connectivity, offsets)
+            elif keyword == "CELL_TYPES":
+                cell_types = reader.read_values("int", int(words[1]))
+            elif keyword in ("POINT_DATA", "CELL_DATA"):
+                # Geometry is always defined before the attributes.
+                break
+    finally:
+        reader.close()
+    if cells is not None:
+        triangles.append(triangulate_cells(cells[0], cells[1], cell_types))
+    if vertices is None or not triangles:
+        raise ValueError("No surface found in {}".format(filename))
+    return vertices, np.concatenate(triangles)
+
+
+def read_vtk_legacy_points(filename: str) -> tuple:
+    """ Reads the points of a legacy VTK file and their data arrays (SCALARS, VECTORS and FIELD arrays).
+    Returns the points as a float64 (N, 3) array and a dictionary of arrays by name, with one row per point. """
+    reader = VtkLegacyReader(filename)
+    points = None
+    point_data = dict()
+    point_count = 0
+    reading_points = False
+    try:
+        while True:
+            words = reader.next_keyword_line()
+            if not words:
+                break
+            keyword = words[0].upper()
+            if keyword == "POINTS":
+                points = reader.read_values(words[2], int(words[1]) * 3).reshape(-1, 3).astype(np.float64)
+            elif keyword in ("POLYGONS", "TRIANGLE_STRIPS", "CELLS", "VERTICES", "LINES"):
+                reader.read_cells(int(words[1]), int(words[2]))
+            elif keyword == "CELL_TYPES":
+                reader.read_values("int", int(words[1]))
+            elif keyword in ("POINT_DATA", "CELL_DATA"):
+                reading_points = keyword == "POINT_DATA"
+                point_count = int(words[1])
+            elif keyword == "SCALARS":
+                component_count = int(words[3]) if len(words) > 3 else 1
+                table_words = reader.next_keyword_line()
+                if table_words[0].upper() != "LOOKUP_TABLE":
+                    raise ValueError("Malformed legacy VTK scalars in {}".format(filename))
+                values = reader.read_values(words[2], point_count * component_count)
+                if reading_points:
+                    point_data[words[1]] = values.reshape(point_count, -1) if component_count > 1 else values
+            elif keyword in ("VECTORS", "NORMALS"):
+                values = reader.read_values(words[2], point_count * 3)
+                if reading_points:
+                    point_data[words[1]] = values.reshape(point_count, 3)
+            elif keyword == "FIELD":
+                for _ in range(int(words[2])):
+                    array_words = reader.next_keyword_line()
+                    component_count, tuple_count = int(array_words[1]), int(array_words[2])
+                    values = reader.read_values(array_words[3], component_count * tuple_count)
+                    if reading_points:
+                        point_data[array_words[0]] = values.reshape(tuple_count, -1) if component_count > 1 else values
+    finally:
+        reader.close()
+    if points is None:
+        raise ValueError("No points found in {}".format(filename))
+    return points, point_data
+
+
+class VtkXmlReader():
+    """ Reader for the data arrays of VTK XML files (ascii, inline binary and appended data). """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.appended_data = b""
+        self.appended_raw = False
+        self.appended_file_offset = None
+        with open(filename, "rb") as vtk_file:
+            content = read_until(vtk_file, b"<AppendedData")
+            appended_start = content.find(b"<AppendedData")
+            if appended_start >= 0:
+                content += read_until(vtk_file, b"_")
+                data_start = content.index(b"_", appended_start) + 1
+                self.appended_raw = b"raw" in content[appended_start:data_start]
+            self.root = ElementTree.fromstring(content[:appended_start] + b"</VTKFile>" if appended_start >= 0 else content)
+            self.header_dtype = np.dtype("<" + VTK_XML_TYPES[self.root.get("header_type", "UInt32")])
+            self.compressed = self.root.get("compressor") is not None
+            if appended_start >= 0:
+                if self.appended_raw and not self.compressed:
+                    # Raw arrays are memory mapped, so huge files are only read when their values are used.
+                    self.appended_file_offset = data_start
+                else:
+                    self.appended_data = content[data_start:] + vtk_file.read()
+                    data_end = self.appended_data.rfind(b"</AppendedData>")
+                    self.appended_data = self.appended_data[:data_end if data_end >= 0 else len(self.appended_data)]
+        if self.compressed and self.root.get("compressor") != "vtkZLibDataCompressor":
+            raise ValueError("Unsupported VTK compressor {}".format(self.root.get("compressor")))
+        if self.root.get("byte_order", "LittleEndian") != "LittleEndian":
+            raise ValueError("Only little endian VTK XML files are supported")
+
+    def decode_blocks(self, header: np.ndarray, data: bytes) -> bytes:
+        """ Decompresses the zlib blocks described by a compression header. """
+        blocks = []
+        position = 0
+        for compressed_size in header[3:]:
+            blocks.append(zlib.decompress(data[position:position + int(compressed_size)]))
+            position += int(compressed_size)
+        return b"".join(blocks)
+
+    def read_inline_binary(self, text: bytes) -> bytes:
+        """ Decodes an inline base64 binary data array. """
+        header_size = self.header_dtype.itemsize
+        if self.compressed:
+            first_chars = -(-header_size // 3) * 4
+            block_count = int(np.frombuffer(base64.b64decode(text[:first_chars])[:header_size], self.header_dtype)[0])
+            header_chars = -(-header_size * (3 + block_count) // 3) * 4
+            header = np.frombuffer(base64.b64decode(text[:header_chars]), self.header_dtype)
+            return self.decode_blocks(header, base64.b64decode(text[header_chars:]))
+        decoded = base64.b64decode(text)
+        byte_count = int(np.frombuffer(decoded[:header_size], self.header_dtype)[0])
+        if len(decoded) == header_size:
+            # Header was encoded separately from the data.
+            decoded = base64.b64decode(text[len(base64.b64encode(decoded)):])
+            return decoded[:byte_count]
+        return decoded[header_size:header_size + byte_count]
+
+    def read_appended(self, offset: int, dtype: np.dtype) -> np.ndarray:
+        """ Decodes an appended data array starting at the given offset. """
+        header_size = self.header_dtype.itemsize
+        if self.appended_file_offset is not None:
+            array_offset = self.appended_file_offset + offset
+            byte_count = int(read_file_array(self.filename, self.header_dtype, 1, array_offset)[0])
+            return np.memmap(self.filename, dtype=dtype, mode="r", offset=array_offset + header_size,
+                             shape=(byte_count // dtype.itemsize,))
+        if not self.appended_raw:
+            return np.frombuffer(self.read_inline_binary(self.appended_data[offset:].split(b"<")[0].strip()), dtype)
+        block_count = int(np.frombuffer(self.appended_data[offset:offset + header_size], self.header_dtype)[0])
+        header = np.frombuffer(self.appended_data[offset:offset + header_size * (3 + block_count)], self.header_dtype)
+        data_start = offset + header_size * (3 + block_count)
+        return np.frombuffer(self.decode_blocks(header, self.appended_data[data_start:data_start + int(header[3:].sum())]), dtype)
+
+    def read_data_array(self, element) -> np.ndarray:
+        """ Returns the values of a DataArray element. """
+        dtype = np.dtype("<" + VTK_XML_TYPES[element.get("type")])
+        data_format = element.get("format", "ascii")
+        if data_format == "ascii":
+            return np.array((element.text or "").split(), dtype=dtype)
+        if data_format == "binary":
+            return np.frombuffer(self.read_inline_binary((element.text or "").strip().encode("ascii")), dtype)
+        if data_format == "appended":
+            return self.read_appended(int(element.get("offset")), dtype)
+        raise ValueError("Unsupported VTK data array format {}".format(data_format))
+
+    def find_data_array(self, parent, name: str) -> np.ndarray:
+        """ Returns the values of the DataArray with the given name inside parent, or None. """
+        for element in parent.iter("DataArray"):
+            if element.get("Name") == name:
+                return self.read_data_array(element)
+        return None
+
+
+def read_vtk_xml_arrays(filename: str) -> tuple:
+    """ Reads the surface in a VTU (UnstructuredGrid) or VTP (PolyData) file. """
+    reader = VtkXmlReader(filename)
+    vertices = []
+    triangles = []
+    vertex_count = 0
+    for piece in reader.root.iter("Piece"):
+        points = piece.find("Points")
+        if points is None:
+            continue
+        piece_vertices = reader.read_data_array(points.find("DataArray")).reshape(-1, 3).astype(np.float64)
+        cells = piece.find("Cells")
+        if cells is not None:
+            triangles.append(vertex_count + triangulate_cells(reader.find_data_array(cells, "connectivity"),
+                                                              reader.find_data_array(cells, "offsets"),
+                                                              reader.find_data_array(cells, "types")))
+        polys = piece.find("Polys")
+        if polys is not None and int(piece.get("NumberOfPolys", "1")) > 0:
+            triangles.append(vertex_count + triangulate_cells(reader.find_data_array(polys, "connectivity"),
+                                                              reader.find_data_array(polys, "offsets")))
+        strips = piece.find("Strips")
+        if strips is not None and int(piece.get("NumberOfStrips", "1")) > 0:
+            triangles.append(vertex_count + triangulate_strips(reader.find_data_array(strips, "connectivity"),
+                                                               reader.find_data_array(strips, "offsets")))
+        vertices.append(piece_vertices)
+        vertex_count += len(piece_vertices)
+    if not vertices or not triangles:
+        raise ValueError("No surface found in {}".format(filename))
+    return np.concatenate(vertices), np.concatenate(triangles)
+
+
+def map_stl_triangles(filename: str) -> np.ndarray:
+    """ Memory maps the facets of a binary STL file. Returns a (M, 3, 3) array with the corners of each triangle. """
+    if not is_binary_stl(filename):
+        raise ValueError("Only binary STL files can be memory mapped")
+    facet_count = (path.getsize(filename) - STL_BINARY_HEADER_SIZE) // STL_BINARY_FACET_DTYPE.itemsize
+    if facet_count == 0:
+        raise ValueError("No surface found in {}".format(filename))
+    return np.memmap(filename, dtype=STL_BINARY_FACET_DTYPE, mode="r", offset=STL_BINARY_HEADER_SIZE,
+                     shape=(facet_count,))["vertices"]
+
+
+def map_vtk_legacy_triangles(filename: str) -> tuple:
+    """ Memory maps the points and faces of a binary legacy VTK file made only of triangles.
+    Returns the (vertices, faces) arrays, or raises ValueError for other kinds of files. """
+    reader = VtkLegacyReader(filename)
+    vertices = None
+    faces = None
+    try:
+        if not reader.binary:
+            raise ValueError("Only binary legacy VTK files can be memory mapped")
+        while True:
+            words = reader.next_keyword_line()
+            if not words or words[0].upper() in ("POINT_DATA", "CELL_DATA"):
+                break
+            keyword = words[0].upper()
+            if keyword == "POINTS":
+                vertices = reader.read_values(words[2], int(words[1]) * 3).reshape(-1, 3)
+            elif keyword in ("POLYGONS", "CELLS"):
+                if faces is not None:
+                    raise ValueError("Only files with a single cell section can be memory mapped")
+                first_size, second_size = int(words[1]), int(words[2])
+                position = reader.file.tell()
+                section_words = reader.next_keyword_line()
+                if section_words and section_words[0].upper() == "OFFSETS":
+                    # Every polygon has 3 or more vertices, so they are all triangles if the total is 3 per cell.
+                    reader.read_values(section_words[1], first_size)
+                    section_words = reader.next_keyword_line()
+                    if second_size != 3 * (first_size - 1):
+                        raise ValueError("Only triangle meshes can be memory mapped")
+                    faces = reader.read_values(section_words[1], second_size).reshape(-1, 3)
+                else:
+                    reader.file.seek(position)
+                    if second_size != 4 * first_size:
+                        raise ValueError("Only triangle meshes can be memory mapped")
+                    faces = reader.read_values("int", second_size).reshape(-1, 4)[:, 1:]
+            elif keyword == "CELL_TYPES":
+                cell_types = reader.read_values("int", int(words[1]))
+                for start in range(0, len(cell_types), TRIANGLE_CHUNK_SIZE):
+                    if (cell_types[start:start + TRIANGLE_CHUNK_SIZE] != VTK_TRIANGLE).any():
+                        raise ValueError("Only triangle meshes can be memory mapped")
+            elif keyword in ("TRIANGLE_STRIPS", "VERTICES", "LINES"):
+                raise ValueError("Only triangle meshes can be memory mapped")
+    finally:
+        reader.close()
+    if vertices is None or faces is None:
+        raise ValueError("No surface found in {}".format(filename))
+    return vertices, faces
+
+
+def map_mesh_triangles(filename: str) -> tuple:
+    """ Opens a mesh file with as little memory as possible. Returns (vertices, faces) arrays, where faces is None
+    if vertices contains the corners of each triangle instead (STL). Binary STL, binary legacy VTK and VTK XML files
+    with raw appended data are memory mapped. Other files are fully read. """
+    file_type = path.splitext(filename)[1].lower()
+    try:
+        if file_type == ".stl":
+            return map_stl_triangles(filename), None
+        if file_type == ".vtk":
+            return map_vtk_legacy_triangles(filename)
+    except ValueError:
+        pass
+    return read_mesh_arrays(filename)
+
+
+def get_triangle_count(vertices: np.ndarray, faces: np.ndarray) -> int:
+    """ Returns the number of triangles of a mesh opened with map_mesh_triangles. """
+    return len(vertices) if faces is None else len(faces)
+
+
+def iter_triangle_chunks(vertices: np.ndarray, faces: np.ndarray, chunk_size: int = None):
+    """ Yields the triangles of a mesh opened with map_mesh_triangles as (n, 3, 3) float64 arrays of corner
+    coordinates, a chunk at a time, so memory mapped meshes are never fully loaded. """
+    chunk_size = chunk_size or TRIANGLE_CHUNK_SIZE
+    for start in range(0, get_triangle_count(vertices, faces), chunk_size):
+        if faces is None:
+            yield np.asarray(vertices[start:start + chunk_size], dtype=np.float64)
+        else:
+            yield np.asarray(vertices[np.asarray(faces[start:start + chunk_size], dtype=np.int64)], dtype=np.float64)
+
+
+def build_lod_mesh_arrays(filename: str, scale: tuple, max_faces: int, chunk_size: int = None) -> tuple:
+    """ Builds a light version of a mesh file, with approximately max_faces triangles, to be shown in the 3D view.
+    The file is streamed in chunks and simplified by vertex clustering, so meshes with tens of millions of triangles
+    are never loaded at once. Coordinates are scaled from meters to millimeters.
+    Returns (vertices, faces, original triangle count). """
+    scale = np.asarray(scale, dtype=np.float64) * 1000
+    vertices, faces = map_mesh_triangles(filename)
+    triangle_count = get_triangle_count(vertices, faces)
+    if triangle_count <= max_faces:
+        if faces is None:
+            vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+            faces = np.arange(len(vertices), dtype=np.int64).reshape(-1, 3)
+        return np.asarray(vertices, dtype=np.float64) * scale, np.asarray(faces, dtype=np.int64), triangle_count
+
+    # First pass: bounding box and surface area, to size the clustering grid.
+    min_corner = np.full(3, np.inf)
+    max_corner = np.full(3, -np.inf)
+    surface_area = 0.0
+    for triangles in iter_triangle_chunks(vertices, faces, chunk_size):
+        triangles *= scale
+        min_corner = np.minimum(min_corner, triangles.min(axis=(0, 1)))
+        max_corner = np.maximum(max_corner, triangles.max(axis=(0, 1)))
+        surface_area += 0.5 * np.linalg.norm(np.cross(triangles[:, 1] - triangles[:, 0],
+                                                      triangles[:, 2] - triangles[:, 0]), axis=1).sum()
+    # A triangulated surface has about twice as many triangles as vertices.
+    cell_size = np.sqrt(surface_area / max(max_faces // 2, 2))
+    if not cell_size > 0.0:
+        raise ValueError("Degenerated surface in {}".format(filename))
+    grid_size = np.floor((max_corner - min_corner) / cell_size).astype(np.int64) + 1
+
+    # Second pass: cluster the corners of each chunk and keep the non degenerated triangles between clusters.
+    cluster_keys, cluster_sums, cluster_counts, triangle_keys = [], [], [], []
+    for triangles in iter_triangle_chunks(vertices, faces, chunk_size):
+        corners = triangles.reshape(-1, 3) * scale
+        cells = np.minimum(((corners - min_corner) / cell_size).astype(np.int64), grid_size - 1)
+        keys = (cells[:, 0] * grid_size[1] + cells[:, 1]) * grid_size[2] + cells[:, 2]
+        chunk_keys, inverse = np.unique(keys, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        cluster_keys.append(chunk_keys)
+        cluster_sums.append(np.stack([np.bincount(inverse, corners[:, axis], len(chunk_keys)) for axis in range(3)], axis=1))
+        cluster_counts.append(np.bincount(inverse, minlength=len(chunk_keys)))
+        keys = keys.reshape(-1, 3)
+        keys = keys[(keys[:, 0] != keys[:, 1]) & (keys[:, 1] != keys[:, 2]) & (keys[:, 0] != keys[:, 2])]
+        triangle_keys.append(unique_triangles(keys))
+
+    cluster_keys, inverse = np.unique(np.concatenate(cluster_keys), return_inverse=True)
+    inverse = inverse.reshape(-1)
+    sums = np.concatenate(cluster_sums)
+    counts = np.bincount(inverse, np.concatenate(cluster_counts), len(cluster_keys))
+    lod_vertices = np.stack([np.bincount(inverse, sums[:, axis], len(cluster_keys)) for axis in range(3)], axis=1)
+    lod_vertices /= counts[:, np.newaxis]
+    lod_faces = np.searchsorted(cluster_keys, unique_triangles(np.concatenate(triangle_keys)))
+    return lod_vertices, lod_faces, triangle_count
+
+
+def unique_triangles(faces: np.ndarray) -> np.ndarray:
+    """ Removes repeated triangles, regardless of their vertex order, keeping the first occurrence of each. """
+    if len(faces) == 0:
+        return faces
+    _, first_indices = np.unique(np.sort(faces, axis=1), axis=0, return_index=True)
+    return faces[np.sort(first_indices)]
+
+
+def decimate_mesh_arrays(vertices: np.ndarray, faces: np.ndarray, reduction: float) -> tuple:
+    """ Simplifies a mesh by vertex clustering, removing approximately the given fraction (0 to 1) of its vertices.
+    Vertices are snapped to a uniform grid sized for the target count and merged into their cluster centroid. """
+    if not 0.0 < reduction < 1.0 or len(faces) == 0:
+        return vertices, faces
+    used_vertices, faces = np.unique(faces, return_inverse=True)
+    vertices = vertices[used_vertices]
+    faces = faces.reshape(-1, 3)
+    target_count = max(int(len(vertices) * (1.0 - reduction)), 4)
+
+    edges_a = vertices[faces[:, 1]] - vertices[faces[:, 0]]
+    edges_b = vertices[faces[:, 2]] - vertices[faces[:, 0]]
+    surface_area = 0.5 * np.linalg.norm(np.cross(edges_a, edges_b), axis=1).sum()
+    if surface_area <= 0.0:
+        return vertices, faces
+    cell_size = np.sqrt(surface_area / target_count)
+
+    cell_keys = np.floor((vertices - vertices.min(axis=0)) / cell_size).astype(np.int64)
+    _, cluster_index, cluster_sizes = np.unique(cell_keys, axis=0, return_inverse=True, return_counts=True)
+    cluster_index = cluster_index.reshape(-1)
+    clustered_vertices = np.zeros((len(cluster_sizes), 3), dtype=np.float64)
+    np.add.at(clustered_vertices, cluster_index, vertices)
+    clustered_vertices /= cluster_sizes[:, np.newaxis]
+
+    clustered_faces = cluster_index[faces]
+    not_degenerated = (clustered_faces[:, 0] != clustered_faces[:, 1]) & \
+                      (clustered_faces[:, 1] != clustered_faces[:, 2]) & \
+                      (clustered_faces[:, 0] != clustered_faces[:, 2])
+    return clustered_vertices, unique_triangles(clustered_faces[not_degenerated])
+
+
+def load_mesh_for_import(filename: str, scale: tuple, reduction: float = 0.0, max_faces: int = 0) -> tuple:
+    """ Reads a mesh file, scales it from meters to the FreeCAD millimeters and optionally simplifies it,
+    removing a fraction (reduction) of its vertices or building a light version with up to max_faces triangles.
+    Meant to run in worker processes, as it is fully independent from FreeCAD. """
+    if max_faces:
+        vertices, faces, _ = build_lod_mesh_arrays(filename, scale, max_faces)
+        return vertices, faces
+    vertices, faces = read_mesh_arrays(filename)
+    vertices = vertices * (np.asarray(scale, dtype=np.float64) * 1000)
+    if reduction:
+        vertices, faces = decimate_mesh_arrays(vertices, faces, reduction)
+    return vertices, faces
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Kinematics of the movements assigned to mk numbers.
+
+Evaluates the movement chains that MotionRenderer writes for each mk over
+a whole time vector at once with NumPy, so a motion can be checked in
+milliseconds instead of running GenCase and the solver. The pose of a body
+at each instant is a rigid transformation, a rotation matrix and a
+translation in m, applied to its initial geometry. Motions of a chain run
+one after another and the movements of an mk are applied in order.
+Wave generators are not evaluated here; they are reported as skipped. """
+
+from time import perf_counter
+
+import numpy as np
+
+from mod.constants import DIVIDER, MKFLUID_LIMIT, MOTION_PREVIEW_POINTS_PER_OBJECT
+from mod.enums import FreeCADObjectType, MotionType, ObjectType, ValidationSeverity
+from mod.tools.case_validation_tools import ValidationIssue, get_domain_limits, get_particle_limits, locate_case_file
+from mod.tools.data_file_tools import load_data_columns
+from mod.tools.freecad_tools import get_fc_object
+from mod.tools.outparts_tools import get_object_bounds
+from mod.tools.point_set_tools import decimate_points
+from mod.tools.stdout_tools import debug
+
+FILE_MOTION_TYPES = (MotionType.FILE_GENERATOR, MotionType.FILE_ROTATIONAL_GENERATOR,
+                     MotionType.FILE_ROTATE_ADV_GENERATOR, MotionType.FILE_PATH_GENERATOR)
+TRANSFORM_POINTS_CHUNK = 1000000  # Transformed points held in memory at once when computing bounds
+
+
+def identity_transforms(count: int) -> tuple:
+    """ Returns count transformations that leave the bodies where they are, as (rotations, translations). """
+    return np.tile(np.eye(3), (count, 1, 1)), np.zeros((count, 3))
+
+
+def translation_transforms(translations: np.ndarray) -> tuple:
+    """ Returns pure translations, one per row of a (T, 3) array. """
+    return np.tile(np.eye(3), (len(translations), 1, 1)), translations
+
+
+def compose_transforms(first: tuple, second: tuple) -> tuple:
+    """ Returns the transformations that apply first and then second, instant by instant. """
+    first_rotations, first_translations = first
+    second_rotations, second_translations = second
+    return np.matmul(second_rotations, first_rotations), \
+        np.einsum("tij,tj->ti", second_rotations, first_translations) + second_translations
+
+
+def axis_rotation_matrices(axis1: list, axis2: list, angles: np.ndarray) -> np.ndarray:
+    """ Returns the rotation matrices of the given angles, in radians, around the axis from axis1 to axis2.
+    Raises ValueError if both points are the same. """
+    axis = np.asarray(axis2, dtype=float) - np.asarray(axis1, dtype=float)
+    length = np.linalg.norm(axis)
+    if not length:
+        raise ValueError("The rotation axis from {} to {} has no length".format(list(axis1), list(axis2)))
+    axis_x, axis_y, axis_z = axis / length
+    cross = np.array([[0.0, -axis_z, axis_y], [axis_z, 0.0, -axis_x], [-axis_y, axis_x, 0.0]])
+    sines = np.sin(angles)[:, np.newaxis, np.newaxis]
+    cosines = np.cos(angles)[:, np.newaxis, np.newaxis]
+    return np.eye(3) + sines * cross + (1 - cosines) * np.matmul(cross, cross)
+
+
+def rotation_transforms(rotations: np.ndarray, center) -> tuple:
+    """ Returns the transformations that rotate the bodies around a center. """
+    center = np.asarray(center, dtype=float)
+    return rotations, center - np.einsum("tij,j->ti", rotations, center)
+
+
+def circular_transforms(reference: list, axis1: list, axis2: list, angles: np.ndarray) -> tuple:
+    """ Returns the transformations that move the bodies along the circle described by a reference point
+    rotating around an axis. The bodies keep their orientation. """
+    rotations, translations = rotation_transforms(axis_rotation_matrices(axis1, axis2, angles), axis1)
+    reference = np.asarray(reference, dtype=float)
+    return translation_transforms(np.einsum("tij,j->ti", rotations, reference) + translations - reference)
+
+
+def sinusoidal_offsets(tau: np.ndarray, freq, ampl, phase) -> np.ndarray:
+    """ Returns the offsets of a sinusoidal motion from its starting value. The phase is in degrees. """
+    phase = np.radians(phase)
+    return ampl * (np.sin(2 * np.pi * np.multiply.outer(tau, freq) + phase) - np.sin(phase))
+
+
+def evaluate_motion(motion: dict, tau: np.ndarray) -> tuple:
+    """ Returns the transformations of a single motion after tau seconds from its start. """
+    motion_type = motion["type"]
+    if motion_type == MotionType.RECTILINEAR:
+        return translation_transforms(np.outer(tau, motion["velocity"]))
+    if motion_type == MotionType.ACCELERATED_RECTILINEAR:
+        return translation_transforms(np.outer(tau, motion["velocity"]) + 0.5 * np.outer(tau ** 2, motion["acceleration"]))
+    if motion_type == MotionType.SINUSOIDAL_RECTILINEAR:
+        return translation_transforms(sinusoidal_offsets(tau, np.asarray(motion["freq"], dtype=float),
+                                                         np.asarray(motion["ampl"], dtype=float),
+                                                         np.asarray(motion["phase"], dtype=float)))
+    if motion_type in (MotionType.ROTATIONAL, MotionType.ACCELERATED_ROTATIONAL, MotionType.CIRCULAR):
+        angles = np.radians(motion["ang_vel"] * tau + 0.5 * motion.get("ang_acc", 0) * tau ** 2)
+    elif motion_type in (MotionType.SINUSOIDAL_ROTATIONAL, MotionType.SINUSOIDAL_CIRCULAR):
+        angles = np.radians(sinusoidal_offsets(tau, motion["freq"], motion["ampl"], motion["phase"]))
+    else:
+        # Waits and motions GenCase receives as <mvnull>
+        return identity_transforms(len(tau))
+    if motion_type in (MotionType.CIRCULAR, MotionType.SINUSOIDAL_CIRCULAR):
+        return circular_transforms(motion["reference"], motion["axis1"], motion["axis2"], angles)
+    return rotation_transforms(axis_rotation_matrices(motion["axis1"], motion["axis2"], angles), motion["axis1"])
+
+
+def evaluate_motion_chain(motion_list: list, loop: bool, times: np.ndarray) -> tuple:
+    """ Returns the transformations of a chain of motions run one after another, repeated if it loops. """
+    durations = [float(motion["duration"]) for motion in motion_list]
+    total_duration = sum(durations)
+    cycles = np.zeros(len(times), dtype=np.int64)
+    if loop and total_duration > 0:
+        cycles = np.floor(times / total_duration).astype(np.int64)
+    local_times = times - cycles * total_duration
+
+    transforms = identity_transforms(len(times))
+    start = 0.0
+    for motion, duration in zip(motion_list, durations):
+        # Motions not started yet stay at tau 0 and finished ones at their whole duration
+        tau = np.clip(local_times - start, 0.0, duration)
+        transforms = compose_transforms(transforms, evaluate_motion(motion, tau))
+        start += duration
+
+    if cycles.any():
+        cycle = evaluate_motion_chain(motion_list, False, np.array([total_duration]))
+        powers = [identity_transforms(1)]
+        for _ in range(cycles.max()):
+            powers.append(compose_transforms(powers[-1], cycle))
+        power_rotations = np.concatenate([power[0] for power in powers])
+        power_translations = np.concatenate([power[1] for power in powers])
+        transforms = compose_transforms((power_rotations[cycles], power_translations[cycles]), transforms)
+    return transforms
+
+
+def interpolate_columns(times: np.ndarray, file_times: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """ Returns the columns of values interpolated at the given times, relative to their first row. """
+    return np.column_stack([np.interp(times, file_times, column) - column[0] for column in values.T])
+
+
+def euler_rotation_matrices(angles: np.ndarray, axes: str, intrinsic: bool) -> np.ndarray:
+    """ Returns the rotation matrices of (T, 3) angles in radians applied around the given sequence of axes. """
+    matrices = None
+    for angle, axis in zip(angles.T, axes.upper()):
+        axis_point = [1.0 if axis == name else 0.0 for name in "XYZ"]
+        rotations = axis_rotation_matrices([0.0, 0.0, 0.0], axis_point, angle)
+        if matrices is None:
+            matrices = rotations
+        elif intrinsic:
+            matrices = np.matmul(matrices, rotations)
+        else:
+            matrices = np.matmul(rotations, matrices)
+    return matrices
+
+
+def evaluate_file_motion(generator: dict, times: np.ndarray, file_path: str) -> tuple:
+    """ Returns the transformations of a motion read from a file. Values are taken relative to the first row,
+    so the body starts where it was placed, and held after the end of the file or the motion duration. """
+    if generator["duration"] > 0:
+        times = np.minimum(times, generator["duration"])
+    to_radians = np.radians if generator.get("anglesunits", "degrees") == "degrees" else np.asarray
+    generator_type = generator["type"]
+
+    if generator_type == MotionType.FILE_GENERATOR:
+        data = load_data_columns(file_path, [generator["fieldtime"], generator["fieldx"], generator["fieldy"], generator["fieldz"]])
+        return translation_transforms(interpolate_columns(times, data[:, 0], data[:, 1:]))
+
+    if generator_type == MotionType.FILE_ROTATIONAL_GENERATOR:
+        data = load_data_columns(file_path, [0, 1])
+        angles = to_radians(interpolate_columns(times, data[:, 0], data[:, 1:])[:, 0])
+        return rotation_transforms(axis_rotation_matrices(generator["axisp1"], generator["axisp2"], angles), generator["axisp1"])
+
+    angle_fields = [generator["fieldang1"], generator["fieldang2"], generator["fieldang3"]]
+    position_fields = [generator["fieldx"], generator["fieldy"], generator["fieldz"]] \
+        if generator_type == MotionType.FILE_PATH_GENERATOR else []
+    data = load_data_columns(file_path, [generator["fieldtime"]] + position_fields + angle_fields)
+    angles = to_radians(np.column_stack([np.interp(times, data[:, 0], column) for column in data[:, -3:].T]))
+    initial_rotation = euler_rotation_matrices(to_radians(data[:1, -3:]), generator["axes"], generator["intrinsic"])[0]
+    rotations = np.matmul(euler_rotation_matrices(angles, generator["axes"], generator["intrinsic"]), initial_rotation.T)
+    transforms = rotation_transforms(rotations, generator["center"])
+    if not position_fields:
+        return transforms
+    displacements = translation_transforms(interpolate_columns(times, data[:, 0], data[:, 1:4]))
+    if generator["movecenter"]:
+        return compose_transforms(transforms, displacements)
+    return compose_transforms(displacements, transforms)
+
+
+def evaluate_movements(case, movements: list, times: np.ndarray) -> tuple:
+    """ Returns the transformations of the movements of an mk, as dictionaries like the ones MotionRenderer receives,
+    and the names of the movements that could not be evaluated, as (transforms, skipped).
+    Raises ValueError or OSError if a motion is not valid or its file can't be read. """
+    transforms = identity_transforms(len(times))
+    skipped = list()
+    for movement in movements:
+        if "generator" not in movement:
+            transforms = compose_transforms(transforms, evaluate_motion_chain(movement["motion_list"], movement["loop"], times))
+            continue
+        generator = movement["generator"]
+        if not generator or generator["type"] not in FILE_MOTION_TYPES:
+            skipped.append("{} ({})".format(movement["name"], generator["type"] if generator else movement["type"]))
+            continue
+        file_path = locate_case_file(case, generator["filename"])
+        if file_path is None:
+            raise OSError("Motion file not found: '{}'".format(generator["filename"]))
+        transforms = compose_transforms(transforms, evaluate_file_motion(generator, times, file_path))
+    return transforms, skipped
+
+
+def evaluate_case_motions(case, mk_movements: dict, times: np.ndarray) -> tuple:
+    """ Returns the transformations of each real mk with movements, in a dictionary, and a list of skipped movements.
+    mk_movements maps real mks to their movements as dictionaries. """
+    start_time = perf_counter()
+    mk_transforms = dict()
+    skipped = list()
+    for real_mk, movements in mk_movements.items():
+        if not movements:
+            continue
+        transforms, mk_skipped = evaluate_movements(case, movements, times)
+        mk_transforms[real_mk] = transforms
+        skipped += ["mk {}: {}".format(real_mk - MKFLUID_LIMIT, name) for name in mk_skipped]
+    debug("Motion of {} mk evaluated at {} instants in {:.3f} s".format(len(mk_transforms), len(times), perf_counter() - start_time))
+    return mk_transforms, skipped
+
+
+def get_object_points(obj) -> np.ndarray:
+    """ Returns points on the surface of a simulation object, in m, to follow it as it moves. """
+    fc_object = get_fc_object(obj.name)
+    if fc_object.TypeId == FreeCADObjectType.CUSTOM_MESH:
+        points = np.array([(point.x, point.y, point.z) for point in fc_object.Mesh.Points])
+    else:
+        shape = fc_object.Shape
+        vertexes = [(vertex.X, vertex.Y, vertex.Z) for vertex in shape.Vertexes]
+        tessellation = [(point.x, point.y, point.z) for point in shape.tessellate(max(shape.BoundBox.DiagonalLength / 50, 0.1))[0]]
+        points = np.array(vertexes + tessellation)
+    if not len(points):
+        raise AttributeError("{} has no geometry".format(obj.name))
+    return decimate_points(points, MOTION_PREVIEW_POINTS_PER_OBJECT) / DIVIDER
+
+
+def get_transformed_bounds(transforms: tuple, points: np.ndarray) -> tuple:
+    """ Returns the (min, max) corners of some points moved by each transformation, as two (T, 3) arrays. """
+    rotations, translations = transforms
+    chunk = max(TRANSFORM_POINTS_CHUNK // max(len(points), 1), 1)
+    minimums, maximums = list(), list()
+    for start in range(0, len(rotations), chunk):
+        moved = np.matmul(points, rotations[start:start + chunk].transpose(0, 2, 1)) + translations[start:start + chunk, np.newaxis, :]
+        minimums.append(moved.min(axis=1))
+        maximums.append(moved.max(axis=1))
+    return np.concatenate(minimums), np.concatenate(maximums)
+
+
+def get_overlaps(bounds: tuple, other_bounds: tuple, mode3d: bool) -> np.ndarray:
+    """ Returns for each instant whether two boxes overlap. Bounds can be (T, 3) arrays or fixed (3,) corners. """
+    axes = [0, 1, 2] if mode3d else [0, 2]
+    return np.all((bounds[0][..., axes] <= other_bounds[1][..., axes]) & (other_bounds[0][..., axes] <= bounds[1][..., axes]), axis=-1)
+
+
+def check_case_motions(case, mk_transforms: dict, times: np.ndarray, mode3d: bool) -> tuple:
+    """ Checks the evaluated motions against the domain and the other boundaries.
+    Returns the ValidationIssue found and the bounds of each moving mk, as (issues, mk_bounds).
+    Overlaps are checked with bounding boxes and only reported when they were not there at the start. """
+    issues = list()
+    mk_bounds = dict()
+    for real_mk, transforms in mk_transforms.items():
+        try:
+            points = np.concatenate([get_object_points(obj) for obj in case.objects
+                                     if obj.type != ObjectType.SPECIAL and obj.real_mk() == real_mk])
+        except (AttributeError, ValueError):
+            issues.append(ValidationIssue(ValidationSeverity.WARNING,
+                                          "The geometry of mk {} could not be read.".format(real_mk - MKFLUID_LIMIT)))
+            continue
+        mk_bounds[real_mk] = get_transformed_bounds(transforms, points)
+
+    particle_limits = get_particle_limits(case, mode3d)
+    if particle_limits is not None:
+        domain_min, domain_max = (np.array(limit) for limit in get_domain_limits(case.domain, *particle_limits))
+        axes = [0, 1, 2] if mode3d else [0, 2]
+        for real_mk, (minimums, maximums) in mk_bounds.items():
+            outside = np.any((minimums[:, axes] < domain_min[axes]) | (maximums[:, axes] > domain_max[axes]), axis=1)
+            if outside.any():
+                instant = np.argmax(outside)
+                distance = max(np.max(domain_min[axes] - minimums[instant, axes]), np.max(maximums[instant, axes] - domain_max[axes]))
+                issues.append(ValidationIssue(ValidationSeverity.ERROR,
+                                              "mk {} leaves the domain at t={:g} s by {:.4g} m.".format(
+                                                  real_mk - MKFLUID_LIMIT, times[instant], distance),
+                                              "Change the motion or enlarge the domain in 'Execution parameters'."))
+
+    static_bounds = list()
+    for obj in case.get_all_bound_objects():
+        if obj.real_mk() in mk_transforms:
+            continue
+        try:
+            static_bounds.append((obj.name, get_object_bounds(obj, mode3d)))
+        except (AttributeError, StopIteration):
+            continue
+    moving = list(mk_bounds.items())
+    for index, (real_mk, bounds) in enumerate(moving):
+        others = [(name, other) for name, other in static_bounds]
+        others += [("mk {}".format(other_mk - MKFLUID_LIMIT), other) for other_mk, other in moving[index + 1:]]
+        for name, other in others:
+            overlaps = get_overlaps(bounds, other, mode3d)
+            new_overlaps = overlaps & ~overlaps[0]
+            if new_overlaps.any():
+                issues.append(ValidationIssue(ValidationSeverity.WARNING,
+                                              "mk {} reaches {} at t={:g} s.".format(real_mk - MKFLUID_LIMIT, name,
+                                                                                     times[np.argmax(new_overlaps)]),
+                                              "Their bounding boxes overlap; check that the bodies don't collide."))
+    return issues, mk_bounds
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Evaluation of the output parts filters (OutputParts) on particle positions.
+
+The filter chain is evaluated as NumPy boolean masks, with the same
+semantics DualSPHysics uses to select the particles stored in each output
+part: an initial selection (all or none), and each filter adding, removing
+or confirming the particles it selects. Groups are evaluated recursively
+with their own initial selection.
+
+Before running GenCase the real particles are not known, so they are
+approximated by positions sampled inside the bounding box of each object,
+weighted by its estimated particle count. Once GenCase has been executed,
+the initial particles are read from the VTK file it writes with all of
+them, so the filters can be checked on the real particles. """
+
+from os import path
+
+import numpy as np
+
+from mod.constants import DIVIDER, MKFLUID_LIMIT, MKFLUID_OFFSET, OUTPARTS_SAMPLES_PER_OBJECT, PART_BYTES_PER_PARTICLE
+from mod.enums import FilterOperations, FilterType, FreeCADObjectType, ObjectType
+from mod.tools.freecad_tools import get_fc_object
+from mod.tools.mesh_tools import read_vtk_legacy_points
+
+# Particle types, as stored in ParticleSet.types
+PARTICLE_FIXED = 0
+PARTICLE_MOVING = 1
+PARTICLE_FLOATING = 2
+PARTICLE_FLUID = 3
+
+GENCASE_PARTICLES_FILE_SUFFIX = "_All.vtk"  # File written by GenCase with all the initial particles
+
+# Particles read from GenCase files by path, with the modification time and size of the file when read
+_gencase_particles: dict = dict()
+
+
+class ParticleSet():
+    """ A set of particles (or samples of them) to evaluate the output filters on.
+    Positions are in meters. Each particle has a type, its real mk, its mkbound or mkfluid (-1 if it
+    doesn't apply) and a weight, the number of real particles it represents. """
+
+    def __init__(self, positions=None, types=None, mk=None, mkbound=None, mkfluid=None, weights=None):
+        self.positions: np.ndarray = np.zeros((0, 3)) if positions is None else np.asarray(positions, dtype=np.float64)
+        count = len(self.positions)
+        self.types: np.ndarray = np.zeros(count, dtype=np.int8) if types is None else np.asarray(types, dtype=np.int8)
+        self.mk: np.ndarray = np.full(count, -1, dtype=np.int32) if mk is None else np.asarray(mk, dtype=np.int32)
+        self.mkbound: np.ndarray = np.full(count, -1, dtype=np.int32) if mkbound is None else np.asarray(mkbound, dtype=np.int32)
+        self.mkfluid: np.ndarray = np.full(count, -1, dtype=np.int32) if mkfluid is None else np.asarray(mkfluid, dtype=np.int32)
+        self.weights: np.ndarray = np.ones(count) if weights is None else np.asarray(weights, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def count(self, mask=None) -> float:
+        """ Returns the number of real particles represented by the particles in the mask (all if not given). """
+        return float(self.weights.sum() if mask is None else self.weights[mask].sum())
+
+    @classmethod
+    def concatenate(cls, particle_sets: list) -> "ParticleSet":
+        """ Returns a single set with the particles of all the given sets. """
+        if not particle_sets:
+            return cls()
+        return cls(positions=np.concatenate([item.positions for item in particle_sets]),
+                   types=np.concatenate([item.types for item in particle_sets]),
+                   mk=np.concatenate([item.mk for item in particle_sets]),
+                   mkbound=np.concatenate([item.mkbound for item in particle_sets]),
+                   mkfluid=np.concatenate([item.mkfluid for item in particle_sets]),
+                   weights=np.concatenate([item.weights for item in particle_sets]))
+
+
+def get_object_particle_type(case, obj) -> int:
+    """ Returns the particle type of a simulation object (PARTICLE_FIXED, PARTICLE_MOVING...). """
+    if obj.type == ObjectType.FLUID:
+        return PARTICLE_FLUID
+    mk_properties = case.mkbasedproperties.get(obj.real_mk())
+    if mk_properties and mk_properties.float_property:
+        return PARTICLE_FLOATING
+    if mk_properties and mk_properties.has_movements():
+        return PARTICLE_MOVING
+    return PARTICLE_FIXED
+
+
+def get_object_bounds(obj, mode3d: bool) -> tuple:
+    """ Returns the (min, max) corners of the region filled by an object, in meters.
+    In 2D cases both corners have the Y coordinate of the object center. """
+    fc_object = get_fc_object(obj.name)
+    if fc_object.TypeId == FreeCADObjectType.FOLDER and "fillbox" in fc_object.Name.lower():
+        fc_object = next(element for element in fc_object.OutList if "FillLimit" in element.Name)
+    geometry = fc_object.Mesh if fc_object.TypeId == FreeCADObjectType.CUSTOM_MESH else fc_object.Shape
+    bound_box = geometry.BoundBox
+    minimum = np.array([bound_box.XMin, bound_box.YMin, bound_box.ZMin]) / DIVIDER
+    maximum = np.array([bound_box.XMax, bound_box.YMax, bound_box.ZMax]) / DIVIDER
+    if not mode3d:
+        minimum[1] = maximum[1] = (minimum[1] + maximum[1]) / 2
+    return minimum, maximum
+
+
+def sample_object_particles(case, obj, particle_count: int, mode3d: bool, samples: int = OUTPARTS_SAMPLES_PER_OBJECT,
+                            rng=None) -> ParticleSet:
+    """ Returns positions sampled uniformly in the bounds of an object, representing its particle_count particles.
+    Raises AttributeError or StopIteration if the object geometry can't be read. """
+    rng = rng or np.random.default_rng(0)
+    minimum, maximum = get_object_bounds(obj, mode3d)
+    sample_count = int(max(min(samples, particle_count), 1))
+    positions = minimum + rng.random((sample_count, 3)) * (maximum - minimum)
+    particle_type = get_object_particle_type(case, obj)
+    return ParticleSet(positions=positions,
+                       types=np.full(sample_count, particle_type),
+                       mk=np.full(sample_count, obj.real_mk()),
+                       mkbound=np.full(sample_count, obj.obj_mk if obj.type == ObjectType.BOUND else -1),
+                       mkfluid=np.full(sample_count, obj.obj_mk if obj.type == ObjectType.FLUID else -1),
+                       weights=np.full(sample_count, particle_count / sample_count))
+
+
+def sample_case_particles(case, object_counts: dict, mode3d: bool, samples: int = OUTPARTS_SAMPLES_PER_OBJECT) -> ParticleSet:
+    """ Returns a sampled approximation of the particles of a case, from the estimated count of each object
+    ({object name: particle count}). Objects whose geometry can't be read are not sampled. """
+    rng = np.random.default_rng(0)
+    particle_sets = list()
+    for obj in case.objects:
+        particle_count = object_counts.get(obj.name, 0)
+        if particle_count <= 0:
+            continue
+        try:
+            particle_sets.append(sample_object_particles(case, obj, particle_count, mode3d, samples, rng))
+        except (AttributeError, StopIteration):
+            continue
+    return ParticleSet.concatenate(particle_sets)
+
+
+def get_mk_particle_types(case, mk: np.ndarray) -> tuple:
+    """ Returns the type, mkbound and mkfluid arrays of some particles from their real mk. """
+    mk = np.asarray(mk, dtype=np.int32)
+    is_fluid = mk < MKFLUID_LIMIT
+    types = np.where(is_fluid, PARTICLE_FLUID, PARTICLE_FIXED).astype(np.int8)
+    for real_mk, mk_properties in case.mkbasedproperties.items():
+        if real_mk < MKFLUID_LIMIT:
+            continue
+        if mk_properties.float_property:
+            types[mk == real_mk] = PARTICLE_FLOATING
+        elif mk_properties.has_movements():
+            types[mk == real_mk] = PARTICLE_MOVING
+    return types, np.where(is_fluid, -1, mk - MKFLUID_LIMIT), np.where(is_fluid, mk - MKFLUID_OFFSET, -1)
+
+
+def get_gencase_particles_path(case) -> str:
+    """ Returns the path of the file written by GenCase with all the initial particles of a case. """
+    return "{}{}{}".format(case.get_out_folder_path(), case.name, GENCASE_PARTICLES_FILE_SUFFIX)
+
+
+def load_gencase_particles(case) -> ParticleSet:
+    """ Returns the initial particles of a case, read from the files written by GenCase. The particles of a file
+    are kept until it changes. Raises OSError if GenCase was not executed and ValueError if the file can't be read. """
+    file_path = get_gencase_particles_path(case)
+    file_stat = (path.getmtime(file_path), path.getsize(file_path))
+    cached = _gencase_particles.get(file_path)
+    if cached is not None and cached[0] == file_stat:
+        positions, mk = cached[1]
+    else:
+        positions, point_data = read_vtk_legacy_points(file_path)
+        mk = next((values for name, values in point_data.items() if name.lower() == "mk"), None)
+        if mk is None or len(mk) != len(positions):
+            raise ValueError("No mk of the particles found in {}".format(file_path))
+        mk = np.asarray(mk, dtype=np.int32)
+        _gencase_particles.clear()
+        _gencase_particles[file_path] = (file_stat, (positions, mk))
+    types, mkbound, mkfluid = get_mk_particle_types(case, mk)
+    return ParticleSet(positions=positions, types=types, mk=mk, mkbound=mkbound, mkfluid=mkfluid)
+
+
+def get_mk_mask(filt, particles: ParticleSet) -> np.ndarray:
+    """ Returns the particles selected by the mk value or range of a FilterMK. """
+    if filt.obj_type is None:
+        mk_values = particles.mk
+    elif filt.obj_type == ObjectType.FLUID:
+        mk_values = particles.mkfluid
+    else:
+        mk_values = particles.mkbound
+    if filt.is_range:
+        return (mk_values >= int(filt.range_min)) & (mk_values <= int(filt.range_max)) & (mk_values >= 0)
+    return mk_values == int(filt.mk_value)
+
+
+def get_type_mask(filt, particles: ParticleSet) -> np.ndarray:
+    """ Returns the particles selected by the types of a TypeFilter. """
+    selected_types = set()
+    if filt.bound:
+        selected_types.update((PARTICLE_FIXED, PARTICLE_MOVING, PARTICLE_FLOATING))
+    if filt.fixed:
+        selected_types.add(PARTICLE_FIXED)
+    if filt.moving:
+        selected_types.add(PARTICLE_MOVING)
+    if filt.floating:
+        selected_types.add(PARTICLE_FLOATING)
+    if filt.fluid:
+        selected_types.add(PARTICLE_FLUID)
+    return np.isin(particles.types, list(selected_types))
+
+
+def get_cylinder_mask(filt, positions: np.ndarray) -> np.ndarray:
+    """ Returns the positions inside the finite cylinder of a FilterCylinder. """
+    point1 = np.asarray(filt.point1, dtype=np.float64)
+    axis = np.asarray(filt.point2, dtype=np.float64) - point1
+    axis_length = np.linalg.norm(axis)
+    if axis_length == 0:
+        return np.zeros(len(positions), dtype=bool)
+    axis /= axis_length
+    relative = positions - point1
+    along = relative @ axis
+    radial = relative - np.outer(along, axis)
+    return (along >= 0) & (along <= axis_length) & (np.einsum("ij,ij->i", radial, radial) <= filt.radius ** 2)
+
+
+def get_filter_selection(filt, particles: ParticleSet) -> np.ndarray:
+    """ Returns the particles a single filter selects, before applying its inverse flag and operation. """
+    positions = particles.positions
+    if filt.filt_type == FilterType.POS:
+        selection = np.ones(len(particles), dtype=bool)
+        for axis in range(3):
+            if filt.enable_pos_min[axis]:
+                selection &= positions[:, axis] >= filt.pos_min[axis]
+            if filt.enable_pos_max[axis]:
+                selection &= positions[:, axis] <= filt.pos_max[axis]
+        return selection
+    if filt.filt_type == FilterType.PLANE:
+        vector = np.asarray(filt.vector, dtype=np.float64)
+        vector_length = np.linalg.norm(vector)
+        if vector_length == 0:
+            return np.zeros(len(particles), dtype=bool)
+        distance = (positions - np.asarray(filt.point, dtype=np.float64)) @ (vector / vector_length)
+        selection = distance >= 0
+        if filt.distance_enabled:
+            selection &= distance <= filt.distance
+        return selection
+    if filt.filt_type == FilterType.SPHERE:
+        relative = positions - np.asarray(filt.center, dtype=np.float64)
+        return np.einsum("ij,ij->i", relative, relative) <= filt.radius ** 2
+    if filt.filt_type == FilterType.CYLINDER:
+        return get_cylinder_mask(filt, positions)
+    if filt.filt_type == FilterType.TYPE:
+        return get_type_mask(filt, particles)
+    if filt.filt_type == FilterType.MK:
+        return get_mk_mask(filt, particles)
+    if filt.filt_type == FilterType.GROUP:
+        return apply_filters(filt.filts, filt.preselection_all, particles)
+    return np.zeros(len(particles), dtype=bool)
+
+
+def apply_filters(filts: dict, preselection_all: bool, particles: ParticleSet) -> np.ndarray:
+    """ Returns the particles kept after applying a list of filters, in order, to an initial selection. """
+    selection = np.full(len(particles), bool(preselection_all))
+    for filt in filts.values():
+        filter_selection = get_filter_selection(filt, particles)
+        if filt.inverse:
+            filter_selection = ~filter_selection
+        if filt.operation == FilterOperations.DEL:
+            selection &= ~filter_selection
+        elif filt.operation == FilterOperations.CONFIRM:
+            selection &= filter_selection
+        else:
+            selection |= filter_selection
+    return selection
+
+
+def get_outparts_mask(outparts, particles: ParticleSet) -> np.ndarray:
+    """ Returns the particles stored in the filtered output parts. All of them if the filters are not active. """
+    if not outparts.active:
+        return np.ones(len(particles), dtype=bool)
+    return apply_filters(outparts.filts, outparts.preselection_all, particles)
+
+
+class OutpartsPreview():
+    """ Particles kept by the output filters in a set of particles, and the resulting size of each output part.
+    Fixed boundary particles are only stored in the first part, so they are not counted in the part size. """
+
+    def __init__(self, particles: ParticleSet, kept: np.ndarray):
+        self.particles: ParticleSet = particles
+        self.kept: np.ndarray = kept
+        self.stored: np.ndarray = particles.types != PARTICLE_FIXED
+
+    @property
+    def stored_count(self) -> float:
+        """ Particles stored in each part without filters. """
+        return self.particles.count(self.stored)
+
+    @property
+    def kept_count(self) -> float:
+        """ Particles stored in each part with the filters applied. """
+        return self.particles.count(self.stored & self.kept)
+
+    @property
+    def kept_fraction(self) -> float:
+        """ Fraction of the stored particles kept by the filters. """
+        return self.kept_count / self.stored_count if self.stored_count else 1.0
+
+    @property
+    def part_size(self) -> int:
+        """ Size of each part with the filters applied, in bytes. """
+        return int(self.kept_count * PART_BYTES_PER_PARTICLE)
+
+    @property
+    def unfiltered_part_size(self) -> int:
+        """ Size of each part without filters, in bytes. """
+        return int(self.stored_count * PART_BYTES_PER_PARTICLE)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Approximate particle count and memory estimation before running GenCase.
+
+Counts are computed from the volume, surface and edge length of each object
+at the current dp, following how GenCase draws them: solids are filled
+(volume / dp^3), faces are covered with one particle per dp^2 and layer, and
+wires with one particle per dp. In 2D cases every object is reduced to its
+section on the XZ plane. The result is approximate: GenCase may place a few
+more or less particles on the object limits, and fillboxes are counted as
+if their whole limits were filled.
+"""
+
+import math
+
+from mod.appmode import AppMode
+from mod.constants import DIVIDER, SOLVER_BYTES_PER_PARTICLE, PART_BYTES_PER_PARTICLE
+from mod.enums import FreeCADObjectType, ObjectFillMode, ObjectType
+from mod.tools.freecad_tools import get_fc_object
+
+# Face areas of a box, as (length, width, height) factors, for each face that can be drawn.
+BOX_FACE_DIMENSIONS = {
+    "front": (0, 2), "back": (0, 2),
+    "left": (1, 2), "right": (1, 2),
+    "top": (0, 1), "bottom": (0, 1)
+}
+
+
+class ParticleEstimate():
+    """ Approximate number of particles of a case and the resources they need. """
+
+    def __init__(self):
+        self.fluid: int = 0
+        self.fixed_bound: int = 0
+        self.moving_bound: int = 0
+        self.skipped_objects: list = list()
+        self.object_particles: dict = dict()  # {object name: particle count}
+
+    @property
+    def bound(self) -> int:
+        """ Total number of boundary particles. """
+        return self.fixed_bound + self.moving_bound
+
+    @property
+    def total(self) -> int:
+        """ Total number of particles. """
+        return self.fluid + self.bound
+
+    def solver_memory(self) -> int:
+        """ Approximate memory needed by the solver, in bytes. """
+        return self.total * SOLVER_BYTES_PER_PARTICLE
+
+    def part_size(self) -> int:
+        """ Approximate size of each output part on disk, in bytes.
+        Fixed boundary particles are only stored in the first part. """
+        return (self.fluid + self.moving_bound) * PART_BYTES_PER_PARTICLE
+
+
+def format_particle_count(count: int) -> str:
+    """ Returns a short human readable particle count (1.2 M, 350 k...). """
+    if count >= 1e6:
+        return "{:.1f} M".format(count / 1e6)
+    if count >= 1e3:
+        return "{:.0f} k".format(count / 1e3)
+    return str(count)
+
+
+def format_size(size: int) -> str:
+    """ Returns a short human readable size in bytes (1.2 GB, 350 MB...). """
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return "{:.0f} {}".format(size, unit) if unit == "B" else "{:.1f} {}".format(size, unit)
+        size /= 1024
+    return "{:.1f} TB".format(size)
+
+
+def count_layers(layers: str) -> int:
+    """ Returns the number of layers of a GenCase layers definition ("0,1,2", "-1:1"...). Defaults to 1. """
+    count = 0
+    for item in str(layers or "").replace(" ", "").split(","):
+        if not item:
+            continue
+        try:
+            if ":" in item:
+                first, last = item.split(":")[:2]
+                count += abs(int(float(last)) - int(float(first))) + 1
+            else:
+                float(item)
+                count += 1
+        except ValueError:
+            continue
+    return max(count, 1)
+
+
+def get_object_layers(obj) -> int:
+    """ Returns the number of layers used to draw the faces of an object. """
+    if obj.faces_configuration and obj.faces_configuration.layers:
+        return count_layers(obj.faces_configuration.layers)
+    return 1
+
+
+def get_fc_geometry(fc_object):
+    """ Returns the object that holds the geometry of a FreeCAD object (its Shape or its Mesh). """
+    if fc_object.TypeId == FreeCADObjectType.CUSTOM_MESH:
+        return fc_object.Mesh
+    return fc_object.Shape
+
+
+def get_object_measures(fc_object, mode3d: bool) -> tuple:
+    """ Returns the (volume, surface) of an object in m3 and m2.
+    In 2D cases returns the (area, perimeter) of its section instead, in m2 and m, assuming it spans its width in Y. """
+    geometry = get_fc_geometry(fc_object)
+    volume = abs(geometry.Volume) / DIVIDER ** 3
+    surface = geometry.Area / DIVIDER ** 2
+    if mode3d:
+        return volume, surface
+    width = geometry.BoundBox.YLength / DIVIDER
+    if width <= 0:
+        return 0.0, 0.0
+    section_area = volume / width
+    # Only the lateral surface is part of the section perimeter, not the front and back faces.
+    return section_area, max(surface - 2 * section_area, 0.0) / width
+
+
+def get_box_faces_surface(fc_object, face_print: str, mode3d: bool) -> float:
+    """ Returns the surface (m2) of the selected faces of a box, or their length (m) in the section of 2D cases. """
+    box_size = [fc_object.Length.Value / DIVIDER, fc_object.Width.Value / DIVIDER, fc_object.Height.Value / DIVIDER]
+    faces = [face.strip() for face in face_print.split("|") if face.strip() in BOX_FACE_DIMENSIONS]
+    if mode3d:
+        return sum(box_size[BOX_FACE_DIMENSIONS[face][0]] * box_size[BOX_FACE_DIMENSIONS[face][1]] for face in faces)
+    # Front and back faces are not part of the section.
+    return sum(box_size[0] if face in ("top", "bottom") else box_size[2] for face in faces if face not in ("front", "back"))
+
+
+def estimate_object_particles(obj, dp: float, mode3d: bool) -> int:
+    """ Returns the approximate number of particles GenCase creates for a simulation object.
+    Raises AttributeError if the object geometry can't be measured. """
+    fc_object = get_fc_object(obj.name)
+    dimensions = 3 if mode3d else 2
+
+    if fc_object.TypeId == FreeCADObjectType.FOLDER and "fillbox" in fc_object.Name.lower():
+        fill_limits = next(element for element in fc_object.OutList if "FillLimit" in element.Name)
+        size = [fill_limits.Length.Value / DIVIDER, fill_limits.Width.Value / DIVIDER, fill_limits.Height.Value / DIVIDER]
+        return int(size[0] * size[2] * (size[1] if mode3d else 1.0) / dp ** dimensions)
+
+    if obj.fillmode == ObjectFillMode.WIRE and fc_object.TypeId != FreeCADObjectType.CUSTOM_MESH:
+        return int(fc_object.Shape.Length / DIVIDER / dp)
+
+    volume, surface = get_object_measures(fc_object, mode3d)
+    layers = get_object_layers(obj)
+    if fc_object.TypeId == FreeCADObjectType.CUSTOM_MESH:
+        if obj.autofill:
+            return int(volume / dp ** dimensions)
+        layers = 1
+        if obj.advdraw_enabled and obj.advdraw_maxdepth_enabled:
+            # Advanced draw mode fills below the surface up to the maximum depth, given in dp units.
+            min_depth = obj.advdraw_mindepth if obj.advdraw_mindepth_enabled else 0.0
+            layers = max(int(math.ceil(obj.advdraw_maxdepth - min_depth)), 1)
+    elif obj.fillmode in (ObjectFillMode.FULL, ObjectFillMode.SOLID):
+        return int(volume / dp ** dimensions)
+    elif obj.fillmode != ObjectFillMode.FACE:
+        return 0
+    elif fc_object.TypeId == FreeCADObjectType.BOX and obj.faces_configuration \
+            and obj.faces_configuration.face_print not in ("", "all"):
+        surface = get_box_faces_surface(fc_object, obj.faces_configuration.face_print, mode3d)
+    return int(surface / dp ** (dimensions - 1) * layers)
+
+
+def estimate_case_particles(case) -> ParticleEstimate:
+    """ Returns an approximate particle count of the case at its current dp, without running GenCase. """
+    estimate = ParticleEstimate()
+    if case.dp <= 0:
+        return estimate
+    for obj in case.objects:
+        if obj.type == ObjectType.SPECIAL:
+            continue
+        try:
+            count = estimate_object_particles(obj, case.dp, AppMode.is_3d())
+        except (AttributeError, StopIteration, ZeroDivisionError):
+            estimate.skipped_objects.append(obj.name)
+            continue
+        estimate.object_particles[obj.name] = count
+        if obj.type == ObjectType.FLUID:
+            estimate.fluid += count
+            continue
+        mk_properties = case.mkbasedproperties.get(obj.real_mk())
+        if mk_properties and (mk_properties.has_movements() or mk_properties.float_property):
+            estimate.moving_bound += count
+        else:
+            estimate.fixed_bound += count
+    return estimate
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Tools to build MeasureTool point sets with NumPy.
+
+A point set is defined as a list of parts (lines, planes, volumes or
+random samples of a mesh surface) stored as dictionaries in the case.
+The points of all the parts are generated as a single (N, 3) array, so
+sets of millions of points are built and written to the MeasureTool
+points file in bulk. The generated points are also kept in a binary .npy
+file next to it, which is reloaded to preview them. """
+
+from os import path
+
+import numpy as np
+
+from mod.tools.mesh_tools import get_triangle_count, iter_triangle_chunks, map_mesh_triangles
+
+POINT_SET_KINDS = ("line", "plane", "volume", "mesh")
+POINTS_WRITE_CHUNK = 100000  # Points formatted at once when writing a points file
+POINT_FORMAT = "%.9g  %.9g  %.9g\n"
+
+
+def create_point_set_part(kind: str) -> dict:
+    """ Returns the definition of a point set part of the given kind with its default values. """
+    part = {"kind": kind, "origin": [0.0, 0.0, 0.0]}
+    if kind == "line":
+        part.update({"end": [1.0, 0.0, 0.0], "count": 100})
+    elif kind == "plane":
+        part.update({"vector1": [1.0, 0.0, 0.0], "vector2": [0.0, 0.0, 1.0], "count1": 100, "count2": 100})
+    elif kind == "volume":
+        part.update({"size": [1.0, 1.0, 1.0], "counts": [10, 10, 10]})
+    elif kind == "mesh":
+        part.update({"mesh_path": "", "count": 10000, "scale": 1.0})
+    return part
+
+
+def describe_point_set_part(part: dict) -> str:
+    """ Returns a short text describing a point set part and its number of points. """
+    if part["kind"] == "mesh":
+        return "Mesh surface: {} ({} points)".format(path.basename(part["mesh_path"]), part["count"])
+    return "{}: {} points from ({:g}, {:g}, {:g})".format(part["kind"].capitalize(), get_point_set_part_count(part),
+                                                          *part["origin"])
+
+
+def get_point_set_part_count(part: dict) -> int:
+    """ Returns the number of points of a point set part without generating them. """
+    if part["kind"] == "plane":
+        return part["count1"] * part["count2"]
+    if part["kind"] == "volume":
+        return int(np.prod(part["counts"]))
+    return part["count"]
+
+
+def linspace_offsets(count: int) -> np.ndarray:
+    """ Returns count evenly spaced values from 0 to 1, both included, or 0 for a single value. """
+    return np.linspace(0.0, 1.0, count) if count > 1 else np.zeros(max(count, 0))
+
+
+def generate_line(origin: list, end: list, count: int) -> np.ndarray:
+    """ Returns count points evenly spaced from origin to end. """
+    origin = np.asarray(origin, dtype=float)
+    return origin + np.outer(linspace_offsets(count), np.asarray(end, dtype=float) - origin)
+
+
+def generate_plane(origin: list, vector1: list, vector2: list, count1: int, count2: int) -> np.ndarray:
+    """ Returns a count1 x count2 grid of points on the parallelogram spanned by two edge vectors from origin. """
+    steps1 = np.outer(linspace_offsets(count1), np.asarray(vector1, dtype=float))
+    steps2 = np.outer(linspace_offsets(count2), np.asarray(vector2, dtype=float))
+    return (np.asarray(origin, dtype=float) + steps2[:, np.newaxis, :] + steps1[np.newaxis, :, :]).reshape((-1, 3))
+
+
+def generate_volume(origin: list, size: list, counts: list) -> np.ndarray:
+    """ Returns a grid of points filling a box from origin with the given size, X varying fastest. """
+    axes = [origin[axis] + size[axis] * linspace_offsets(counts[axis]) for axis in range(3)]
+    z_values, y_values, x_values = np.meshgrid(axes[2], axes[1], axes[0], indexing="ij")
+    return np.column_stack((x_values.ravel(), y_values.ravel(), z_values.ravel()))
+
+
+def sample_mesh_surface(mesh_path: str, count: int, scale: float = 1.0, seed: int = 0) -> np.ndarray:
+    """ Returns count points randomly distributed on the surface of a STL or VTK mesh, with the same density on every
+    triangle. Raises ValueError if the mesh can't be read. """
+    vertices, faces = map_mesh_triangles(mesh_path)
+    if not get_triangle_count(vertices, faces) or count < 1:
+        return np.empty((0, 3))
+    areas = np.concatenate([0.5 * np.linalg.norm(np.cross(chunk[:, 1] - chunk[:, 0], chunk[:, 2] - chunk[:, 0]), axis=1)
+                            for chunk in iter_triangle_chunks(vertices, faces)])
+    if not areas.sum():
+        return np.empty((0, 3))
+    rng = np.random.default_rng(seed)
+    triangle_indices = np.sort(rng.choice(len(areas), size=count, p=areas / areas.sum()))
+    # Uniform barycentric coordinates, folding the samples outside the triangle back into it
+    u_values, v_values = rng.random(count), rng.random(count)
+    outside = u_values + v_values > 1
+    u_values[outside], v_values[outside] = 1 - u_values[outside], 1 - v_values[outside]
+    # Only the sampled triangles are gathered, a chunk at a time
+    sampled_triangles = list()
+    chunk_start = 0
+    position = 0
+    for chunk in iter_triangle_chunks(vertices, faces):
+        chunk_end = chunk_start + len(chunk)
+        stop = np.searchsorted(triangle_indices, chunk_end)
+        sampled_triangles.append(chunk[triangle_indices[position:stop] - chunk_start])
+        position, chunk_start = stop, chunk_end
+    triangles = np.concatenate(sampled_triangles)
+    points = triangles[:, 0] + u_values[:, np.newaxis] * (triangles[:, 1] - triangles[:, 0]) \
+        + v_values[:, np.newaxis] * (triangles[:, 2] - triangles[:, 0])
+    return points * scale
+
+
+def generate_point_set_part(part: dict) -> np.ndarray:
+    """ Returns the points of a point set part as a (N, 3) array. """
+    if part["kind"] == "line":
+        return generate_line(part["origin"], part["end"], part["count"])
+    if part["kind"] == "plane":
+        return generate_plane(part["origin"], part["vector1"], part["vector2"], part["count1"], part["count2"])
+    if part["kind"] == "volume":
+        return generate_volume(part["origin"], part["size"], part["counts"])
+    return sample_mesh_surface(part["mesh_path"], part["count"], part["scale"]) + np.asarray(part["origin"], dtype=float)
+
+
+def generate_point_set(parts: list) -> np.ndarray:
+    """ Returns the points of all the parts of a point set as a single (N, 3) array. """
+    if not parts:
+        return np.empty((0, 3))
+    return np.concatenate([generate_point_set_part(part) for part in parts])
+
+
+def write_measuretool_points(file_path: str, points) -> None:
+    """ Writes a MeasureTool POINTS file, formatting the points in big chunks instead of one line at a time. """
+    points = np.asarray(points, dtype=float).reshape((-1, 3))
+    with open(file_path, "w", encoding="utf-8", buffering=1024 * 1024) as points_file:
+        points_file.write("POINTS\n")
+        for start in range(0, len(points), POINTS_WRITE_CHUNK):
+            chunk = points[start:start + POINTS_WRITE_CHUNK]
+            points_file.write((POINT_FORMAT * len(chunk)) % tuple(chunk.ravel()))
+
+
+def get_point_cache_path(points_file_path: str) -> str:
+    """ Returns the path of the binary copy of a points file. """
+    return "{}.npy".format(path.splitext(points_file_path)[0])
+
+
+def save_point_set(points_file_path: str, points: np.ndarray) -> None:
+    """ Writes the MeasureTool points file and its binary copy. """
+    write_measuretool_points(points_file_path, points)
+    np.save(get_point_cache_path(points_file_path), np.asarray(points, dtype=float))
+
+
+def load_point_set(points_file_path: str) -> np.ndarray:
+    """ Returns the points stored in the binary copy of a points file, or None if there is none. """
+    cache_path = get_point_cache_path(points_file_path)
+    if not path.isfile(cache_path):
+        return None
+    return np.load(cache_path)
+
+
+def decimate_points(points: np.ndarray, max_points: int) -> np.ndarray:
+    """ Returns at most max_points of the given points, evenly picked, to preview big sets. """
+    if len(points) <= max_points:
+        return points
+    return points[np.linspace(0, len(points) - 1, max_points).astype(np.int64)]
+
+
+def points_inside_box(points, box_min, box_max, mode3d: bool, tolerance: float = 0.0) -> np.ndarray:
+    """ Returns which of the (N, 3) points are inside a box, with a margin relative to the size of its coordinates.
+    The Y axis is ignored in 2D cases. """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    box_min, box_max = np.asarray(box_min, dtype=np.float64), np.asarray(box_max, dtype=np.float64)
+    margin = tolerance * np.maximum(np.maximum(np.abs(box_min), np.abs(box_max)), 1.0)
+    axes = [0, 1, 2] if mode3d else [0, 2]
+    inside = (points[:, axes] >= box_min[axes] - margin[axes]) & (points[:, axes] <= box_max[axes] + margin[axes])
+    return inside.all(axis=1)
@@ -11,7 +11,7 @@ from mod.tools.translation_tools import __
 from mod.tools.dialog_tools import error_dialog, info_dialog, warning_dialog
 from mod.tools.freecad_tools import get_fc_main_window
 from mod.tools.file_tools import get_total_exported_parts_from_disk,  save_measuretool_point_list, \
-    save_measuretool_point_grid
+    save_measuretool_point_grid, save_measuretool_point_set
 from mod.tools.executable_tools import ensure_process_is_executable_or_fail
 
 from mod.widgets.dock.postprocessing.export_progress_dialog import ExportProgressDialog
@@ -262,13 +262,22 @@ def measuretool_export(options, case, post_processing_widget,generate_script) ->
         save_measuretool_point_list(case.path, points_file,case.post_processing_settings.measuretool_points)
     elif options["points_source"]==1: #Points grid
         save_measuretool_point_grid(case.path, points_file, case.post_processing_settings.measuretool_grid)
+    elif options["points_source"]==4: #Point set
+        try:
+            save_measuretool_point_set(case.path, points_file, case.post_processing_settings.measuretool_point_sets)
+        except (OSError, ValueError) as ex:
+            if not generate_script:
+                post_processing_widget.adapt_to_export_finished()
+                export_dialog.reject()
+            error_dialog(__("The point set could not be generated."), str(ex))
+            return
 
 
 
     executable_parameters = ["-dirin {out_path}".format(out_path=outfolder),
                              "-filexml {out_path}{case_name}.xml".format(out_path=outfolder, case_name=case.name),
                              "{save_flag} {out_path}measure/{file_name}".format(save_flag=save_flag, out_path=outfolder, file_name=options["filename"]),
-                             "-points {case_path}{points_file}".format(case_path=casepath,points_file=points_file) if options["points_source"]<3
+                             "-points {case_path}{points_file}".format(case_path=casepath,points_file=points_file) if options["points_source"]!=3
                                 else "-pointsgeo {case_path}{mesh_file}".format(case_path=casepath,mesh_file=points_file),
                              "-vars:{save_vars}".format(save_vars=options["save_vars"]),
                              "-height" if options["calculate_water_elevation"] else "",
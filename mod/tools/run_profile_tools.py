@@ -0,0 +1,152 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Tools to apply CPU run profiles to the solver.
+
+A run profile sets the number of OpenMP threads, how they are bound to
+the cores (OMP_PROC_BIND and OMP_PLACES), the CPUs the solver can run on
+and its nice level. Profiles are stored in the application settings as
+dictionaries and applied both to local runs and to generated scripts, so
+concurrent runs can be kept on separate cores or NUMA nodes. """
+
+import shutil
+from sys import platform
+
+from PySide2 import QtCore
+
+from mod.dataobjects.configuration.application_settings import ApplicationSettings
+from mod.tools.stdout_tools import debug, warning
+
+OMP_PROC_BIND_OPTIONS = ["", "close", "spread", "master", "true", "false"]
+OMP_PLACES_OPTIONS = ["", "cores", "sockets", "threads", "ll_caches", "numa_domains"]
+
+
+def create_run_profile(name: str) -> dict:
+    """ Returns a run profile with the given name that changes nothing from the defaults. """
+    return {
+        "name": name,
+        "threads": 0,  # 0: as many as cores
+        "omp_proc_bind": "",
+        "omp_places": "",
+        "cpus": "",  # CPU list as in taskset -c, like 0-15,32-47
+        "nice": 0
+    }
+
+
+def get_run_profile(name: str) -> dict:
+    """ Returns the stored run profile with the given name, or None if it does not exist. """
+    for profile in ApplicationSettings.the().run_profiles:
+        if profile["name"] == name:
+            return dict(create_run_profile(name), **profile)
+    return None
+
+
+def get_active_run_profile() -> dict:
+    """ Returns the run profile selected for local runs, or None to run with the defaults. """
+    if not ApplicationSettings.the().run_profile_name:
+        return None
+    return get_run_profile(ApplicationSettings.the().run_profile_name)
+
+
+def parse_cpu_list(text: str) -> list:
+    """ Returns the sorted CPU numbers of a CPU list like 0-3,8,10-11. Raises ValueError if malformed. """
+    cpus = set()
+    for item in filter(None, (chunk.strip() for chunk in text.split(","))):
+        first, _, last = item.partition("-")
+        first_cpu = int(first)
+        last_cpu = int(last) if last else first_cpu
+        if first_cpu < 0 or last_cpu < first_cpu:
+            raise ValueError("Invalid CPU range: {}".format(item))
+        cpus.update(range(first_cpu, last_cpu + 1))
+    return sorted(cpus)
+
+
+def get_affinity_mask(cpus: list) -> str:
+    """ Returns the hexadecimal affinity mask of a list of CPUs. """
+    return "{:X}".format(sum(1 << cpu for cpu in cpus))
+
+
+def get_profile_environment(profile: dict) -> dict:
+    """ Returns the environment variables that configure OpenMP for a run profile. """
+    environment = dict()
+    if not profile:
+        return environment
+    if profile["threads"] > 0:
+        environment["OMP_NUM_THREADS"] = str(profile["threads"])
+    if profile["omp_proc_bind"]:
+        environment["OMP_PROC_BIND"] = profile["omp_proc_bind"]
+    if profile["omp_places"]:
+        environment["OMP_PLACES"] = profile["omp_places"]
+    return environment
+
+
+def get_profile_parameters(profile: dict, device: str) -> list:
+    """ Returns the solver parameters of a run profile for the given device. """
+    if not profile or device != "cpu" or profile["threads"] <= 0:
+        return list()
+    return ["-ompthreads:{}".format(profile["threads"])]
+
+
+def get_profile_launcher(profile: dict) -> list:
+    """ Returns the command that must precede the solver to apply the CPU list and nice level of a run profile.
+    taskset and nice replace themselves with the solver, so the started process is still the solver. """
+    if not profile or not (profile["cpus"] or profile["nice"]):
+        return list()
+    if platform not in ("linux", "linux2"):
+        warning("CPU list and nice level of run profiles are only applied to local runs on Linux")
+        return list()
+    launcher = list()
+    if profile["cpus"]:
+        if shutil.which("taskset"):
+            launcher += ["taskset", "-c", ",".join(map(str, parse_cpu_list(profile["cpus"])))]
+        else:
+            warning("taskset was not found. The CPU list of the run profile is not applied")
+    if profile["nice"]:
+        if shutil.which("nice"):
+            launcher += ["nice", "-n", str(profile["nice"])]
+        else:
+            warning("nice was not found. The nice level of the run profile is not applied")
+    return launcher
+
+
+def start_with_run_profile(process: QtCore.QProcess, executable: str, parameters: list, profile: dict) -> None:
+    """ Starts the solver in a process with the environment, CPU list and nice level of a run profile. """
+    environment = QtCore.QProcessEnvironment.systemEnvironment()
+    for key, value in get_profile_environment(profile).items():
+        environment.insert(key, value)
+    process.setProcessEnvironment(environment)
+    launcher = get_profile_launcher(profile)
+    if profile:
+        debug("Applying run profile {}: {} {}".format(profile["name"], get_profile_environment(profile), launcher))
+    if launcher:
+        process.start(launcher[0], launcher[1:] + [executable] + parameters)
+    else:
+        process.start(executable, parameters)
+
+
+def get_profile_script_text(profile: dict, linux: bool) -> tuple:
+    """ Returns the lines that set the environment of a run profile in a script and the prefix
+    of the solver command that applies its CPU list and nice level, as (environment, launcher). """
+    if not profile:
+        return "", ""
+    environment = get_profile_environment(profile)
+    if linux:
+        environment_text = "\n".join("export {}={}".format(key, value) for key, value in environment.items())
+        launcher = ""
+        if profile["cpus"]:
+            launcher += "taskset -c {} ".format(",".join(map(str, parse_cpu_list(profile["cpus"]))))
+        if profile["nice"]:
+            launcher += "nice -n {} ".format(profile["nice"])
+        return environment_text, launcher
+
+    environment_text = "\n".join("set {}={}".format(key, value) for key, value in environment.items())
+    launcher = ""
+    if profile["cpus"] or profile["nice"]:
+        launcher = 'start "" /b /wait '
+        if profile["cpus"]:
+            launcher += "/affinity {} ".format(get_affinity_mask(parse_cpu_list(profile["cpus"])))
+        if profile["nice"] > 0:
+            launcher += "/belownormal " if profile["nice"] < 10 else "/low "
+        elif profile["nice"] < 0:
+            launcher += "/abovenormal " if profile["nice"] > -10 else "/high "
+    return environment_text, launcher
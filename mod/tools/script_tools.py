@@ -4,6 +4,7 @@ import stat
 from mod.dataobjects.case import Case
 from mod.dataobjects.configuration.application_settings import ApplicationSettings
 from mod.tools.dialog_tools import warning_dialog, info_dialog
+from mod.tools.run_profile_tools import get_profile_script_text
 from mod.tools.stdout_tools import debug
 from mod.tools.template_tools import get_template_text
 
@@ -11,7 +12,7 @@ LINUX_FOLDER = "/templates/scripts/linux/"
 WINDOWS_FOLDER = "/templates/scripts/windows/"
 
 
-def generate_ext_script(toolname, arguments, sufix):
+def generate_ext_script(toolname, arguments, sufix, run_profile=None):
     if not Case.the().path:
         warning_dialog("Case is not saved. You need to save your case first")
         return
@@ -36,8 +37,12 @@ def generate_ext_script(toolname, arguments, sufix):
         GENCASE_SCRIPT_TEMPLATE = WINDOWS_FOLDER + template
     common = get_template_text(COMMON_SCRIPT_TEMPLATE).format(**{"dir": dir,
                                                                  "custom_text": custom_lines})
+    # Only the solver templates use the run profile
+    run_profile_text, launcher = get_profile_script_text(run_profile, lin)
     script = get_template_text(GENCASE_SCRIPT_TEMPLATE).format(**{"common": common,
                                                                   "args": " ".join(arguments),
+                                                                  "run_profile": run_profile_text,
+                                                                  "launcher": launcher
                                                                   })
     save_to_disk(f"{Case.the().path}{os.sep}{outfile}", script)
     if lin:
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Tools to resume interrupted DualSPHysics simulations.
+
+A simulation is resumed with the restart option of the solver from the
+last part that was completely written. The output of each interrupted
+run is kept as a numbered Run.out segment, and all segments are stitched
+back into Run.out once the resumed run finishes. """
+
+import os
+import re
+from glob import glob
+from os import path
+
+from mod.functions import atomic_open
+from mod.tools.file_tools import get_total_exported_parts_from_disk
+from mod.tools.stdout_tools import debug, log
+
+# Lines of Run.out written each time a part is stored: part number, part time, steps...
+RUN_PART_LINE_REGEX = re.compile(r"^([0-9]{4,})\s+([0-9.eE+-]+)\s")
+RUN_SEGMENT_FILE_NAME = "Run_segment_{:04d}.out"
+
+
+def get_run_file_path(out_folder: str) -> str:
+    """ Returns the path of the Run.out file of an output folder. """
+    return path.join(out_folder, "Run.out")
+
+
+def get_last_logged_part(run_file_path: str) -> int:
+    """ Returns the number of the last part the solver reported as stored in a Run.out file, or -1 if none. """
+    last_part = -1
+    try:
+        with open(run_file_path, "r", encoding="utf-8", errors="replace") as run_file:
+            for line in run_file:
+                match = RUN_PART_LINE_REGEX.match(line)
+                if match and "stored" not in line:
+                    last_part = int(match.group(1))
+    except OSError:
+        return -1
+    return last_part
+
+
+def find_resume_part(out_folder: str, data_folder: str) -> int:
+    """ Returns the last complete part a simulation can be resumed from, or -1 if it can't be resumed.
+    A part is complete once the solver logs it in Run.out. Without a log the last part on disk may be
+    partially written, so the previous one is used. """
+    if not glob(path.join(data_folder, "Part_*.bi4")):
+        return -1
+    last_disk_part = get_total_exported_parts_from_disk(data_folder)
+    last_logged_part = get_last_logged_part(get_run_file_path(out_folder))
+    resume_part = min(last_disk_part, last_logged_part) if last_logged_part >= 0 else last_disk_part - 1
+    # Resuming from the initial state is the same as running again.
+    return resume_part if resume_part > 0 and path.isfile(path.join(data_folder, "Part_{:04d}.bi4".format(resume_part))) else -1
+
+
+def remove_parts_after(data_folder: str, part: int) -> None:
+    """ Removes the parts written after the given one, which the resumed run writes again. """
+    for part_file in glob(path.join(data_folder, "Part_*.bi4")):
+        match = re.search(r"Part_([0-9]+)\.bi4$", part_file)
+        if match and int(match.group(1)) > part:
+            debug("Removing incomplete part {}".format(part_file))
+            os.remove(part_file)
+
+
+def store_run_segment(out_folder: str, resume_part: int) -> None:
+    """ Keeps the Run.out of the interrupted run as a segment, as the resumed run writes a new one. """
+    run_file_path = get_run_file_path(out_folder)
+    if not path.isfile(run_file_path):
+        return
+    segment_file_path = path.join(out_folder, RUN_SEGMENT_FILE_NAME.format(resume_part))
+    if not path.isfile(segment_file_path):
+        os.replace(run_file_path, segment_file_path)
+        return
+    # Resumed from the same part again: the new log follows the previous one.
+    with open(run_file_path, "r", encoding="utf-8", errors="replace") as run_file:
+        run_output = run_file.read()
+    with open(segment_file_path, "a", encoding="utf-8") as segment_file:
+        segment_file.write("\n==== Simulation resumed from Part_{:04d} ====\n\n{}".format(resume_part, run_output))
+    os.remove(run_file_path)
+
+
+def stitch_run_output(out_folder: str) -> str:
+    """ Joins the stored Run.out segments and the current Run.out in a single Run.out, in order.
+    Returns the stitched contents. Does nothing if there are no segments. """
+    segment_files = sorted(glob(path.join(out_folder, "Run_segment_*.out")))
+    run_file_path = get_run_file_path(out_folder)
+    current_output = ""
+    if path.isfile(run_file_path):
+        with open(run_file_path, "r", encoding="utf-8", errors="replace") as run_file:
+            current_output = run_file.read()
+    if not segment_files:
+        return current_output
+
+    stitched_parts = list()
+    for segment_file in segment_files:
+        resume_part = int(re.search(r"Run_segment_([0-9]+)\.out$", segment_file).group(1))
+        with open(segment_file, "r", encoding="utf-8", errors="replace") as segment:
+            stitched_parts.append(segment.read())
+        stitched_parts.append("\n==== Simulation resumed from Part_{:04d} ====\n\n".format(resume_part))
+    stitched_parts.append(current_output)
+    stitched_output = "".join(stitched_parts)
+
+    with atomic_open(run_file_path, "w", encoding="utf-8") as run_file:
+        run_file.write(stitched_output)
+    for segment_file in segment_files:
+        os.remove(segment_file)
+    log("Stitched {} interrupted run logs into {}".format(len(segment_files), run_file_path))
+    return stitched_output
+
+
+def get_resume_parameters(resume_part: int, data_folder: str) -> list:
+    """ Returns the solver parameters to restart a simulation from a part of a data folder. """
+    return ["-partbegin:{}".format(resume_part), data_folder]
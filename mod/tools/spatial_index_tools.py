@@ -0,0 +1,116 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Spatial index of axis aligned bounding boxes.
+
+Answers which boxes intersect a region or contain a point without testing
+every box. Boxes are registered in the cells of a uniform grid that they
+touch, so a query only tests the boxes registered in the cells it covers.
+The grid can be laid on some of the axes only, so queries that ignore an
+axis (the Y axis of 2D cases) still use it. Boxes can be added, moved and
+removed one at a time, so an index can be kept up to date as objects change
+instead of being built again. """
+
+from itertools import product
+from math import floor, isfinite
+
+import numpy as np
+
+MAX_CELLS_PER_BOX = 512  # Boxes that touch more cells are kept apart and tested on every query
+
+
+class AABBIndex():
+    """ Index of axis aligned bounding boxes identified by hashable keys, in a uniform grid of cells of the given size
+    laid on the given axes.
+
+    Attributes:
+        cell_size: Size of the cells of the grid
+        grid_axes: Axes the grid is laid on
+        bounds: (min, max) corners of each box by key
+    """
+
+    def __init__(self, cell_size: float, grid_axes: tuple = (0, 1, 2)):
+        self.cell_size: float = cell_size if cell_size > 0 and isfinite(cell_size) else 1.0
+        self.grid_axes: tuple = tuple(grid_axes)
+        self.bounds: dict = dict()
+        self.cells: dict = dict()
+        self.key_cells: dict = dict()
+        self.large_keys: set = set()
+
+    def __len__(self):
+        return len(self.bounds)
+
+    def __contains__(self, key):
+        return key in self.bounds
+
+    def keys(self) -> list:
+        """ Returns the keys of the boxes in the index. """
+        return list(self.bounds.keys())
+
+    def get_cell_ranges(self, box_min: tuple, box_max: tuple) -> list:
+        """ Returns the range of cell indexes that a box touches along each axis of the grid, or None if it is not
+        finite. """
+        limits = [(box_min[axis], box_max[axis]) for axis in self.grid_axes]
+        if not all(isfinite(low) and isfinite(high) for low, high in limits):
+            return None
+        return [range(floor(low / self.cell_size), floor(high / self.cell_size) + 1) for low, high in limits]
+
+    def insert(self, key, box_min, box_max) -> None:
+        """ Adds a box to the index, replacing the box with the same key if there was one. """
+        if key in self.bounds:
+            self.remove(key)
+        box_min, box_max = tuple(map(float, box_min)), tuple(map(float, box_max))
+        self.bounds[key] = (box_min, box_max)
+        cell_ranges = self.get_cell_ranges(box_min, box_max)
+        if cell_ranges is None or np.prod([len(cell_range) for cell_range in cell_ranges], dtype=np.float64) > MAX_CELLS_PER_BOX:
+            self.large_keys.add(key)
+            return
+        key_cells = list(product(*cell_ranges))
+        for cell in key_cells:
+            self.cells.setdefault(cell, set()).add(key)
+        self.key_cells[key] = key_cells
+
+    def remove(self, key) -> None:
+        """ Removes a box from the index, if it is there. """
+        if self.bounds.pop(key, None) is None:
+            return
+        self.large_keys.discard(key)
+        for cell in self.key_cells.pop(key, []):
+            cell_keys = self.cells[cell]
+            cell_keys.discard(key)
+            if not cell_keys:
+                del self.cells[cell]
+
+    def update(self, key, box_min, box_max) -> bool:
+        """ Moves a box, adding it if it was not in the index. Returns whether the index changed. """
+        bounds = (tuple(map(float, box_min)), tuple(map(float, box_max)))
+        if self.bounds.get(key) == bounds:
+            return False
+        self.insert(key, *bounds)
+        return True
+
+    def query_box(self, box_min, box_max, axes: tuple = (0, 1, 2)) -> set:
+        """ Returns the keys of the boxes that intersect a box, touching included. Only the given axes are tested,
+        so the box may be unbounded along the others. """
+        box_min, box_max = tuple(map(float, box_min)), tuple(map(float, box_max))
+        cell_ranges = self.get_cell_ranges(box_min, box_max) if set(self.grid_axes) <= set(axes) else None
+        if cell_ranges is None or np.prod([len(cell_range) for cell_range in cell_ranges], dtype=np.float64) > len(self.cells):
+            candidates = self.bounds.keys()
+        else:
+            candidates = set(self.large_keys)
+            for cell in product(*cell_ranges):
+                candidates |= self.cells.get(cell, set())
+        return {key for key in candidates
+                if all(box_min[axis] <= self.bounds[key][1][axis] and self.bounds[key][0][axis] <= box_max[axis]
+                       for axis in axes)}
+
+    def query_point(self, point, axes: tuple = (0, 1, 2)) -> set:
+        """ Returns the keys of the boxes that contain a point. Only the given axes are tested. """
+        return self.query_box(point, point, axes)
+
+
+def get_typical_cell_size(bounds: list) -> float:
+    """ Returns a cell size for an index of some (min, max) boxes: the median of their largest sizes. """
+    sizes = [max(high - low for low, high in zip(box_min, box_max)) for box_min, box_max in bounds]
+    sizes = [size for size in sizes if size > 0 and isfinite(size)]
+    return float(np.median(sizes)) if sizes else 1.0
@@ -3,7 +3,9 @@
 
 """ Template loading and formatting related tools. """
 
+from enum import Enum
 from os import path
+from uuid import UUID
 
 from mod.functions import get_mod_path
 from mod.tools.stdout_tools import debug
@@ -19,20 +21,129 @@ def get_template_text(template_path) -> str:
     return template_data
 
 
-def obj_to_dict(obj, classkey=None):
-    """ Converts an object to dictionary recursively. """
-    if isinstance(obj, dict):
-        data = {}
-        for (k, v) in obj.items():
-            data[k] = obj_to_dict(v, classkey)
-        return data
-    if hasattr(obj, "_ast"):
-        return obj_to_dict(obj._ast())  # pylint: disable=protected-access
-    if hasattr(obj, "__iter__") and not isinstance(obj, str):
-        return [obj_to_dict(v, classkey) for v in obj]
-    if hasattr(obj, "__dict__"):
-        data = {key: obj_to_dict(value, classkey) for key, value in obj.__dict__.items() if not callable(value) and not key.startswith("_")}
-        if classkey is not None and hasattr(obj, "__class__"):
-            data[classkey] = obj.__class__.__name__
-        return data
-    return obj
+class DictSerializer():
+    """ Converts objects to dictionaries recursively.
+
+    The way each type has to be converted is resolved only once and cached. For data objects
+    a field plan is kept per class with the attributes that have to be exported, so the
+    exploration done in every conversion is reduced to a dictionary lookup per value.
+    Optionally transforms booleans to the strings understood by GenCase in the same walk. """
+
+    ATOMIC_TYPES = frozenset({str, int, float, complex, type(None), UUID})
+
+    def __init__(self, classkey=None, bools_to_strs=False):
+        self.classkey = classkey
+        self.bools_to_strs = bools_to_strs
+        self.converters: dict = {
+            bool: self.convert_bool if bools_to_strs else self.convert_atomic,
+            list: self.convert_iterable,
+            tuple: self.convert_iterable,
+            dict: self.convert_dict
+        }
+        self.callable_types: set = set()
+
+    def convert(self, obj):
+        """ Converts an object to its dictionary representation. """
+        obj_type = type(obj)
+        if obj_type in self.ATOMIC_TYPES:
+            return obj
+        converter = self.converters.get(obj_type)
+        if converter is None:
+            converter = self.resolve_converter(obj)
+        return converter(obj)
+
+    def resolve_converter(self, obj):
+        """ Finds out how objects of the given object type have to be converted and caches it. """
+        obj_type = type(obj)
+        if isinstance(obj, dict):
+            converter = self.convert_dict
+        elif isinstance(obj, Enum):
+            converter = self.convert_enum
+        elif hasattr(obj, "_ast"):
+            converter = self.convert_ast
+        elif hasattr(obj, "__iter__") and not isinstance(obj, str):
+            converter = self.convert_iterable
+        elif hasattr(obj, "__dict__"):
+            converter = self.build_object_converter(obj_type)
+        else:
+            converter = self.convert_atomic
+        if callable(obj):
+            self.callable_types.add(obj_type)
+        if not isinstance(obj, type):
+            # Classes share their type, so how to convert them depends on each one and can't be cached.
+            self.converters[obj_type] = converter
+        return converter
+
+    def build_object_converter(self, obj_type):
+        """ Returns a converter for instances of a class, with its own field plan. """
+        # Field plan: attribute name -> whether it is exported.
+        field_plan: dict = dict()
+        atomic_types = self.ATOMIC_TYPES
+        converters = self.converters
+        callable_types = self.callable_types
+        classkey = self.classkey
+
+        def convert_object(obj):
+            data = {}
+            for key, value in obj.__dict__.items():
+                exported = field_plan.get(key)
+                if exported is None:
+                    exported = field_plan[key] = not key.startswith("_")
+                if not exported:
+                    continue
+                value_type = type(value)
+                if value_type in atomic_types:
+                    data[key] = value
+                    continue
+                converter = converters.get(value_type)
+                if converter is None:
+                    converter = self.resolve_converter(value)
+                if value_type in callable_types:
+                    continue
+                data[key] = converter(value)
+            if classkey is not None:
+                data[classkey] = obj_type.__name__
+            return data
+
+        return convert_object
+
+    def convert_atomic(self, obj):
+        """ Returns objects that are not explored as they are. """
+        return obj
+
+    def convert_bool(self, obj):
+        """ Transforms a boolean value to a string representing its state, understandable by GenCase. """
+        return "true" if obj else "false"
+
+    def convert_enum(self, obj):
+        """ Converts an enum member to its value. """
+        return self.convert(obj.value)
+
+    def convert_ast(self, obj):
+        """ Converts an object exposing an abstract syntax tree. """
+        return self.convert(obj._ast())  # pylint: disable=protected-access
+
+    def convert_iterable(self, obj):
+        """ Converts an iterable into a list with its converted elements. """
+        atomic_types = self.ATOMIC_TYPES
+        convert = self.convert
+        return [value if type(value) in atomic_types else convert(value) for value in obj]
+
+    def convert_dict(self, obj):
+        """ Converts the values of a dictionary. """
+        atomic_types = self.ATOMIC_TYPES
+        convert = self.convert
+        return {key: value if type(value) in atomic_types else convert(value) for key, value in obj.items()}
+
+
+# Serializers are kept between calls so the resolved converters and field plans are reused.
+_SERIALIZERS: dict = dict()
+
+
+def obj_to_dict(obj, classkey=None, bools_to_strs=False):
+    """ Converts an object to dictionary recursively.
+    If bools_to_strs is set, booleans are transformed to "true"/"false" strings in the same pass. """
+    serializer = _SERIALIZERS.get((classkey, bools_to_strs))
+    if serializer is None:
+        serializer = _SERIALIZERS[(classkey, bools_to_strs)] = DictSerializer(classkey, bools_to_strs)
+    return serializer.convert(obj)
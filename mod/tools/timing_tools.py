@@ -0,0 +1,41 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Elapsed time measurement related tools. """
+
+from time import perf_counter
+
+
+class StageTimer():
+    """ Measures the elapsed time of a sequence of named stages. """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.start_time: float = perf_counter()
+        self.last_time: float = self.start_time
+        self.stages: list = list()
+
+    def add_stage(self, stage_name: str, elapsed: float) -> None:
+        """ Adds a stage measured elsewhere to the report. """
+        self.stages.append((stage_name, elapsed))
+
+    def mark(self, stage_name: str) -> float:
+        """ Closes the current stage with the given name and returns its elapsed time in seconds. """
+        now = perf_counter()
+        elapsed = now - self.last_time
+        self.last_time = now
+        self.stages.append((stage_name, elapsed))
+        return elapsed
+
+    def total(self) -> float:
+        """ Returns the time elapsed since the timer was created, in seconds. """
+        return self.last_time - self.start_time
+
+    def report(self) -> str:
+        """ Returns a text report with the time spent on each stage. """
+        name_width = max([len(stage_name) for stage_name, _ in self.stages] + [len("Total")])
+        lines = ["{} timing report:".format(self.name)]
+        for stage_name, elapsed in self.stages:
+            lines.append("    {}  {:8.3f} s".format(stage_name.ljust(name_width), elapsed))
+        lines.append("    {}  {:8.3f} s".format("Total".ljust(name_width), self.total()))
+        return "\n".join(lines)
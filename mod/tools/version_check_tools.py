@@ -0,0 +1,119 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Tools to check in background if a newer DesignSPHysics version is available. """
+
+import json
+import os
+import time
+from http.client import HTTPException
+from urllib.request import urlopen
+
+import FreeCAD
+
+from PySide2 import QtCore
+
+from mod.constants import VERSION, GITHUB_MASTER_CONSTANTS_URL, VERSION_CHECK_TIMEOUT, VERSION_CHECK_CACHE_TTL, \
+    VERSION_CHECK_FAILED_CACHE_TTL, VERSION_CHECK_CACHE_FILE_NAME
+from mod.tools.dialog_tools import info_dialog
+from mod.tools.stdout_tools import log
+from mod.tools.translation_tools import __
+
+
+def get_version_check_cache_file() -> str:
+    """ Returns the path of the version check cache file saved in the FreeCAD user directory. """
+    return "{datadir}/{name}".format(datadir=FreeCAD.getUserAppDataDir(), name=VERSION_CHECK_CACHE_FILE_NAME)
+
+
+def read_version_check_cache(cache_file: str) -> dict:
+    """ Returns the cached version check result if it has not expired, or None otherwise.
+    A failed check is cached with a None master_version and a shorter time to live. """
+    if not os.path.isfile(cache_file):
+        return None
+    try:
+        with open(cache_file, "r", encoding="utf-8") as cache:
+            cached_data: dict = json.load(cache)
+        time_to_live = VERSION_CHECK_CACHE_TTL if cached_data["master_version"] else VERSION_CHECK_FAILED_CACHE_TTL
+        if 0 <= time.time() - cached_data["checked_at"] < time_to_live:
+            return cached_data
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def write_version_check_cache(cache_file: str, master_version: str) -> None:
+    """ Stores the result of a version check on disk. """
+    try:
+        with open(cache_file, "w", encoding="utf-8") as cache:
+            json.dump({"checked_at": time.time(), "master_version": master_version}, cache)
+    except OSError:
+        pass
+
+
+def fetch_master_version() -> str:
+    """ Returns the version published on the master branch of the repository.
+    Raises OSError (URLError, timeouts...) or HTTPException if it can't be reached in VERSION_CHECK_TIMEOUT seconds. """
+    with urlopen(GITHUB_MASTER_CONSTANTS_URL, timeout=VERSION_CHECK_TIMEOUT) as response:
+        return str(response.read()).split("VERSION = \"")[-1].split("\"")[0]
+
+
+class VersionCheckThread(QtCore.QThread):
+    """ Checks the latest published version without blocking the startup.
+    The result is cached on disk so the network is only reached once per VERSION_CHECK_CACHE_TTL. """
+
+    newer_version_found = QtCore.Signal(str)
+    check_skipped = QtCore.Signal(str)
+
+    def __init__(self):
+        super().__init__()
+        # Resolved here, as FreeCAD should only be accessed from the main thread.
+        self.cache_file: str = get_version_check_cache_file()
+        # The thread object lives in the main thread, so its slots are executed there.
+        self.newer_version_found.connect(self.on_newer_version_found)
+        self.check_skipped.connect(self.on_check_skipped)
+
+    def run(self):
+        cached_data: dict = read_version_check_cache(self.cache_file)
+        if cached_data is not None:
+            master_version = cached_data["master_version"]
+            if not master_version:
+                self.check_skipped.emit("Last version check failed recently. Skipping version check.")
+                return
+        else:
+            try:
+                master_version = fetch_master_version()
+            except (OSError, HTTPException):
+                write_version_check_cache(self.cache_file, None)
+                self.check_skipped.emit("No network connection or Git repo is down. Skipping version check.")
+                return
+            write_version_check_cache(self.cache_file, master_version)
+
+        if VERSION < master_version:
+            self.newer_version_found.emit(master_version)
+
+    @QtCore.Slot(str)
+    def on_newer_version_found(self, master_branch_version: str):
+        """ Notifies the user that the version in use is outdated. """
+        info_dialog(
+            __("Your version of DesignSPHyiscs is outdated. Please go to the Addon Manager and update it. New versions include bug fixes, new features and new DualSPHysics executables, among other things."),
+            __("The version you're using is {} while the version that you can update to is {}").format(VERSION,
+                                                                                                       master_branch_version)
+        )
+
+    @QtCore.Slot(str)
+    def on_check_skipped(self, reason: str):
+        """ Logs the reason why the version was not checked. """
+        log(reason)
+
+
+# Keeps a reference to the running check so it is not garbage collected while running.
+_version_check_thread: VersionCheckThread = None
+
+
+def check_version_in_background() -> None:
+    """ Starts a background check for newer versions of DesignSPHysics. """
+    global _version_check_thread  # pylint: disable=global-statement
+    if _version_check_thread is not None and _version_check_thread.isRunning():
+        return
+    _version_check_thread = VersionCheckThread()
+    _version_check_thread.start()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Watchdog for running DualSPHysics simulations.
+
+The solver logs a line in Run.out each time it stores a part, with the
+simulated time and the number of steps since the previous one. From those
+lines the watchdog follows the simulated time advanced per second of wall
+time and the mean time step. It flags a stall when no part is stored for
+too long, and a collapse when the throughput or the time step fall far
+below their usual values. Each flagged issue writes a diagnostics report
+to the output folder. """
+
+import os
+import re
+from datetime import datetime
+from glob import glob
+from os import path
+from statistics import median
+from time import monotonic
+
+from PySide2 import QtCore
+
+from mod.constants import WATCHDOG_CHECK_INTERVAL, WATCHDOG_LOG_TAIL_LINES, WATCHDOG_REPORT_FILE_NAME
+from mod.tools.disk_output_tools import get_free_space
+from mod.tools.particle_estimation_tools import format_size
+from mod.tools.simulation_tools import get_run_file_path
+from mod.tools.stdout_tools import debug, warning
+
+# Same part lines on_fs_change reads the progress from: part number, part time, total steps, steps...
+RUN_PROGRESS_LINE_REGEX = re.compile(r"^([0-9]{4,})\s+([0-9.eE+-]+)\s+([0-9]+)\s+([0-9]+)\s")
+
+WATCHDOG_STALL = "stall"
+WATCHDOG_THROUGHPUT = "throughput"
+WATCHDOG_TIMESTEP = "timestep"
+
+
+def parse_run_progress(lines: list) -> list:
+    """ Returns the (part, part time, steps) stored parts logged in the given Run.out lines. """
+    progress = list()
+    for line in lines:
+        match = RUN_PROGRESS_LINE_REGEX.match(line)
+        if match and "stored" not in line:
+            progress.append((int(match.group(1)), float(match.group(2)), int(match.group(4))))
+    return progress
+
+
+def get_process_cpu_time(pid: int) -> float:
+    """ Returns the CPU seconds used by a process and all its threads, or None if unknown.
+    Only available where /proc exists (Linux). """
+    try:
+        with open("/proc/{}/stat".format(pid), "r") as stat_file:
+            # The process name may contain spaces, the fields after it don't.
+            fields = stat_file.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class RunProgressMonitor():
+    """ Follows the parts stored by a simulation and decides whether it is stalled or its throughput collapsed.
+    Times are seconds of wall time, as given by the caller. """
+
+    def __init__(self, stall_seconds: float, min_ratio: float, start_time: float):
+        self.stall_seconds: float = stall_seconds
+        self.min_ratio: float = min_ratio
+        self.start_time: float = start_time
+        self.parts: list = list()  # [(part, part time, steps, wall time it was first seen)]
+
+    def update(self, progress: list, now: float) -> None:
+        """ Records the parts stored since the last update. """
+        last_part = self.parts[-1][0] if self.parts else -1
+        for part, part_time, steps in progress:
+            if part > last_part:
+                self.parts.append((part, part_time, steps, now))
+                last_part = part
+
+    def get_intervals(self) -> list:
+        """ Returns (simulated seconds per wall second, mean time step) between consecutive parts.
+        The first interval includes the solver start up, so it is not used. """
+        intervals = list()
+        for previous, current in zip(self.parts[1:], self.parts[2:]):
+            simulated = current[1] - previous[1]
+            wall = current[3] - previous[3]
+            if simulated <= 0 or wall <= 0:
+                continue
+            intervals.append((simulated / wall, simulated / current[2] if current[2] else 0.0))
+        return intervals
+
+    @property
+    def last_progress_time(self) -> float:
+        """ Wall time of the last stored part, or of the start if none was stored. """
+        return self.parts[-1][3] if self.parts else self.start_time
+
+    def get_current_rate(self, now: float) -> float:
+        """ Returns the simulated seconds per wall second of the last interval, bounded by the time waited
+        for the next part, or None if not known yet. The next part is assumed as far as the last one. """
+        intervals = self.get_intervals()
+        if not intervals:
+            return None
+        rate = intervals[-1][0]
+        waited = now - self.last_progress_time
+        last_simulated = self.parts[-1][1] - self.parts[-2][1]
+        if waited > 0 and last_simulated > 0:
+            rate = min(rate, last_simulated / waited)
+        return rate
+
+    def check(self, now: float) -> dict:
+        """ Returns the detected issues as {issue: description}. """
+        issues = dict()
+        waited = now - self.last_progress_time
+        if waited > self.stall_seconds:
+            issues[WATCHDOG_STALL] = "No part was stored in the last {:.0f} minutes".format(waited / 60)
+
+        intervals = self.get_intervals()
+        if len(intervals) < 2:
+            return issues
+        reference_rate = median(rate for rate, _ in intervals[:-1])
+        current_rate = self.get_current_rate(now)
+        if current_rate is not None and current_rate < self.min_ratio * reference_rate:
+            issues[WATCHDOG_THROUGHPUT] = "Throughput fell to {:.3g} simulated s per hour, usually {:.3g}".format(
+                current_rate * 3600, reference_rate * 3600)
+        reference_dt = median(dt for _, dt in intervals[:-1])
+        current_dt = intervals[-1][1]
+        if 0 < current_dt < self.min_ratio * reference_dt:
+            issues[WATCHDOG_TIMESTEP] = "Mean time step fell to {:.3e} s, usually {:.3e} s".format(current_dt, reference_dt)
+        return issues
+
+
+def build_diagnostics(out_folder: str, data_folder: str, run_lines: list, issues: dict, cpu_usage: float) -> str:
+    """ Returns a text report with the issues found, the last lines of the log, the CPU use of the solver
+    and the state of the output folder. """
+    report = ["==== Simulation watchdog report {} ====".format(datetime.now().isoformat(timespec="seconds"))]
+    report += ["Issue: {}".format(description) for description in issues.values()]
+    report.append("Solver CPU use: {}".format("{:.0f}%".format(cpu_usage) if cpu_usage is not None else "unavailable"))
+
+    part_files = sorted(glob(path.join(data_folder, "Part_*.bi4")))
+    report.append("Stored parts: {}".format(len(part_files)))
+    if part_files:
+        last_part_file = part_files[-1]
+        try:
+            age = datetime.now().timestamp() - path.getmtime(last_part_file)
+            report.append("Last part: {} ({}, written {:.0f} s ago)".format(
+                path.basename(last_part_file), format_size(path.getsize(last_part_file)), age))
+        except OSError:
+            report.append("Last part: {}".format(path.basename(last_part_file)))
+    free_space = get_free_space(out_folder)
+    if free_space >= 0:
+        report.append("Free space in output folder: {}".format(format_size(free_space)))
+
+    report.append("Last {} lines of Run.out:".format(WATCHDOG_LOG_TAIL_LINES))
+    report += [line.rstrip("\n") for line in run_lines[-WATCHDOG_LOG_TAIL_LINES:]]
+    return "\n".join(report) + "\n\n"
+
+
+class SimulationWatchdog(QtCore.QObject):
+    """ Periodically checks a running simulation. Emits alert with the description of the issues and the
+    diagnostics report once for each issue found, until the simulation progresses again. """
+
+    alert = QtCore.Signal(str, str)
+
+    def __init__(self, process: QtCore.QProcess, out_folder: str, data_folder: str, stall_minutes: float,
+                 min_ratio: float, parent=None):
+        super().__init__(parent=parent)
+        self.process: QtCore.QProcess = process
+        self.out_folder: str = out_folder
+        self.data_folder: str = data_folder
+        self.monitor: RunProgressMonitor = RunProgressMonitor(stall_minutes * 60, min_ratio, monotonic())
+        self.reported_issues: set = set()
+        self.last_cpu_sample: tuple = None  # (wall time, CPU seconds)
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(WATCHDOG_CHECK_INTERVAL * 1000)
+        self.timer.timeout.connect(self.check)
+
+    def start(self):
+        """ Starts checking the simulation. """
+        self.monitor.start_time = monotonic()
+        self.timer.start()
+
+    def stop(self):
+        """ Stops checking the simulation. """
+        self.timer.stop()
+
+    def get_cpu_usage(self, now: float) -> float:
+        """ Returns the CPU use of the solver since the last check, in percent of one core, or None if unknown. """
+        cpu_time = get_process_cpu_time(self.process.processId())
+        if cpu_time is None:
+            return None
+        previous_sample, self.last_cpu_sample = self.last_cpu_sample, (now, cpu_time)
+        if previous_sample is None or now <= previous_sample[0]:
+            return None
+        return 100 * (cpu_time - previous_sample[1]) / (now - previous_sample[0])
+
+    def check(self):
+        """ Reads the run log and reports the new issues found. """
+        if self.process.state() == QtCore.QProcess.NotRunning:
+            self.stop()
+            return
+        now = monotonic()
+        run_lines = list()
+        try:
+            with open(get_run_file_path(self.out_folder), "r", encoding="utf-8", errors="replace") as run_file:
+                run_lines = run_file.readlines()
+        except OSError:
+            pass
+
+        parts_before = len(self.monitor.parts)
+        self.monitor.update(parse_run_progress(run_lines), now)
+        if len(self.monitor.parts) > parts_before:
+            # The simulation progresses, so the issues may be reported again.
+            self.reported_issues.clear()
+        cpu_usage = self.get_cpu_usage(now)
+
+        issues = self.monitor.check(now)
+        new_issues = {key: value for key, value in issues.items() if key not in self.reported_issues}
+        if not new_issues:
+            return
+        self.reported_issues.update(new_issues.keys())
+        report = build_diagnostics(self.out_folder, self.data_folder, run_lines, new_issues, cpu_usage)
+        report_file = path.join(self.out_folder, WATCHDOG_REPORT_FILE_NAME)
+        try:
+            with open(report_file, "a", encoding="utf-8") as report_stream:
+                report_stream.write(report)
+        except OSError as ex:
+            debug("Unable to write the watchdog report {}: {}".format(report_file, ex))
+        description = ". ".join(new_issues.values())
+        warning("Simulation watchdog: {}. Diagnostics stored in {}".format(description, report_file))
+        self.alert.emit(description, report)
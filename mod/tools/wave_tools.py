@@ -0,0 +1,241 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Linear synthesis of irregular and focused waves to preview wave generators.
+
+Builds the spectrum of an irregular or focused wave generator, splits it
+into components and sums them into the free-surface elevation and the
+paddle motion with NumPy, so the generator can be checked before running
+GenCase and the solver. Long records are summed with an inverse FFT, and
+the components of their spectrum are placed on the frequencies the FFT
+resolves, so the FFT gives the exact sum of those components.
+
+This is a first order preview. The random phases don't reproduce the ones
+DualSPHysics draws from the same seed and the discretizations follow the
+same idea as GenCase's without matching its frequencies exactly. """
+
+import numpy as np
+
+from mod.enums import IrregularDiscretization, IrregularSpectrum, MotionType
+
+GRAVITY = 9.81
+SPECTRUM_MIN_FREQ_COEF = 0.5  # Lowest component frequency, relative to the peak frequency
+SPECTRUM_MAX_FREQ_COEF = 3.0  # Highest component frequency, relative to the peak frequency
+SPECTRUM_SAMPLES = 2000  # Frequencies used to integrate and plot the spectrum
+DIRECT_SUM_MAX_TERMS = 2000000  # Components x instants summed directly before switching to FFT summation
+FFT_PADDING = 8  # Length of the FFT relative to the record when summing long records
+FFT_MAX_SAMPLES = 1 << 22
+BREAKING_STEEPNESS = 1 / 7  # Limit wave steepness H/L
+FLAP_MAX_ANGLE = 30  # Degrees
+FLAP_GENERATOR_TYPES = (MotionType.IRREGULAR_FLAP_WAVE_GENERATOR, MotionType.REGULAR_FLAP_WAVE_GENERATOR)
+
+
+def solve_wave_numbers(frequencies: np.ndarray, depth: float) -> np.ndarray:
+    """ Returns the wave numbers of the given frequencies (Hz) in water of the given depth,
+    solving the linear dispersion relation with Newton iterations. """
+    omegas = 2 * np.pi * np.asarray(frequencies, dtype=float)
+    wave_numbers = np.maximum(omegas ** 2 / GRAVITY, omegas / np.sqrt(GRAVITY * depth))
+    for _ in range(50):
+        tanh = np.tanh(wave_numbers * depth)
+        residual = GRAVITY * wave_numbers * tanh - omegas ** 2
+        derivative = GRAVITY * (tanh + wave_numbers * depth * (1 - tanh ** 2))
+        step = residual / derivative
+        wave_numbers -= step
+        if np.all(np.abs(step) <= 1e-12 * wave_numbers):
+            break
+    return wave_numbers
+
+
+def get_spectrum_shape(ratios: np.ndarray, spectrum: str, peak_coef: float) -> np.ndarray:
+    """ Returns the shape of a JONSWAP or Pierson-Moskowitz spectrum at frequencies relative to the peak frequency. """
+    shape = np.zeros_like(ratios)
+    positive = ratios > 0
+    shape[positive] = ratios[positive] ** -5 * np.exp(-1.25 * ratios[positive] ** -4)
+    if spectrum == IrregularSpectrum.JONSWAP and peak_coef > 0:
+        sigma = np.where(ratios <= 1, 0.07, 0.09)
+        shape *= peak_coef ** np.exp(-(ratios - 1) ** 2 / (2 * sigma ** 2))
+    return shape
+
+
+def get_spectrum_density(frequencies: np.ndarray, spectrum: str, wave_height: float, peak_period: float,
+                         peak_coef: float) -> np.ndarray:
+    """ Returns the spectral density (m^2/Hz) of a JONSWAP or Pierson-Moskowitz spectrum with the given significant
+    wave height and peak period. The spectrum is scaled so its zeroth moment is Hs^2/16. """
+    peak_frequency = 1 / peak_period
+    grid = np.linspace(0.0, 10 * peak_frequency, SPECTRUM_SAMPLES * 4)
+    grid_shape = get_spectrum_shape(grid / peak_frequency, spectrum, peak_coef)
+    zeroth_moment = np.sum((grid_shape[1:] + grid_shape[:-1]) / 2 * np.diff(grid))
+    shape = get_spectrum_shape(np.asarray(frequencies, dtype=float) / peak_frequency, spectrum, peak_coef)
+    return shape * (wave_height ** 2 / 16) / zeroth_moment
+
+
+def get_component_frequencies(discretization: str, count: int, min_frequency: float, max_frequency: float,
+                              peak_frequency: float, rng) -> tuple:
+    """ Returns the frequencies of the wave components and the bandwidth each one represents, as (frequencies, widths). """
+    if discretization == IrregularDiscretization.STRETCHED:
+        # Bands narrower close to the peak
+        coordinates = np.linspace(-1.0, 1.0, count + 1)
+        edges = peak_frequency + np.where(coordinates < 0, peak_frequency - min_frequency, max_frequency - peak_frequency) \
+            * np.sign(coordinates) * np.abs(coordinates) ** 1.5
+    elif discretization == IrregularDiscretization.COSSTRETCHED:
+        edges = min_frequency + (max_frequency - min_frequency) * (1 - np.cos(np.linspace(0.0, np.pi, count + 1))) / 2
+    else:
+        edges = np.linspace(min_frequency, max_frequency, count + 1)
+    widths = np.diff(edges)
+    if discretization == IrregularDiscretization.RANDOM:
+        frequencies = edges[:-1] + rng.random(count) * widths
+    else:
+        frequencies = (edges[:-1] + edges[1:]) / 2
+    return frequencies, widths
+
+
+def get_stroke_transfer(wave_numbers: np.ndarray, depth: float, flap: bool, hinge_height: float = 0.0) -> np.ndarray:
+    """ Returns the ratio between the wave height and the paddle stroke of each component (Biesel transfer
+    functions). The stroke of a flap is measured at the still water level, with the hinge at a height above the bottom. """
+    kh = wave_numbers * depth
+    if not flap:
+        return 2 * (np.cosh(2 * kh) - 1) / (np.sinh(2 * kh) + 2 * kh)
+    kd = wave_numbers * (depth - hinge_height)
+    return 4 * np.sinh(kh) / kd * (kd * np.sinh(kh) - np.cosh(kh) + np.cosh(wave_numbers * hinge_height)) \
+        / (np.sinh(2 * kh) + 2 * kh)
+
+
+def get_hinge_height(generator: dict) -> float:
+    """ Returns the height of the hinge of a flap above the bottom. GenCase takes negative drafts as above the bottom. """
+    return -generator.get("variable_draft", 0.0)
+
+
+def build_wave_components(generator: dict, times: np.ndarray = None) -> dict:
+    """ Returns the components of an irregular or focused wave generator, given as a dictionary with the attributes of
+    the generator, as arrays of frequencies (Hz), amplitudes (m), wave numbers, phases (rad) and stroke amplitudes (m).
+    If the times they will be summed over are given, the frequencies are placed where sum_components is exact. """
+    peak_frequency = 1 / generator["wave_period"]
+    depth = generator["depth"]
+    if depth <= 0 or generator["wave_period"] <= 0:
+        raise ValueError("The depth and the wave period must be greater than 0")
+    rng = np.random.default_rng(int(generator["randomseed"]))
+    frequencies, widths = get_component_frequencies(generator["discretization"], int(generator["waves"]),
+                                                    SPECTRUM_MIN_FREQ_COEF * peak_frequency,
+                                                    SPECTRUM_MAX_FREQ_COEF * peak_frequency, peak_frequency, rng)
+    if times is not None:
+        frequencies = snap_frequencies(frequencies, times)
+    density = get_spectrum_density(frequencies, generator["spectrum"], generator["wave_height"], generator["wave_period"],
+                                   generator["peak_coef"])
+    amplitudes = np.sqrt(2 * density * widths)
+    wave_numbers = solve_wave_numbers(frequencies, depth)
+    flap = generator["type"] in FLAP_GENERATOR_TYPES
+    transfer = get_stroke_transfer(wave_numbers, depth, flap, get_hinge_height(generator))
+    if generator["type"] == MotionType.FOCUSED_PISTON_WAVE_GENERATOR:
+        # All the components are in phase at the focus point at the focus time
+        group_velocities = np.pi * frequencies / wave_numbers * (1 + 2 * wave_numbers * depth / np.sinh(2 * wave_numbers * depth))
+        focus_time = generator["fpretime"] + generator["xf"] / group_velocities.min()
+        phases = 2 * np.pi * frequencies * focus_time - wave_numbers * generator["xf"] - np.radians(generator["fphase"])
+    else:
+        phases = rng.random(len(frequencies)) * 2 * np.pi
+    return {"frequencies": frequencies, "amplitudes": amplitudes, "wave_numbers": wave_numbers, "phases": phases,
+            "strokes": amplitudes / transfer * generator["gainstroke"], "flap": flap}
+
+
+def get_fft_length(sample_count: int) -> int:
+    """ Returns the length of the FFT used to sum the components over a record with the given number of instants. """
+    # A longer transform resolves finer frequencies, so the components are moved less to place them on its grid
+    samples = max(sample_count * FFT_PADDING, 1 << 10)
+    return min(1 << int(np.ceil(np.log2(samples))), max(FFT_MAX_SAMPLES, sample_count))
+
+
+def uses_fft_sum(component_count: int, times: np.ndarray) -> bool:
+    """ Returns whether the components are summed with an inverse FFT over the given equally spaced times. """
+    return len(times) >= 2 and component_count > 0 and len(times) * component_count > DIRECT_SUM_MAX_TERMS
+
+
+def snap_frequencies(frequencies: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """ Moves the frequencies to the nearest ones resolved by the FFT used to sum them over the given times, m / (N dt),
+    if they are summed with an FFT. Other frequencies are returned as they are. """
+    if not uses_fft_sum(len(frequencies), times):
+        return frequencies
+    frequency_step = 1 / (get_fft_length(len(times)) * (times[1] - times[0]))
+    return np.maximum(np.rint(frequencies / frequency_step), 1) * frequency_step
+
+
+def sum_components(frequencies: np.ndarray, coefficients: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """ Returns the real part of the sum of coefficients * exp(2 pi i f t) for equally spaced times.
+    Small sums are computed directly in chunks; long records use an inverse FFT, which is exact for the frequencies
+    returned by snap_frequencies. Other frequencies are rounded to those. """
+    if not len(times) or not len(frequencies):
+        return np.zeros(len(times))
+    if not uses_fft_sum(len(frequencies), times):
+        chunk = max(DIRECT_SUM_MAX_TERMS // len(frequencies), 1)
+        return np.concatenate([np.real(np.exp(2j * np.pi * np.outer(times[start:start + chunk], frequencies)) @ coefficients)
+                               for start in range(0, len(times), chunk)])
+    time_step = times[1] - times[0]
+    samples = get_fft_length(len(times))
+    bins = np.rint(frequencies * samples * time_step).astype(np.int64)
+    # Shift to the first instant and drop the components the time step can't resolve
+    shifted = coefficients * np.exp(2j * np.pi * frequencies * times[0])
+    resolved = (bins >= 0) & (bins < samples // 2)
+    spectrum = np.zeros(samples, dtype=complex)
+    np.add.at(spectrum, bins[resolved], shifted[resolved])
+    return np.real(np.fft.ifft(spectrum)[:len(times)]) * samples
+
+
+def get_ramp(times: np.ndarray, generator: dict) -> np.ndarray:
+    """ Returns the factor applied to the motion by the initial ramp and, for focused waves, the final ramp. """
+    ramp = np.ones(len(times))
+    if generator.get("ramptime", 0) > 0:
+        ramp *= np.clip(times / generator["ramptime"], 0.0, 1.0)
+    if generator.get("fmovtime", 0) > 0:
+        if generator.get("fmovramp", 0) > 0:
+            ramp *= np.clip((generator["fmovtime"] - times) / generator["fmovramp"], 0.0, 1.0)
+        else:
+            ramp *= times <= generator["fmovtime"]
+    return ramp
+
+
+def synthesize_wave_series(generator: dict, times: np.ndarray, position: float = 0.0) -> dict:
+    """ Returns the free-surface elevation at a distance from the paddle, the paddle displacement (m, at the still
+    water level) and the flap angle (degrees, flaps only) of a wave generator at the given times. """
+    series_times = times + generator.get("serieini", 0.0)
+    components = build_wave_components(generator, series_times)
+    phases = components["phases"]
+    elevation_coefficients = components["amplitudes"] * np.exp(-1j * (components["wave_numbers"] * position + phases))
+    # The paddle moves a quarter of period ahead of the elevation it generates
+    stroke_coefficients = -1j * components["strokes"] * np.exp(-1j * phases)
+    ramp = get_ramp(times, generator)
+    series = {"times": times,
+              "elevation": sum_components(components["frequencies"], elevation_coefficients, series_times) * ramp,
+              "displacement": sum_components(components["frequencies"], stroke_coefficients, series_times) * ramp,
+              "components": components}
+    if components["flap"]:
+        series["angle"] = np.degrees(np.arctan2(series["displacement"], generator["depth"] - get_hinge_height(generator)))
+    return series
+
+
+def get_series_summary(series: dict) -> dict:
+    """ Returns the largest values of the paddle motion and the free-surface elevation of a series. """
+    displacement = series["displacement"]
+    times = series["times"]
+    velocity = np.gradient(displacement, times) if len(times) > 2 else np.zeros(len(times))
+    summary = {"stroke": np.ptp(displacement) if len(displacement) else 0.0,
+               "max_displacement": np.abs(displacement).max(initial=0.0),
+               "max_velocity": np.abs(velocity).max(initial=0.0),
+               "max_elevation": np.abs(series["elevation"]).max(initial=0.0)}
+    if "angle" in series:
+        summary["max_angle"] = np.abs(series["angle"]).max(initial=0.0)
+    return summary
+
+
+def check_wave_series(generator: dict, series: dict) -> list:
+    """ Returns warnings about the paddle motion and the generated waves. """
+    warnings = list()
+    depth = generator["depth"]
+    summary = get_series_summary(series)
+    if summary["stroke"] > depth:
+        warnings.append("The paddle stroke ({:.3f} m) is larger than the depth ({:.3f} m).".format(summary["stroke"], depth))
+    peak_wave_number = solve_wave_numbers(np.array([1 / generator["wave_period"]]), depth)[0]
+    steepness = generator["wave_height"] * peak_wave_number / (2 * np.pi)
+    if steepness > BREAKING_STEEPNESS:
+        warnings.append("The wave steepness at the peak period ({:.3f}) is above the breaking limit ({:.3f}).".format(
+            steepness, BREAKING_STEEPNESS))
+    if summary.get("max_angle", 0.0) > FLAP_MAX_ANGLE:
+        warnings.append("The flap rotates up to {:.1f} degrees.".format(summary["max_angle"]))
+    return warnings
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""DesignSPHysics Series Plot widget"""
+
+import numpy as np
+
+from PySide2 import QtCore, QtGui, QtWidgets
+
+
+class SeriesPlot(QtWidgets.QWidget):
+    """ A lightweight line plot of a series, with optional horizontal limit lines.
+    Long series are reduced to the minimum and maximum of each pixel column before drawing. """
+
+    MARGIN_LEFT = 60
+    MARGIN_RIGHT = 10
+    MARGIN_TOP = 20
+    MARGIN_BOTTOM = 25
+
+    def __init__(self, title: str = "", x_label: str = "", parent=None):
+        super().__init__(parent=parent)
+        self.title: str = title
+        self.x_label: str = x_label
+        self.x_values: np.ndarray = np.zeros(0)
+        self.y_values: np.ndarray = np.zeros(0)
+        self.limits: list = list()
+        self.setMinimumHeight(160)
+
+    def set_series(self, x_values, y_values, limits: list = None):
+        """ Sets the series to plot and the values where limit lines are drawn. """
+        self.x_values = np.asarray(x_values, dtype=float)
+        self.y_values = np.asarray(y_values, dtype=float)
+        self.limits = list(limits or [])
+        self.update()
+
+    def get_envelope(self, width: int) -> tuple:
+        """ Returns the points to draw, reduced to the extremes of each pixel column for long series. """
+        if len(self.x_values) <= 2 * width:
+            return self.x_values, self.y_values
+        columns = np.linspace(0, len(self.x_values), width + 1).astype(np.int64)
+        starts = columns[:-1]
+        minimums = np.minimum.reduceat(self.y_values, starts)
+        maximums = np.maximum.reduceat(self.y_values, starts)
+        return np.repeat(self.x_values[starts], 2), np.column_stack((minimums, maximums)).ravel()
+
+    def paintEvent(self, _):
+        """ Draws the axes, the series and the limit lines. """
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        plot_rect = QtCore.QRectF(self.MARGIN_LEFT, self.MARGIN_TOP, self.width() - self.MARGIN_LEFT - self.MARGIN_RIGHT,
+                                  self.height() - self.MARGIN_TOP - self.MARGIN_BOTTOM)
+        painter.fillRect(self.rect(), self.palette().base())
+        painter.setPen(self.palette().text().color())
+        painter.drawText(QtCore.QRectF(0, 0, self.width(), self.MARGIN_TOP), QtCore.Qt.AlignCenter, self.title)
+        painter.drawRect(plot_rect)
+        if not len(self.x_values) or plot_rect.width() <= 0 or plot_rect.height() <= 0:
+            painter.end()
+            return
+
+        x_min, x_max = self.x_values.min(), self.x_values.max()
+        y_min = min([self.y_values.min()] + self.limits)
+        y_max = max([self.y_values.max()] + self.limits)
+        if x_max == x_min:
+            x_max = x_min + 1
+        if y_max == y_min:
+            y_min, y_max = y_min - 1, y_max + 1
+
+        def to_screen(x_value, y_value):
+            return QtCore.QPointF(plot_rect.left() + (x_value - x_min) / (x_max - x_min) * plot_rect.width(),
+                                  plot_rect.bottom() - (y_value - y_min) / (y_max - y_min) * plot_rect.height())
+
+        label_width = self.MARGIN_LEFT - 4
+        painter.drawText(QtCore.QRectF(0, plot_rect.top() - 8, label_width, 16), QtCore.Qt.AlignRight, "{:.4g}".format(y_max))
+        painter.drawText(QtCore.QRectF(0, plot_rect.bottom() - 8, label_width, 16), QtCore.Qt.AlignRight, "{:.4g}".format(y_min))
+        painter.drawText(QtCore.QRectF(plot_rect.left(), plot_rect.bottom() + 2, plot_rect.width(), self.MARGIN_BOTTOM),
+                         QtCore.Qt.AlignLeft, "{:.4g}".format(x_min))
+        painter.drawText(QtCore.QRectF(plot_rect.left(), plot_rect.bottom() + 2, plot_rect.width(), self.MARGIN_BOTTOM),
+                         QtCore.Qt.AlignHCenter, self.x_label)
+        painter.drawText(QtCore.QRectF(plot_rect.left(), plot_rect.bottom() + 2, plot_rect.width(), self.MARGIN_BOTTOM),
+                         QtCore.Qt.AlignRight, "{:.4g}".format(x_max))
+
+        painter.setPen(QtGui.QPen(QtGui.QColor(220, 40, 40), 1, QtCore.Qt.DashLine))
+        for limit in self.limits:
+            painter.drawLine(to_screen(x_min, limit), to_screen(x_max, limit))
+
+        painter.setPen(QtGui.QPen(QtGui.QColor(30, 100, 200), 1))
+        x_values, y_values = self.get_envelope(int(plot_rect.width()))
+        painter.drawPolyline(QtGui.QPolygonF([to_screen(x, y) for x, y in zip(x_values, y_values)]))
+        painter.end()
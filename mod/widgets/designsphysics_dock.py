@@ -80,6 +80,7 @@ class DesignSPHysicsDock(QtWidgets.QDockWidget):
         """ Reacts to a refresh signal emitted by the pre processing widget. """
         self.need_refresh.emit()
         self.dock_configuration_widget.update_case_name(Case.the().name)
+        self.dp_widget.update_particle_estimate()
 
     def on_signal_update_dp(self):
         """ Defines the behaviour on DP update request. """
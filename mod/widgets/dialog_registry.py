@@ -0,0 +1,94 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""DesignSPHysics Dialog Registry.
+
+Holds deferred factories for the dialogs opened from the docks, so their
+modules (and everything they import) are only loaded the first time
+each dialog is used instead of on workbench startup.
+"""
+
+from importlib import import_module
+from time import perf_counter
+
+from mod.tools.stdout_tools import debug
+
+
+class DeferredDialog():
+    """ Factory that behaves like a dialog class, importing the module that defines it on first use. """
+
+    def __init__(self, module_name: str, class_name: str):
+        self.module_name: str = module_name
+        self.class_name: str = class_name
+        self.dialog_class: type = None
+
+    def resolve(self) -> type:
+        """ Returns the dialog class, importing its module if it was not loaded yet. """
+        if self.dialog_class is None:
+            start_time = perf_counter()
+            self.dialog_class = getattr(import_module(self.module_name), self.class_name)
+            debug("Loaded {} in {:.3f} s".format(self.class_name, perf_counter() - start_time))
+        return self.dialog_class
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+
+# Dock configuration
+ConstantsDialog = DeferredDialog("mod.widgets.dock.dock_widgets.constants_dialog", "ConstantsDialog")
+DiskOutputPlanDialog = DeferredDialog("mod.widgets.dock.dock_widgets.disk_output_plan_dialog", "DiskOutputPlanDialog")
+ExecutionParametersDialog = DeferredDialog("mod.widgets.dock.dock_widgets.execution_parameters_dialog", "ExecutionParametersDialog")
+SetupPluginDialog = DeferredDialog("mod.widgets.dock.dock_widgets.setup_plugin_dialog", "SetupPluginDialog")
+
+# Dock pre-processing
+AddBathymetryDialog = DeferredDialog("mod.widgets.dock.dock_widgets.add_bathymetry_dialog", "AddBathymetryDialog")
+AddGeoDialog = DeferredDialog("mod.widgets.dock.dock_widgets.add_geo_dialog", "AddGeoDialog")
+CaseSummary = DeferredDialog("mod.widgets.dock.dock_widgets.case_summary", "CaseSummary")
+DataFilesDialog = DeferredDialog("mod.widgets.dock.dock_widgets.data_files_dialog", "DataFilesDialog")
+GencaseCompletedDialog = DeferredDialog("mod.widgets.dock.dock_widgets.gencase_completed_dialog", "GencaseCompletedDialog")
+Mode2DConfigDialog = DeferredDialog("mod.widgets.dock.dock_widgets.mode_2d_config_dialog", "Mode2DConfigDialog")
+SpecialOptionsSelectorDialog = DeferredDialog("mod.widgets.dock.special_widgets.special_options_selector_dialog", "SpecialOptionsSelectorDialog")
+
+# Dock simulation
+RunAdditionalParametersDialog = DeferredDialog("mod.widgets.dock.dock_widgets.run_additional_parameters_dialog", "RunAdditionalParametersDialog")
+RunDialog = DeferredDialog("mod.widgets.dock.dock_widgets.run_dialog", "RunDialog")
+RunProfilesDialog = DeferredDialog("mod.widgets.dock.dock_widgets.run_profiles_dialog", "RunProfilesDialog")
+
+# Dock post-processing
+ComputeForcesDialog = DeferredDialog("mod.widgets.dock.postprocessing.computeforces_dialog", "ComputeForcesDialog")
+FloatingInfoDialog = DeferredDialog("mod.widgets.dock.postprocessing.floatinginfo_dialog", "FloatingInfoDialog")
+FlowToolDialog = DeferredDialog("mod.widgets.dock.postprocessing.flowtool_dialog", "FlowToolDialog")
+IsoSurfaceDialog = DeferredDialog("mod.widgets.dock.postprocessing.isosurface_dialog", "IsoSurfaceDialog")
+MeasureToolDialog = DeferredDialog("mod.widgets.dock.postprocessing.measuretool_dialog", "MeasureToolDialog")
+PartVTKDialog = DeferredDialog("mod.widgets.dock.postprocessing.partvtk_dialog", "PartVTKDialog")
+
+# Special options
+AccelerationInputDialog = DeferredDialog("mod.widgets.dock.special_widgets.acceleration_input_dialog", "AccelerationInputDialog")
+ChronoConfigDialog = DeferredDialog("mod.widgets.dock.special_widgets.chrono.chrono_config_dialog", "ChronoConfigDialog")
+DampingBoxConfigDialog = DeferredDialog("mod.widgets.dock.special_widgets.damping.damping_box_config_dialog", "DampingBoxConfigDialog")
+DampingCylinderConfigDialog = DeferredDialog("mod.widgets.dock.special_widgets.damping.damping_cylinder_dialog", "DampingCylinderConfigDialog")
+DampingZoneConfigDialog = DeferredDialog("mod.widgets.dock.special_widgets.damping.damping_zone_config_dialog", "DampingZoneConfigDialog")
+FlexStructDialog = DeferredDialog("mod.widgets.dock.special_widgets.flex_struct_dialog", "FlexStructDialog")
+GaugesListDialog = DeferredDialog("mod.widgets.dock.special_widgets.gauges.gauges_list_dialog", "GaugesListDialog")
+InletConfigDialog = DeferredDialog("mod.widgets.dock.special_widgets.inout.inlet_config_dialog", "InletConfigDialog")
+MLPiston1DConfigDialog = DeferredDialog("mod.widgets.dock.special_widgets.ml_piston_1d_config_dialog", "MLPiston1DConfigDialog")
+MLPiston2DConfigDialog = DeferredDialog("mod.widgets.dock.special_widgets.ml_piston_2d_config_dialog", "MLPiston2DConfigDialog")
+MooringsConfigurationDialog = DeferredDialog("mod.widgets.dock.special_widgets.moorings.moorings_configuration_dialog", "MooringsConfigurationDialog")
+OutpartsDialog = DeferredDialog("mod.widgets.dock.special_widgets.outfilters.outparts_dialog", "OutpartsDialog")
+RelaxationZoneFileConfigDialog = DeferredDialog("mod.widgets.dock.special_widgets.relaxation_zone.relaxation_zone_file_config_dialog", "RelaxationZoneFileConfigDialog")
+RelaxationZoneIrregularConfigDialog = DeferredDialog("mod.widgets.dock.special_widgets.relaxation_zone.relaxation_zone_irregular_config_dialog", "RelaxationZoneIrregularConfigDialog")
+RelaxationZoneRegularConfigDialog = DeferredDialog("mod.widgets.dock.special_widgets.relaxation_zone.relaxation_zone_regular_config_dialog", "RelaxationZoneRegularConfigDialog")
+RelaxationZoneUniformConfigDialog = DeferredDialog("mod.widgets.dock.special_widgets.relaxation_zone.relaxation_zone_uniform_config_dialog", "RelaxationZoneUniformConfigDialog")
+VariableResConfigDialog = DeferredDialog("mod.widgets.dock.special_widgets.variable_res.variable_res_config_dialog", "VariableResConfigDialog")
+
+# Object properties
+BoundNormalsDialog = DeferredDialog("mod.widgets.properties_widgets.bound_normals_dialog", "BoundNormalsDialog")
+FacesDialog = DeferredDialog("mod.widgets.properties_widgets.faces_dialog", "FacesDialog")
+FloatStateDialog = DeferredDialog("mod.widgets.properties_widgets.float_state_dialog", "FloatStateDialog")
+InitialsDialog = DeferredDialog("mod.widgets.properties_widgets.initials_dialog", "InitialsDialog")
+MaterialDialog = DeferredDialog("mod.widgets.properties_widgets.material_dialog", "MaterialDialog")
+MDBCDialog = DeferredDialog("mod.widgets.properties_widgets.mdbc_dialog", "MDBCDialog")
+MovementDialog = DeferredDialog("mod.widgets.properties_widgets.motion.movement_dialog", "MovementDialog")
+SimObjectDialog = DeferredDialog("mod.widgets.properties_widgets.sim_object_dialog", "SimObjectDialog")
@@ -7,9 +7,7 @@ from PySide2 import QtWidgets
 
 from mod.dataobjects.case import Case
 from mod.tools.translation_tools import __
-from mod.widgets.dock.dock_widgets.constants_dialog import ConstantsDialog
-from mod.widgets.dock.dock_widgets.execution_parameters_dialog import ExecutionParametersDialog
-from mod.widgets.dock.dock_widgets.setup_plugin_dialog import SetupPluginDialog
+from mod.widgets.dialog_registry import ConstantsDialog, ExecutionParametersDialog, SetupPluginDialog
 
 
 class DockConfigurationWidget(QtWidgets.QWidget):
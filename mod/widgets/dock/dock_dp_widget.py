@@ -9,6 +9,7 @@ from mod.tools.translation_tools import __
 
 from mod.dataobjects.case import Case
 from mod.tools.freecad_tools import update_dp
+from mod.tools.particle_estimation_tools import estimate_case_particles, format_particle_count, format_size
 from mod.tools.translation_tools import __
 from mod.widgets.custom_widgets.value_input import ValueInput
 from mod.widgets.custom_widgets.size_input import SizeInput
@@ -31,8 +32,17 @@ class DockDPWidget(QtWidgets.QWidget):
         self.dp_input.setValue(Case.the().dp)
         self.dp_input.value_changed.connect(self.on_dp_changed)
 
+        self.estimate_label = QtWidgets.QLabel()
+        self.estimate_refresh_button = QtWidgets.QToolButton()
+        self.estimate_refresh_button.setText("\u27f3")
+        self.estimate_refresh_button.setToolTip(__("Refresh the particle estimation."))
+        self.estimate_refresh_button.clicked.connect(self.update_particle_estimate)
+
         self.main_layout.addWidget(self.dp_label)
         self.main_layout.addWidget(self.dp_input)
+        self.main_layout.addStretch(1)
+        self.main_layout.addWidget(self.estimate_label)
+        self.main_layout.addWidget(self.estimate_refresh_button)
 
         self.setLayout(self.main_layout)
 
@@ -41,4 +51,23 @@ class DockDPWidget(QtWidgets.QWidget):
         dp=self.dp_input.value()
         Case.the().dp = dp
         update_dp(dp)
+        self.update_particle_estimate()
+
+    def update_particle_estimate(self):
+        """ Shows the approximate number of particles of the case at the current dp and the resources they need. """
+        estimate = estimate_case_particles(Case.the())
+        self.estimate_label.setText(__("~{} particles").format(format_particle_count(estimate.total)))
+        tooltip = [
+            __("Approximate values before running GenCase:"),
+            __("Fluid particles: {}").format(format_particle_count(estimate.fluid)),
+            __("Boundary particles: {} ({} moving)").format(format_particle_count(estimate.bound),
+                                                            format_particle_count(estimate.moving_bound)),
+            __("Solver memory: {}").format(format_size(estimate.solver_memory())),
+            __("Size of each output part: {}").format(format_size(estimate.part_size()))
+        ]
+        if Case.the().info.particle_number:
+            tooltip.append(__("Particles in the last GenCase run: {}").format(Case.the().info.particle_number))
+        if estimate.skipped_objects:
+            tooltip.append(__("Not estimated: {}").format(", ".join(estimate.skipped_objects)))
+        self.estimate_label.setToolTip("\n".join(tooltip))
 
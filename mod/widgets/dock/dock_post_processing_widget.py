@@ -4,12 +4,8 @@
 
 from PySide2 import QtWidgets
 from mod.tools.translation_tools import __
-from mod.widgets.dock.postprocessing.computeforces_dialog import ComputeForcesDialog
-from mod.widgets.dock.postprocessing.floatinginfo_dialog import FloatingInfoDialog
-from mod.widgets.dock.postprocessing.flowtool_dialog import FlowToolDialog
-from mod.widgets.dock.postprocessing.isosurface_dialog import IsoSurfaceDialog
-from mod.widgets.dock.postprocessing.measuretool_dialog import MeasureToolDialog
-from mod.widgets.dock.postprocessing.partvtk_dialog import PartVTKDialog
+from mod.widgets.dialog_registry import ComputeForcesDialog, FloatingInfoDialog, FlowToolDialog, IsoSurfaceDialog, \
+    MeasureToolDialog, PartVTKDialog
 
 
 class DockPostProcessingWidget(QtWidgets.QWidget):
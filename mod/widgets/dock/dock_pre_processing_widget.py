@@ -14,9 +14,10 @@ from mod.appmode import AppMode
 from mod.constants import CASE_LIMITS_OBJ_NAME, CASE_LIMITS_2D_LABEL, CASE_LIMITS_3D_LABEL, WIDTH_2D
 from mod.dataobjects.case import Case
 from mod.dataobjects.configuration.application_settings import ApplicationSettings
-from mod.tools.dialog_tools import error_dialog, warning_dialog, WaitDialog, info_dialog
+from mod.tools.dialog_tools import error_dialog, warning_dialog, info_dialog, StageProgressDialog
 from mod.tools.dialog_tools import ok_cancel_dialog
-from mod.enums import SDPositionPropertyType
+from mod.tools.case_validation_tools import check_helpers_in_domain, confirm_case_validation, get_domain_limits, \
+    log_validation_issues, validate_case
 from mod.tools.executable_tools import refocus_cwd, ensure_process_is_executable_or_fail
 from mod.tools.file_tools import save_case, load_case, save_extra_files
 from mod.tools.freecad_tools import document_count, prompt_close_all_documents, create_dsph_document, \
@@ -25,16 +26,13 @@ from mod.tools.freecad_tools import document_count, prompt_close_all_documents,
 from mod.tools.freecad_tools import get_fc_main_window, valid_document_environment, save_current_freecad_document, \
     get_fc_object
 from mod.functions import has_special_char, parse_ds_int
+from mod.tools.gencase_tools import GENCASE_STAGES, GencaseRun, store_gencase_history
 from mod.tools.gui_tools import get_icon
 from mod.tools.script_tools import generate_ext_script
 from mod.tools.stdout_tools import error, log, debug
 from mod.tools.translation_tools import __
-from mod.widgets.dock.dock_widgets.add_bathymetry_dialog import AddBathymetryDialog
-from mod.widgets.dock.dock_widgets.add_geo_dialog import AddGeoDialog
-from mod.widgets.dock.dock_widgets.case_summary import CaseSummary
-from mod.widgets.dock.dock_widgets.gencase_completed_dialog import GencaseCompletedDialog
-from mod.widgets.dock.dock_widgets.mode_2d_config_dialog import Mode2DConfigDialog
-from mod.widgets.dock.special_widgets.special_options_selector_dialog import SpecialOptionsSelectorDialog
+from mod.widgets.dialog_registry import AddBathymetryDialog, AddGeoDialog, CaseSummary, GencaseCompletedDialog, \
+    Mode2DConfigDialog, SpecialOptionsSelectorDialog
 
 
 class DockPreProcessingWidget(QtWidgets.QWidget):
@@ -50,6 +48,8 @@ class DockPreProcessingWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent=parent)
 
+        self.gencase_run: GencaseRun = None
+
         self.main_layout = QtWidgets.QVBoxLayout()
         self.main_layout.setContentsMargins(0, 0, 0, 0)
 
@@ -146,9 +146,9 @@ class DockPreProcessingWidget(QtWidgets.QWidget):
         self.load_button.clicked.connect(self.on_load_button)
         self.add_fillbox_button.clicked.connect(self.on_add_fillbox)
         self.add_geometry_button.clicked.connect(self.on_add_geo)
-        self.case_summary_button.clicked.connect(CaseSummary)
+        self.case_summary_button.clicked.connect(lambda: CaseSummary())
         self.toggle_2d_mode_button.clicked.connect(self.on_2d_toggle)
-        self.special_button.clicked.connect(SpecialOptionsSelectorDialog)
+        self.special_button.clicked.connect(lambda: SpecialOptionsSelectorDialog())
 
         self.label_layout.addWidget(self.casecontrols_label)
         self.label_layout.addStretch(1)
@@ -229,6 +229,7 @@ class DockPreProcessingWidget(QtWidgets.QWidget):
         save_case(save_name, Case.the())
 
         save_current_freecad_document(Case.the().path)
+        log_validation_issues(validate_case(Case.the()))
         if Case.the().has_materials() and Case.the().execution_parameters.rigidalgorithm not in (2, 3):
             warning_dialog(
                 __("Properties and Material information was not written. See details for more info."),
@@ -254,9 +255,8 @@ class DockPreProcessingWidget(QtWidgets.QWidget):
             self.on_generate_gencase_script()
 
     def on_execute_gencase(self):
-        """ Saves data into disk and uses GenCase to generate the case files."""
-        wait_dialog = WaitDialog("Gencase is running.please wait")
-        wait_dialog.show()
+        """ Saves data into disk and uses GenCase to generate the case files.
+        The output of GenCase is shown while it runs, with the time spent in each stage, and it can be cancelled. """
         if not Case.the().path:
             error_dialog(__("The case must be saved before running GenCase."))
             self.on_save_case()
@@ -276,6 +276,9 @@ class DockPreProcessingWidget(QtWidgets.QWidget):
                      "-save:+all"]
         cmd_string = "{} {}".format(gencase_full_path, " ".join(arguments))
 
+        if not confirm_case_validation(Case.the(), "GenCase"):
+            return
+
         # Check if the case was already generated
         dirout=str("{path}/{name}_out/".format(path=Case.the().path, name=Case.the().name))
         gencasefile=str("{dirout}/{name}.out".format(dirout=dirout, name=Case.the().name))
@@ -294,23 +297,25 @@ class DockPreProcessingWidget(QtWidgets.QWidget):
                     return
             
         refocus_cwd()
-        process = QtCore.QProcess(get_fc_main_window())
-        process.setWorkingDirectory(Case.the().path)
         try:
             ensure_process_is_executable_or_fail(gencase_full_path)
         except RuntimeError:
-            wait_dialog.close_dialog()
             error_dialog("GenCase executable is invalid, does not have execution permissions or it's path is incorrect")
             return
-        process.start(gencase_full_path, arguments)
-        log("Executing -> {}".format(cmd_string))
 
-
-        def on_gencase_finished(exit_code):
-            try:
-                output = str(process.readAllStandardOutput().data(), encoding='utf-8')
-            except UnicodeDecodeError:
-                output = str(process.readAllStandardOutput().data(), encoding='latin1')
+        progress_dialog = StageProgressDialog("GenCase is running. Please wait.", len(GENCASE_STAGES), cancellable=True)
+        self.gencase_run = GencaseRun(gencase_full_path, arguments, Case.the().path, parent=get_fc_main_window())
+        self.gencase_run.stage_started.connect(progress_dialog.start_stage)
+        self.gencase_run.progress.connect(progress_dialog.update_info)
+        progress_dialog.cancel_requested.connect(self.gencase_run.cancel)
+
+        def on_gencase_finished(exit_code, output):
+            progress_dialog.close_dialog()
+            store_gencase_history(Case.the(), self.gencase_run)
+            if self.gencase_run.cancelled:
+                log("GenCase was cancelled after {:.1f} s".format(self.gencase_run.total_time))
+                Case.the().info.recommends_to_run_gencase = True
+                return
 
             if exit_code:
                 error_dialog(
@@ -335,9 +340,10 @@ class DockPreProcessingWidget(QtWidgets.QWidget):
                     print_exc()
                     Case.the().info.recommends_to_run_gencase = True
 
-            # Refresh widget enable/disable status as GenCase finishes
-            wait_dialog.close_dialog()
-        process.finished.connect(on_gencase_finished)
+        self.gencase_run.finished.connect(on_gencase_finished)
+        progress_dialog.show()
+        log("Executing -> {}".format(cmd_string))
+        self.gencase_run.start()
 
     def on_generate_gencase_script(self):
         """ Generates custom script for running gencase externally"""
@@ -502,64 +508,12 @@ def manage_simulation_domain(particle_limits_text : str):
     particles_limit_max_y = float(particles_limit_y[1])
     particles_limit_min_z = float(particles_limit_z[0])
     particles_limit_max_z = float(particles_limit_z[1])
-    sd = Case.the().domain
-    #min_x
-    if sd.posmin_x.type==SDPositionPropertyType.DEFAULT:
-        min_x=particles_limit_min_x
-    elif sd.posmin_x.type==SDPositionPropertyType.VALUE:
-        min_x=sd.posmin_x.value
-    elif sd.posmin_x.type==SDPositionPropertyType.DEFAULT_VALUE:
-        min_x = particles_limit_min_x-sd.posmin_x.value
-    else:
-        min_x = particles_limit_min_x - sd.posmin_x.value*particles_limit_min_x / 100
-    #min_y
-    if sd.posmin_y.type == SDPositionPropertyType.DEFAULT:
-        min_y = particles_limit_min_y
-    elif sd.posmin_y.type == SDPositionPropertyType.VALUE:
-        min_y = sd.posmin_y.value
-    elif sd.posmin_y.type == SDPositionPropertyType.DEFAULT_VALUE:
-        min_y = particles_limit_min_y - sd.posmin_y.value
-    else:
-        min_y = particles_limit_min_y - sd.posmin_y.value * particles_limit_min_y / 100
-    #min_z
-    if sd.posmin_z.type == SDPositionPropertyType.DEFAULT:
-        min_z = particles_limit_min_z
-    elif sd.posmin_z.type == SDPositionPropertyType.VALUE:
-        min_z = sd.posmin_z.value
-    elif sd.posmin_z.type == SDPositionPropertyType.DEFAULT_VALUE:
-        min_z = particles_limit_min_z - sd.posmin_z.value
-    else:
-        min_z = particles_limit_min_z - sd.posmin_z.value * particles_limit_min_z / 100
-    #MAX
-    # max_x
-    if sd.posmax_x.type == SDPositionPropertyType.DEFAULT:
-        max_x = particles_limit_max_x
-    elif sd.posmax_x.type == SDPositionPropertyType.VALUE:
-        max_x = sd.posmax_x.value
-    elif sd.posmax_x.type == SDPositionPropertyType.DEFAULT_VALUE:
-        max_x = particles_limit_max_x + sd.posmax_x.value
-    else:
-        max_x = particles_limit_max_x + sd.posmax_x.value * particles_limit_max_x / 100
-    # max_y
-    if sd.posmax_y.type == SDPositionPropertyType.DEFAULT:
-        max_y = particles_limit_max_y
-    elif sd.posmax_y.type == SDPositionPropertyType.VALUE:
-        max_y = sd.posmax_y.value
-    elif sd.posmax_y.type == SDPositionPropertyType.DEFAULT_VALUE:
-        max_y = particles_limit_max_y + sd.posmax_y.value
-    else:
-        max_y = particles_limit_max_y + sd.posmax_y.value * particles_limit_max_y / 100
-    # max_z
-    if sd.posmax_z.type == SDPositionPropertyType.DEFAULT:
-        max_z = particles_limit_max_z
-    elif sd.posmax_z.type == SDPositionPropertyType.VALUE:
-        max_z = sd.posmax_z.value
-    elif sd.posmax_z.type == SDPositionPropertyType.DEFAULT_VALUE:
-        max_z = particles_limit_max_z + sd.posmax_z.value
-    else:
-        max_z = particles_limit_max_z + sd.posmax_z.value * particles_limit_max_z / 100
-    
-    update_simulation_domain(min_x,min_y,min_z,max_x,max_y,max_z)
+    domain_min, domain_max = get_domain_limits(
+        Case.the().domain,
+        [particles_limit_min_x, particles_limit_min_y, particles_limit_min_z],
+        [particles_limit_max_x, particles_limit_max_y, particles_limit_max_z])
+    update_simulation_domain(*domain_min, *domain_max)
+    log_validation_issues(check_helpers_in_domain(Case.the(), domain_min, domain_max, AppMode.is_3d()))
 
 
 
@@ -9,18 +9,25 @@ from sys import platform
 from PySide2 import QtWidgets, QtCore
 from PySide2.QtWidgets import QAction
 
+from mod.constants import WATCHDOG_MAX_AUTO_RESUMES
 from mod.dataobjects.case import Case
 from mod.dataobjects.configuration.application_settings import ApplicationSettings
-from mod.tools.dialog_tools import error_dialog, warning_dialog, info_dialog
+from mod.tools.case_validation_tools import confirm_case_validation
+from mod.tools.dialog_tools import error_dialog, warning_dialog, info_dialog, ok_cancel_dialog
+from mod.tools.disk_output_tools import plan_disk_output
 from mod.tools.executable_tools import refocus_cwd, ensure_process_is_executable_or_fail
 from mod.tools.freecad_tools import get_fc_main_window
 from mod.functions import parse_ds_int
 from mod.tools.gui_tools import get_icon
+from mod.tools.particle_estimation_tools import format_size
+from mod.tools.run_profile_tools import get_active_run_profile, get_profile_parameters, start_with_run_profile
 from mod.tools.script_tools import generate_ext_script
+from mod.tools.simulation_tools import find_resume_part, get_resume_parameters, remove_parts_after, store_run_segment, \
+    stitch_run_output
 from mod.tools.stdout_tools import log, debug
+from mod.tools.watchdog_tools import SimulationWatchdog
 from mod.tools.translation_tools import __
-from mod.widgets.dock.dock_widgets.run_additional_parameters_dialog import RunAdditionalParametersDialog
-from mod.widgets.dock.dock_widgets.run_dialog import RunDialog
+from mod.widgets.dialog_registry import RunAdditionalParametersDialog, RunDialog, RunProfilesDialog
 
 
 class DockSimulationWidget(QtWidgets.QWidget):
@@ -65,9 +72,12 @@ class DockSimulationWidget(QtWidgets.QWidget):
         self.execute_menu = QtWidgets.QMenu()
         self.action_run = QAction(__("Local Run"))
         self.action_run.setIcon(get_icon("run.png"))
+        self.action_resume = QAction(__("Resume Run"))
+        self.action_resume.setIcon(get_icon("run.png"))
+        self.action_resume.setToolTip(__("Resumes an interrupted simulation from its last complete part."))
         self.action_generate_script = QAction(__("Generate_script"))
         self.action_generate_script.setIcon(get_icon("save.png"))
-        self.execute_menu.addActions([self.action_run, self.action_generate_script])
+        self.execute_menu.addActions([self.action_run, self.action_resume, self.action_generate_script])
 
         self.execute_button.setMenu(self.execute_menu)
         self.execute_menu.triggered.connect(self.on_simulate_menu)
@@ -80,19 +90,40 @@ class DockSimulationWidget(QtWidgets.QWidget):
         self.additional_parameters_button.setToolTip(__("Sets simulation additional parameters for execution."))
         self.additional_parameters_button.clicked.connect(self.on_additional_parameters)
 
+        # CPU run profile selection
+        self.run_profile_selector = QtWidgets.QComboBox()
+        self.run_profile_selector.setToolTip(__("CPU threads, binding and priority used to run the solver."))
+        self.run_profiles_button = QtWidgets.QPushButton("...")
+        self.run_profiles_button.setToolTip(__("Edits the run profiles."))
+        self.run_profiles_button.setFixedWidth(30)
+        self.update_run_profile_selector()
+        self.run_profile_selector.currentIndexChanged.connect(self.on_run_profile_changed)
+        self.run_profiles_button.clicked.connect(self.on_run_profiles)
+
         self.button_layout = QtWidgets.QHBoxLayout()
         self.button_layout.addWidget(self.execute_button)
         self.button_layout.addWidget(self.device_selector)
         #self.button_layout.addWidget(self.executable_selector)
         self.button_layout.addWidget(self.additional_parameters_button)
 
+        self.run_profile_layout = QtWidgets.QHBoxLayout()
+        self.run_profile_layout.addWidget(QtWidgets.QLabel(__("Run profile: ")))
+        self.run_profile_layout.addWidget(self.run_profile_selector, 1)
+        self.run_profile_layout.addWidget(self.run_profiles_button)
+
         self.main_layout.addWidget(self.title_label)
         self.main_layout.addLayout(self.button_layout)
+        self.main_layout.addLayout(self.run_profile_layout)
 
         #self.main_layout.setSizeConstraint(QtWidgets.QLayout.SetFixedSize)
 
         self.setLayout(self.main_layout)
 
+        # Simulation watchdog of the running simulation
+        self.watchdog = None
+        self.watchdog_restart_pending: bool = False
+        self.watchdog_resume_count: int = 0
+
     def update_simulate_menu(self):
         if (ApplicationSettings.the().basic_visualization):
             if self.execute_menu.actions():
@@ -100,21 +131,27 @@ class DockSimulationWidget(QtWidgets.QWidget):
             self.on_simulate_menu(self.action_run)
         else:
             if not self.execute_menu.actions():
-                self.execute_menu.addActions([self.action_run,self.action_generate_script])
+                self.execute_menu.addActions([self.action_run, self.action_resume, self.action_generate_script])
 
     def on_simulate_menu(self,action):
         """ Handles the new document button and its dropdown items. """
         if __("Local Run") in action.text():
             self.on_ex_simulate()
 
+        if __("Resume Run") in action.text():
+            self.on_ex_simulate(resume=True)
+
         if __("Generate script") in action.text():
             self.on_ex_simulate(generate_script=True)
 
-    def on_ex_simulate(self,generate_script=False):
+    def on_ex_simulate(self,generate_script=False,resume=False):
         """ Defines what happens on simulation button press.
-            It shows the run window and starts a background process with dualsphysics running. Updates the window with useful info."""
+            It shows the run window and starts a background process with dualsphysics running. Updates the window with useful info.
+            If resume is set, the simulation is restarted from the last complete part, keeping the previous outputs."""
 
         refocus_cwd()
+        if not resume:
+            self.watchdog_resume_count = 0
         if self.device_selector.currentIndex()==0:
             device="cpu"
         elif self.device_selector.currentIndex()==1:
@@ -130,10 +167,24 @@ class DockSimulationWidget(QtWidgets.QWidget):
                            Case.the().get_out_xml_file_path()+".xml not found")
             return
 
-        if Case.the().info.recommends_to_run_gencase and not generate_script:
+        # A resumed simulation continues with the case it was started with
+        if Case.the().info.recommends_to_run_gencase and not generate_script and not resume:
             # Warning window about save_case
             warning_dialog("You should run GenCase again. Otherwise, the obtained results may not be as expected")
 
+        if not generate_script and not resume and not confirm_case_validation(Case.the(), "the simulation"):
+            return
+
+        if not generate_script and not resume:
+            output_plan = plan_disk_output(Case.the())
+            if output_plan.exceeds_free_space():
+                answer = ok_cancel_dialog(__("Not enough disk space"), __(
+                    "The simulation output is predicted to take {} but only {} are free in the output folder.\n"
+                    "Increase the time out data or add output filters to reduce it. Run anyway?"
+                ).format(format_size(output_plan.total_size), format_size(output_plan.free_space)))
+                if answer == QtWidgets.QMessageBox.Cancel:
+                    return
+
         if not Case.the().vres.active:
             vres=False
             outdatadir=Case.the().path + "/" + Case.the().name + "_out/data/"
@@ -157,7 +208,20 @@ class DockSimulationWidget(QtWidgets.QWidget):
         if Case.the().info.run_additional_parameters:
             additional_parameters = Case.the().info.run_additional_parameters.split(" ")
 
-        final_params_ex = static_params_exe + additional_parameters
+        run_profile = get_active_run_profile()
+        final_params_ex = static_params_exe + get_profile_parameters(run_profile, device) + additional_parameters
+
+        resume_part = -1
+        if resume:
+            if vres:
+                warning_dialog(__("Variable resolution simulations can't be resumed. Run the simulation again."))
+                return
+            resume_part = find_resume_part(Case.the().get_out_folder_path(), outdatadir)
+            if resume_part < 0:
+                warning_dialog(__("The simulation can't be resumed: no complete part was found in {}").format(outdatadir))
+                return
+            log("Resuming simulation from Part_{:04d}".format(resume_part))
+            final_params_ex += get_resume_parameters(resume_part, outdatadir)
         cmd_string = "{} {}".format(Case.the().executable_paths.dsphysics, " ".join(final_params_ex))
 
         if generate_script:
@@ -166,13 +230,13 @@ class DockSimulationWidget(QtWidgets.QWidget):
              "{name}_out/".format(name=Case.the().name),
              f"-{device}",
              "-svres",
-             "-dirdataout data"]
+             "-dirdataout data"] + get_profile_parameters(run_profile, device)
 
             if vres:
                 args.append("-vres")
-                generate_ext_script("simulate_vres",args,"")
+                generate_ext_script("simulate_vres",args,"",run_profile)
             else:
-                generate_ext_script("simulate", args, "")
+                generate_ext_script("simulate", args, "", run_profile)
             return
 
         run_dialog = RunDialog(case_name=Case.the().name, processor=self.device_selector.currentText(), number_of_particles=Case.the().info.particle_number, cmd_string=cmd_string, parent=None)
@@ -186,6 +250,8 @@ class DockSimulationWidget(QtWidgets.QWidget):
         # Cancel button handler
         def on_cancel():
             log(__("Stopping simulation"))
+            if self.watchdog:
+                self.watchdog.stop()
             if process:
                 process.kill()
             run_dialog.hide_all()
@@ -201,8 +267,22 @@ class DockSimulationWidget(QtWidgets.QWidget):
         def on_dsph_sim_finished(exit_code):
             """ Simulation finish handler. Defines what happens when the process finishes."""
             log(f"Exit code: {exit_code}")
+            if self.watchdog:
+                self.watchdog.stop()
+            if self.watchdog_restart_pending:
+                # Killed by the watchdog, the simulation continues from its last complete part
+                self.watchdog_restart_pending = False
+                run_fs_watcher.removePath(outdatadir)
+                run_dialog.hide_all()
+                QtCore.QTimer.singleShot(0, lambda: self.on_ex_simulate(resume=True))
+                return
             # Reads output from the .out file and completes the progress bar
             output = ""
+            try:
+                # Joins the logs of the runs interrupted before resuming
+                stitch_run_output(Case.the().get_out_folder_path())
+            except OSError as ex:
+                debug("Unable to stitch the run logs: {}".format(ex))
             try:
                 with open(Case.the().path + "/" + Case.the().name + "_out/Run.out", "r", encoding="utf-8") as run_file:
                     output = "".join(run_file.readlines())
@@ -224,6 +304,8 @@ class DockSimulationWidget(QtWidgets.QWidget):
             else:
                 # In case of an error
                 Case.the().info.recommends_to_run_gencase = True
+                if not vres and find_resume_part(Case.the().get_out_folder_path(), outdatadir) > 0:
+                    log(__("The simulation can be resumed from its last complete part with 'Resume Run'."))
                 if "exception" in str(output).lower():
                     log("There was an error on the execution. Opening an error dialog for that.")
                     run_dialog.hide()
@@ -252,6 +334,10 @@ class DockSimulationWidget(QtWidgets.QWidget):
                 if os.path.exists(Case.the().path + "/" + Case.the().name + "_out/data_vres00/"):
                     warning_dialog("It looks like you are simulating a VRES case. Please select VRes in simulation control panel")
                     return 1
+            elif resume:
+                # Outputs up to the resumed part are kept
+                remove_parts_after(outdatadir, resume_part)
+                store_run_segment(Case.the().get_out_folder_path(), resume_part)
             else:
                 filelist = [f for f in os.listdir(outdatadir) if
                             f.startswith("Part")]
@@ -259,7 +345,7 @@ class DockSimulationWidget(QtWidgets.QWidget):
                     os.remove(outdatadir + f)
             ensure_process_is_executable_or_fail(Case.the().executable_paths.dsphysics)
             log(f"{Case.the().executable_paths.dsphysics} {final_params_ex}")
-            process.start(Case.the().executable_paths.dsphysics, final_params_ex)
+            start_with_run_profile(process, Case.the().executable_paths.dsphysics, final_params_ex, run_profile)
         else:
             if platform in ("linux", "linux2"):
                 os.environ["LD_LIBRARY_PATH"] = os.path.dirname(Case.the().executable_paths.dsphysics)
@@ -275,7 +361,7 @@ class DockSimulationWidget(QtWidgets.QWidget):
                 for f in filelist:
                     os.remove(Case.the().path + "/" + Case.the().name + "_out/" + d +os.sep+ f)
             ensure_process_is_executable_or_fail(Case.the().executable_paths.dsphysics)
-            process.start(Case.the().executable_paths.dsphysics, final_params_ex)
+            start_with_run_profile(process, Case.the().executable_paths.dsphysics, final_params_ex, run_profile)
         log("Simulation just started")
 
         def on_fs_change():
@@ -332,12 +418,54 @@ class DockSimulationWidget(QtWidgets.QWidget):
             error_dialog("Error on simulation start. Check that the DualSPHysics executable is correctly set.")
         else:
             run_dialog.show()
+            if ApplicationSettings.the().watchdog_enabled:
+                self.start_watchdog(process, outdatadir, can_resume=not vres)
 
         if not os.path.exists(outdatadir):
             os.mkdir(outdatadir)
         run_fs_watcher.addPath(outdatadir)
         run_fs_watcher.directoryChanged.connect(on_fs_change)
 
+    def start_watchdog(self, process, outdatadir: str, can_resume: bool):
+        """ Starts watching the running simulation for stalls and throughput collapses. """
+        settings = ApplicationSettings.the()
+        self.watchdog = SimulationWatchdog(process, Case.the().get_out_folder_path(), outdatadir,
+                                           settings.watchdog_stall_minutes, settings.watchdog_min_throughput_ratio, parent=self)
+
+        def on_watchdog_alert(description, report):
+            if settings.watchdog_auto_resume and can_resume and self.watchdog_resume_count < WATCHDOG_MAX_AUTO_RESUMES:
+                self.watchdog_resume_count += 1
+                log(__("Killing the simulation to resume it from its last complete part ({}/{})").format(
+                    self.watchdog_resume_count, WATCHDOG_MAX_AUTO_RESUMES))
+                self.watchdog_restart_pending = True
+                process.kill()
+            else:
+                warning_dialog(__("The simulation watchdog found a problem: {}").format(description), report)
+
+        self.watchdog.alert.connect(on_watchdog_alert)
+        self.watchdog.start()
+
+    def update_run_profile_selector(self):
+        """ Fills the run profile selector with the stored profiles and selects the active one. """
+        self.run_profile_selector.blockSignals(True)
+        self.run_profile_selector.clear()
+        self.run_profile_selector.addItem(__("Default"))
+        profile_names = [profile["name"] for profile in ApplicationSettings.the().run_profiles]
+        self.run_profile_selector.addItems(profile_names)
+        active_name = ApplicationSettings.the().run_profile_name
+        self.run_profile_selector.setCurrentIndex(profile_names.index(active_name) + 1 if active_name in profile_names else 0)
+        self.run_profile_selector.blockSignals(False)
+
+    def on_run_profile_changed(self, index):
+        """ Stores the selected run profile as the active one. """
+        ApplicationSettings.the().run_profile_name = self.run_profile_selector.itemText(index) if index > 0 else ""
+        ApplicationSettings.the().persist()
+
+    def on_run_profiles(self):
+        """ Opens the run profiles editor. """
+        RunProfilesDialog(parent=None)
+        self.update_run_profile_selector()
+
     def on_additional_parameters(self):
         """ Handles additional parameters button for execution """
         RunAdditionalParametersDialog(parent=None)
@@ -3,20 +3,17 @@
 """DesignSPHysics Add STL Dialog. """
 import os
 from os.path import dirname
-from tempfile import gettempdir
-from uuid import uuid4
 
 from PySide2 import QtCore, QtWidgets
 from mod.dataobjects.case import Case
-from mod.tools.dialog_tools import error_dialog, WaitDialog, warning_dialog
+from mod.tools.bathymetry_tools import BathymetryToolRun
+from mod.tools.dialog_tools import error_dialog, warning_dialog
 from mod.tools.executable_tools import ensure_process_is_executable_or_fail
 from mod.tools.file_tools import import_geo
-from mod.tools.freecad_tools import get_fc_main_window
-from mod.tools.stdout_tools import log
+from mod.tools.freecad_tools import get_fc_main_window, get_fc_object
 from mod.tools.translation_tools import __
 from mod.widgets.custom_widgets.size_input import SizeInput
 from mod.widgets.custom_widgets.value_input import ValueInput
-from mod.widgets.dock.dock_widgets.add_geo_dialog import WorkingDialog
 
 class AddBathymetryDialog(QtWidgets.QDialog):
     """ A dialog that shows option to import a geometry passed as parameter """
@@ -415,6 +412,11 @@ class AddBathymetryDialog(QtWidgets.QDialog):
         self.geo_group_layout.addLayout(self.geo_autofil_layout)
         self.geo_group.setLayout(self.geo_group_layout)
 
+        # Status of the BathymetryTool runs
+        self.bathymetry_runs: list = list()
+        self.running_names: list = list()
+        self.bath_status_label = QtWidgets.QLabel()
+
         # Create button layout
         self.geo_button_layout = QtWidgets.QHBoxLayout()
         self.geo_button_ok = QtWidgets.QPushButton(__("Import"))
@@ -427,6 +429,7 @@ class AddBathymetryDialog(QtWidgets.QDialog):
 
         # Compose main window layout
         self.geo_dialog_layout.addWidget(self.geo_group)
+        self.geo_dialog_layout.addWidget(self.bath_status_label)
         self.geo_dialog_layout.addLayout(self.geo_button_layout)
 
         self.setLayout(self.geo_dialog_layout)
@@ -666,34 +669,14 @@ class AddBathymetryDialog(QtWidgets.QDialog):
 
     def geo_ok_clicked(self):
         """ Defines ok button behaviour"""
-        wait_dialog = WaitDialog("Geometry is being imported.Please wait")
-        wait_dialog.show()
         try:
             self.execute_bathymetry_tool()
         except ValueError:
             error_dialog(__("There was an error with bathymetry tool"))
 
-    def execute_bathymetry_tool(self):
-        """ Executes bathymetry tool and returns the output path of the generated file. """
-
-        export_process = QtCore.QProcess(get_fc_main_window())
-        temp_dir = gettempdir()
-        working_dialog = WorkingDialog(self)
-
-        def on_export_finished():
-            temp_bathymetry_file_path = "{}/output.stl".format(temp_dir)
-            import_geo(filename=str(temp_bathymetry_file_path),
-                       scale_x=1.0,
-                       scale_y=1.0,
-                       scale_z=1.0,
-                       name=str(self.geo_objname_text.text()),
-                       autofill=self.geo_autofill_chck.isChecked(),
-                       case=Case.the())
-            working_dialog.accept()
-
+    def get_bathymetry_tool_parameters(self) -> list:
+        """ Returns the BathymetryTool parameters for the selected options, without the input and output files. """
         executable_parameters = [
-            "-loadpos",
-            self.geo_file_path.text(),
             "-move:{}:{}:{}".format(self.bath_move_x_e.value(),self.bath_move_y_e.value(),self.bath_move_z_e.value()),
             "-rotate:{}:{}:{}".format(self.bath_rotate_x_e.value(),self.bath_rotate_y_e.value(),
                                      self.bath_rotate_z_e.value()),
@@ -747,16 +730,64 @@ class AddBathymetryDialog(QtWidgets.QDialog):
                 "-gmove:{}:{}:{}".format(self.bath_finalmove_x_e.value(),self.bath_finalmove_y_e.value(),
                                         self.bath_finalmove_z_e.value()))
 
-        executable_parameters.append("-savegrid:stl:m")
-        executable_parameters.append("{}/output.stl".format(temp_dir))
+        return executable_parameters
 
+    def execute_bathymetry_tool(self):
+        """ Executes bathymetry tool in background and imports the generated file when it finishes.
+        Several runs can be launched at once, and repeated runs are taken from the cache. """
+        ensure_process_is_executable_or_fail(Case.the().executable_paths.bathymetrytool)
         self.save_default_data()
 
-        export_process.finished.connect(on_export_finished)
-        ensure_process_is_executable_or_fail(Case.the().executable_paths.bathymetrytool)
-        log("Executing: {} {}".format(Case.the().executable_paths.bathymetrytool, " ".join(executable_parameters)))
-        export_process.start(Case.the().executable_paths.bathymetrytool, executable_parameters)
-        working_dialog.exec()
+        name = str(self.geo_objname_text.text())
+        autofill = self.geo_autofill_chck.isChecked()
+        if get_fc_object("external_{}".format(name).replace("-", "_")) or name in self.running_names:
+            warning_dialog("There is already an object in FreeCAD with this name. Choose another name")
+            return
+        # Grids are written in the case folder if it was saved, so the geometry doesn't refer to a temporary file.
+        output_dir = Case.the().path if Case.the().path and os.path.isdir(Case.the().path) else None
+        bathymetry_run = BathymetryToolRun(Case.the().executable_paths.bathymetrytool, self.geo_file_path.text(),
+                                           self.get_bathymetry_tool_parameters(), output_dir=output_dir,
+                                           parent=get_fc_main_window())
+        self.bathymetry_runs.append(bathymetry_run)
+        self.running_names.append(name)
+
+        def on_run_progress(text):
+            self.bath_status_label.setText("{}: {}".format(name, text))
+
+        def on_run_finished(output_file):
+            self.bathymetry_runs.remove(bathymetry_run)
+            self.running_names.remove(name)
+            self.bath_status_label.setText(__("{} imported").format(name))
+            import_geo(filename=str(output_file),
+                       scale_x=1.0,
+                       scale_y=1.0,
+                       scale_z=1.0,
+                       name=name,
+                       autofill=autofill,
+                       case=Case.the())
+
+        def on_run_failed(output):
+            self.bathymetry_runs.remove(bathymetry_run)
+            self.running_names.remove(name)
+            self.bath_status_label.setText(__("{} failed").format(name))
+            error_dialog(__("There was an error with bathymetry tool"), detailed_text=output)
+
+        def on_run_cancelled():
+            self.bathymetry_runs.remove(bathymetry_run)
+            self.running_names.remove(name)
+            self.bath_status_label.setText(__("{} cancelled").format(name))
+
+        bathymetry_run.progress.connect(on_run_progress)
+        bathymetry_run.finished.connect(on_run_finished)
+        bathymetry_run.failed.connect(on_run_failed)
+        bathymetry_run.cancelled.connect(on_run_cancelled)
+        bathymetry_run.start()
+
+    def reject(self):
+        """ Stops the running BathymetryTool executions when the dialog is closed. """
+        for bathymetry_run in self.bathymetry_runs:
+            bathymetry_run.cancel()
+        super().reject()
 
     def geo_dialog_browse(self):
         """ Defines the browse button behaviour."""
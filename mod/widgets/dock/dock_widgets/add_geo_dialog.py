@@ -7,10 +7,11 @@ from tempfile import gettempdir
 from uuid import uuid4
 
 from PySide2 import QtCore, QtWidgets
+from mod.constants import GEO_PREVIEW_MAX_FACES
 from mod.dataobjects.case import Case
-from mod.tools.dialog_tools import error_dialog, WaitDialog, warning_dialog
+from mod.tools.dialog_tools import WaitDialog, warning_dialog
 from mod.tools.executable_tools import ensure_process_is_executable_or_fail
-from mod.tools.file_tools import import_geo
+from mod.tools.file_tools import import_geo, import_geo_batch
 from mod.tools.freecad_tools import get_fc_main_window, get_fc_object
 from mod.tools.stdout_tools import debug, log
 from mod.tools.translation_tools import __
@@ -140,6 +141,20 @@ class AddGeoDialog(QtWidgets.QDialog):
 
         self.geo_decimate_layout.addWidget(self.geo_decimate_reduction_label)
         self.geo_decimate_layout.addWidget(self.geo_decimate_reduction_input)
+
+        # Light preview
+        self.geo_preview_layout = QtWidgets.QHBoxLayout()
+        self.geo_preview_chck = QtWidgets.QCheckBox(__("Light preview"))
+        self.geo_preview_chck.setToolTip(__("Shows a simplified version of huge meshes in the 3D view. "
+                                            "GenCase always uses the full resolution file."))
+        self.geo_preview_max_faces_label = QtWidgets.QLabel(__("Max. triangles"))
+        self.geo_preview_max_faces_input = IntValueInput(min_val=1000)
+        # Set once the range is defined, as the spin box clamps the initial value to its default range.
+        self.geo_preview_max_faces_input.setValue(GEO_PREVIEW_MAX_FACES)
+        self.geo_preview_max_faces_input.setEnabled(False)
+        for x in [self.geo_preview_chck, self.geo_preview_max_faces_label, self.geo_preview_max_faces_input]:
+            self.geo_preview_layout.addWidget(x)
+        self.geo_preview_chck.clicked.connect(self.on_preview_enable)
         self.surface_selection_layout.addWidget(self.geo_vtm_select_all_button)
         self.surface_selection_layout.addWidget(self.geo_vtm_select_none_button)
         self.surface_selection_layout.addWidget(self.geo_vtm_first_mkbound_label)
@@ -174,6 +189,7 @@ class AddGeoDialog(QtWidgets.QDialog):
         self.geo_group_layout.addLayout(self.adv_draw_layout)
         self.geo_group_layout.addLayout(self.geo_autofil_layout)
         self.geo_group_layout.addLayout(self.geo_decimate_layout)
+        self.geo_group_layout.addLayout(self.geo_preview_layout)
         self.geo_group_layout.addLayout(self.surface_selection_layout)
         self.geo_group_layout.addWidget(self.vtm_options_scroll)
         self.geo_group.setLayout(self.geo_group_layout)
@@ -249,35 +265,30 @@ class AddGeoDialog(QtWidgets.QDialog):
 
     def geo_ok_clicked(self):
         """ Defines ok button behaviour"""
-        wait_dialog = WaitDialog("Geometry is being imported.Please wait")
-        wait_dialog.show()
         if self.vtm_mode:
-            for surf in self.vtm_surfaces_list:
-                wait_dialog.update_info(f"Loading surface n {surf['@index']} named {surf['@name']}")
-                try:
-                    if self.vtm_surfaces_layout_list[int(surf["@index"])].vtm_surface_include.isChecked() :
-                        import_geo(filename=os.path.dirname(self.geo_file_path.text())+ os.sep + surf["@file"],
-                                   scale_x=self.geo_scaling_x_e.value(),
-                                   scale_y=self.geo_scaling_y_e.value(),
-                                   scale_z=self.geo_scaling_z_e.value(),
-                                   name=(surf["@name"]),
-                                   autofill=self.geo_autofill_chck.isChecked(),
-                                   case=Case.the(),
-                                   adm=self.adv_draw_enabled_checkbox.isChecked(),
-                                   adm_reverse=self.adv_draw_reverse_checkbox.isChecked(),
-                                   has_adm_mindepth=self.adv_draw_mindepth_checkbox.isChecked(),
-                                   adm_mindepth=self.adv_draw_mindepth_input.value(),
-                                   has_adm_maxdepth=self.adv_draw_maxdepth_checkbox.isChecked(),
-                                   adm_maxdepth=self.adv_draw_maxdepth_input.value(),
-                                   desired_mkbound=self.vtm_surfaces_layout_list[int(surf["@index"])].vtm_surface_mk.value(),
-                                   draw_as_points=self.geo_draw_as_points_chck.isChecked(),
-                                   decimate=self.geo_decimate_chck.isChecked(),
-                                   reduction=self.geo_decimate_reduction_input.value()
-                                   )
-                except ValueError as err:
-                    error_dialog(__(f"There was an loading error surface {surf['@name']}: {err.with_traceback(__tb=None).__str__()}"))
+            surfaces = [(os.path.dirname(self.geo_file_path.text()) + os.sep + surf["@file"], surf["@name"],
+                         self.vtm_surfaces_layout_list[int(surf["@index"])].vtm_surface_mk.value())
+                        for surf in self.vtm_surfaces_list
+                        if self.vtm_surfaces_layout_list[int(surf["@index"])].vtm_surface_include.isChecked()]
+            import_geo_batch(surfaces, Case.the(),
+                             scale_x=self.geo_scaling_x_e.value(),
+                             scale_y=self.geo_scaling_y_e.value(),
+                             scale_z=self.geo_scaling_z_e.value(),
+                             autofill=self.geo_autofill_chck.isChecked(),
+                             adm=self.adv_draw_enabled_checkbox.isChecked(),
+                             adm_reverse=self.adv_draw_reverse_checkbox.isChecked(),
+                             has_adm_mindepth=self.adv_draw_mindepth_checkbox.isChecked(),
+                             adm_mindepth=self.adv_draw_mindepth_input.value(),
+                             has_adm_maxdepth=self.adv_draw_maxdepth_checkbox.isChecked(),
+                             adm_maxdepth=self.adv_draw_maxdepth_input.value(),
+                             draw_as_points=self.geo_draw_as_points_chck.isChecked(),
+                             decimate=self.geo_decimate_chck.isChecked(),
+                             reduction=self.geo_decimate_reduction_input.value(),
+                             preview_max_faces=self.get_preview_max_faces())
 
         else:
+            wait_dialog = WaitDialog("Geometry is being imported.Please wait")
+            wait_dialog.show()
             name=self.geo_objname_text.text()
             internal_name = "external_{}".format(name).replace("-", "_")
             if get_fc_object(internal_name):  #If there is no object with the same name in FreeCAD
@@ -299,9 +310,10 @@ class AddGeoDialog(QtWidgets.QDialog):
                    adm_maxdepth= self.adv_draw_maxdepth_input.value(),
                    draw_as_points = self.geo_draw_as_points_chck.isChecked(),
                    decimate=self.geo_decimate_chck.isChecked(),
-                   reduction=self.geo_decimate_reduction_input.value()
+                   reduction=self.geo_decimate_reduction_input.value(),
+                   preview_max_faces=self.get_preview_max_faces()
                    )
-        wait_dialog.close_dialog()
+            wait_dialog.close_dialog()
         self.accept()
 
 
@@ -340,6 +352,16 @@ class AddGeoDialog(QtWidgets.QDialog):
     def on_decimate_enable(self, state):
         self.geo_decimate_reduction_input.setEnabled(state)
 
+    def on_preview_enable(self, state):
+        """ Enables the preview size input. A light preview replaces the decimation. """
+        self.geo_preview_max_faces_input.setEnabled(state)
+        self.geo_decimate_chck.setEnabled(not state)
+        self.geo_decimate_reduction_input.setEnabled(not state and self.geo_decimate_chck.isChecked())
+
+    def get_preview_max_faces(self) -> int:
+        """ Returns the number of triangles of the light preview, or 0 if it's disabled. """
+        return self.geo_preview_max_faces_input.value() if self.geo_preview_chck.isChecked() else 0
+
     def on_surface_stl(self):
         dialog = SurfaceStlDialog(self.geo_file_path.text(), parent=None)
         res=dialog.exec_()
@@ -13,6 +13,7 @@ from mod.enums import ObjectType
 from mod.tools.freecad_tools import get_fc_object
 from mod.tools.template_tools import get_template_text, obj_to_dict
 from mod.tools.translation_tools import __
+from mod.widgets.dialog_registry import DataFilesDialog
 
 
 class CaseSummary(QtWidgets.QDialog):
@@ -24,8 +25,15 @@ class CaseSummary(QtWidgets.QDialog):
         super().__init__(parent=parent)
         self.main_layout = QtWidgets.QVBoxLayout()
         self.info = QtWidgets.QTextEdit()
+        self.data_files_button = QtWidgets.QPushButton(__("Check data files"))
+        self.data_files_button.setToolTip(__("Checks and plots the motion, acceleration and velocity files used by the case."))
+        self.data_files_button.clicked.connect(lambda: DataFilesDialog(parent=self))
         self.close_button = QtWidgets.QPushButton(__("Close"))
         self.close_button.clicked.connect(self.accept)
+        self.button_layout = QtWidgets.QHBoxLayout()
+        self.button_layout.addWidget(self.data_files_button)
+        self.button_layout.addStretch(1)
+        self.button_layout.addWidget(self.close_button)
 
         self.info_text = get_template_text(self.CASE_SUMMARY_TEMPLATE).format(**self.get_formatter())
 
@@ -33,7 +41,7 @@ class CaseSummary(QtWidgets.QDialog):
         self.info.setReadOnly(True)
 
         self.main_layout.addWidget(self.info)
-        self.main_layout.addWidget(self.close_button)
+        self.main_layout.addLayout(self.button_layout)
         self.setLayout(self.main_layout)
         self.setModal(True)
         self.setMinimumSize(700, 650)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+""" DesignSPHysics Data Files Dialog """
+
+from PySide2 import QtCore, QtWidgets
+
+from mod.dataobjects.case import Case
+from mod.tools.background_tools import run_in_background
+from mod.tools.case_validation_tools import get_data_files, locate_case_file
+from mod.tools.data_file_tools import scan_data_file
+from mod.tools.dialog_tools import StageProgressDialog
+from mod.tools.translation_tools import __
+from mod.widgets.custom_widgets.series_plot import SeriesPlot
+
+
+class DataFilesDialog(QtWidgets.QDialog):
+    """ Lists the time series files referenced by the case. Selecting one scans it, shows the problems found
+    and plots its columns. """
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.setWindowTitle(__("Data files"))
+        self.setMinimumSize(800, 600)
+        self.data_files: list = get_data_files(Case.the())
+        self.scan = None
+
+        self.files_table = QtWidgets.QTableWidget(len(self.data_files), 2)
+        self.files_table.setHorizontalHeaderLabels([__("Used for"), __("File")])
+        self.files_table.horizontalHeader().setStretchLastSection(True)
+        self.files_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.files_table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.files_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        for row, data_file in enumerate(self.data_files):
+            self.files_table.setItem(row, 0, QtWidgets.QTableWidgetItem(data_file.description))
+            self.files_table.setItem(row, 1, QtWidgets.QTableWidgetItem(data_file.file_path))
+        self.files_table.resizeColumnToContents(0)
+
+        self.report_label = QtWidgets.QLabel(__("Select a file to check it.") if self.data_files
+                                             else __("The case does not use any data file."))
+        self.report_label.setWordWrap(True)
+        self.report_label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+
+        self.column_label = QtWidgets.QLabel(__("Column: "))
+        self.column_selector = QtWidgets.QComboBox()
+        self.column_layout = QtWidgets.QHBoxLayout()
+        self.column_layout.addWidget(self.column_label)
+        self.column_layout.addWidget(self.column_selector)
+        self.column_layout.addStretch(1)
+        self.series_plot = SeriesPlot(x_label=__("Time (s)"))
+
+        self.close_button = QtWidgets.QPushButton(__("Close"))
+        self.button_layout = QtWidgets.QHBoxLayout()
+        self.button_layout.addStretch(1)
+        self.button_layout.addWidget(self.close_button)
+
+        self.main_layout = QtWidgets.QVBoxLayout()
+        self.main_layout.addWidget(self.files_table)
+        self.main_layout.addWidget(self.report_label)
+        self.main_layout.addLayout(self.column_layout)
+        self.main_layout.addWidget(self.series_plot, 1)
+        self.main_layout.addLayout(self.button_layout)
+        self.setLayout(self.main_layout)
+
+        self.files_table.itemSelectionChanged.connect(self.on_file_selected)
+        self.column_selector.currentIndexChanged.connect(self.on_column_selected)
+        self.close_button.clicked.connect(self.accept)
+
+        self.exec_()
+
+    def on_file_selected(self):
+        """ Scans the selected file and shows the result. """
+        rows = self.files_table.selectionModel().selectedRows()
+        if not rows:
+            return
+        data_file = self.data_files[rows[0].row()]
+        self.scan = None
+        self.column_selector.clear()
+        self.series_plot.set_series([], [])
+        file_path = locate_case_file(Case.the(), data_file.file_path)
+        if file_path is None:
+            self.report_label.setText(__("The file does not exist."))
+            return
+
+        progress_dialog = StageProgressDialog("Scanning data file. Please wait.", 1)
+        progress_dialog.show()
+        progress_dialog.start_stage(data_file.description)
+        try:
+            self.scan = run_in_background(scan_data_file, file_path, data_file.columns, data_file.field_count,
+                                          progress_slot=progress_dialog.update_info)
+        except OSError as ex:
+            self.report_label.setText(__("The file can't be read: {}").format(ex))
+            return
+        finally:
+            progress_dialog.close_dialog()
+
+        lines = [__("{} rows with {} values, {} header lines.").format(self.scan.rows, self.scan.column_count, self.scan.header_lines)]
+        if self.scan.rows:
+            lines.append(__("Time from {:g} s to {:g} s.").format(self.scan.first_time, self.scan.last_time))
+        problems = self.scan.get_problems(data_file.time_span)
+        lines += ["<font color='red'>{}</font>".format(message) for _, message in problems]
+        if not problems:
+            lines.append(__("No problems found."))
+        self.report_label.setText("<br/>".join(lines))
+        if self.scan.rows:
+            self.column_selector.addItems(data_file.column_names[1:])
+
+    def on_column_selected(self, index: int):
+        """ Plots the selected column against time. """
+        if self.scan is None or index < 0:
+            return
+        preview = self.scan.get_preview()
+        self.series_plot.title = "{} ({:g} to {:g})".format(self.column_selector.currentText(), self.scan.value_min[index + 1],
+                                                             self.scan.value_max[index + 1])
+        self.series_plot.set_series(preview[:, 0], preview[:, index + 1])
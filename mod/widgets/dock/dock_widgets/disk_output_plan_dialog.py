@@ -0,0 +1,118 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+""" DesignSPHysics Disk Output Plan Dialog. """
+
+from PySide2 import QtWidgets
+
+from mod.dataobjects.case import Case
+from mod.tools.disk_output_tools import DiskOutputPlan, plan_disk_output
+from mod.tools.particle_estimation_tools import format_particle_count, format_size
+from mod.tools.translation_tools import __
+
+GIGABYTE = 1024 ** 3
+
+
+class DiskOutputPlanDialog(QtWidgets.QDialog):
+    """ Shows the predicted output volume of the simulation, whether it fits in the free space of the output
+    folder and the output interval or output filters needed to fit a disk budget.
+    If the suggested output interval is accepted, it's stored in suggested_timeout. """
+
+    def __init__(self, timemax: float = None, timeout: float = None, parent=None):
+        super().__init__(parent=parent)
+        self.setWindowTitle(__("Disk output plan"))
+        self.setMinimumWidth(520)
+
+        self.plan: DiskOutputPlan = plan_disk_output(Case.the(), timemax=timemax, timeout=timeout)
+        self.suggested_timeout: float = -1
+
+        self.main_layout = QtWidgets.QVBoxLayout()
+        self.report_label = QtWidgets.QLabel()
+        self.report_label.setWordWrap(True)
+
+        self.budget_layout = QtWidgets.QHBoxLayout()
+        self.budget_label = QtWidgets.QLabel(__("Disk budget:"))
+        self.budget_input = QtWidgets.QDoubleSpinBox()
+        self.budget_input.setRange(0.01, 1e6)
+        self.budget_input.setDecimals(2)
+        self.budget_input.setSuffix(" GB")
+        self.budget_input.setValue(self.plan.free_space / GIGABYTE if self.plan.free_space > 0 else 10.0)
+        self.budget_layout.addWidget(self.budget_label)
+        self.budget_layout.addWidget(self.budget_input)
+        self.budget_layout.addStretch(1)
+
+        self.suggestion_label = QtWidgets.QLabel()
+        self.suggestion_label.setWordWrap(True)
+
+        self.button_layout = QtWidgets.QHBoxLayout()
+        self.apply_button = QtWidgets.QPushButton(__("Use suggested interval"))
+        self.close_button = QtWidgets.QPushButton(__("Close"))
+        self.button_layout.addStretch(1)
+        self.button_layout.addWidget(self.apply_button)
+        self.button_layout.addWidget(self.close_button)
+
+        self.main_layout.addWidget(self.report_label)
+        self.main_layout.addLayout(self.budget_layout)
+        self.main_layout.addWidget(self.suggestion_label)
+        self.main_layout.addStretch(1)
+        self.main_layout.addLayout(self.button_layout)
+        self.setLayout(self.main_layout)
+
+        self.budget_input.valueChanged.connect(self.update_suggestions)
+        self.apply_button.clicked.connect(self.on_apply)
+        self.close_button.clicked.connect(self.reject)
+
+        self.report_label.setText(self.get_report_text())
+        self.update_suggestions()
+
+    def get_report_text(self) -> str:
+        """ Returns the html report of the predicted output volume. """
+        plan = self.plan
+        lines = [
+            __("Particles: <b>{}</b>").format(format_particle_count(plan.particles)),
+            __("Output parts: <b>{}</b> ({} s every {} s)").format(plan.part_count, plan.timemax, plan.timeout),
+            __("Initial part: {}. Each following part: {}").format(format_size(plan.first_part_size), format_size(plan.part_size)),
+            __("Predicted output volume: <b>{}</b>").format(format_size(plan.total_size))
+        ]
+        if plan.filter_savings > 0:
+            lines.append(__("Output filters keep {:.1f}% of the particles, saving {} ({:.0f}%)").format(
+                plan.kept_fraction * 100, format_size(plan.filter_savings),
+                plan.filter_savings / plan.unfiltered_total_size * 100))
+        else:
+            lines.append(__("Output filters don't reduce the output volume."))
+        if plan.free_space >= 0:
+            free_space_text = __("Free space in the output folder: {}").format(format_size(plan.free_space))
+            if plan.exceeds_free_space():
+                free_space_text = "<span style='color: red'>{}</span>".format(
+                    free_space_text + ". " + __("The output does not fit."))
+            lines.append(free_space_text)
+        else:
+            lines.append(__("Free space in the output folder: unknown. Save the case to check it."))
+        if plan.skipped_objects:
+            lines.append(__("Objects not estimated: {}").format(", ".join(plan.skipped_objects)))
+        return "<br/>".join(lines)
+
+    def update_suggestions(self):
+        """ Updates the suggested output interval and filters for the current budget. """
+        budget = int(self.budget_input.value() * GIGABYTE)
+        self.suggested_timeout = -1
+        if self.plan.total_size <= budget:
+            self.suggestion_label.setText(__("The predicted output fits in the budget."))
+            self.apply_button.setEnabled(False)
+            return
+
+        suggestions = list()
+        timeout = self.plan.suggest_timeout(budget)
+        if timeout > 0:
+            self.suggested_timeout = timeout
+            suggestions.append(__("Increase the time out data to at least <b>{:.4g} s</b>").format(timeout))
+        kept_fraction = self.plan.suggest_kept_fraction(budget)
+        if kept_fraction > 0:
+            suggestions.append(__("Use output filters that keep at most <b>{:.1f}%</b> of the particles").format(kept_fraction * 100))
+        if not suggestions:
+            suggestions.append(__("The initial part alone does not fit. Increase the budget or the particle distance."))
+        self.suggestion_label.setText(__("The predicted output exceeds the budget:") + "<br/>" + "<br/>".join(suggestions))
+        self.apply_button.setEnabled(self.suggested_timeout > 0)
+
+    def on_apply(self):
+        """ Closes the dialog accepting the suggested output interval. """
+        self.accept()
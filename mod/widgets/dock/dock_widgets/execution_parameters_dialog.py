@@ -4,7 +4,9 @@
 import FreeCADGui
 from PySide2 import QtCore, QtWidgets
 
+from mod.appmode import AppMode
 from mod.dataobjects.configuration.application_settings import ApplicationSettings
+from mod.tools.case_validation_tools import check_helpers_in_domain, log_validation_issues
 from mod.tools.dialog_tools import warning_dialog
 from mod.tools.freecad_tools import draw_simulation_domain, update_simulation_domain
 
@@ -14,6 +16,7 @@ from mod.enums import HelpText, SDPositionPropertyType
 from mod.widgets.custom_widgets.density_input import DensityInput
 from mod.widgets.dock.dock_widgets.simulation_domain_widget import SimulationDomainWidget
 from mod.widgets.custom_widgets.value_input import ValueInput
+from mod.widgets.dialog_registry import DiskOutputPlanDialog
 
 from mod.widgets.custom_widgets.focusable_combo_box import FocusableComboBox
 
@@ -371,6 +374,14 @@ class ExecutionParametersDialog(QtWidgets.QDialog):
         self.timeout_layout.addWidget(self.timeout_label)
         self.timeout_layout.addWidget(self.timeout_input)
         self.time_configuration_layout.addLayout(self.timeout_layout)
+        # Disk output plan
+        self.disk_output_plan_layout = QtWidgets.QHBoxLayout()
+        self.disk_output_plan_button = QtWidgets.QPushButton(__("Plan disk output..."))
+        self.disk_output_plan_button.setToolTip(__("Predicts the size of the simulation output and suggests an output interval that fits a disk budget."))
+        self.disk_output_plan_button.clicked.connect(self.on_disk_output_plan)
+        self.disk_output_plan_layout.addStretch(1)
+        self.disk_output_plan_layout.addWidget(self.disk_output_plan_button)
+        self.time_configuration_layout.addLayout(self.disk_output_plan_layout)
         # Sim start freeze time (ftpause)
         self.ftpause_layout = QtWidgets.QHBoxLayout()
         self.ftpause_label = QtWidgets.QLabel(__("Floating freeze time:"))
@@ -623,6 +634,12 @@ class ExecutionParametersDialog(QtWidgets.QDialog):
         """ Reacts to focusing the help setting the corresponding help text. """
         self.help_label.setText("<b>{}: </b>{}".format(__("Help"), help_text))
 
+    def on_disk_output_plan(self):
+        """ Opens the disk output plan for the time values in the dialog, applying the suggested interval if accepted. """
+        plan_dialog = DiskOutputPlanDialog(timemax=self.timemax_input.value(), timeout=self.timeout_input.value(), parent=self)
+        if plan_dialog.exec_() and plan_dialog.suggested_timeout > 0:
+            self.timeout_input.setValue(plan_dialog.suggested_timeout)
+
     def on_boundary_type_change(self, index):
         """ Reacts to densitydt type change enabling/disabling the input. """
         if index == 0:
@@ -783,6 +800,11 @@ class ExecutionParametersDialog(QtWidgets.QDialog):
                                        Case.the().domain.posmax_x.value,
                                        Case.the().domain.posmax_y.value,
                                        Case.the().domain.posmax_z.value,)
+                domain = Case.the().domain
+                log_validation_issues(check_helpers_in_domain(Case.the(),
+                                                              [domain.posmin_x.value, domain.posmin_y.value, domain.posmin_z.value],
+                                                              [domain.posmax_x.value, domain.posmax_y.value, domain.posmax_z.value],
+                                                              AppMode.is_3d()))
 
         FreeCADGui.Selection.clearSelection() #Clear selection to refresh
         #self.update_properties()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""DesignSPHysics Run Profiles Dialog. """
+
+from PySide2 import QtWidgets
+
+from mod.dataobjects.configuration.application_settings import ApplicationSettings
+from mod.tools.dialog_tools import error_dialog
+from mod.tools.run_profile_tools import OMP_PLACES_OPTIONS, OMP_PROC_BIND_OPTIONS, create_run_profile, parse_cpu_list
+from mod.tools.translation_tools import __
+
+
+class RunProfilesDialog(QtWidgets.QDialog):
+    """ A dialog to edit the CPU run profiles applied to the solver: threads, OpenMP binding, CPU list and nice level. """
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.setWindowTitle(__("Run profiles"))
+        self.profiles: list = [dict(create_run_profile(profile["name"]), **profile)
+                               for profile in ApplicationSettings.the().run_profiles]
+        self.current_row: int = -1
+
+        # Profile list
+        self.profile_list = QtWidgets.QListWidget()
+        self.add_button = QtWidgets.QPushButton(__("Add"))
+        self.remove_button = QtWidgets.QPushButton(__("Remove"))
+        self.list_buttons_layout = QtWidgets.QHBoxLayout()
+        self.list_buttons_layout.addWidget(self.add_button)
+        self.list_buttons_layout.addWidget(self.remove_button)
+        self.list_layout = QtWidgets.QVBoxLayout()
+        self.list_layout.addWidget(self.profile_list)
+        self.list_layout.addLayout(self.list_buttons_layout)
+
+        # Profile form
+        self.name_input = QtWidgets.QLineEdit()
+        self.threads_input = QtWidgets.QSpinBox()
+        self.threads_input.setRange(0, 4096)
+        self.threads_input.setSpecialValueText(__("All cores"))
+        self.proc_bind_input = QtWidgets.QComboBox()
+        self.proc_bind_input.setEditable(True)
+        self.proc_bind_input.addItems(OMP_PROC_BIND_OPTIONS)
+        self.places_input = QtWidgets.QComboBox()
+        self.places_input.setEditable(True)
+        self.places_input.addItems(OMP_PLACES_OPTIONS)
+        self.cpus_input = QtWidgets.QLineEdit()
+        self.cpus_input.setPlaceholderText(__("All CPUs. Example: 0-15,32-47"))
+        self.nice_input = QtWidgets.QSpinBox()
+        self.nice_input.setRange(-20, 19)
+        self.nice_input.setToolTip(__("Process priority. Higher values leave more CPU time to other processes."))
+
+        self.form_layout = QtWidgets.QFormLayout()
+        self.form_layout.addRow(__("Name: "), self.name_input)
+        self.form_layout.addRow(__("Threads: "), self.threads_input)
+        self.form_layout.addRow("OMP_PROC_BIND: ", self.proc_bind_input)
+        self.form_layout.addRow("OMP_PLACES: ", self.places_input)
+        self.form_layout.addRow(__("CPU list: "), self.cpus_input)
+        self.form_layout.addRow(__("Nice level: "), self.nice_input)
+        self.form_widget = QtWidgets.QWidget()
+        self.form_widget.setLayout(self.form_layout)
+
+        self.profile_layout = QtWidgets.QHBoxLayout()
+        self.profile_layout.addLayout(self.list_layout)
+        self.profile_layout.addWidget(self.form_widget, 1)
+
+        # Button layout definition
+        self.ok_button = QtWidgets.QPushButton(__("OK"))
+        self.cancel_button = QtWidgets.QPushButton(__("Cancel"))
+        self.button_layout = QtWidgets.QHBoxLayout()
+        self.button_layout.addStretch(1)
+        self.button_layout.addWidget(self.ok_button)
+        self.button_layout.addWidget(self.cancel_button)
+
+        self.main_layout = QtWidgets.QVBoxLayout()
+        self.main_layout.addLayout(self.profile_layout)
+        self.main_layout.addLayout(self.button_layout)
+        self.setLayout(self.main_layout)
+
+        self.profile_list.addItems([profile["name"] for profile in self.profiles])
+        self.profile_list.currentRowChanged.connect(self.on_profile_selected)
+        self.name_input.textEdited.connect(self.on_name_edited)
+        self.add_button.clicked.connect(self.on_add)
+        self.remove_button.clicked.connect(self.on_remove)
+        self.ok_button.clicked.connect(self.on_ok)
+        self.cancel_button.clicked.connect(self.reject)
+
+        self.form_widget.setEnabled(bool(self.profiles))
+        if self.profiles:
+            self.profile_list.setCurrentRow(0)
+
+        self.exec_()
+
+    def store_current_profile(self):
+        """ Copies the form values to the profile being edited. """
+        if self.current_row < 0:
+            return
+        self.profiles[self.current_row].update({
+            "name": self.name_input.text().strip(),
+            "threads": self.threads_input.value(),
+            "omp_proc_bind": self.proc_bind_input.currentText().strip(),
+            "omp_places": self.places_input.currentText().strip(),
+            "cpus": self.cpus_input.text().strip(),
+            "nice": self.nice_input.value()
+        })
+
+    def on_profile_selected(self, row):
+        """ Shows the selected profile in the form. """
+        self.store_current_profile()
+        self.current_row = row
+        self.form_widget.setEnabled(row >= 0)
+        if row < 0:
+            return
+        profile = self.profiles[row]
+        self.name_input.setText(profile["name"])
+        self.threads_input.setValue(profile["threads"])
+        self.proc_bind_input.setEditText(profile["omp_proc_bind"])
+        self.places_input.setEditText(profile["omp_places"])
+        self.cpus_input.setText(profile["cpus"])
+        self.nice_input.setValue(profile["nice"])
+
+    def on_name_edited(self, text):
+        """ Keeps the name in the list up to date. """
+        if self.current_row >= 0:
+            self.profile_list.item(self.current_row).setText(text)
+
+    def on_add(self):
+        """ Adds a new profile and selects it. """
+        name = __("Profile {}").format(len(self.profiles) + 1)
+        self.profiles.append(create_run_profile(name))
+        self.profile_list.addItem(name)
+        self.profile_list.setCurrentRow(len(self.profiles) - 1)
+
+    def on_remove(self):
+        """ Removes the selected profile. """
+        row = self.current_row
+        if row < 0:
+            return
+        self.current_row = -1
+        self.profiles.pop(row)
+        self.profile_list.takeItem(row)
+
+    def on_ok(self):
+        """ Validates the profiles and stores them in the application settings. """
+        self.store_current_profile()
+        names = [profile["name"] for profile in self.profiles]
+        if not all(names) or len(set(names)) != len(names):
+            error_dialog(__("Each run profile needs a different name."))
+            return
+        for profile in self.profiles:
+            try:
+                parse_cpu_list(profile["cpus"])
+            except ValueError:
+                error_dialog(__("The CPU list of the run profile {} is not valid: {}").format(profile["name"], profile["cpus"]))
+                return
+        ApplicationSettings.the().run_profiles = self.profiles
+        if ApplicationSettings.the().run_profile_name not in names:
+            ApplicationSettings.the().run_profile_name = ""
+        ApplicationSettings.the().persist()
+        self.accept()
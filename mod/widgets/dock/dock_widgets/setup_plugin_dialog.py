@@ -243,6 +243,30 @@ class SetupPluginDialog(QtWidgets.QDialog):
         self.settings_layout.addRow(self.use_version_check)
         self.settings_layout.addRow(self.visualization_mode_layout)
 
+        # Simulation watchdog
+        self.watchdog_label = QtWidgets.QLabel(__("Simulation watchdog"))
+        self.watchdog_enabled_check = QtWidgets.QCheckBox(__("Watch running simulations for stalls"))
+        self.watchdog_enabled_check.setChecked(ApplicationSettings.the().watchdog_enabled)
+        self.watchdog_stall_input = QtWidgets.QDoubleSpinBox()
+        self.watchdog_stall_input.setRange(1, 10000)
+        self.watchdog_stall_input.setSuffix(" min")
+        self.watchdog_stall_input.setValue(ApplicationSettings.the().watchdog_stall_minutes)
+        self.watchdog_stall_input.setToolTip(__("A simulation is stalled when no part is stored for this time."))
+        self.watchdog_ratio_input = QtWidgets.QDoubleSpinBox()
+        self.watchdog_ratio_input.setRange(1, 100)
+        self.watchdog_ratio_input.setSuffix(" %")
+        self.watchdog_ratio_input.setValue(ApplicationSettings.the().watchdog_min_throughput_ratio * 100)
+        self.watchdog_ratio_input.setToolTip(__("Throughput and time step are flagged when they fall below this "
+                                                "percentage of their usual value in the simulation."))
+        self.watchdog_auto_resume_check = QtWidgets.QCheckBox(__("Kill and resume stalled simulations"))
+        self.watchdog_auto_resume_check.setChecked(ApplicationSettings.the().watchdog_auto_resume)
+        self.settings_layout.addRow(h_line_generator())
+        self.settings_layout.addRow(self.watchdog_label)
+        self.settings_layout.addRow(self.watchdog_enabled_check)
+        self.settings_layout.addRow(__("Stall time: "), self.watchdog_stall_input)
+        self.settings_layout.addRow(__("Minimum throughput: "), self.watchdog_ratio_input)
+        self.settings_layout.addRow(self.watchdog_auto_resume_check)
+
         self.external_settings_label=QtWidgets.QLabel("External run settings")
         # DualSPHyisics path
         self.hpc_dsphpath_layout = QtWidgets.QHBoxLayout()
@@ -328,6 +352,10 @@ class SetupPluginDialog(QtWidgets.QDialog):
         ApplicationSettings.the().verbose_enabled = self.use_verbose_check.isChecked()
         ApplicationSettings.the().notify_on_outdated_version_enabled = self.use_version_check.isChecked()
         ApplicationSettings.the().basic_visualization = self.visualization_mode_combo.currentIndex()==0
+        ApplicationSettings.the().watchdog_enabled = self.watchdog_enabled_check.isChecked()
+        ApplicationSettings.the().watchdog_stall_minutes = self.watchdog_stall_input.value()
+        ApplicationSettings.the().watchdog_min_throughput_ratio = self.watchdog_ratio_input.value() / 100
+        ApplicationSettings.the().watchdog_auto_resume = self.watchdog_auto_resume_check.isChecked()
         ApplicationSettings.the().execs_path=self.hpc_dsphpath_input.text()
         ApplicationSettings.the().custom_script_text = self.custom_script_text_input.toPlainText()
         ApplicationSettings.the().linux_os = self.os_select_combo.currentIndex()
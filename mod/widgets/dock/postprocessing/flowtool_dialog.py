@@ -9,8 +9,9 @@ from mod.constants import FLOWBOXES_GROUP_NAME, FLOWBOXES_COLOR
 from mod.dataobjects.case import Case
 from mod.dataobjects.configuration.application_settings import ApplicationSettings
 from mod.dataobjects.flow_tool_xml_box import FlowToolXmlBox
-from mod.enums import FlowUnits
+from mod.enums import FlowUnits, HelperKind
 from mod.tools.freecad_tools import draw_box, get_fc_object, update_flow_box, delete_object
+from mod.tools.helper_index_tools import remove_helper, update_helper
 from mod.tools.post_processing_tools import flowtool_export
 from mod.tools.template_tools import get_template_text
 from mod.tools.translation_tools import __
@@ -173,6 +174,7 @@ class FlowToolDialog(QtWidgets.QDialog):
 
         if box_to_remove is not None:
             delete_object(box_to_remove.fc_object_name)
+            remove_helper(Case.the(), HelperKind.FLOWTOOL_BOX, box_to_remove.fc_object_name)
             Case.the().post_processing_settings.flowtool_xml_boxes.remove(box_to_remove)
             self.refresh_boxlist()
 
@@ -201,6 +203,7 @@ class FlowToolDialog(QtWidgets.QDialog):
             self.fltool_boxlist_layout.addLayout(to_add_layout)
             if box.fc_object_name:
                 update_flow_box(box.fc_object_name,box.point,box.size,box.angle)
+                update_helper(Case.the(), HelperKind.FLOWTOOL_BOX, box.fc_object_name)
 
 
 
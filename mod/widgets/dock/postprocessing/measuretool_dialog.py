@@ -8,11 +8,12 @@ from mod.dataobjects.configuration.application_settings import ApplicationSettin
 from mod.enums import ObjectType
 from mod.dataobjects.case import Case, mk_help_list
 from mod.tools.dialog_tools import error_dialog, info_dialog, warning_dialog
-from mod.tools.file_tools import save_measuretool_point_list, save_measuretool_point_grid
+from mod.tools.file_tools import save_measuretool_point_list, save_measuretool_point_grid, save_measuretool_point_set
 from mod.tools.post_processing_tools import measuretool_export
 from mod.tools.translation_tools import __
 from mod.widgets.custom_widgets.mk_select_input_with_names import MkSelectInputWithNames
 from mod.widgets.dock.postprocessing.measuretool_grid_dialog import MeasureToolGridDialog
+from mod.widgets.dock.postprocessing.measuretool_point_set_dialog import MeasureToolPointSetDialog
 from mod.widgets.dock.postprocessing.measuretool_points_dialog import MeasureToolPointsDialog
 from mod.widgets.dock.postprocessing.mk_helper_widget import MkHelperWidget
 
@@ -146,7 +147,7 @@ class MeasureToolDialog(QtWidgets.QDialog):
 
         self.mtool_points_selector_layout=QtWidgets.QHBoxLayout()
         self.mtool_points_selector=QtWidgets.QComboBox()
-        self.mtool_points_selector.addItems(["List of points","Grid of points","Load points file","Load mesh file"])
+        self.mtool_points_selector.addItems(["List of points","Grid of points","Load points file","Load mesh file","Point set"])
         self.mtool_edit_button = QtWidgets.QPushButton("Edit")
 
 
@@ -330,6 +331,12 @@ class MeasureToolDialog(QtWidgets.QDialog):
                 __("Please define a 'Grid of points' to continue, or select a different option. MeasureTool will not be executed.")
             )
             return
+        if self.mtool_points_selector.currentIndex() == 4 and not Case.the().post_processing_settings.measuretool_point_sets:
+            error_dialog(
+                __("No 'Point set' is defined to execute MeasureTool"),
+                __("Please define a 'Point set' to continue, or select a different option. MeasureTool will not be executed.")
+            )
+            return
         export_parameters["points_source"]=self.mtool_points_selector.currentIndex()
 
         if export_parameters["calculate_water_flow"] and export_parameters["points_source"]==0:
@@ -376,6 +383,8 @@ class MeasureToolDialog(QtWidgets.QDialog):
     def on_mtool_edit(self):
         if self.mtool_points_selector.currentIndex()==0:
             MeasureToolPointsDialog(parent=None)
+        elif self.mtool_points_selector.currentIndex()==4:
+            MeasureToolPointSetDialog(parent=None)
         else:
             MeasureToolGridDialog(parent=None)
 
@@ -384,7 +393,7 @@ class MeasureToolDialog(QtWidgets.QDialog):
         self.mtool_mk_help_list_label.setText(info)
 
     def on_mtool_points_selector_changed(self,index):
-        if index<2:
+        if index<2 or index==4:
             self.mtool_export_points_button.setEnabled(True)
             self.mtool_edit_button.setEnabled(True)
             self.mtool_points_filename_input.setPlaceholderText("Name of the file to export")
@@ -409,10 +418,15 @@ class MeasureToolDialog(QtWidgets.QDialog):
         try:
             if self.mtool_points_selector.currentIndex()==0:
                 save_measuretool_point_list(Case.the().path, pointsfile, Case.the().post_processing_settings.measuretool_points)
+            elif self.mtool_points_selector.currentIndex()==4:
+                save_measuretool_point_set(Case.the().path, pointsfile, Case.the().post_processing_settings.measuretool_point_sets)
             else:
                 save_measuretool_point_grid(Case.the().path, pointsfile, Case.the().post_processing_settings.measuretool_grid)
         except RuntimeError:
             return
+        except (OSError, ValueError) as ex:
+            error_dialog(__("The point set could not be generated."), str(ex))
+            return
         info_dialog(f"Points exported successfully into {pointsfile}")
 
 
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""DesignSPHysics MeasureTool Point Set Dialog """
+
+from PySide2 import QtWidgets
+
+from mod.constants import MEASURETOOL_PREVIEW_MAX_POINTS
+from mod.dataobjects.case import Case
+from mod.tools.dialog_tools import error_dialog
+from mod.tools.freecad_tools import delete_object, draw_point_cloud
+from mod.tools.point_set_tools import POINT_SET_KINDS, create_point_set_part, decimate_points, \
+    describe_point_set_part, generate_point_set, get_point_set_part_count
+from mod.tools.stdout_tools import log
+from mod.tools.translation_tools import __
+from mod.widgets.custom_widgets.size_input import SizeInput
+from mod.widgets.custom_widgets.value_input import ValueInput
+
+POINT_SET_PREVIEW_NAME = "MeasureTool_PointSet_Preview"
+
+
+class MeasureToolPointSetDialog(QtWidgets.QDialog):
+    """ Builds MeasureTool point sets from lines, planes, volumes and samples of mesh surfaces.
+    The points are not listed; they can be previewed as a point cloud instead. """
+
+    KIND_LABELS = ("Line", "Plane", "Volume", "Mesh surface")
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.setWindowTitle(__("MeasureTool Point Set"))
+        self.parts: list = [dict(part) for part in Case.the().post_processing_settings.measuretool_point_sets]
+        self.current_row: int = -1
+
+        # Part list
+        self.parts_list = QtWidgets.QListWidget()
+        self.add_button = QtWidgets.QPushButton(__("Add"))
+        self.add_menu = QtWidgets.QMenu()
+        for label in self.KIND_LABELS:
+            self.add_menu.addAction(__(label))
+        self.add_button.setMenu(self.add_menu)
+        self.remove_button = QtWidgets.QPushButton(__("Remove"))
+        self.list_buttons_layout = QtWidgets.QHBoxLayout()
+        self.list_buttons_layout.addWidget(self.add_button)
+        self.list_buttons_layout.addWidget(self.remove_button)
+        self.list_layout = QtWidgets.QVBoxLayout()
+        self.list_layout.addWidget(self.parts_list)
+        self.list_layout.addLayout(self.list_buttons_layout)
+
+        # Part forms, one per kind
+        self.origin_inputs = [SizeInput() for _ in range(3)]
+        self.origin_layout = self.row_layout(self.origin_inputs)
+        self.origin_form = QtWidgets.QFormLayout()
+        self.origin_form.addRow(__("Origin (X,Y,Z)"), self.origin_layout)
+
+        self.line_end_inputs = [SizeInput() for _ in range(3)]
+        self.line_count_input = self.count_input()
+        self.line_widget = self.form_widget([(__("End (X,Y,Z)"), self.row_layout(self.line_end_inputs)),
+                                             (__("Points"), self.line_count_input)])
+
+        self.plane_vector1_inputs = [SizeInput() for _ in range(3)]
+        self.plane_vector2_inputs = [SizeInput() for _ in range(3)]
+        self.plane_count1_input = self.count_input()
+        self.plane_count2_input = self.count_input()
+        self.plane_widget = self.form_widget([(__("Edge 1 (X,Y,Z)"), self.row_layout(self.plane_vector1_inputs)),
+                                              (__("Edge 2 (X,Y,Z)"), self.row_layout(self.plane_vector2_inputs)),
+                                              (__("Points along edge 1"), self.plane_count1_input),
+                                              (__("Points along edge 2"), self.plane_count2_input)])
+
+        self.volume_size_inputs = [SizeInput() for _ in range(3)]
+        self.volume_count_inputs = [self.count_input() for _ in range(3)]
+        self.volume_widget = self.form_widget([(__("Size (X,Y,Z)"), self.row_layout(self.volume_size_inputs)),
+                                               (__("Points per axis (X,Y,Z)"), self.row_layout(self.volume_count_inputs))])
+
+        self.mesh_path_input = QtWidgets.QLineEdit()
+        self.mesh_browse_button = QtWidgets.QPushButton("...")
+        self.mesh_count_input = self.count_input()
+        self.mesh_scale_input = ValueInput()
+        self.mesh_scale_input.setToolTip(__("Scale applied to the mesh coordinates to get them in m."))
+        self.mesh_widget = self.form_widget([(__("Mesh file"), self.row_layout([self.mesh_path_input, self.mesh_browse_button])),
+                                             (__("Points"), self.mesh_count_input),
+                                             (__("Scale"), self.mesh_scale_input)])
+
+        self.kind_stack = QtWidgets.QStackedWidget()
+        for widget in [self.line_widget, self.plane_widget, self.volume_widget, self.mesh_widget]:
+            self.kind_stack.addWidget(widget)
+
+        self.part_layout = QtWidgets.QVBoxLayout()
+        self.part_layout.addLayout(self.origin_form)
+        self.part_layout.addWidget(self.kind_stack)
+        self.part_layout.addStretch(1)
+        self.part_widget = QtWidgets.QWidget()
+        self.part_widget.setLayout(self.part_layout)
+
+        self.edit_layout = QtWidgets.QHBoxLayout()
+        self.edit_layout.addLayout(self.list_layout)
+        self.edit_layout.addWidget(self.part_widget, 1)
+
+        # Summary and buttons
+        self.total_label = QtWidgets.QLabel()
+        self.preview_button = QtWidgets.QPushButton(__("Preview"))
+        self.preview_button.setToolTip(__("Draws the points as a point cloud. Big sets are decimated to {} points.").format(
+            MEASURETOOL_PREVIEW_MAX_POINTS))
+        self.ok_button = QtWidgets.QPushButton(__("OK"))
+        self.cancel_button = QtWidgets.QPushButton(__("Cancel"))
+        self.button_layout = QtWidgets.QHBoxLayout()
+        self.button_layout.addWidget(self.total_label)
+        self.button_layout.addStretch(1)
+        self.button_layout.addWidget(self.preview_button)
+        self.button_layout.addWidget(self.ok_button)
+        self.button_layout.addWidget(self.cancel_button)
+
+        self.main_layout = QtWidgets.QVBoxLayout()
+        self.main_layout.addLayout(self.edit_layout)
+        self.main_layout.addLayout(self.button_layout)
+        self.setLayout(self.main_layout)
+
+        self.parts_list.addItems([describe_point_set_part(part) for part in self.parts])
+        self.parts_list.currentRowChanged.connect(self.on_part_selected)
+        self.add_menu.triggered.connect(self.on_add)
+        self.remove_button.clicked.connect(self.on_remove)
+        self.mesh_browse_button.clicked.connect(self.on_mesh_browse)
+        self.preview_button.clicked.connect(self.on_preview)
+        self.ok_button.clicked.connect(self.on_ok)
+        self.cancel_button.clicked.connect(self.reject)
+
+        self.part_widget.setEnabled(bool(self.parts))
+        if self.parts:
+            self.parts_list.setCurrentRow(0)
+        self.update_total()
+
+        self.exec_()
+
+    @staticmethod
+    def row_layout(widgets: list) -> QtWidgets.QHBoxLayout:
+        """ Returns a horizontal layout with the given widgets. """
+        layout = QtWidgets.QHBoxLayout()
+        for widget in widgets:
+            layout.addWidget(widget)
+        return layout
+
+    @staticmethod
+    def count_input() -> QtWidgets.QSpinBox:
+        """ Returns an input for a number of points. """
+        count_input = QtWidgets.QSpinBox()
+        count_input.setRange(1, 100000000)
+        return count_input
+
+    @staticmethod
+    def form_widget(rows: list) -> QtWidgets.QWidget:
+        """ Returns a widget with a form of (label, widget or layout) rows. """
+        form_layout = QtWidgets.QFormLayout()
+        for label, field in rows:
+            form_layout.addRow(label, field)
+        widget = QtWidgets.QWidget()
+        widget.setLayout(form_layout)
+        return widget
+
+    @staticmethod
+    def set_values(inputs: list, values: list):
+        """ Sets a list of values in a list of inputs. """
+        for value_input, value in zip(inputs, values):
+            value_input.setValue(value)
+
+    @staticmethod
+    def get_values(inputs: list) -> list:
+        """ Returns the values of a list of inputs. """
+        return [value_input.value() for value_input in inputs]
+
+    def store_current_part(self):
+        """ Copies the form values to the part being edited. """
+        if self.current_row < 0:
+            return
+        part = self.parts[self.current_row]
+        part["origin"] = self.get_values(self.origin_inputs)
+        if part["kind"] == "line":
+            part.update({"end": self.get_values(self.line_end_inputs), "count": self.line_count_input.value()})
+        elif part["kind"] == "plane":
+            part.update({"vector1": self.get_values(self.plane_vector1_inputs),
+                         "vector2": self.get_values(self.plane_vector2_inputs),
+                         "count1": self.plane_count1_input.value(), "count2": self.plane_count2_input.value()})
+        elif part["kind"] == "volume":
+            part.update({"size": self.get_values(self.volume_size_inputs),
+                         "counts": self.get_values(self.volume_count_inputs)})
+        elif part["kind"] == "mesh":
+            part.update({"mesh_path": self.mesh_path_input.text(), "count": self.mesh_count_input.value(),
+                         "scale": self.mesh_scale_input.value()})
+        self.parts_list.item(self.current_row).setText(describe_point_set_part(part))
+
+    def update_total(self):
+        """ Shows the total number of points of the set. """
+        self.store_current_part()
+        total = sum(get_point_set_part_count(part) for part in self.parts)
+        self.total_label.setText(__("Total points: {}").format(total))
+
+    def on_part_selected(self, row):
+        """ Shows the selected part in the form. """
+        self.store_current_part()
+        self.update_total()
+        self.current_row = row
+        self.part_widget.setEnabled(row >= 0)
+        if row < 0:
+            return
+        part = self.parts[row]
+        self.kind_stack.setCurrentIndex(POINT_SET_KINDS.index(part["kind"]))
+        self.set_values(self.origin_inputs, part["origin"])
+        if part["kind"] == "line":
+            self.set_values(self.line_end_inputs, part["end"])
+            self.line_count_input.setValue(part["count"])
+        elif part["kind"] == "plane":
+            self.set_values(self.plane_vector1_inputs, part["vector1"])
+            self.set_values(self.plane_vector2_inputs, part["vector2"])
+            self.plane_count1_input.setValue(part["count1"])
+            self.plane_count2_input.setValue(part["count2"])
+        elif part["kind"] == "volume":
+            self.set_values(self.volume_size_inputs, part["size"])
+            self.set_values(self.volume_count_inputs, part["counts"])
+        elif part["kind"] == "mesh":
+            self.mesh_path_input.setText(part["mesh_path"])
+            self.mesh_count_input.setValue(part["count"])
+            self.mesh_scale_input.setValue(part["scale"])
+
+    def on_add(self, action):
+        """ Adds a part of the selected kind. """
+        labels = [__(label) for label in self.KIND_LABELS]
+        part = create_point_set_part(POINT_SET_KINDS[labels.index(action.text())])
+        self.parts.append(part)
+        self.parts_list.addItem(describe_point_set_part(part))
+        self.parts_list.setCurrentRow(len(self.parts) - 1)
+
+    def on_remove(self):
+        """ Removes the selected part. """
+        row = self.current_row
+        if row < 0:
+            return
+        self.current_row = -1
+        self.parts.pop(row)
+        self.parts_list.takeItem(row)
+        self.update_total()
+
+    def on_mesh_browse(self):
+        """ Selects the mesh file to sample. """
+        file_name, _ = QtWidgets.QFileDialog.getOpenFileName(self, __("Select the mesh to sample"), self.mesh_path_input.text(),
+                                                             "Mesh (*.stl *.vtk *.vtu *.vtp)")
+        if file_name:
+            self.mesh_path_input.setText(file_name)
+
+    def generate(self):
+        """ Returns the points of the set, or None if they can't be generated. """
+        self.update_total()
+        try:
+            return generate_point_set(self.parts)
+        except (OSError, ValueError) as ex:
+            error_dialog(__("The point set could not be generated."), str(ex))
+            return None
+
+    def on_preview(self):
+        """ Draws the points of the set as a point cloud, replacing the previous preview. """
+        points = self.generate()
+        if points is None:
+            return
+        delete_object(POINT_SET_PREVIEW_NAME)
+        if len(points):
+            draw_point_cloud(decimate_points(points, MEASURETOOL_PREVIEW_MAX_POINTS), POINT_SET_PREVIEW_NAME)
+        log("Previewing {} of {} MeasureTool points".format(min(len(points), MEASURETOOL_PREVIEW_MAX_POINTS), len(points)))
+
+    def on_ok(self):
+        """ Stores the point set in the case. """
+        self.update_total()
+        for part in self.parts:
+            if part["kind"] == "mesh" and not part["mesh_path"]:
+                error_dialog(__("Select the mesh file of each mesh surface part."))
+                return
+        Case.the().post_processing_settings.measuretool_point_sets = self.parts
+        self.accept()
@@ -0,0 +1,201 @@
+from PySide2.QtWidgets import QHBoxLayout
+
+from PySide2 import QtWidgets
+from mod.constants import GAUGES_COLOR, GAUGES_GROUP_NAME
+from mod.dataobjects.gauges.gauge_array import GaugeArray
+from mod.tools.dialog_tools import warning_dialog
+from mod.tools.freecad_tools import draw_gauge_array, get_fc_object, update_gauge_array
+from mod.tools.gauge_array_tools import GAUGE_ARRAY_LAYOUTS, GAUGE_ARRAY_TYPES, generate_array_points
+from mod.tools.translation_tools import __
+from mod.widgets.dock.special_widgets.gauges.base_gauge_dialog import BaseGaugeDialog
+from mod.widgets.custom_widgets.size_input import SizeInput
+from mod.widgets.custom_widgets.value_input import ValueInput
+
+
+class GaugeArrayDialog(BaseGaugeDialog):
+    """ Dialog to define an array of gauges with shared settings along a line, on a grid or from a CSV file of points. """
+
+    def __init__(self, gauge_array: GaugeArray, parent):
+        super().__init__(base_gauge=gauge_array, parent=parent)
+        self.setWindowTitle(__("Gauge array"))
+
+        self.type_layout = QHBoxLayout()
+        self.gauge_type_label = QtWidgets.QLabel(__("Gauge type"))
+        self.gauge_type_combo = QtWidgets.QComboBox()
+        self.gauge_type_combo.addItems([__("Velocity"), __("SWL"), __("Max Z")])
+        self.layout_label = QtWidgets.QLabel(__("Layout"))
+        self.layout_combo = QtWidgets.QComboBox()
+        self.layout_combo.addItems([__("Line"), __("Grid"), __("CSV file")])
+        for x in [self.gauge_type_label, self.gauge_type_combo, self.layout_label, self.layout_combo]:
+            self.type_layout.addWidget(x)
+
+        # Line layout
+        self.line_widget = QtWidgets.QWidget()
+        self.line_layout = QtWidgets.QFormLayout()
+        self.line_start_inputs = [SizeInput() for _ in range(3)]
+        self.line_end_inputs = [SizeInput() for _ in range(3)]
+        self.line_count_input = QtWidgets.QSpinBox()
+        self.line_count_input.setRange(1, 100000)
+        self.line_layout.addRow(__("Start (X,Y,Z)"), self.row_layout(self.line_start_inputs))
+        self.line_layout.addRow(__("End (X,Y,Z)"), self.row_layout(self.line_end_inputs))
+        self.line_layout.addRow(__("Number of gauges"), self.line_count_input)
+        self.line_widget.setLayout(self.line_layout)
+
+        # Grid layout
+        self.grid_widget = QtWidgets.QWidget()
+        self.grid_layout = QtWidgets.QFormLayout()
+        self.grid_origin_inputs = [SizeInput() for _ in range(3)]
+        self.grid_spacing_inputs = [SizeInput() for _ in range(3)]
+        self.grid_count_inputs = [QtWidgets.QSpinBox() for _ in range(3)]
+        for count_input in self.grid_count_inputs:
+            count_input.setRange(1, 100000)
+        self.grid_layout.addRow(__("Origin (X,Y,Z)"), self.row_layout(self.grid_origin_inputs))
+        self.grid_layout.addRow(__("Spacing (X,Y,Z)"), self.row_layout(self.grid_spacing_inputs))
+        self.grid_layout.addRow(__("Gauges per axis (X,Y,Z)"), self.row_layout(self.grid_count_inputs))
+        self.grid_widget.setLayout(self.grid_layout)
+
+        # CSV layout
+        self.csv_widget = QtWidgets.QWidget()
+        self.csv_layout = QHBoxLayout()
+        self.csv_label = QtWidgets.QLabel(__("Points file (X,Y,Z in m)"))
+        self.csv_path_input = QtWidgets.QLineEdit()
+        self.csv_browse_button = QtWidgets.QPushButton("...")
+        self.csv_offset_label = QtWidgets.QLabel(__("Offset (X,Y,Z)"))
+        self.csv_offset_inputs = [SizeInput() for _ in range(3)]
+        for x in [self.csv_label, self.csv_path_input, self.csv_browse_button, self.csv_offset_label]:
+            self.csv_layout.addWidget(x)
+        self.csv_layout.addLayout(self.row_layout(self.csv_offset_inputs))
+        self.csv_widget.setLayout(self.csv_layout)
+
+        self.layout_stack = QtWidgets.QStackedWidget()
+        for widget in [self.line_widget, self.grid_widget, self.csv_widget]:
+            self.layout_stack.addWidget(widget)
+
+        # Settings of swl and maxz gauges
+        self.swl_widget = QtWidgets.QWidget()
+        self.swl_layout = QtWidgets.QVBoxLayout()
+        self.swl_offset_layout = QHBoxLayout()
+        self.swl_offset_label = QtWidgets.QLabel(__("End point offset (X,Y,Z)"))
+        self.swl_offset_inputs = [SizeInput() for _ in range(3)]
+        self.swl_offset_layout.addWidget(self.swl_offset_label)
+        self.swl_offset_layout.addLayout(self.row_layout(self.swl_offset_inputs))
+        self.swl_conf_layout = QHBoxLayout()
+        self.point_dp_label = QtWidgets.QLabel(__("Point dp"))
+        self.point_dp_input = ValueInput()
+        self.point_dp_coef_dp_checkbox = QtWidgets.QCheckBox(__("Coef DP"))
+        self.mass_limit_label = QtWidgets.QLabel(__("Mass limit"))
+        self.mass_limit_input = ValueInput()
+        self.mass_limit_coef_checkbox = QtWidgets.QCheckBox(__("Coef Mass Limit"))
+        for x in [self.point_dp_label, self.point_dp_input, self.point_dp_coef_dp_checkbox,
+                  self.mass_limit_label, self.mass_limit_input, self.mass_limit_coef_checkbox]:
+            self.swl_conf_layout.addWidget(x)
+        self.swl_layout.addLayout(self.swl_offset_layout)
+        self.swl_layout.addLayout(self.swl_conf_layout)
+        self.swl_widget.setLayout(self.swl_layout)
+
+        self.maxz_widget = QtWidgets.QWidget()
+        self.maxz_layout = QHBoxLayout()
+        self.height_label = QtWidgets.QLabel(__("Height"))
+        self.height_input = SizeInput()
+        self.dist_limit_label = QtWidgets.QLabel(__("Distance limit"))
+        self.dist_limit_input = SizeInput()
+        for x in [self.height_label, self.height_input, self.dist_limit_label, self.dist_limit_input]:
+            self.maxz_layout.addWidget(x)
+        self.maxz_widget.setLayout(self.maxz_layout)
+
+        self.count_label = QtWidgets.QLabel()
+
+        self.main_layout.insertLayout(4, self.type_layout)
+        self.main_layout.insertWidget(5, self.layout_stack)
+        self.main_layout.insertWidget(6, self.swl_widget)
+        self.main_layout.insertWidget(7, self.maxz_widget)
+        self.main_layout.insertWidget(8, self.count_label)
+
+        self.gauge_type_combo.currentIndexChanged.connect(self.on_gauge_type_changed)
+        self.layout_combo.currentIndexChanged.connect(self.layout_stack.setCurrentIndex)
+        self.csv_browse_button.clicked.connect(self.on_csv_browse)
+
+        self.fill_values()
+
+    @staticmethod
+    def row_layout(widgets: list) -> QHBoxLayout:
+        """ Returns a horizontal layout with the given widgets. """
+        layout = QHBoxLayout()
+        for widget in widgets:
+            layout.addWidget(widget)
+        return layout
+
+    def on_gauge_type_changed(self, index):
+        """ Shows the settings of the selected gauge type. """
+        self.swl_widget.setVisible(GAUGE_ARRAY_TYPES[index] == "swl")
+        self.maxz_widget.setVisible(GAUGE_ARRAY_TYPES[index] == "maxz")
+
+    def on_csv_browse(self):
+        """ Selects the CSV file with the gauge points. """
+        file_name, _ = QtWidgets.QFileDialog.getOpenFileName(self, __("Select the gauge points file"),
+                                                             self.csv_path_input.text(), "CSV (*.csv *.txt);;All files (*)")
+        if file_name:
+            self.csv_path_input.setText(file_name)
+
+    def fill_values(self):
+        super().fill_values()
+        self.gauge_type_combo.setCurrentIndex(GAUGE_ARRAY_TYPES.index(self.data.gauge_type))
+        self.on_gauge_type_changed(self.gauge_type_combo.currentIndex())
+        self.layout_combo.setCurrentIndex(GAUGE_ARRAY_LAYOUTS.index(self.data.layout))
+        for inputs, values in ((self.line_start_inputs, self.data.line_start), (self.line_end_inputs, self.data.line_end),
+                               (self.grid_origin_inputs, self.data.grid_origin),
+                               (self.grid_spacing_inputs, self.data.grid_spacing),
+                               (self.grid_count_inputs, self.data.grid_counts),
+                               (self.csv_offset_inputs, self.data.csv_offset),
+                               (self.swl_offset_inputs, self.data.swl_offset)):
+            for value_input, value in zip(inputs, values):
+                value_input.setValue(value)
+        self.line_count_input.setValue(self.data.line_count)
+        self.csv_path_input.setText(self.data.csv_path)
+        self.point_dp_input.setValue(self.data.point_dp)
+        self.point_dp_coef_dp_checkbox.setChecked(self.data.point_dp_coef_dp)
+        self.mass_limit_input.setValue(self.data.mass_limit)
+        self.mass_limit_coef_checkbox.setChecked(self.data.mass_limit_coef)
+        self.height_input.setValue(self.data.height)
+        self.dist_limit_input.setValue(self.data.dist_limit)
+        self.count_label.setText(__("Gauges in the array: {}").format(len(self.data.points)))
+
+    def save_data(self):
+        if not self.name_input.text():
+            warning_dialog("Please name your Gauge")
+            return
+        super().save_data()
+        self.data.gauge_type = GAUGE_ARRAY_TYPES[self.gauge_type_combo.currentIndex()]
+        self.data.layout = GAUGE_ARRAY_LAYOUTS[self.layout_combo.currentIndex()]
+        self.data.line_start = [value_input.value() for value_input in self.line_start_inputs]
+        self.data.line_end = [value_input.value() for value_input in self.line_end_inputs]
+        self.data.line_count = self.line_count_input.value()
+        self.data.grid_origin = [value_input.value() for value_input in self.grid_origin_inputs]
+        self.data.grid_spacing = [value_input.value() for value_input in self.grid_spacing_inputs]
+        self.data.grid_counts = [value_input.value() for value_input in self.grid_count_inputs]
+        self.data.csv_path = self.csv_path_input.text()
+        self.data.csv_offset = [value_input.value() for value_input in self.csv_offset_inputs]
+        self.data.swl_offset = [value_input.value() for value_input in self.swl_offset_inputs]
+        self.data.point_dp = self.point_dp_input.value()
+        self.data.point_dp_coef_dp = self.point_dp_coef_dp_checkbox.isChecked()
+        self.data.mass_limit = self.mass_limit_input.value()
+        self.data.mass_limit_coef = self.mass_limit_coef_checkbox.isChecked()
+        self.data.height = self.height_input.value()
+        self.data.dist_limit = self.dist_limit_input.value()
+
+        try:
+            points = generate_array_points(self.data)
+        except OSError as ex:
+            warning_dialog(__("The points file could not be read: {}").format(ex))
+            return
+        if not len(points):
+            warning_dialog(__("The gauge array has no points. Check its layout."))
+            return
+        self.data.points = points.tolist()
+
+        if self.data.fc_object_name and get_fc_object(self.data.fc_object_name):
+            update_gauge_array(self.data)
+        else:
+            self.data.fc_object_name = draw_gauge_array(self.data, name="Helper_GaugeArray", color=GAUGES_COLOR)
+            get_fc_object(GAUGES_GROUP_NAME).addObject(get_fc_object(self.data.fc_object_name))
+        self.accept()
@@ -2,19 +2,23 @@ from PySide2 import QtWidgets
 from mod.constants import GAUGES_GROUP_NAME, GAUGES_COLOR
 from mod.dataobjects.case import Case
 from mod.dataobjects.gauges.force_gauge import ForceGauge
+from mod.dataobjects.gauges.gauge_array import GaugeArray
 from mod.dataobjects.gauges.gauge_base import Gauge
 from mod.dataobjects.gauges.max_z_gauge import MaxZGauge
 from mod.dataobjects.gauges.mesh_gauge import MeshGauge
 from mod.dataobjects.gauges.swl_gauge import SWLGauge
 from mod.dataobjects.gauges.velocity_gauge import VelocityGauge
+from mod.enums import HelperKind
 from mod.tools.dialog_tools import info_dialog
 from mod.tools.freecad_tools import delete_object, draw_line, get_fc_object, draw_sphere, \
     create_mesh_gauge_box, delete_group, create_flow_gauge_box
 from mod.tools.freecad_tools import manage_gauges
+from mod.tools.helper_index_tools import remove_helper, update_helper, update_helper_kind
 from mod.tools.translation_tools import __
 from mod.widgets.dock.special_widgets.gauges.defaults_gauge_dialog import GaugeDefaultsDialog
 from mod.widgets.dock.special_widgets.gauges.flow_gauge_dialog import FlowGaugeDialog
 from mod.widgets.dock.special_widgets.gauges.force_gauge_dialog import ForceGaugeDialog
+from mod.widgets.dock.special_widgets.gauges.gauge_array_dialog import GaugeArrayDialog
 from mod.widgets.dock.special_widgets.gauges.max_z_gauge_dialog import MaxZGaugeDialog
 from mod.widgets.dock.special_widgets.gauges.mesh_gauge_dialog import MeshGaugeDialog
 from mod.widgets.dock.special_widgets.gauges.swl_gauge_dialog import SWLGaugeDialog
@@ -41,6 +45,7 @@ class GaugesListDialog(QtWidgets.QDialog):
         self.add_gauge_menu.addAction(__("Add swl gauge"))
         self.add_gauge_menu.addAction(__("Add force gauge"))
         self.add_gauge_menu.addAction(__("Add mesh gauge"))
+        self.add_gauge_menu.addAction(__("Add gauge array"))
         self.add_gauge_button.setMenu(self.add_gauge_menu)
         self.add_gauge_menu.triggered.connect(self.on_add_gauge_menu)
         self.edit_gauge_button = QtWidgets.QPushButton(__("Edit gauge"))
@@ -63,6 +68,7 @@ class GaugesListDialog(QtWidgets.QDialog):
         self.setLayout(self.main_layout)
 
         manage_gauges(Case.the().gauges.gauges_dict)
+        update_helper_kind(Case.the(), HelperKind.GAUGE)
         self.update_gauges_list()
 
     def on_ok(self):
@@ -109,11 +115,18 @@ class GaugesListDialog(QtWidgets.QDialog):
             get_fc_object(new_gauge.fc_object_name).addProperty("App::PropertyVector", "lastposition")
             dialog = MeshGaugeDialog(mesh_gauge=new_gauge, parent=None)
             ret=dialog.exec_()
+        elif __("Add gauge array") in action.text():
+            # Its helper object is drawn once its points are known
+            new_gauge = GaugeArray()
+            new_gauge.load_defaults(Case.the().gauges.gauges_dict["Defaults"])
+            dialog = GaugeArrayDialog(gauge_array=new_gauge, parent=None)
+            ret=dialog.exec_()
         if ret== QtWidgets.QDialog.Accepted:
             if new_gauge.name == "Defaults":
                 info_dialog("New gauge cannot be named 'Defaults'")
             else:
                 Case.the().gauges.add_gauge(new_gauge)
+                update_helper(Case.the(), HelperKind.GAUGE, new_gauge.fc_object_name)
         else:
             if new_gauge.type=="mesh" or new_gauge.type=="flow":
                 delete_group(new_gauge.fc_object_name)
@@ -145,9 +158,14 @@ class GaugesListDialog(QtWidgets.QDialog):
         elif gauge.__class__ == MeshGauge:
             dialog = MeshGaugeDialog(mesh_gauge=gauge, parent=None)
             dialog.exec_()
+        elif gauge.__class__ == GaugeArray:
+            dialog = GaugeArrayDialog(gauge_array=gauge, parent=None)
+            dialog.exec_()
         elif gauge.__class__ == Gauge:
             dialog = GaugeDefaultsDialog(base_gauge=gauge, parent=None)
             dialog.exec_()
+        if gauge.fc_object_name:
+            update_helper(Case.the(), HelperKind.GAUGE, gauge.fc_object_name)
         self.update_gauges_list()
 
     def on_delete(self):
@@ -159,6 +177,7 @@ class GaugesListDialog(QtWidgets.QDialog):
                 delete_group(Case.the().gauges.gauges_dict[key].fc_object_name)
             else:
                 delete_object(Case.the().gauges.gauges_dict[key].fc_object_name)
+            remove_helper(Case.the(), HelperKind.GAUGE, Case.the().gauges.gauges_dict[key].fc_object_name)
             Case.the().gauges.remove_gauge(key)
         self.update_gauges_list()
 
@@ -8,11 +8,12 @@ from PySide2 import QtCore, QtWidgets
 from mod.dataobjects.case import Case
 from mod.dataobjects.inletoutlet.inlet_outlet_config import InletOutletConfig
 from mod.dataobjects.inletoutlet.inlet_outlet_zone import InletOutletZone
-from mod.enums import InletOutletDetermLimit, InletOutletZoneGeneratorType, ObjectType
+from mod.enums import HelperKind, InletOutletDetermLimit, InletOutletZoneGeneratorType, ObjectType
 from mod.tools.freecad_tools import delete_group, create_inout_zone_box, create_inout_zone_circle, \
     create_inout_zone_line, create_inout_zone_3d_mk_object, update_inout_zone_3d_mk_object, \
-    update_inout_zone_2d_mk_object
+    update_inout_zone_2d_mk_object, store_inout_zone_geometry_key
 from mod.tools.freecad_tools import manage_inlet_outlet_zones
+from mod.tools.helper_index_tools import remove_helper, update_helper, update_helper_kind
 from mod.tools.stdout_tools import log
 from mod.tools.translation_tools import __
 from mod.widgets.dock.special_widgets.inout.inlet_zone_edit import InletZoneEdit
@@ -232,6 +233,7 @@ class InletConfigDialog(QtWidgets.QDialog):
         self.finish_button.setFocus()
 
         manage_inlet_outlet_zones(Case.the().inlet_outlet.zones)
+        update_helper_kind(Case.the(), HelperKind.INOUT_ZONE)
 
 
     def on_add_line_zone(self):
@@ -240,6 +242,8 @@ class InletConfigDialog(QtWidgets.QDialog):
         info=new_io_zone.zone_info
         new_io_zone.fc_object_name = create_inout_zone_line(info.zone_line_generator, info.zone_direction_2d,
                                                            info.zone_rotation_2d)
+        store_inout_zone_geometry_key(new_io_zone)
+        update_helper(Case.the(), HelperKind.INOUT_ZONE, new_io_zone.fc_object_name)
         self.inlet_outlet.zones.append(new_io_zone)
         self.refresh_zones()
         self.zone_edit(io = new_io_zone,new=True)
@@ -256,6 +260,8 @@ class InletConfigDialog(QtWidgets.QDialog):
             update_inout_zone_2d_mk_object(new_io_zone.fc_object_name, info.zone_mk_generator,
                                            info.zone_direction_2d,
                                            info.zone_rotation_2d,obj_name)
+            store_inout_zone_geometry_key(new_io_zone)
+            update_helper(Case.the(), HelperKind.INOUT_ZONE, new_io_zone.fc_object_name)
 
     def on_add_box_zone(self):
         """ Adds Inlet/Outlet zone """
@@ -263,6 +269,8 @@ class InletConfigDialog(QtWidgets.QDialog):
         info = new_io_zone.zone_info
         new_io_zone.fc_object_name = create_inout_zone_box(info.zone_box_generator, info.zone_direction_3d,
                                                                    info.zone_rotation_3d)
+        store_inout_zone_geometry_key(new_io_zone)
+        update_helper(Case.the(), HelperKind.INOUT_ZONE, new_io_zone.fc_object_name)
         self.inlet_outlet.zones.append(new_io_zone)
         self.refresh_zones()
         self.zone_edit(io = new_io_zone,new=True)
@@ -273,6 +281,8 @@ class InletConfigDialog(QtWidgets.QDialog):
         info=new_io_zone.zone_info
         new_io_zone.fc_object_name = create_inout_zone_circle(info.zone_circle_generator, info.zone_direction_3d,
                                                            info.zone_rotation_3d)
+        store_inout_zone_geometry_key(new_io_zone)
+        update_helper(Case.the(), HelperKind.INOUT_ZONE, new_io_zone.fc_object_name)
         self.inlet_outlet.zones.append(new_io_zone)
         self.refresh_zones()
         self.zone_edit(io = new_io_zone,new=True)
@@ -289,6 +299,8 @@ class InletConfigDialog(QtWidgets.QDialog):
             update_inout_zone_3d_mk_object(new_io_zone.fc_object_name,info.zone_mk_generator,
                                                                     info.zone_direction_3d,
                                                                     info.zone_rotation_3d,obj_name)
+            store_inout_zone_geometry_key(new_io_zone)
+            update_helper(Case.the(), HelperKind.INOUT_ZONE, new_io_zone.fc_object_name)
 
     def refresh_zones(self):
         """ Refreshes the zones list """
@@ -307,6 +319,7 @@ class InletConfigDialog(QtWidgets.QDialog):
         """ Delete one zone from the list """
         io_zone_obj_name=io.fc_object_name
         delete_group(io_zone_obj_name)
+        remove_helper(Case.the(), HelperKind.INOUT_ZONE, io_zone_obj_name)
         self.inlet_outlet.zones.remove(io)
         self.refresh_zones()
 
@@ -319,6 +332,7 @@ class InletConfigDialog(QtWidgets.QDialog):
         if ret==QDialog.Rejected and new:
             self.zone_delete(io)
             return False
+        update_helper(Case.the(), HelperKind.INOUT_ZONE, io.fc_object_name)
         self.refresh_zones()
         return True
 
@@ -9,8 +9,7 @@ from mod.dataobjects.inletoutlet.inlet_outlet_zone import InletOutletZone
 from mod.enums import InletOutletElevationType, InletOutletVelocitySpecType, InletOutletVelocityType, \
     InletOutletZSurfMode, InletOutletZoneGeneratorType, InletOutletZoneType, ObjectType
 from mod.tools.dialog_tools import warning_dialog
-from mod.tools.freecad_tools import update_inout_zone_box, update_inout_zone_circle, update_inout_zone_line, \
-    update_inout_zone_3d_mk_object, change_mk_inout_zone_3d, update_inout_zone_2d_mk_object
+from mod.tools.freecad_tools import change_mk_inout_zone_3d, update_inout_zone
 from mod.tools.translation_tools import __
 from mod.widgets.custom_widgets.int_value_input import IntValueInput
 from mod.widgets.dock.special_widgets.inout.velocity_widgets import VelocityTypeFixedConstantWidget, VelocityTypeFixedLinearWidget, \
@@ -462,8 +461,7 @@ class InletZoneEdit(QtWidgets.QDialog):
                     original = Case.the().get_first_fc_object_from_mk(ObjectType.FLUID,values["mkfluid"])
                     if values["mkfluid"] != mk:
                         change_mk_inout_zone_3d(self.target_io_zone.fc_object_name,original)
-                    update_inout_zone_2d_mk_object(self.target_io_zone.fc_object_name, info.zone_mk_generator, info.zone_direction_2d,
-                                   info.zone_rotation_2d,original)
+                    update_inout_zone(self.target_io_zone)
             else:
                 return False
         elif info.zone_generator_type == InletOutletZoneGeneratorType.MK_3D:
@@ -476,23 +474,20 @@ class InletZoneEdit(QtWidgets.QDialog):
                 if self.target_io_zone.fc_object_name:
                     if values["mkfluid"] != mk:
                         change_mk_inout_zone_3d(self.target_io_zone.fc_object_name,Case.the().get_first_fc_object_from_mk(ObjectType.FLUID,values["mkfluid"]))
-                    update_inout_zone_3d_mk_object(self.target_io_zone.fc_object_name, info.zone_mk_generator, info.zone_direction_3d,
-                                   info.zone_rotation_3d,Case.the().get_first_fc_object_from_mk(ObjectType.FLUID,values["mkfluid"]))
+                    update_inout_zone(self.target_io_zone)
             else:
                 return False
         elif info.zone_generator_type == InletOutletZoneGeneratorType.LINE:
             info.zone_line_generator.save_values(self.line_zone_generator_widget.to_dict())
             info.zone_rotation_2d.save_values(self.line_zone_generator_widget.rotation_widget.to_dict())
             info.zone_direction_2d.save_values(self.line_zone_generator_widget.direction_widget.to_dict())
-            update_inout_zone_line(self.target_io_zone.fc_object_name, info.zone_line_generator, info.zone_direction_2d,
-                                   info.zone_rotation_2d)
+            update_inout_zone(self.target_io_zone)
         elif info.zone_generator_type == InletOutletZoneGeneratorType.BOX:
             if self.check_box_inlet():
                 info.zone_box_generator.save_values(self.box_zone_generator_widget.to_dict())
                 info.zone_direction_3d.save_values(self.box_zone_generator_widget.direction_widget.to_dict())
                 info.zone_rotation_3d.save_values(self.box_zone_generator_widget.rotation_widget.to_dict())
-                update_inout_zone_box(self.target_io_zone.fc_object_name, info.zone_box_generator, info.zone_direction_3d,
-                                      info.zone_rotation_3d)
+                update_inout_zone(self.target_io_zone)
             else:
                 return False
         elif info.zone_generator_type == InletOutletZoneGeneratorType.CIRCLE:
@@ -500,8 +495,7 @@ class InletZoneEdit(QtWidgets.QDialog):
             info.zone_rotation_3d.save_values(self.circle_zone_generator_widget.rotation_widget.to_dict())
             info.zone_direction_3d.save_values(self.circle_zone_generator_widget.direction_widget.to_dict())
             info.zone_circle_generator.save_values(self.circle_zone_generator_widget.to_dict())
-            update_inout_zone_circle(self.target_io_zone.fc_object_name, info.zone_circle_generator,
-                                     info.zone_direction_3d, info.zone_rotation_3d)
+            update_inout_zone(self.target_io_zone)
 
         # Velocity info
         info = self.target_io_zone.velocity_info
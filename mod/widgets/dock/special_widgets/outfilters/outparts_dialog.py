@@ -1,13 +1,22 @@
+import numpy as np
+
 from PySide2 import QtWidgets
-from mod.constants import OUTFILTERS_GROUP_NAME
+from mod.constants import OUTFILTERS_GROUP_NAME, OUTPARTS_PREVIEW_MAX_POINTS
 from mod.dataobjects.case import Case
 
 from mod.dataobjects.outparts_filter.filters import FilterPos, FilterPlane, FilterSphere, FilterCylinder, TypeFilter, \
     FilterMK, FilterGroup
-from mod.tools.dialog_tools import ok_cancel_dialog, info_dialog
+from mod.enums import HelperKind
+from mod.tools.background_tools import run_in_background
+from mod.tools.dialog_tools import ok_cancel_dialog, info_dialog, warning_dialog
 from mod.tools.freecad_tools import delete_object, create_parts_out_sphere, create_parts_out_box, \
-    get_fc_object, create_parts_out_cylinder
+    get_fc_object, create_parts_out_cylinder, draw_point_cloud
 from mod.tools.freecad_tools import manage_partfilters
+from mod.tools.helper_index_tools import remove_helper, update_helper, update_helper_kind
+from mod.tools.outparts_tools import OutpartsPreview, apply_filters, load_gencase_particles
+from mod.tools.particle_estimation_tools import format_particle_count, format_size
+from mod.tools.point_set_tools import decimate_points
+from mod.tools.stdout_tools import log
 
 from mod.tools.translation_tools import __
 from mod.widgets.custom_widgets.int_value_input import IntValueInput
@@ -20,6 +29,8 @@ from mod.widgets.dock.special_widgets.outfilters.pos_filter_dialog import PosFil
 from mod.widgets.dock.special_widgets.outfilters.sphere_filter_dialog import SphereFilterDialog
 from mod.widgets.dock.special_widgets.outfilters.type_filter_dialog import TypeFilterDialog
 
+OUTPARTS_PREVIEW_NAME = "OutParts_Preview"
+
 
 class OutpartsDialog(QtWidgets.QDialog):
 
@@ -67,17 +78,28 @@ class OutpartsDialog(QtWidgets.QDialog):
         self.delete_filter_button.clicked.connect(self.on_delete)
 
 
+        self.preview_button = QtWidgets.QPushButton(__("Preview"))
+        self.preview_button.setToolTip(__("Applies the filters to the particles created by GenCase and draws the kept "
+                                          "ones as a point cloud. Big sets are decimated to {} points.").format(
+                                              OUTPARTS_PREVIEW_MAX_POINTS))
+        self.preview_button.clicked.connect(self.on_preview)
+        self.preview_label = QtWidgets.QLabel()
+        self.preview_label.setWordWrap(True)
+        self.preview_label.setVisible(False)
+
         self.ok_button = QtWidgets.QPushButton(text=__("OK"))
         self.ok_button.clicked.connect(self.on_ok)
         self.buttons_layout.addWidget(self.add_filter_button)
         self.buttons_layout.addWidget(self.edit_filter_button)
         self.buttons_layout.addWidget(self.delete_filter_button)
+        self.buttons_layout.addWidget(self.preview_button)
         self.buttons_layout.addWidget(self.ok_button)
 
         self.main_layout.addLayout(self.active_layout)
         self.main_layout.addLayout(self.preselect_all_layout)
         self.main_layout.addLayout(self.ignore_nparts_layout)
         self.main_layout.addLayout(self.list_layout)
+        self.main_layout.addWidget(self.preview_label)
         self.main_layout.addLayout(self.buttons_layout)
         self.setLayout(self.main_layout)
 
@@ -91,6 +113,7 @@ class OutpartsDialog(QtWidgets.QDialog):
 
         self.on_activate(Case.the().outparts.active)
         manage_partfilters(Case.the().outparts.filts)
+        update_helper_kind(Case.the(), HelperKind.OUTPUT_FILTER)
         self.update_filter_list()
 
     def on_ok(self):
@@ -102,6 +125,34 @@ class OutpartsDialog(QtWidgets.QDialog):
     def on_cancel(self):
         self.reject()
 
+    def on_preview(self):
+        """ Applies the filters, as set in the dialog, to the particles created by GenCase. Shows the particles they
+        keep in each part and draws them, replacing the previous preview. """
+        try:
+            particles = run_in_background(load_gencase_particles, Case.the())
+        except OSError:
+            warning_dialog(__("Run GenCase to create the particles to preview the filters on."))
+            return
+        except ValueError as ex:
+            warning_dialog(__("The particles created by GenCase can't be read."), str(ex))
+            return
+        if self.active_checkbox.isChecked():
+            kept = apply_filters(Case.the().outparts.filts, self.preselect_all_checkbox.isChecked(), particles)
+        else:
+            kept = np.ones(len(particles), dtype=bool)
+        preview = OutpartsPreview(particles, kept)
+        self.preview_label.setText(__(
+            "{} of {} particles stored in each part are kept ({:.1f} %). Part size: {} instead of {}."
+        ).format(format_particle_count(int(preview.kept_count)), format_particle_count(int(preview.stored_count)),
+                 100 * preview.kept_fraction, format_size(preview.part_size), format_size(preview.unfiltered_part_size)))
+        self.preview_label.setVisible(True)
+        delete_object(OUTPARTS_PREVIEW_NAME)
+        kept_positions = particles.positions[preview.stored & kept]
+        if len(kept_positions):
+            draw_point_cloud(decimate_points(kept_positions, OUTPARTS_PREVIEW_MAX_POINTS), OUTPARTS_PREVIEW_NAME)
+        log("Previewing {} of {} particles kept by the output filters".format(
+            min(len(kept_positions), OUTPARTS_PREVIEW_MAX_POINTS), len(kept_positions)))
+
     def on_add_filter_menu(self, action):
         """ Defines damping menu behaviour"""
         if __("Add position filter") in action.text():
@@ -140,6 +191,7 @@ class OutpartsDialog(QtWidgets.QDialog):
                 info_dialog(f"Filter named {new_filter.name} already exists")
             else:
                 Case.the().outparts.add_filter(new_filter)
+                update_helper(Case.the(), HelperKind.OUTPUT_FILTER, new_filter.fc_object_name)
             new_filter.process_strings()
         else:
             delete_object(new_filter.fc_object_name)
@@ -176,6 +228,7 @@ class OutpartsDialog(QtWidgets.QDialog):
             dialog = GroupFilterDialog(group_filter=filter, parent=None)
             dialog.exec_()
         filter.process_strings()
+        update_helper(Case.the(), HelperKind.OUTPUT_FILTER, filter.fc_object_name)
         self.update_filter_list()
 
     def on_delete(self):
@@ -188,6 +241,7 @@ class OutpartsDialog(QtWidgets.QDialog):
                 Case.the().outparts.remove_filter(name)
         else:
             delete_object(Case.the().outparts.filts[name].fc_object_name)
+            remove_helper(Case.the(), HelperKind.OUTPUT_FILTER, Case.the().outparts.filts[name].fc_object_name)
             Case.the().outparts.remove_filter(name)
 
         self.update_filter_list()
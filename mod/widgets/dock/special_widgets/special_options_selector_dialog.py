@@ -10,26 +10,15 @@ from PySide2 import QtWidgets
 
 from mod.tools.translation_tools import __
 from mod.tools.dialog_tools import error_dialog, warning_dialog, ok_cancel_dialog
-from mod.enums import ObjectType, DampingType
+from mod.enums import ObjectType, DampingType, HelperKind
 from mod.constants import APP_NAME
 from mod.tools.freecad_tools import setup_damping_environment, delete_group
-from mod.widgets.dock.special_widgets.damping.damping_box_config_dialog import DampingBoxConfigDialog
-from mod.widgets.dock.special_widgets.damping.damping_cylinder_dialog import DampingCylinderConfigDialog
-from mod.widgets.dock.special_widgets.flex_struct_dialog import FlexStructDialog
-from mod.widgets.dock.special_widgets.gauges.gauges_list_dialog import GaugesListDialog
-
-from mod.widgets.dock.special_widgets.ml_piston_1d_config_dialog import MLPiston1DConfigDialog
-from mod.widgets.dock.special_widgets.ml_piston_2d_config_dialog import MLPiston2DConfigDialog
-from mod.widgets.dock.special_widgets.outfilters.outparts_dialog import OutpartsDialog
-from mod.widgets.dock.special_widgets.relaxation_zone.relaxation_zone_regular_config_dialog import RelaxationZoneRegularConfigDialog
-from mod.widgets.dock.special_widgets.relaxation_zone.relaxation_zone_irregular_config_dialog import RelaxationZoneIrregularConfigDialog
-from mod.widgets.dock.special_widgets.relaxation_zone.relaxation_zone_file_config_dialog import RelaxationZoneFileConfigDialog
-from mod.widgets.dock.special_widgets.relaxation_zone.relaxation_zone_uniform_config_dialog import RelaxationZoneUniformConfigDialog
-from mod.widgets.dock.special_widgets.acceleration_input_dialog import AccelerationInputDialog
-from mod.widgets.dock.special_widgets.damping.damping_zone_config_dialog import DampingZoneConfigDialog
-from mod.widgets.dock.special_widgets.inout.inlet_config_dialog import InletConfigDialog
-from mod.widgets.dock.special_widgets.chrono.chrono_config_dialog import ChronoConfigDialog
-from mod.widgets.dock.special_widgets.moorings.moorings_configuration_dialog import MooringsConfigurationDialog
+from mod.tools.helper_index_tools import update_helper
+from mod.widgets.dialog_registry import AccelerationInputDialog, ChronoConfigDialog, DampingBoxConfigDialog, \
+    DampingCylinderConfigDialog, DampingZoneConfigDialog, FlexStructDialog, GaugesListDialog, InletConfigDialog, \
+    MLPiston1DConfigDialog, MLPiston2DConfigDialog, MooringsConfigurationDialog, OutpartsDialog, \
+    RelaxationZoneFileConfigDialog, RelaxationZoneIrregularConfigDialog, RelaxationZoneRegularConfigDialog, \
+    RelaxationZoneUniformConfigDialog, VariableResConfigDialog
 
 from mod.dataobjects.case import Case
 from mod.dataobjects.configuration.application_settings import ApplicationSettings
@@ -40,7 +29,6 @@ from mod.dataobjects.relaxation_zone.relaxation_zone_regular import RelaxationZo
 from mod.dataobjects.relaxation_zone.relaxation_zone_irregular import RelaxationZoneIrregular
 from mod.dataobjects.relaxation_zone.relaxation_zone_file import RelaxationZoneFile
 from mod.dataobjects.relaxation_zone.relaxation_zone_uniform import RelaxationZoneUniform
-from mod.widgets.dock.special_widgets.variable_res.variable_res_config_dialog import VariableResConfigDialog
 
 
 class SpecialOptionsSelectorDialog(QtWidgets.QDialog):
@@ -163,6 +151,8 @@ class SpecialOptionsSelectorDialog(QtWidgets.QDialog):
         if ret != QtWidgets.QDialog.Accepted:
             Case.the().remove_damping_zone(damping_group_name)
             delete_group(damping_group_name)
+        else:
+            update_helper(Case.the(), HelperKind.DAMPING_ZONE, damping_group_name)
         self.accept()
 
 
@@ -1,7 +1,9 @@
 from PySide2 import QtWidgets
 from mod.dataobjects.case import Case
 from mod.tools.dialog_tools import ok_cancel_dialog, error_dialog
+from mod.enums import HelperKind
 from mod.tools.freecad_tools import manage_vres_bufferboxes
+from mod.tools.helper_index_tools import update_helper_kind
 from mod.tools.translation_tools import __
 from mod.tools.stdout_tools import debug
 
@@ -87,26 +89,10 @@ class VariableResConfigDialog(QtWidgets.QDialog):
         self.update_buffer_boxs_list()
 
     def update_buffer_boxs_list(self):
+        update_helper_kind(Case.the(), HelperKind.VRES_BOX) # Boxes added, edited or deleted
         self.buffer_boxs_list.clear()
-        buff_list=Case.the().vres.bufferbox_list.copy()
-        remove_buff=[]
-        for buff in buff_list:
-            if buff.parent:
-                remove_buff.append(buff)
-   
-        if remove_buff:
-            for rem in remove_buff:
-                buff_list.remove(rem)
-
-        while buff_list:
-            buffer_box= buff_list.pop(0)
-            sons = Case.the().vres.get_children(buffer_box.id)
-            for son in sons:
-                if son in buff_list:
-                    buff_list.remove(son)
-                buff_list.insert(0,son)
-            if buffer_box.parent:
-                buffer_box.depth=buffer_box.parent.depth + 1
+        for buffer_box, depth in Case.the().vres.get_tree_order():
+            buffer_box.depth = depth
             self.buffer_boxs_list.addItem(self.spaces(buffer_box.depth) + str(buffer_box.id)) #Add spacings
         self.buffer_boxs_list.setCurrentRow(0)
 
@@ -11,24 +11,17 @@ from PySide2.QtWidgets import QWidget
 
 from mod.dataobjects.configuration.application_settings import ApplicationSettings
 from mod.tools.translation_tools import __
-from mod.enums import ObjectType, ObjectFillMode, FreeCADObjectType, HelpURL, DampingType
+from mod.enums import ObjectType, ObjectFillMode, FreeCADObjectType, HelpURL, DampingType, HelperKind
 from mod.constants import PROP_WIDGET_INTERNAL_NAME, MKFLUID_LIMIT, MKFLUID_OFFSET
 from mod.tools.stdout_tools import log
 from mod.tools.dialog_tools import warning_dialog
-from mod.widgets.dock.special_widgets.damping.damping_box_config_dialog import DampingBoxConfigDialog
-from mod.widgets.dock.special_widgets.damping.damping_zone_config_dialog import DampingZoneConfigDialog
-from mod.widgets.dock.special_widgets.damping.damping_cylinder_dialog import DampingCylinderConfigDialog
-from mod.widgets.properties_widgets.initials_dialog import InitialsDialog
-from mod.widgets.properties_widgets.bound_normals_dialog import BoundNormalsDialog
-from mod.widgets.properties_widgets.mdbc_dialog import MDBCDialog
-from mod.widgets.properties_widgets.motion.movement_dialog import MovementDialog
-from mod.widgets.properties_widgets.float_state_dialog import FloatStateDialog
-from mod.widgets.properties_widgets.faces_dialog import FacesDialog
-from mod.widgets.properties_widgets.material_dialog import MaterialDialog
+from mod.tools.helper_index_tools import update_helper
+from mod.widgets.dialog_registry import BoundNormalsDialog, DampingBoxConfigDialog, DampingCylinderConfigDialog, \
+    DampingZoneConfigDialog, FacesDialog, FloatStateDialog, InitialsDialog, MDBCDialog, MaterialDialog, \
+    MovementDialog, SimObjectDialog
 
 from mod.dataobjects.case import Case
 from mod.dataobjects.properties.simulation_object import SimulationObject
-from mod.widgets.properties_widgets.sim_object_dialog import SimObjectDialog
 
 
 class PropertiesDockWidget(QtWidgets.QDockWidget):
@@ -281,6 +274,7 @@ class PropertiesDockWidget(QtWidgets.QDockWidget):
             DampingBoxConfigDialog(damping=damping, group=group, parent=None).exec_()
         elif damping.damping_type == DampingType.CYLINDER:
             DampingCylinderConfigDialog(damping=damping, group=group, parent=None).exec_()
+        update_helper(Case.the(), HelperKind.DAMPING_ZONE, group.Name)
         
     def on_objtype_change(self, index):
         """ Defines what happens when type of object is changed """
@@ -13,6 +13,7 @@ from mod.widgets.custom_widgets.time_input import TimeInput
 from mod.widgets.custom_widgets.value_input import ValueInput
 from mod.widgets.custom_widgets.int_value_input import IntValueInput
 from mod.tools.dialog_tools import warning_dialog
+from mod.widgets.properties_widgets.motion.wave_preview_dialog import WavePreviewDialog
 
 
 class IrregularFlapWaveMotionTimeline(QtWidgets.QWidget):
@@ -143,7 +144,8 @@ class IrregularFlapWaveMotionTimeline(QtWidgets.QWidget):
         self.root_layout.addWidget(self.root_label)
         self.root_layout.addStretch(1)
 
-        for x in [self.duration_label, self.duration_input]:
+        self.preview_button = QtWidgets.QPushButton(__("Preview"))
+        for x in [self.duration_label, self.duration_input, self.preview_button]:
             self.root_layout.addWidget(x)
 
         self.first_row_layout = QtWidgets.QHBoxLayout()
@@ -243,6 +245,7 @@ class IrregularFlapWaveMotionTimeline(QtWidgets.QWidget):
         self.saveseriewaves_xpos_input.setValue(irreg_wave_gen.saveseriewaves_xpos)
 
     def _init_connections(self):
+        self.preview_button.clicked.connect(self.on_preview)
         self.serieini_autofit.stateChanged.connect(self.on_change)
         for x in [self.wave_order_selector, self.spectrum_selector, self.discretization_selector]:
             x.currentIndexChanged.connect(self.on_change)
@@ -306,6 +309,13 @@ class IrregularFlapWaveMotionTimeline(QtWidgets.QWidget):
                                     saveseriewaves_timemax=self.saveseriewaves_timemax_input.value(),
                                     saveseriewaves_xpos=self.saveseriewaves_xpos_input.value())
 
+    def on_preview(self):
+        """ Opens a preview of the wave series generated with the current values. """
+        try:
+            WavePreviewDialog(self.construct_motion_object(), parent=self)
+        except ValueError:
+            warning_dialog("Introduced an invalid value for a float number.")
+
     def on_delete(self):
         """ Deletes the currently defined object. """
         self.deleted.emit(self.index, self.construct_motion_object())
@@ -16,6 +16,7 @@ from mod.widgets.custom_widgets.time_input import TimeInput
 from mod.widgets.custom_widgets.value_input import ValueInput
 from mod.widgets.custom_widgets.int_value_input import IntValueInput
 from mod.tools.dialog_tools import warning_dialog
+from mod.widgets.properties_widgets.motion.wave_preview_dialog import WavePreviewDialog
 
 
 class IrregularPistonWaveMotionTimeline(QtWidgets.QWidget):
@@ -191,7 +192,8 @@ class IrregularPistonWaveMotionTimeline(QtWidgets.QWidget):
         self.root_layout = QtWidgets.QHBoxLayout()
         self.root_layout.addWidget(self.root_label)
         self.root_layout.addStretch(1)
-        for x in [self.duration_label, self.duration_input]:
+        self.preview_button = QtWidgets.QPushButton(__("Preview"))
+        for x in [self.duration_label, self.duration_input, self.preview_button]:
             self.root_layout.addWidget(x)
 
         self.first_row_layout = QtWidgets.QHBoxLayout()
@@ -336,6 +338,7 @@ class IrregularPistonWaveMotionTimeline(QtWidgets.QWidget):
         self._awas_enabled_handler()
 
     def _init_connections(self):
+        self.preview_button.clicked.connect(self.on_preview)
         self.serieini_autofit.stateChanged.connect(self.on_change)
         self.awas_savedata_selector.currentIndexChanged.connect(self.on_change)
         self.awas_elevation_selector.currentIndexChanged.connect(
@@ -466,6 +469,13 @@ class IrregularPistonWaveMotionTimeline(QtWidgets.QWidget):
                                       saveseriewaves_xpos=self.saveseriewaves_xpos_input.value(),
                                       awas=awas_object)
 
+    def on_preview(self):
+        """ Opens a preview of the wave series generated with the current values. """
+        try:
+            WavePreviewDialog(self.construct_motion_object(), parent=self)
+        except ValueError:
+            warning_dialog("Introduced an invalid value for a float number.")
+
     def on_delete(self):
         """ Deletes the currently defined object. """
         self.deleted.emit(self.index, self.construct_motion_object())
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""DesignSPHysics Motion Preview Dialog """
+
+import numpy as np
+
+import FreeCAD
+
+from PySide2 import QtCore, QtWidgets
+
+from mod.appmode import AppMode
+from mod.constants import MKFLUID_LIMIT, MOTION_PREVIEW_FRAME_INTERVAL, MOTION_PREVIEW_TIME_STEPS
+from mod.dataobjects.case import Case
+from mod.enums import ObjectType
+from mod.tools.freecad_tools import get_fc_object, get_rigid_placement
+from mod.tools.motion_tools import check_case_motions, evaluate_case_motions
+from mod.tools.stdout_tools import log
+from mod.tools.template_tools import obj_to_dict
+from mod.tools.translation_tools import __
+from mod.widgets.custom_widgets.value_input import ValueInput
+
+
+class MotionPreviewDialog(QtWidgets.QDialog):
+    """ Evaluates the motions of the case, reports the bodies that leave the domain or reach other boundaries
+    and plays them back in the 3D view. The objects are put back in place when the dialog is closed. """
+
+    def __init__(self, mk_movements: dict = None, parent=None):
+        super().__init__(parent=parent)
+        self.setWindowTitle(__("Motion preview"))
+        self.setMinimumWidth(600)
+        if mk_movements is None:
+            mk_movements = {real_mk: properties.movements for real_mk, properties in Case.the().mkbasedproperties.items()}
+        self.mk_movements: dict = {real_mk: obj_to_dict(movements) for real_mk, movements in mk_movements.items() if movements}
+        self.times: np.ndarray = np.zeros(1)
+        self.mk_transforms: dict = dict()
+        self.original_placements: dict = dict()
+        self.mk_objects: dict = dict()
+
+        # Evaluation settings
+        self.duration_label = QtWidgets.QLabel(__("Duration (s): "))
+        self.duration_input = ValueInput(min_val=0.0)
+        self.duration_input.setValue(Case.the().execution_parameters.timemax)
+        self.steps_label = QtWidgets.QLabel(__("Instants: "))
+        self.steps_input = QtWidgets.QSpinBox()
+        self.steps_input.setRange(2, 1000000)
+        self.steps_input.setValue(MOTION_PREVIEW_TIME_STEPS)
+        self.evaluate_button = QtWidgets.QPushButton(__("Evaluate"))
+        self.settings_layout = QtWidgets.QHBoxLayout()
+        for x in [self.duration_label, self.duration_input, self.steps_label, self.steps_input]:
+            self.settings_layout.addWidget(x)
+        self.settings_layout.addStretch(1)
+        self.settings_layout.addWidget(self.evaluate_button)
+
+        # Report
+        self.report_text = QtWidgets.QPlainTextEdit()
+        self.report_text.setReadOnly(True)
+
+        # Playback
+        self.play_button = QtWidgets.QPushButton(__("Play"))
+        self.play_button.setCheckable(True)
+        self.time_slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
+        self.time_label = QtWidgets.QLabel()
+        self.playback_layout = QtWidgets.QHBoxLayout()
+        self.playback_layout.addWidget(self.play_button)
+        self.playback_layout.addWidget(self.time_slider, 1)
+        self.playback_layout.addWidget(self.time_label)
+        self.play_timer = QtCore.QTimer(self)
+        self.play_timer.setInterval(MOTION_PREVIEW_FRAME_INTERVAL)
+
+        self.close_button = QtWidgets.QPushButton(__("Close"))
+        self.button_layout = QtWidgets.QHBoxLayout()
+        self.button_layout.addStretch(1)
+        self.button_layout.addWidget(self.close_button)
+
+        self.main_layout = QtWidgets.QVBoxLayout()
+        self.main_layout.addLayout(self.settings_layout)
+        self.main_layout.addWidget(self.report_text)
+        self.main_layout.addLayout(self.playback_layout)
+        self.main_layout.addLayout(self.button_layout)
+        self.setLayout(self.main_layout)
+
+        self.evaluate_button.clicked.connect(self.on_evaluate)
+        self.play_button.toggled.connect(self.on_play)
+        self.play_timer.timeout.connect(self.on_next_frame)
+        self.time_slider.valueChanged.connect(self.show_frame)
+        self.close_button.clicked.connect(self.reject)
+        self.finished.connect(self.on_finished)
+
+        self.store_placements()
+        self.on_evaluate()
+
+        self.exec_()
+
+    def store_placements(self):
+        """ Stores the placement of the objects with motion to restore them after the preview. """
+        for real_mk in self.mk_movements:
+            self.mk_objects[real_mk] = list()
+            for obj in Case.the().objects:
+                if obj.type == ObjectType.SPECIAL or obj.real_mk() != real_mk:
+                    continue
+                fc_object = get_fc_object(obj.name)
+                if fc_object is not None and hasattr(fc_object, "Placement"):
+                    self.mk_objects[real_mk].append(fc_object)
+                    self.original_placements[fc_object.Name] = FreeCAD.Placement(fc_object.Placement)
+
+    def restore_placements(self):
+        """ Puts the objects with motion back in their initial placement. """
+        for fc_objects in self.mk_objects.values():
+            for fc_object in fc_objects:
+                fc_object.Placement = self.original_placements[fc_object.Name]
+
+    def on_evaluate(self):
+        """ Evaluates the motions over the selected time and shows the issues found. """
+        self.play_button.setChecked(False)
+        self.restore_placements()
+        self.times = np.linspace(0.0, max(self.duration_input.value(), 0.0), self.steps_input.value())
+        report = list()
+        try:
+            self.mk_transforms, skipped = evaluate_case_motions(Case.the(), self.mk_movements, self.times)
+            issues, _ = check_case_motions(Case.the(), self.mk_transforms, self.times, AppMode.is_3d())
+        except (OSError, ValueError) as ex:
+            self.mk_transforms, skipped, issues = dict(), list(), list()
+            report.append(__("The motion could not be evaluated: {}").format(ex))
+        report += [str(issue) for issue in issues]
+        report += [__("Not evaluated: {}").format(name) for name in skipped]
+        if self.mk_transforms and not issues:
+            report.append(__("No issues found for mk {}.").format(
+                ", ".join(str(real_mk - MKFLUID_LIMIT) for real_mk in self.mk_transforms)))
+        if not self.mk_movements:
+            report.append(__("There are no motions to evaluate."))
+        self.report_text.setPlainText("\n".join(report))
+        for line in report:
+            log(line)
+
+        self.time_slider.setRange(0, len(self.times) - 1)
+        self.time_slider.setValue(0)
+        self.show_frame(0)
+
+    def show_frame(self, frame: int):
+        """ Places the objects with motion where they are at the given frame. """
+        self.time_label.setText("t = {:.3f} s".format(self.times[frame]))
+        for real_mk, (rotations, translations) in self.mk_transforms.items():
+            placement = get_rigid_placement(rotations[frame], translations[frame])
+            for fc_object in self.mk_objects.get(real_mk, []):
+                fc_object.Placement = placement.multiply(self.original_placements[fc_object.Name])
+
+    def on_play(self, playing: bool):
+        """ Starts or stops the playback. """
+        self.play_button.setText(__("Pause") if playing else __("Play"))
+        if playing:
+            self.play_timer.start()
+        else:
+            self.play_timer.stop()
+
+    def on_next_frame(self):
+        """ Shows the next frame, going back to the start after the last one. """
+        self.time_slider.setValue((self.time_slider.value() + 1) % (self.time_slider.maximum() + 1))
+
+    def on_finished(self, _):
+        """ Stops the playback and puts the objects back in place. """
+        self.play_timer.stop()
+        self.restore_placements()
+        FreeCAD.ActiveDocument.recompute()
@@ -43,6 +43,7 @@ from mod.widgets.properties_widgets.motion.focused_piston_wave_motion_timeline i
 from mod.widgets.properties_widgets.motion.irregular_flap_wave_motion_timeline import IrregularFlapWaveMotionTimeline
 from mod.widgets.properties_widgets.motion.irregular_piston_wave_motion_timeline import IrregularPistonWaveMotionTimeline
 from mod.widgets.properties_widgets.motion.movement_actions import MovementActions
+from mod.widgets.properties_widgets.motion.motion_preview_dialog import MotionPreviewDialog
 from mod.widgets.properties_widgets.motion.movement_timeline_placeholder import MovementTimelinePlaceholder
 from mod.widgets.properties_widgets.motion.path_file_motion_timeline import PathFileMotionTimeline
 from mod.widgets.properties_widgets.motion.rect_sinu_motion_timeline import RectSinuMotionTimeline
@@ -68,6 +69,9 @@ class MovementDialog(QtWidgets.QDialog):
         self.setWindowTitle(__("Motion configuration"))
         self.ok_button = QtWidgets.QPushButton(__("OK"))
         self.cancel_button = QtWidgets.QPushButton(__("Cancel"))
+        self.preview_button = QtWidgets.QPushButton(__("Preview motion"))
+        self.preview_button.setToolTip(__("Evaluates the motions of the case, checks them against the domain and "
+                                          "the other boundaries and plays them in the 3D view."))
         self.notice_label = QtWidgets.QLabel("")
         self.notice_label.setStyleSheet("QLabel { color : red; }")
         self.target=Case.the().get_simulation_object(FreeCADGui.Selection.getSelection()[0].Name)
@@ -77,6 +81,7 @@ class MovementDialog(QtWidgets.QDialog):
 
         self.ok_button.clicked.connect(self.on_ok)
         self.cancel_button.clicked.connect(self.on_cancel)
+        self.preview_button.clicked.connect(self.on_preview)
 
         self.has_motion_layout = QtWidgets.QHBoxLayout()
         self.has_motion_label = QtWidgets.QLabel(__("Set motion: "))
@@ -182,6 +187,7 @@ class MovementDialog(QtWidgets.QDialog):
         self.buttons_layout = QtWidgets.QHBoxLayout()
         self.buttons_layout.addWidget(self.notice_label)
         self.buttons_layout.addStretch(1)
+        self.buttons_layout.addWidget(self.preview_button)
         self.buttons_layout.addWidget(self.ok_button)
         self.buttons_layout.addWidget(self.cancel_button)
 
@@ -253,6 +259,12 @@ class MovementDialog(QtWidgets.QDialog):
             self.mkbasedproperties.movements = list()
         self.accept()
 
+    def on_preview(self):
+        """ Previews the motions of the case with the movements currently selected for this mk. """
+        mk_movements = {real_mk: properties.movements for real_mk, properties in Case.the().mkbasedproperties.items()}
+        mk_movements[self.target.real_mk()] = self.movements_selected if self.has_motion_selector.currentIndex() == 0 else []
+        MotionPreviewDialog(mk_movements=mk_movements, parent=self)
+
     def on_cancel(self):
         """ Closes the dialog rejecting it. """
         self.reject()
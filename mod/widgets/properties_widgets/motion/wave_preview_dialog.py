@@ -0,0 +1,111 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""DesignSPHysics Wave Preview Dialog """
+
+import numpy as np
+
+from PySide2 import QtWidgets
+
+from mod.dataobjects.case import Case
+from mod.enums import MotionType
+from mod.tools.stdout_tools import warning
+from mod.tools.template_tools import obj_to_dict
+from mod.tools.translation_tools import __
+from mod.tools.wave_tools import FLAP_MAX_ANGLE, SPECTRUM_MAX_FREQ_COEF, SPECTRUM_SAMPLES, check_wave_series, \
+    get_series_summary, get_spectrum_density, synthesize_wave_series
+from mod.widgets.custom_widgets.series_plot import SeriesPlot
+from mod.widgets.custom_widgets.value_input import ValueInput
+
+DEFAULT_PREVIEW_TIME_STEP = 0.05
+
+
+class WavePreviewDialog(QtWidgets.QDialog):
+    """ Plots the spectrum, the free-surface elevation and the paddle motion of an irregular or focused wave generator,
+    computed in place with linear wave theory, and warns about strokes that can't be generated. """
+
+    def __init__(self, wave_generator, parent=None):
+        super().__init__(parent=parent)
+        self.setWindowTitle(__("Wave generator preview"))
+        self.setMinimumSize(800, 700)
+        self.generator: dict = obj_to_dict(wave_generator)
+
+        # Preview settings
+        self.duration_label = QtWidgets.QLabel(__("Duration (s): "))
+        self.duration_input = ValueInput(min_val=0.0)
+        self.duration_input.setValue(self.generator["duration"] or Case.the().execution_parameters.timemax)
+        self.time_step_label = QtWidgets.QLabel(__("Time step (s): "))
+        self.time_step_input = ValueInput(min_val=0.0, decimals=4)
+        self.time_step_input.setValue(self.generator.get("saveserie_timedt") or self.generator.get("savemotion_timedt")
+                                      or DEFAULT_PREVIEW_TIME_STEP)
+        self.position_label = QtWidgets.QLabel(__("Elevation at distance (m): "))
+        self.position_input = ValueInput()
+        self.position_input.setValue(self.generator["xf"] if self.generator["type"] == MotionType.FOCUSED_PISTON_WAVE_GENERATOR
+                                     else self.generator.get("saveserie_xpos", 0.0))
+        self.update_button = QtWidgets.QPushButton(__("Update"))
+        self.settings_layout = QtWidgets.QHBoxLayout()
+        for x in [self.duration_label, self.duration_input, self.time_step_label, self.time_step_input,
+                  self.position_label, self.position_input]:
+            self.settings_layout.addWidget(x)
+        self.settings_layout.addStretch(1)
+        self.settings_layout.addWidget(self.update_button)
+
+        # Plots and summary
+        self.spectrum_plot = SeriesPlot(__("Spectral density (m2/Hz)"), __("Frequency (Hz)"))
+        self.elevation_plot = SeriesPlot(__("Free-surface elevation (m)"), __("Time (s)"))
+        self.displacement_plot = SeriesPlot(__("Paddle displacement (m)"), __("Time (s)"))
+        self.angle_plot = SeriesPlot(__("Flap angle (degrees)"), __("Time (s)"))
+        self.summary_label = QtWidgets.QLabel()
+        self.summary_label.setWordWrap(True)
+
+        self.close_button = QtWidgets.QPushButton(__("Close"))
+        self.button_layout = QtWidgets.QHBoxLayout()
+        self.button_layout.addStretch(1)
+        self.button_layout.addWidget(self.close_button)
+
+        self.main_layout = QtWidgets.QVBoxLayout()
+        self.main_layout.addLayout(self.settings_layout)
+        for x in [self.spectrum_plot, self.elevation_plot, self.displacement_plot, self.angle_plot, self.summary_label]:
+            self.main_layout.addWidget(x)
+        self.main_layout.addLayout(self.button_layout)
+        self.setLayout(self.main_layout)
+
+        self.update_button.clicked.connect(self.on_update)
+        self.close_button.clicked.connect(self.accept)
+
+        self.on_update()
+        self.exec_()
+
+    def on_update(self):
+        """ Computes the wave series and plots them. """
+        time_step = self.time_step_input.value()
+        duration = self.duration_input.value()
+        if time_step <= 0 or duration <= 0:
+            self.summary_label.setText(__("Set a duration and a time step greater than 0."))
+            return
+        try:
+            series = synthesize_wave_series(self.generator, np.arange(0.0, duration + time_step / 2, time_step),
+                                            self.position_input.value())
+        except ValueError as ex:
+            self.summary_label.setText(str(ex))
+            return
+
+        frequencies = np.linspace(0.0, SPECTRUM_MAX_FREQ_COEF / self.generator["wave_period"], SPECTRUM_SAMPLES)
+        self.spectrum_plot.set_series(frequencies, get_spectrum_density(frequencies, self.generator["spectrum"],
+                                                                        self.generator["wave_height"],
+                                                                        self.generator["wave_period"],
+                                                                        self.generator["peak_coef"]))
+        self.elevation_plot.set_series(series["times"], series["elevation"])
+        half_depth = self.generator["depth"] / 2
+        self.displacement_plot.set_series(series["times"], series["displacement"], [-half_depth, half_depth])
+        self.angle_plot.setVisible("angle" in series)
+        if "angle" in series:
+            self.angle_plot.set_series(series["times"], series["angle"], [-FLAP_MAX_ANGLE, FLAP_MAX_ANGLE])
+
+        summary = get_series_summary(series)
+        lines = [__("{} components. Stroke: {:.3f} m. Maximum paddle velocity: {:.3f} m/s. Maximum elevation: {:.3f} m.").format(
+            len(series["components"]["frequencies"]), summary["stroke"], summary["max_velocity"], summary["max_elevation"])]
+        warnings = check_wave_series(self.generator, series)
+        for text in warnings:
+            warning(text)
+        lines += ["<font color='red'>{}</font>".format(text) for text in warnings]
+        self.summary_label.setText("<br/>".join(lines))
@@ -1,4 +1,8 @@
+import re
+from string import Formatter
+
 from mod.constants import LINE_END
+from mod.tools.gauge_array_tools import get_member_name
 from mod.tools.template_tools import get_template_text
 
 
@@ -14,6 +18,9 @@ class GaugesRenderer:
     MESH_XML = "/templates/gencase/gauges/mesh.xml"
     FLOW_XML = "/templates/gencase/gauges/flow.xml"
 
+    # Fields of the gauge templates that change between the gauges of an array
+    ARRAY_MEMBER_FIELDS = ("name", "point0", "point1")
+
     each_template= {
         "velocity" : VELOCITY_XML,
         "swl":SWL_XML,
@@ -27,12 +34,15 @@ class GaugesRenderer:
     @classmethod
     def render(cls, data):
 
+        # Templates are read once, as gauge arrays may render thousands of gauges.
+        common_template = get_template_text(cls.COMMON_XML)
+        templates = {gauge_type: get_template_text(path) for gauge_type, path in cls.each_template.items()}
 
         gauges_template_list: list = list()
         for name,gauge in data["gauges"]["gauges_dict"].items():
             if name != "Defaults":
-                gauge["common"]=get_template_text(cls.COMMON_XML).format(**gauge)
-                if gauge["type"]=="swl":
+                gauge["common"]=common_template.format(**gauge)
+                if gauge["type"]=="swl" or (gauge["type"] == "array" and gauge["gauge_type"] == "swl"):
                     if gauge["mass_limit_coef"]=="true": gauge["mass_limit_coef"]="coef"
                     else: gauge["mass_limit_coef"]="value"
                     if gauge["point_dp_coef_dp"]=="true": gauge["point_dp_coef_dp"]="coefdp"
@@ -44,11 +54,45 @@ class GaugesRenderer:
                     if gauge["kc_dummy_enable"]=="false": gauge["kc_dummy"] = "NONE"
                 if gauge["type"] == "flow":
                     if gauge["kclimit_enable"]=="false":gauge["kclimit"]="NONE"
-                gauges_template_list.append(get_template_text(cls.each_template[gauge["type"]]).format(**gauge))
+                if gauge["type"] == "array":
+                    gauges_template_list.extend(cls.render_array(gauge, templates[gauge["gauge_type"]]))
+                else:
+                    gauges_template_list.append(templates[gauge["type"]].format(**gauge))
         formatter: dict = {
             "gauges_each": LINE_END.join(gauges_template_list)
         }
         return get_template_text(cls.BASE_XML).format(**formatter)
 
+    @classmethod
+    def format_array_template(cls, template: str, gauge_array: dict) -> str:
+        """ Formats the fields of a gauge template shared by all the gauges of an array. Returns a template with only
+        the fields that change from one gauge to the next. """
+        formatter = Formatter()
+        pieces: list = list()
+        for literal_text, field_name, format_spec, conversion in formatter.parse(template):
+            pieces.append(literal_text.replace("{", "{{").replace("}", "}}"))
+            if field_name is None:
+                continue
+            if re.split(r"[.\[]", field_name, 1)[0] in cls.ARRAY_MEMBER_FIELDS:
+                pieces.append("{{{}{}{}}}".format(field_name, "!" + conversion if conversion else "",
+                                                  ":" + format_spec if format_spec else ""))
+                continue
+            value, _ = formatter.get_field(field_name, (), gauge_array)
+            value = formatter.format_field(formatter.convert_field(value, conversion), format_spec)
+            pieces.append(value.replace("{", "{{").replace("}", "}}"))
+        return "".join(pieces)
 
-
+    @classmethod
+    def render_array(cls, gauge_array: dict, template: str) -> list:
+        """ Renders a gauge for each point of a gauge array. The shared settings are formatted once and only
+        the name and points are formatted for each gauge. """
+        member_template = cls.format_array_template(template, gauge_array)
+        offset = gauge_array["swl_offset"]
+        member: dict = dict()
+        rendered: list = list()
+        for index, point in enumerate(gauge_array["points"]):
+            member["name"] = get_member_name(gauge_array["name"], index)
+            member["point0"] = point
+            member["point1"] = [point[0] + offset[0], point[1] + offset[1], point[2] + offset[2]]
+            rendered.append(member_template.format_map(member))
+        return rendered
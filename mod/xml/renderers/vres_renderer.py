@@ -18,18 +18,8 @@ class VResRenderer:
 
         if data["vres"]["active"]=="false":
             return ""
-        vres_render_list : list = list()
-        bufferbox_templates_list = list()
-        buff_list = data["vres"]["bufferbox_list"].copy()
-        delete_list = []
-        for bbox in buff_list:
-            if bbox["parent"] is not None:
-                delete_list.append(bbox)
-        for bbox in delete_list:
-            buff_list.remove(bbox)
-
-        for buf in buff_list: #LISTA DE PADRES
-            bufferbox_templates_list.append(cls.rec_render_xml(buf,data))
+        children_index = cls.get_children_index(data["vres"]["bufferbox_list"])
+        bufferbox_templates_list = [cls.rec_render_xml(buf, children_index) for buf in children_index.get(None, [])]
 
         formatter: dict = {
             "vres_each": LINE_END.join(bufferbox_templates_list),
@@ -39,10 +29,9 @@ class VResRenderer:
         return result
 
     @classmethod
-    def rec_render_xml(cls,bbox,data):
-        text = ""
-        sons_text = ""
-        sons = cls.get_bbox_children(bbox,data["vres"]["bufferbox_list"])
+    def rec_render_xml(cls,bbox,children_index):
+        """ Renders a buffer box with its children nested inside. """
+        sons = children_index.get(bbox["id"], [])
         if bbox["tracking_active"] == "true":
             bbox["tracking"] = get_template_text(cls.TRACKING_XML).format(**bbox)
         else:
@@ -84,21 +73,13 @@ class VResRenderer:
             bbox["simulation_domain"] = get_template_text(cls.DOMAIN_XML).format(**bbox["domain"])
         else:
             bbox["simulation_domain"] = ""
-        if not sons:
-            bbox['vres_each'] = ''
-            text= get_template_text(cls.EACH_XML).format(**bbox)
-        else:
-            for son in sons:
-                sons_text = sons_text + cls.rec_render_xml(son,data)
-            bbox['vres_each'] = sons_text
-            text = get_template_text(cls.EACH_XML).format(**bbox)
-        return text
+        bbox['vres_each'] = "".join(cls.rec_render_xml(son, children_index) for son in sons)
+        return get_template_text(cls.EACH_XML).format(**bbox)
 
     @classmethod
-    def get_bbox_children(cls,bbox, dict):
-        children = []
-        for cand in dict:
-            if cand['parent'] is not None:
-                if cand['parent']['id'] == bbox['id']:
-                    children.append(cand)
-        return children
+    def get_children_index(cls, bufferbox_list) -> dict:
+        """ Returns the children of each buffer box by parent id, in list order. Top level boxes are under None. """
+        children_index = {}
+        for bbox in bufferbox_list:
+            children_index.setdefault(bbox["parent"]["id"] if bbox["parent"] is not None else None, []).append(bbox)
+        return children_index
@@ -7,8 +7,10 @@ The utilities on this module creates
 
 import os
 from datetime import datetime
+from io import StringIO
 
 from mod.constants import APP_NAME, LINE_END
+from mod.functions import atomic_open
 from mod.tools.stdout_tools import debug
 from mod.tools.template_tools import obj_to_dict, get_template_text
 from mod.xml.renderers.accinput_renderer import AccinputRenderer
@@ -33,6 +35,7 @@ from mod.xml.renderers.rzones_renderer import RZonesRenderer
 from mod.xml.renderers.simulationdomain_renderer import SimulationDomainRenderer
 from mod.xml.renderers.vres_renderer import VResRenderer
 from mod.xml.renderers.wavepaddles_renderer import WavePaddlesRenderer
+from mod.xml.xml_stream_writer import XMLStreamWriter
 
 
 class XMLExporter():
@@ -48,20 +51,10 @@ class XMLExporter():
     def __init__(self):
         self.mod_folder = "{}/..".format(os.path.dirname(os.path.realpath(__file__)))
 
-    def transform_bools_to_strs(self, value):
-        """ Transforms a boolean value to a string representing its state, understandable by GenCase. """
-        if isinstance(value, bool):
-            return "true" if value else "false"
-        if isinstance(value, list):
-            return [self.transform_bools_to_strs(v) for v in value]
-        if isinstance(value, dict):
-            return {k: self.transform_bools_to_strs(v) for k, v in value.items()}
-        return value
-
     def get_adapted_case_data(self, case: "Case") -> dict:
         """ Adapts the case data to a dictionary used to format the resulting XML """
-        data: dict = obj_to_dict(case)
-        data = self.transform_bools_to_strs(data)
+        # Booleans are transformed to strings understandable by GenCase in the same pass.
+        data: dict = obj_to_dict(case, bools_to_strs=True)
 
         data["definition_template"] = DefinitionRenderer.render(data)
         data["objects_template"] = ObjectsRenderer.render(data)
@@ -92,14 +85,22 @@ class XMLExporter():
         data["parameters_template"]=ParametersRenderer.render(data)
         return data
 
+    def write(self, case, stream) -> None:
+        """ Writes the GenCase-compatible XML resulting from the case into the given stream. """
+        self.write_adapted_case_data(self.get_adapted_case_data(case), stream)
+
+    def write_adapted_case_data(self, data: dict, stream) -> None:
+        """ Writes the GenCase-compatible XML from already adapted case data into the given stream.
+        Each section is written as soon as it is reached in the base template and empty lines are stripped inline.
+        It does not access FreeCAD, so it can be run in a worker thread. """
+        writer = XMLStreamWriter(stream)
+        writer.write_template(get_template_text(self.BASE_XML), data, release_suffix="_template")
+
     def generate(self, case) -> str:
         """ Returns the GenCase-compatible XML resulting from the case """
-        final_xml: str = get_template_text(self.BASE_XML).format(**self.get_adapted_case_data(case))
-        # Strip empty lines from the final XML to clean it up.
-        while "\n\n" in final_xml:
-            final_xml = final_xml.replace("\n\n", "\n")
-
-        return final_xml
+        final_xml = StringIO()
+        self.write(case, final_xml)
+        return final_xml.getvalue()
 
     def generate_material(self, case) -> str:
         """ Returns a material XML definition for DualSPHysics from the data available on the given case. """
@@ -119,8 +120,13 @@ class XMLExporter():
 
     def save_to_disk(self, path, case: "Case") -> None:
         """ Creates a file on disk with the contents of the GenCase generated XML. """
-        with open("{}/{}".format(path, self.MATERIAL_FILE_NAME), "w", encoding="utf-8") as file:
-            file.write(self.generate_material(case))
-        with open("{}/{}{}".format(path, case.name, self.GENCASE_XML_SUFFIX), "w", encoding="utf-8") as file:
-            file.write(self.generate(case))
-
+        self.write_files_to_disk(path, case.name, self.get_adapted_case_data(case), self.generate_material(case))
+
+    def write_files_to_disk(self, path, case_name: str, data: dict, material_xml: str) -> None:
+        """ Writes the material and GenCase XML files from already generated data.
+        Files are replaced atomically and it does not access FreeCAD, so it can be run in a worker thread. """
+        with atomic_open("{}/{}".format(path, self.MATERIAL_FILE_NAME), "w", encoding="utf-8") as file:
+            file.write(material_xml)
+        with atomic_open("{}/{}{}".format(path, case_name, self.GENCASE_XML_SUFFIX), "w", encoding="utf-8",
+                         buffering=XMLStreamWriter.BUFFER_SIZE) as file:
+            self.write_adapted_case_data(data, file)
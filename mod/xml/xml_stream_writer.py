@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""XML stream writer for DesignSPHysics
+
+Writes text chunks to an open stream, collapsing consecutive line
+breaks as they are written so the final document never needs to be
+held in memory or rescanned.
+
+"""
+
+import re
+from string import Formatter
+
+
+class XMLStreamWriter():
+    """ Writes text to a stream removing empty lines on the fly. """
+
+    BUFFER_SIZE = 1024 * 1024
+    LINE_BREAKS_REGEX = re.compile("\n{2,}")
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.ends_with_line_break = False
+
+    def write(self, text: str) -> None:
+        """ Writes a chunk of text into the stream, collapsing line breaks with the previously written ones. """
+        if not text:
+            return
+        text = self.LINE_BREAKS_REGEX.sub("\n", text)
+        if self.ends_with_line_break and text[0] == "\n":
+            text = text[1:]
+            if not text:
+                return
+        self.stream.write(text)
+        self.ends_with_line_break = text[-1] == "\n"
+
+    def write_template(self, template: str, data: dict, release_suffix: str = None) -> None:
+        """ Formats a template piece by piece, writing each literal and field into the stream as it is resolved.
+        Fields whose name ends with release_suffix are dropped from data once written to free their memory. """
+        formatter = Formatter()
+        for literal_text, field_name, format_spec, conversion in formatter.parse(template):
+            self.write(literal_text)
+            if field_name is None:
+                continue
+            value, _ = formatter.get_field(field_name, (), data)
+            self.write(formatter.format_field(formatter.convert_field(value, conversion), format_spec or ""))
+            if release_suffix and field_name.endswith(release_suffix) and field_name in data:
+                data[field_name] = ""
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Benchmark of the conversion of case data to dictionaries done before writing the GenCase XML.
+
+Builds a tree of data objects shaped like the ones of a big case and times the conversion with
+obj_to_dict, booleans transformed to strings included, against the recursive conversion plus the
+separate boolean pass used before the field plans. Both results are compared, except for Enum
+members, which the previous conversion exported as empty dictionaries.
+
+Run it from the root of the repository with the Python interpreter of FreeCAD, as the tools import it:
+    python tools/bench_case_serialization.py [--objects 40000] [--repeat 20] """
+
+import argparse
+import sys
+from enum import Enum
+from os import path
+from time import perf_counter
+from uuid import uuid4
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from mod.tools.template_tools import obj_to_dict  # pylint: disable=wrong-import-position
+
+
+class BenchmarkMode(Enum):
+    """ Enum stored in the benchmark objects, like the ones of the case data objects. """
+    FIRST = 1
+    SECOND = 2
+
+
+class BenchmarkMotion():
+    """ Nested data object, like a movement of an mk. """
+
+    def __init__(self, index: int):
+        self.id = uuid4()
+        self.duration = index * 0.5
+        self.velocity = [index * 0.1, 0.0, -index * 0.1]
+        self.enabled = index % 2 == 0
+        self.type = "rectilinear"
+
+
+class BenchmarkObject():
+    """ Data object with about 20 attributes of the types found in the case data. """
+
+    def __init__(self, index: int):
+        self.name = "object_{}".format(index)
+        self.mk = index % 240
+        self.fillmode = "solid"
+        self.autofill = index % 3 == 0
+        self.frdrawmode = False
+        self.position = [index * 0.01, index * 0.02, index * 0.03]
+        self.size = (1.0, 2.0, 3.0)
+        self.rotation = {"angle": 45.0, "axis": [0.0, 0.0, 1.0]}
+        self.density = 1000.0
+        self.mass = None
+        self.mode = BenchmarkMode.FIRST if index % 2 else BenchmarkMode.SECOND
+        self.motions = [BenchmarkMotion(motion_index) for motion_index in range(3)]
+        self.float_property = {"enabled": True, "values": [1.0, 2.0]}
+        self.initials = None
+        self.active = True
+        self.visible = index % 5 != 0
+        self.description = "Benchmark object"
+        self.scale = 1.0
+        self.parts = list(range(4))
+        self._private_cache = [0] * 10
+
+
+class BenchmarkCase():
+    """ Root of the benchmark tree, like the Case. """
+
+    def __init__(self, object_count: int):
+        self.name = "benchmark"
+        self.mode3d = True
+        self.objects = {"object_{}".format(index): BenchmarkObject(index) for index in range(object_count)}
+
+
+def legacy_obj_to_dict(obj, classkey=None):
+    """ Conversion to dictionary used before the field plans. """
+    if isinstance(obj, dict):
+        return {key: legacy_obj_to_dict(value, classkey) for key, value in obj.items()}
+    if hasattr(obj, "_ast"):
+        return legacy_obj_to_dict(obj._ast())  # pylint: disable=protected-access
+    if hasattr(obj, "__iter__") and not isinstance(obj, str):
+        return [legacy_obj_to_dict(value, classkey) for value in obj]
+    if hasattr(obj, "__dict__"):
+        data = {key: legacy_obj_to_dict(value, classkey) for key, value in obj.__dict__.items()
+                if not callable(value) and not key.startswith("_")}
+        if classkey is not None and hasattr(obj, "__class__"):
+            data[classkey] = obj.__class__.__name__
+        return data
+    return obj
+
+
+def legacy_transform_bools_to_strs(value):
+    """ Boolean transformation pass done by the XML exporter before the field plans. """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        return [legacy_transform_bools_to_strs(item) for item in value]
+    if isinstance(value, dict):
+        return {key: legacy_transform_bools_to_strs(item) for key, item in value.items()}
+    return value
+
+
+def without_enums(data):
+    """ Replaces the exported Enum members by the empty dictionary the previous conversion returned. """
+    if isinstance(data, dict):
+        return {key: {} if key == "mode" else without_enums(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [without_enums(value) for value in data]
+    return data
+
+
+def best_time(function, repeat: int) -> tuple:
+    """ Returns the best time of some runs of a function and the result of the last one. """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = perf_counter()
+        result = function()
+        best = min(best, perf_counter() - start)
+    return best, result
+
+
+def main():
+    """ Runs the benchmark and prints the times. """
+    parser = argparse.ArgumentParser(description="Times the conversion of case data to dictionaries.")
+    parser.add_argument("--objects", type=int, default=40000, help="Data objects in the benchmark case")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs of each conversion, the best one is kept")
+    args = parser.parse_args()
+
+    case = BenchmarkCase(args.objects)
+    legacy_time, legacy_data = best_time(lambda: legacy_transform_bools_to_strs(legacy_obj_to_dict(case)), args.repeat)
+    current_time, current_data = best_time(lambda: obj_to_dict(case, bools_to_strs=True), args.repeat)
+    if without_enums(current_data) != legacy_data:
+        sys.exit("The conversions returned different data.")
+
+    print("{} data objects, best of {} runs".format(args.objects, args.repeat))
+    print("Previous conversion plus boolean pass: {:.3f} s".format(legacy_time))
+    print("Field plans with booleans transformed: {:.3f} s (x{:.1f})".format(current_time, legacy_time / current_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+
+""" Check of the FFT summation used to preview long irregular wave records.
+
+Synthesizes the free-surface elevation and the paddle motion of an irregular
+piston wave generator over records long enough to be summed with an inverse
+FFT, and compares them with the direct sum of the same components. The
+whole record is compared for the shorter one, and evenly spaced instants,
+including the end of the record, for the longer one. Exits with an error if
+the relative RMS difference of any of them is above the tolerance.
+
+Run it from the root of the repository with the Python interpreter of FreeCAD, as the tools import it:
+    python tools/check_wave_synthesis.py """
+
+import sys
+from os import path
+
+import numpy as np
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from mod.enums import IrregularDiscretization, IrregularSpectrum, MotionType
+from mod.tools.wave_tools import build_wave_components, synthesize_wave_series, uses_fft_sum
+
+TOLERANCE = 1e-6  # Relative RMS difference allowed between the FFT and the direct sums
+CHECKED_INSTANTS = 2000  # Instants compared with the direct sum in long records
+DIRECT_MAX_INSTANTS = 100000  # Records with more instants are only compared at CHECKED_INSTANTS instants
+RECORDS = ((600.0, 0.01), (30000.0, 0.01))  # (duration, time step) of the checked records
+
+GENERATOR = {"type": MotionType.IRREGULAR_PISTON_WAVE_GENERATOR, "depth": 0.66, "wave_height": 0.12, "wave_period": 1.8,
+             "spectrum": IrregularSpectrum.JONSWAP, "discretization": IrregularDiscretization.STRETCHED,
+             "peak_coef": 3.3, "waves": 200, "randomseed": 43, "gainstroke": 1.0, "serieini": 0.0, "ramptime": 0.0}
+
+
+def direct_sum(frequencies: np.ndarray, coefficients: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """ Returns the real part of the sum of coefficients * exp(2 pi i f t), computed term by term. """
+    return np.concatenate([np.real(np.exp(2j * np.pi * np.outer(times[start:start + 1000], frequencies)) @ coefficients)
+                           for start in range(0, len(times), 1000)])
+
+
+def check_record(duration: float, time_step: float) -> bool:
+    """ Compares the FFT and the direct sums of a record and prints the differences. Returns whether they match. """
+    times = np.arange(0.0, duration + time_step / 2, time_step)
+    if not uses_fft_sum(int(GENERATOR["waves"]), times):
+        sys.exit("The record of {:g} s is not summed with an FFT.".format(duration))
+    series = synthesize_wave_series(GENERATOR, times)
+    components = series["components"]
+    if not np.array_equal(components["frequencies"], build_wave_components(GENERATOR, times)["frequencies"]):
+        sys.exit("The components are not reproducible.")
+
+    checked = np.arange(len(times))
+    if len(times) > DIRECT_MAX_INSTANTS:
+        checked = np.unique(np.concatenate((np.linspace(0, len(times) - 1, CHECKED_INSTANTS // 2).astype(int),
+                                            np.arange(len(times) - CHECKED_INSTANTS // 2, len(times)))))
+    phases = components["phases"]
+    expected = {"elevation": direct_sum(components["frequencies"], components["amplitudes"] * np.exp(-1j * phases),
+                                        times[checked]),
+                "displacement": direct_sum(components["frequencies"], -1j * components["strokes"] * np.exp(-1j * phases),
+                                           times[checked])}
+    matches = True
+    for name, values in expected.items():
+        difference = np.sqrt(np.mean((series[name][checked] - values) ** 2) / np.mean(values ** 2))
+        matches &= difference <= TOLERANCE
+        print("{:g} s record ({} instants, {} checked), {}: relative RMS difference {:.2e}".format(
+            duration, len(times), len(checked), name, difference))
+    return matches
+
+
+def main():
+    """ Checks every record. """
+    if not all([check_record(duration, time_step) for duration, time_step in RECORDS]):
+        sys.exit("The FFT summation doesn't match the direct sum.")
+    print("The FFT summation matches the direct sum.")
+
+
+if __name__ == "__main__":
+    main()